@@ -0,0 +1,97 @@
+"""jsonb structured_data and architecture
+
+requirements.structured_data / infrastructure_designs.architecture를
+PostgreSQL에서 JSONB + GIN 인덱스로 전환하고,
+SQLite에서는 자주 필터링하는 필드에 json_extract 식 인덱스를 추가
+
+Revision ID: 3c3449a21baa
+Revises: ee1387b85e56
+Create Date: 2026-10-18 11:03:27.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c3449a21baa'
+down_revision: Union[str, Sequence[str], None] = 'ee1387b85e56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.alter_column(
+            "requirements",
+            "structured_data",
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using="structured_data::jsonb",
+        )
+        op.alter_column(
+            "infrastructure_designs",
+            "architecture",
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=False,
+            postgresql_using="architecture::jsonb",
+        )
+        op.create_index(
+            "ix_requirements_structured_data_gin",
+            "requirements",
+            ["structured_data"],
+            postgresql_using="gin",
+            postgresql_ops={"structured_data": "jsonb_path_ops"},
+        )
+        op.create_index(
+            "ix_infrastructure_designs_architecture_gin",
+            "infrastructure_designs",
+            ["architecture"],
+            postgresql_using="gin",
+            postgresql_ops={"architecture": "jsonb_path_ops"},
+        )
+    elif dialect == "sqlite":
+        op.create_index(
+            "ix_requirements_structured_data_deployment_type",
+            "requirements",
+            [sa.text("json_extract(structured_data, '$.deployment_type')")],
+        )
+        op.create_index(
+            "ix_requirements_structured_data_scale",
+            "requirements",
+            [sa.text("json_extract(structured_data, '$.scale')")],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.drop_index("ix_infrastructure_designs_architecture_gin", table_name="infrastructure_designs")
+        op.drop_index("ix_requirements_structured_data_gin", table_name="requirements")
+        op.alter_column(
+            "infrastructure_designs",
+            "architecture",
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=False,
+            postgresql_using="architecture::json",
+        )
+        op.alter_column(
+            "requirements",
+            "structured_data",
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using="structured_data::json",
+        )
+    elif dialect == "sqlite":
+        op.drop_index("ix_requirements_structured_data_scale", table_name="requirements")
+        op.drop_index("ix_requirements_structured_data_deployment_type", table_name="requirements")
@@ -0,0 +1,34 @@
+"""add documents content_hash
+
+내용 주소 저장(UPLOAD_DIR/objects/ab/cd/<sha256>.<ext>)을 위한 documents.content_hash 컬럼 추가
+
+Revision ID: 5d0e7a93c1f4
+Revises: 3c3449a21baa
+Create Date: 2026-10-18 23:50:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d0e7a93c1f4'
+down_revision: Union[str, Sequence[str], None] = '3c3449a21baa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("documents") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.create_index("ix_documents_content_hash", "documents", ["content_hash"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_documents_content_hash", table_name="documents")
+    with op.batch_alter_table("documents") as batch_op:
+        batch_op.drop_column("content_hash")
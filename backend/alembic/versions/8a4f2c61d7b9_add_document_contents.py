@@ -0,0 +1,43 @@
+"""add document_contents
+
+내용 해시(SHA-256)별 파싱 결과 캐시 테이블 추가 (documents.content_hash로 참조)
+
+Revision ID: 8a4f2c61d7b9
+Revises: 5d0e7a93c1f4
+Create Date: 2026-10-19 00:20:41.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4f2c61d7b9'
+down_revision: Union[str, Sequence[str], None] = '5d0e7a93c1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "document_contents",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("file_type", sa.String(length=50), nullable=False),
+        sa.Column("file_size", sa.BigInteger(), nullable=False),
+        sa.Column("file_path", sa.String(length=500), nullable=False),
+        sa.Column("extracted_text", sa.Text(), nullable=True),
+        sa.Column("parsed_data", sa.JSON(), nullable=True),
+        sa.Column("chunk_count", sa.Integer(), nullable=True),
+        sa.Column("indexed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=True),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=True),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("document_contents")
@@ -0,0 +1,30 @@
+"""add documents retention index
+
+보관 기간 만료 조회(deleted_at IS NULL AND created_at < ?)용 복합 인덱스 추가
+
+Revision ID: b7e3d95a0c26
+Revises: 8a4f2c61d7b9
+Create Date: 2026-10-19 01:05:18.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d95a0c26'
+down_revision: Union[str, Sequence[str], None] = '8a4f2c61d7b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_documents_deleted_at_created_at", "documents", ["deleted_at", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_documents_deleted_at_created_at", table_name="documents")
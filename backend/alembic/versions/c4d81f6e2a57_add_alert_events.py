@@ -0,0 +1,56 @@
+"""add alert events
+
+알림 규칙 상태 전이(firing/resolved) 기록 테이블 추가
+
+Revision ID: c4d81f6e2a57
+Revises: b7e3d95a0c26
+Create Date: 2026-10-19 09:20:41.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d81f6e2a57'
+down_revision: Union[str, Sequence[str], None] = 'b7e3d95a0c26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "alert_events",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("deployment_id", sa.Uuid(), nullable=False),
+        sa.Column("rule_name", sa.String(length=100), nullable=False),
+        sa.Column("severity", sa.String(length=20), nullable=False),
+        sa.Column("state", sa.String(length=20), nullable=False),
+        sa.Column("metric_name", sa.String(length=200), nullable=False),
+        sa.Column("series_key", sa.String(length=64), nullable=False),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("value", sa.Float(), nullable=True),
+        sa.Column("triggered_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_alert_events_deployment_id_triggered_at",
+        "alert_events",
+        ["deployment_id", "triggered_at"],
+    )
+    op.create_index(
+        "ix_alert_events_series",
+        "alert_events",
+        ["deployment_id", "rule_name", "series_key", "triggered_at"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_alert_events_series", table_name="alert_events")
+    op.drop_index("ix_alert_events_deployment_id_triggered_at", table_name="alert_events")
+    op.drop_table("alert_events")
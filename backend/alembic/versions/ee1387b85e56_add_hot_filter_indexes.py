@@ -0,0 +1,53 @@
+"""add hot filter indexes
+
+리포지토리 조회 조건(FK, 상태값, IaC 현재 버전/버전 정렬)에 대한 인덱스 추가
+
+Revision ID: ee1387b85e56
+Revises:
+Create Date: 2026-10-18 10:12:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee1387b85e56'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_deployments_infrastructure_design_id", "deployments", ["infrastructure_design_id"])
+    op.create_index("ix_deployments_status", "deployments", ["status"])
+    op.create_index("ix_infrastructure_designs_requirement_id", "infrastructure_designs", ["requirement_id"])
+    op.create_index("ix_requirements_user_id", "requirements", ["user_id"])
+    op.create_index("ix_requirements_status", "requirements", ["status"])
+    op.create_index(
+        "ix_iac_codes_infrastructure_design_id_is_current",
+        "iac_codes",
+        ["infrastructure_design_id", "is_current"],
+    )
+    op.create_index(
+        "ix_iac_codes_infrastructure_design_id_version",
+        "iac_codes",
+        ["infrastructure_design_id", "version"],
+    )
+    # 복합 인덱스의 선두 컬럼과 중복되는 단일 컬럼 인덱스 제거
+    op.drop_index("ix_iac_codes_infrastructure_design_id", table_name="iac_codes")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_iac_codes_infrastructure_design_id", "iac_codes", ["infrastructure_design_id"])
+    op.drop_index("ix_iac_codes_infrastructure_design_id_version", table_name="iac_codes")
+    op.drop_index("ix_iac_codes_infrastructure_design_id_is_current", table_name="iac_codes")
+    op.drop_index("ix_requirements_status", table_name="requirements")
+    op.drop_index("ix_requirements_user_id", table_name="requirements")
+    op.drop_index("ix_infrastructure_designs_requirement_id", table_name="infrastructure_designs")
+    op.drop_index("ix_deployments_status", table_name="deployments")
+    op.drop_index("ix_deployments_infrastructure_design_id", table_name="deployments")
@@ -211,6 +211,7 @@ async def start_deployment(
 async def list_deployments(
     infrastructure_id: Optional[UUID] = Query(None, description="인프라 설계 ID로 필터링"),
     status: Optional[str] = Query(None, description="상태로 필터링"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 조회 개수 (인프라 설계 ID 필터가 없을 때)"),
     deployment_repository: IDeploymentRepository = Depends(get_deployment_repository),
     infrastructure_repository: IInfrastructureRepository = Depends(get_infrastructure_repository),
     iac_repository: IIaCRepository = Depends(get_iac_repository)
@@ -219,7 +220,7 @@ async def list_deployments(
     배포 목록 조회
     
     - 인프라 설계 ID로 필터링 가능
-    - 상태로 필터링 가능
+    - 상태로 필터링 가능 (DB에서 status 인덱스로 필터링)
     """
     service = DeploymentService(
         deployment_repository,
@@ -229,14 +230,11 @@ async def list_deployments(
     
     if infrastructure_id:
         deployments = await service.get_deployments_by_infrastructure(infrastructure_id)
+        # 상태 필터링
+        if status:
+            deployments = [d for d in deployments if d.status == status]
     else:
-        # 모든 배포 조회 (리포지토리에 메서드 추가 필요)
-        # 임시로 빈 리스트 반환
-        deployments = []
-    
-    # 상태 필터링
-    if status:
-        deployments = [d for d in deployments if d.status == status]
+        deployments = await service.get_deployments(status=status, limit=limit)
     
     return deployments
 
@@ -12,10 +12,10 @@ from app.services.llm_service import LLMService
 from app.core.dependencies import (
     get_requirement_repository,
     get_infrastructure_repository,
+    get_iac_repository,
     get_db
 )
 from app.repositories.interfaces.iac_repository import IIaCRepository
-from app.repositories.implementations.iac_repository import IaCRepository
 from app.services.iac_service import IaCService
 from app.repositories.interfaces.requirement_repository import IRequirementRepository
 from app.repositories.interfaces.infrastructure_repository import IInfrastructureRepository
@@ -113,7 +113,9 @@ async def compare_infrastructure_designs(
 async def generate_iac_code(
     infrastructure_id: UUID,
     iac_tool: str = Query("terraform", description="IaC 도구: terraform, ansible, kubernetes"),
+    requirement_repository: IRequirementRepository = Depends(get_requirement_repository),
     infrastructure_repository: IInfrastructureRepository = Depends(get_infrastructure_repository),
+    iac_repository: IIaCRepository = Depends(get_iac_repository),
     db = Depends(get_db)
 ):
     """
@@ -122,15 +124,7 @@ async def generate_iac_code(
     if iac_tool not in ["terraform", "ansible", "kubernetes"]:
         raise HTTPException(status_code=400, detail="Invalid iac_tool. Must be: terraform, ansible, kubernetes")
     
-    iac_repository: IIaCRepository = IaCRepository(db)
-    
     # LLM 서비스 초기화
-    from app.repositories.interfaces.document_repository import IDocumentRepository
-    from app.repositories.implementations.document_repository import DocumentRepository
-    from app.repositories.interfaces.requirement_repository import IRequirementRepository
-    from app.repositories.implementations.requirement_repository import RequirementRepository
-    
-    requirement_repository: IRequirementRepository = RequirementRepository(db)
     document_repository: IDocumentRepository = DocumentRepository(db)
     llm_service = LLMService(requirement_repository, document_repository)
     
@@ -149,12 +143,11 @@ async def generate_iac_code(
 @router.get("/{infrastructure_id}/iac-code", response_model=IaCCodeResponse)
 async def get_current_iac_code(
     infrastructure_id: UUID,
-    db = Depends(get_db)
+    iac_repository: IIaCRepository = Depends(get_iac_repository)
 ):
     """
     현재 버전의 IaC 코드 조회
     """
-    iac_repository: IIaCRepository = IaCRepository(db)
     iac_code = iac_repository.get_current_version(infrastructure_id)
     
     if not iac_code:
@@ -167,12 +160,11 @@ async def get_current_iac_code(
 async def get_iac_code_by_version(
     infrastructure_id: UUID,
     version: int,
-    db = Depends(get_db)
+    iac_repository: IIaCRepository = Depends(get_iac_repository)
 ):
     """
     특정 버전의 IaC 코드 조회
     """
-    iac_repository: IIaCRepository = IaCRepository(db)
     iac_codes = iac_repository.get_by_infrastructure_id(infrastructure_id)
     
     iac_code = next((code for code in iac_codes if code.version == version), None)
@@ -186,26 +178,20 @@ async def get_iac_code_by_version(
 async def modify_iac_code(
     infrastructure_id: UUID,
     modify_request: IaCCodeModifyRequest,
+    requirement_repository: IRequirementRepository = Depends(get_requirement_repository),
     infrastructure_repository: IInfrastructureRepository = Depends(get_infrastructure_repository),
+    iac_repository: IIaCRepository = Depends(get_iac_repository),
     db = Depends(get_db)
 ):
     """
     프롬프트 기반 IaC 코드 수정
     """
-    iac_repository: IIaCRepository = IaCRepository(db)
-    
     # 현재 버전 가져오기
     current_code = iac_repository.get_current_version(infrastructure_id)
     if not current_code:
         raise HTTPException(status_code=404, detail="Current IaC code not found")
     
     # LLM 서비스 초기화
-    from app.repositories.interfaces.document_repository import IDocumentRepository
-    from app.repositories.implementations.document_repository import DocumentRepository
-    from app.repositories.interfaces.requirement_repository import IRequirementRepository
-    from app.repositories.implementations.requirement_repository import RequirementRepository
-    
-    requirement_repository: IRequirementRepository = RequirementRepository(db)
     document_repository: IDocumentRepository = DocumentRepository(db)
     llm_service = LLMService(requirement_repository, document_repository)
     
@@ -1,56 +1,92 @@
 """
 모니터링 API
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta
 
-from app.schemas.monitoring import MonitoringResponse, MonitoringMetric, HealthCheckResponse
-from app.core.dependencies import get_deployment_repository, get_db
+import numpy as np
+
+from app.schemas.monitoring import (
+    MonitoringResponse, MonitoringMetric, HealthCheckResponse, ActiveAlert, AlertEventResponse, AlertsResponse,
+    NetworkSweepRequest
+)
+from app.core.dependencies import get_alert_repository, get_deployment_repository, get_db
+from app.repositories.interfaces.alert_repository import IAlertRepository
 from app.repositories.interfaces.deployment_repository import IDeploymentRepository
+from app.core.cache import LRUCache
+from app.core.config import settings
 from app.core.logging_config import get_logger
+from app.utils.alert_engine import get_alert_engine
+from app.utils.metrics_aggregation import is_valid_aggregation, overall_status
 from app.utils.metrics_collector import MetricsCollector
+from app.utils.metrics_ingest import IngestBufferFull, get_ingest_buffer, parse_json_batch, parse_line_protocol
+from app.utils.metrics_stream import get_metrics_stream_hub
+from app.utils.network_sweep import NetworkSweeper, expand_hosts, get_sweep_inventory, parse_ports, summarize
+from app.utils.connectivity_prober import get_connectivity_prober
 from app.utils.vm_connectivity import VMConnectivityChecker
 
 router = APIRouter()
 logger = get_logger("app.api.monitoring")
 
+# 수집 요청에서 존재가 확인된 배포 ID
+_known_ingest_deployments = LRUCache(max_size=10000, ttl=settings.METRICS_INGEST_DEPLOYMENT_CACHE_TTL)
+
+# 값이 원래 단위(percent)를 유지해 임계치 검사가 의미 있는 집계
+_THRESHOLD_AGGS = ("latest", "mean", "min", "max")
+
+
+def _validate_aggregation(agg: Optional[str]) -> None:
+    if agg is not None and not is_valid_aggregation(agg):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported aggregation: {agg} (latest, mean, min, max, sum, count, rate, p0~p99)"
+        )
+
 
 @router.get("/deployment/{deployment_id}", response_model=MonitoringResponse)
 async def get_deployment_monitoring(
     deployment_id: UUID,
     deployment_repository: IDeploymentRepository = Depends(get_deployment_repository),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
-    end_time: Optional[datetime] = Query(None, description="종료 시간")
+    end_time: Optional[datetime] = Query(None, description="종료 시간"),
+    agg: str = Query("latest", description="집계 (latest, mean, min, max, sum, count, rate, p50/p95/p99 등)"),
+    group_by: Optional[str] = Query(None, description="묶을 태그 키 (예: resource)")
 ):
     """
     배포 모니터링 데이터 조회
     
     - 배포된 인프라의 메트릭 수집
     - CPU, 메모리, 네트워크, 디스크 등 모니터링
+    - 시계열별(또는 group_by 태그별) agg 집계 값을 반환하고, percent 메트릭으로 상태 판단
+    - 현재 시점 최신 값 조회는 알림 엔진이 유지하는 상태와 firing 알림을 그대로 반환
     """
+    _validate_aggregation(agg)
+    
     # 배포 확인
     deployment = deployment_repository.get_by_id(deployment_id)
     if not deployment:
         raise HTTPException(status_code=404, detail="Deployment not found")
     
+    live = end_time is None and agg == "latest"
+    
     # 기본 시간 범위 설정 (최근 1시간)
     if not end_time:
         end_time = datetime.utcnow()
     if not start_time:
         start_time = end_time - timedelta(hours=1)
     
-    # 메트릭 수집기로 데이터 수집
     collector = MetricsCollector(deployment_id)
-    metrics_data = await collector.collect_metrics(start_time, end_time)
-    
-    # 최신 메트릭만 반환 (또는 집계된 메트릭)
-    latest_metrics = {}
-    for metric_data in metrics_data:
-        name = metric_data["name"]
-        if name not in latest_metrics or metric_data["timestamp"] > latest_metrics[name]["timestamp"]:
-            latest_metrics[name] = metric_data
+    if agg == "latest" and group_by is None:
+        # 시계열별 최신 값 조회 (저장소 이진 탐색)
+        latest_metrics = await collector.collect_latest_metrics(start_time, end_time)
+    else:
+        latest_metrics = await collector.collect_aggregated(agg, group_by, start_time=start_time, end_time=end_time)
     
     # MonitoringMetric 객체로 변환
     metrics = [
@@ -61,15 +97,22 @@ async def get_deployment_monitoring(
             timestamp=m["timestamp"],
             tags=m.get("tags")
         )
-        for m in latest_metrics.values()
+        for m in latest_metrics
     ]
     
-    # 상태 결정
-    status = "healthy"
-    if any(m.value > 80 for m in metrics if m.unit == "percent"):
-        status = "warning"
-    if any(m.value > 95 for m in metrics if m.unit == "percent"):
-        status = "critical"
+    # 상태 결정: 알림 엔진 상태 (현재 시점 조회), 없으면 percent 메트릭 값 배열에 대한 벡터 임계치 검사
+    alerts = get_alert_engine() if live else None
+    status = alerts.status(deployment_id) if alerts is not None else None
+    active = []
+    if status is not None:
+        active = [ActiveAlert(**alert) for alert in alerts.active_alerts(deployment_id)]
+    elif agg in _THRESHOLD_AGGS or agg.startswith("p"):
+        status = overall_status(
+            np.array([m["value"] for m in latest_metrics], dtype=np.float64),
+            np.array([m.get("unit") == "percent" for m in latest_metrics], dtype=bool),
+        )
+    else:
+        status = "healthy"
     
     logger.info(f"모니터링 데이터 조회: deployment_id={deployment_id}, metrics_count={len(metrics)}")
     
@@ -77,7 +120,37 @@ async def get_deployment_monitoring(
         deployment_id=deployment_id,
         metrics=metrics,
         status=status,
-        last_updated=datetime.utcnow()
+        last_updated=datetime.utcnow(),
+        alerts=active
+    )
+
+
+@router.get("/deployment/{deployment_id}/alerts", response_model=AlertsResponse)
+async def get_deployment_alerts(
+    deployment_id: UUID,
+    deployment_repository: IDeploymentRepository = Depends(get_deployment_repository),
+    alert_repository: IAlertRepository = Depends(get_alert_repository),
+    since: Optional[datetime] = Query(None, description="이 시각 이후 전이만"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 전이 기록 수")
+):
+    """
+    배포 알림 조회
+    
+    - 현재 firing 중인 알림 (알림 엔진 메모리 상태)
+    - firing/resolved 전이 기록 (최신순)
+    """
+    deployment = deployment_repository.get_by_id(deployment_id)
+    if not deployment:
+        raise HTTPException(status_code=404, detail="Deployment not found")
+    
+    alerts = get_alert_engine()
+    history = alert_repository.get_by_deployment_id(deployment_id, since=since, limit=limit)
+    
+    return AlertsResponse(
+        deployment_id=deployment_id,
+        status=alerts.status(deployment_id) if alerts is not None else None,
+        active=[ActiveAlert(**alert) for alert in alerts.active_alerts(deployment_id)] if alerts is not None else [],
+        history=[AlertEventResponse.from_entity(event) for event in history]
     )
 
 
@@ -87,13 +160,21 @@ async def get_metric(
     metric_name: str,
     deployment_repository: IDeploymentRepository = Depends(get_deployment_repository),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
-    end_time: Optional[datetime] = Query(None, description="종료 시간")
+    end_time: Optional[datetime] = Query(None, description="종료 시간"),
+    step: Optional[int] = Query(None, ge=1, description="점 간격 (초, 1m/5m/1h/1d 롤업에서 선택)"),
+    max_points: Optional[int] = Query(None, ge=3, le=10000, description="최대 점 수 (기본값: METRICS_MAX_POINTS)"),
+    agg: Optional[str] = Query(None, description="집계 (지정하면 시계열 대신 집계 값 반환, group_by만 주면 mean)"),
+    group_by: Optional[str] = Query(None, description="묶을 태그 키 (예: resource)")
 ):
     """
     특정 메트릭 조회
     
     - 특정 메트릭의 시계열 데이터 반환
+    - 범위에 맞는 롤업 해상도를 골라 읽고, max_points를 넘으면 LTTB로 다운샘플링
+    - agg/group_by를 주면 시계열(또는 태그 그룹)별 집계 값 하나씩 반환
     """
+    _validate_aggregation(agg)
+    
     # 배포 확인
     deployment = deployment_repository.get_by_id(deployment_id)
     if not deployment:
@@ -107,7 +188,18 @@ async def get_metric(
     
     # 메트릭 수집기로 데이터 수집
     collector = MetricsCollector(deployment_id)
-    metrics_data = await collector.collect_metric_by_name(metric_name, start_time, end_time)
+    if agg or group_by:
+        metrics_data = await collector.collect_aggregated(
+            agg or "mean", group_by, metric_name=metric_name, start_time=start_time, end_time=end_time
+        )
+    else:
+        metrics_data = await collector.collect_metric_by_name(
+            metric_name,
+            start_time,
+            end_time,
+            step=step,
+            max_points=max_points or settings.METRICS_MAX_POINTS,
+        )
     
     # MonitoringMetric 객체로 변환
     metrics = [
@@ -126,10 +218,212 @@ async def get_metric(
     return metrics
 
 
+@router.post("/ingest", status_code=202)
+async def ingest_metrics(
+    request: Request,
+    deployment_id: Optional[UUID] = Query(None, description="기본 배포 ID (본문에 없을 때 사용)"),
+    precision: str = Query("ns", description="line protocol 타임스탬프 단위 (ns, us, ms, s)")
+):
+    """
+    메트릭 push 수집 (배포된 VM의 에이전트용)
+    
+    - Content-Type: application/json → compact JSON
+      {"deployment_id": "...", "series": [{"name", "tags", "unit", "points": [[epoch_ms, value], ...]}]}
+    - 그 밖의 Content-Type → line protocol (measurement,deployment_id=...,unit=percent,tag=v value=1.5 timestamp)
+    - 메모리 버퍼에 넣고 즉시 202 응답, 백그라운드에서 배치로 저장소에 기록
+    - 버퍼가 가득 차면 429 + Retry-After (에이전트는 잠시 후 재전송)
+    - 본문이 METRICS_INGEST_MAX_BODY_BYTES를 넘으면 413, 없는 배포 ID가 있으면 404
+    """
+    body = await _read_ingest_body(request, settings.METRICS_INGEST_MAX_BODY_BYTES)
+    
+    default_deployment = str(deployment_id) if deployment_id else None
+    try:
+        if request.headers.get("content-type", "").startswith("application/json"):
+            batch = parse_json_batch(json.loads(body), default_deployment)
+        else:
+            batch = parse_line_protocol(body.decode("utf-8"), default_deployment, precision)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid metrics payload: {str(e)}")
+    
+    unknown = await _unknown_ingest_deployments(batch.deployment_ids)
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Deployment not found: {', '.join(unknown)}")
+    
+    buffer = get_ingest_buffer()
+    try:
+        accepted = buffer.offer(batch)
+    except IngestBufferFull as e:
+        logger.warning(f"메트릭 수집 거절: {str(e)}")
+        retry_after = max(1, int(settings.METRICS_INGEST_FLUSH_INTERVAL + 0.999))
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(retry_after)})
+    
+    return {"accepted": accepted, "series": len(batch.series), "pending": buffer.pending_points}
+
+
+async def _read_ingest_body(request: Request, limit: int) -> bytes:
+    """
+    요청 본문 읽기 (limit 바이트 초과 시 413)
+    
+    Content-Length로 먼저 거절하고, 없거나 틀려도 스트림을 읽는 동안 limit을 넘으면 바로 중단한다.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length is not None:
+        try:
+            declared = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length")
+        if declared > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    return bytes(body)
+
+
+async def _unknown_ingest_deployments(deployment_ids: List[str]) -> List[str]:
+    """
+    존재하지 않는 배포 ID (수집 요청 검증)
+    
+    에이전트는 같은 배포로 계속 보내므로 확인된 배포는 METRICS_INGEST_DEPLOYMENT_CACHE_TTL 동안 캐시하고,
+    캐시에 없는 ID만 한 번의 조회로 확인한다.
+    """
+    missing = [d for d in deployment_ids if _known_ingest_deployments.get(d) is None]
+    if not missing:
+        return []
+    unknown = await asyncio.to_thread(_unknown_deployments, [UUID(d) for d in missing])
+    for deployment_id in missing:
+        if deployment_id not in unknown:
+            _known_ingest_deployments.set(deployment_id, True)
+    return unknown
+
+
+def _unknown_deployments(deployment_ids: List[UUID]) -> List[str]:
+    """
+    존재하지 않는 배포 ID (스트림 구독 검증)
+
+    스트림 연결 동안 DB 커넥션을 잡아 두지 않도록 의존성 대신 짧은 세션으로 조회한다.
+    """
+    if not deployment_ids:
+        return []
+    from app.db.session import SessionLocal
+    from app.repositories.implementations.deployment_repository import DeploymentRepository
+
+    db = SessionLocal()
+    try:
+        found = {deployment.id for deployment in DeploymentRepository(db).bulk_get_by_ids(deployment_ids)}
+    finally:
+        db.close()
+    return [str(d) for d in deployment_ids if d not in found]
+
+
+@router.get("/stream")
+async def stream_metrics_sse(
+    request: Request,
+    deployment_id: List[UUID] = Query(..., description="구독할 배포 ID (여러 번 지정 가능)")
+):
+    """
+    실시간 메트릭 스트림 (Server-Sent Events)
+    
+    - 첫 메시지: 배포별 최신 점 + 상태 스냅샷
+    - 이후: 새 점과 상태 변경만 전송 (event: update)
+    - 느린 구독자는 event: dropped 후 종료 (클라이언트는 재연결)
+    - 없는 배포 ID가 있으면 404
+    """
+    deployment_ids = list(dict.fromkeys(deployment_id))
+    unknown = _unknown_deployments(deployment_ids)
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Deployment not found: {', '.join(unknown)}")
+    
+    hub = get_metrics_stream_hub()
+    subscription = await hub.subscribe([str(d) for d in deployment_ids])
+    
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                message = await subscription.get(timeout=settings.METRICS_STREAM_HEARTBEAT)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {message['type']}\ndata: {json.dumps(message, ensure_ascii=False)}\n\n"
+                if message["type"] == "dropped":
+                    break
+        finally:
+            hub.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def stream_metrics_ws(
+    websocket: WebSocket,
+    deployment_id: List[UUID] = Query([], description="구독할 배포 ID (여러 번 지정 가능)")
+):
+    """
+    실시간 메트릭 스트림 (WebSocket)
+    
+    - 서버 → 클라이언트: SSE와 같은 메시지 ({"type": "update" | "dropped", ...})
+    - 클라이언트 → 서버: {"subscribe": [배포 ID, ...]} / {"unsubscribe": [배포 ID, ...]}
+    - 없는 배포 ID: 연결 시에는 error 메시지 후 종료(1008), 구독 명령이면 error 메시지만 보내고 무시
+    """
+    await websocket.accept()
+    deployment_ids = list(dict.fromkeys(deployment_id))
+    unknown = _unknown_deployments(deployment_ids)
+    if unknown:
+        await websocket.send_json({"type": "error", "detail": f"Deployment not found: {', '.join(unknown)}"})
+        await websocket.close(code=1008)
+        return
+    hub = get_metrics_stream_hub()
+    subscription = await hub.subscribe([str(d) for d in deployment_ids])
+    
+    async def send_loop():
+        while True:
+            message = await subscription.get()
+            await websocket.send_json(message)
+            if message["type"] == "dropped":
+                await websocket.close(code=1013)
+                return
+    
+    async def receive_loop():
+        while True:
+            command = await websocket.receive_json()
+            try:
+                add = list(dict.fromkeys(UUID(str(d)) for d in command.get("subscribe", [])))
+                remove = [str(UUID(str(d))) for d in command.get("unsubscribe", [])]
+            except (AttributeError, TypeError, ValueError):
+                await websocket.send_json({"type": "error", "detail": "invalid subscription command"})
+                continue
+            unknown = _unknown_deployments(add)
+            if unknown:
+                await websocket.send_json({"type": "error", "detail": f"Deployment not found: {', '.join(unknown)}"})
+                continue
+            await hub.update(subscription, add=[str(d) for d in add], remove=remove)
+    
+    # 보내기/받기 중 하나가 끝나면 (연결 종료, 구독자 끊김) 나머지도 정리
+    tasks = [asyncio.create_task(send_loop()), asyncio.create_task(receive_loop())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, (WebSocketDisconnect, RuntimeError)):
+                logger.warning(f"메트릭 스트림 WebSocket 오류: {str(error)}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
+
+
 @router.get("/vm/connectivity")
 async def check_vm_connectivity(
     vm_name: Optional[str] = Query(None, description="VM 이름 (기본값: Solmakase-Dev-Server)"),
-    vagrant_dir: Optional[str] = Query(None, description="Vagrantfile 디렉토리")
+    vagrant_dir: Optional[str] = Query(None, description="Vagrantfile 디렉토리"),
+    refresh: bool = Query(False, description="캐시(VM_CHECK_CACHE_TTL)를 무시하고 다시 확인")
 ):
     """
     VM 연결성 확인
@@ -138,8 +432,16 @@ async def check_vm_connectivity(
     - Vagrant 상태 확인
     - SSH 연결 확인
     - 네트워크 연결 확인
+    - 각 확인은 동시에 실행되고, 결과는 VM_CHECK_CACHE_TTL 동안 캐시
+    - 백그라운드 프로버가 확인 중인 VM이면 최신 결과를 반환 (checked_at, stale 포함)
     """
-    checker = VMConnectivityChecker(vm_name=vm_name)
+    checker = VMConnectivityChecker(vm_name=vm_name, use_cache=not refresh)
+    prober = get_connectivity_prober()
+    if prober is not None and not refresh and vagrant_dir is None:
+        latest = prober.latest(f"vm:{checker.vm_name}")
+        if latest is not None and not latest["stale"]:
+            return {**latest["result"], "checked_at": latest["checked_at"], "stale": False}
+    
     results = await checker.check_all(vagrant_dir=vagrant_dir)
     
     logger.info(f"VM 연결성 확인: overall_status={results['overall']['status']}")
@@ -147,14 +449,47 @@ async def check_vm_connectivity(
     return results
 
 
+@router.get("/vm/status")
+async def get_connectivity_status(
+    include_results: bool = Query(False, description="대상별 확인 결과 원본 포함 여부")
+):
+    """
+    백그라운드 연결성 프로버 상태
+    
+    - 대상별 최신 상태(up/down/error/pending), 확인 시각, 경과 시간, stale 여부
+    - 대상: 기본 VM, CONNECTIVITY_PROBE_VMS, CONNECTIVITY_PROBE_HOSTS
+    """
+    prober = get_connectivity_prober()
+    if prober is None:
+        raise HTTPException(status_code=503, detail="Connectivity prober is disabled")
+    return prober.snapshot(include_results=include_results)
+
+
+@router.get("/vm/status/history")
+async def get_connectivity_history(
+    target: str = Query(..., description="대상 키 (예: vm:Solmakase-Dev-Server, port:192.168.56.10:22)")
+):
+    """
+    대상별 최근 연결성 확인 이력 (오래된 순, 최대 CONNECTIVITY_PROBE_HISTORY개)
+    """
+    prober = get_connectivity_prober()
+    if prober is None:
+        raise HTTPException(status_code=503, detail="Connectivity prober is disabled")
+    history = prober.history(target)
+    if history is None:
+        raise HTTPException(status_code=404, detail="Probe target not found")
+    return {"target": target, "history": history}
+
+
 @router.get("/vm/virtualbox")
 async def check_virtualbox_status(
-    vm_name: Optional[str] = Query(None, description="VM 이름")
+    vm_name: Optional[str] = Query(None, description="VM 이름"),
+    refresh: bool = Query(False, description="캐시를 무시하고 다시 확인")
 ):
     """
     VirtualBox VM 상태 확인
     """
-    checker = VMConnectivityChecker(vm_name=vm_name)
+    checker = VMConnectivityChecker(vm_name=vm_name, use_cache=not refresh)
     result = await checker.check_virtualbox_vm_status()
     
     return result
@@ -162,12 +497,13 @@ async def check_virtualbox_status(
 
 @router.get("/vm/vagrant")
 async def check_vagrant_status(
-    vagrant_dir: Optional[str] = Query(None, description="Vagrantfile 디렉토리")
+    vagrant_dir: Optional[str] = Query(None, description="Vagrantfile 디렉토리"),
+    refresh: bool = Query(False, description="캐시를 무시하고 다시 확인")
 ):
     """
     Vagrant 상태 확인
     """
-    checker = VMConnectivityChecker()
+    checker = VMConnectivityChecker(use_cache=not refresh)
     result = await checker.check_vagrant_status(vagrant_dir=vagrant_dir)
     
     return result
@@ -177,7 +513,8 @@ async def check_vagrant_status(
 async def check_ssh_connection(
     host: str = Query("localhost", description="호스트 주소"),
     port: int = Query(22, description="SSH 포트"),
-    vagrant_dir: Optional[str] = Query(None, description="Vagrantfile 디렉토리 (Vagrant SSH 확인 시)")
+    vagrant_dir: Optional[str] = Query(None, description="Vagrantfile 디렉토리 (Vagrant SSH 확인 시)"),
+    refresh: bool = Query(False, description="캐시를 무시하고 다시 확인")
 ):
     """
     SSH 연결 확인
@@ -185,7 +522,7 @@ async def check_ssh_connection(
     - 직접 호스트/포트 지정 또는
     - Vagrant SSH 설정 사용
     """
-    checker = VMConnectivityChecker()
+    checker = VMConnectivityChecker(use_cache=not refresh)
     
     if vagrant_dir:
         result = await checker.check_vagrant_ssh(vagrant_dir=vagrant_dir)
@@ -197,15 +534,16 @@ async def check_ssh_connection(
 
 @router.get("/vm/network")
 async def check_network_connectivity(
-    include_optional: bool = Query(True, description="선택적 서비스(PostgreSQL, Redis) 포함 여부")
+    include_optional: bool = Query(True, description="선택적 서비스(PostgreSQL, Redis) 포함 여부"),
+    refresh: bool = Query(False, description="캐시를 무시하고 다시 확인")
 ):
     """
     네트워크 연결 확인
     
-    - 기본 서비스 포트 연결 확인
+    - 기본 서비스 포트 연결 확인 (동시 확인)
     - 필수 서비스(FastAPI)와 선택적 서비스(PostgreSQL, Redis) 구분
     """
-    checker = VMConnectivityChecker()
+    checker = VMConnectivityChecker(use_cache=not refresh)
     
     # 기본 호스트 리스트
     hosts = [
@@ -224,6 +562,68 @@ async def check_network_connectivity(
     return result
 
 
+@router.post("/network/sweep")
+async def sweep_network(request: Request, sweep_request: NetworkSweepRequest):
+    """
+    네트워크 대역 포트 스윕 (배포 전 온프레미스 대역 검증)
+    
+    - cidrs × ports 비동기 TCP 연결 확인 (프로세스 전역 동시 연결/초당 시도 수 제한, 호스트별 시간 예산)
+    - NETWORK_SWEEP_ALLOWED_CIDRS(기본: 사설/CGNAT/ULA 대역) 밖의 대역은 400
+    - 응답: NDJSON 스트림, 결과가 끝나는 순서대로 한 줄씩 ({"type": "result", ...}),
+      마지막 줄은 요약 ({"type": "summary", ...})
+    - NETWORK_SWEEP_INVENTORY_TTL 안에 확인한 (host, port)는 인벤토리 결과 재사용 (cached: true)
+    """
+    try:
+        hosts = expand_hosts(sweep_request.cidrs)
+        ports = parse_ports(sweep_request.ports)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not hosts or not ports:
+        raise HTTPException(status_code=400, detail="At least one host and one port are required")
+    if len(ports) > settings.NETWORK_SWEEP_MAX_PORTS:
+        raise HTTPException(status_code=400, detail=f"Too many ports (max {settings.NETWORK_SWEEP_MAX_PORTS})")
+    
+    logger.info(f"네트워크 스윕 시작: cidrs={sweep_request.cidrs}, hosts={len(hosts)}, ports={len(ports)}")
+    sweeper = NetworkSweeper()
+    
+    async def lines():
+        started = datetime.utcnow()
+        results = []
+        async for result in sweeper.sweep(hosts, ports, refresh=sweep_request.refresh):
+            results.append(result)
+            yield json.dumps({"type": "result", **result, "checked_at": result["checked_at"].isoformat()}) + "\n"
+            if len(results) % 256 == 0 and await request.is_disconnected():
+                return
+        summary = summarize(results)
+        summary["duration_ms"] = round((datetime.utcnow() - started).total_seconds() * 1000, 1)
+        logger.info(
+            f"네트워크 스윕 완료: total={summary['total']}, open={summary['counts']['open']}, "
+            f"duration_ms={summary['duration_ms']}"
+        )
+        yield json.dumps({"type": "summary", **summary}) + "\n"
+    
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/network/inventory")
+async def get_network_inventory(
+    cidr: Optional[str] = Query(None, description="대역 (예: 192.168.56.0/24, 없으면 전체)"),
+    status: Optional[str] = Query("open", description="상태 (open, closed, filtered, error, 비우면 전체)")
+):
+    """
+    네트워크 스윕 인벤토리 조회 (NETWORK_SWEEP_INVENTORY_TTL 안에 확인한 결과)
+    """
+    try:
+        results = get_sweep_inventory().query(cidr=cidr, status=status or None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"cidr": cidr, "count": len(results), "results": results}
+
+
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check():
     """
@@ -1,19 +1,23 @@
 """
 요구사항 수집 API
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Path, BackgroundTasks
 from typing import List
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.schemas.requirement import RequirementCreate, RequirementResponse
 from app.schemas.chat import ChatMessageCreate, ChatMessageResponse
+from app.schemas.document import UploadInitRequest, UploadStatusResponse, UploadPartResponse
 from app.services.requirement_service import RequirementService
+from app.services.ingestion_service import index_document_content
+from app.core.config import settings
 from app.core.dependencies import get_requirement_repository, get_chat_repository, get_db
 from app.repositories.interfaces.requirement_repository import IRequirementRepository
 from app.repositories.interfaces.chat_repository import IChatRepository
 from app.repositories.interfaces.document_repository import IDocumentRepository
 from app.repositories.implementations.document_repository import DocumentRepository
+from app.repositories.implementations.document_content_repository import DocumentContentRepository
 
 router = APIRouter()
 
@@ -30,9 +34,16 @@ async def create_requirement(
     return await service.create_requirement(requirement)
 
 
+def _schedule_indexing(background_tasks: BackgroundTasks, result: dict) -> None:
+    """업로드 문서 벡터 스토어 수집 예약 (응답 후 실행, 캐시 적중이면 이미 수집된 내용은 건너뜀)"""
+    if settings.DOCUMENT_INDEXING_ENABLED and result.get("content_hash"):
+        background_tasks.add_task(index_document_content, result["content_hash"])
+
+
 @router.post("/upload")
 async def upload_document(
     requirement_id: UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     repository: IRequirementRepository = Depends(get_requirement_repository),
     db: Session = Depends(get_db)
@@ -41,8 +52,106 @@ async def upload_document(
     문서 업로드
     """
     document_repository: IDocumentRepository = DocumentRepository(db)
-    service = RequirementService(repository, document_repository)
-    return await service.upload_document(requirement_id, file)
+    service = RequirementService(repository, document_repository, DocumentContentRepository(db))
+    result = await service.upload_document(requirement_id, file)
+    _schedule_indexing(background_tasks, result)
+    return result
+
+
+def _upload_error(e: ValueError) -> HTTPException:
+    """업로드 서비스 ValueError → HTTP 오류 (없는 업로드/요구사항은 404)"""
+    message = str(e)
+    not_found = message.startswith(("Upload ", "Requirement ")) and message.endswith("not found")
+    return HTTPException(status_code=404 if not_found else 400, detail=message)
+
+
+@router.post("/upload/init", response_model=UploadStatusResponse)
+async def init_upload(
+    upload: UploadInitRequest,
+    repository: IRequirementRepository = Depends(get_requirement_repository),
+    db: Session = Depends(get_db)
+):
+    """
+    재개 가능한 멀티파트 업로드 시작
+    
+    - 반환된 upload_id로 PUT /upload/{upload_id}/parts/{N} (N = 1..total_parts) 전송
+    - 파트는 병렬로 보낼 수 있고, 실패한 파트만 다시 보내면 된다
+    """
+    service = RequirementService(repository, DocumentRepository(db))
+    try:
+        return await service.init_upload(upload)
+    except ValueError as e:
+        raise _upload_error(e)
+
+
+@router.put("/upload/{upload_id}/parts/{part_number}", response_model=UploadPartResponse)
+async def upload_part(
+    upload_id: UUID,
+    request: Request,
+    part_number: int = Path(..., ge=1),
+    repository: IRequirementRepository = Depends(get_requirement_repository),
+    db: Session = Depends(get_db)
+):
+    """
+    파트 업로드 (요청 본문 = 파트 바이트, 스트리밍 저장)
+    """
+    service = RequirementService(repository, DocumentRepository(db))
+    try:
+        return await service.upload_part(upload_id, part_number, request.stream())
+    except ValueError as e:
+        raise _upload_error(e)
+
+
+@router.get("/upload/{upload_id}", response_model=UploadStatusResponse)
+async def get_upload_status(
+    upload_id: UUID,
+    repository: IRequirementRepository = Depends(get_requirement_repository),
+    db: Session = Depends(get_db)
+):
+    """
+    멀티파트 업로드 상태 조회 (재개 시 missing_parts만 다시 전송)
+    """
+    service = RequirementService(repository, DocumentRepository(db))
+    try:
+        return await service.get_upload_status(upload_id)
+    except ValueError as e:
+        raise _upload_error(e)
+
+
+@router.post("/upload/{upload_id}/complete")
+async def complete_upload(
+    upload_id: UUID,
+    background_tasks: BackgroundTasks,
+    repository: IRequirementRepository = Depends(get_requirement_repository),
+    db: Session = Depends(get_db)
+):
+    """
+    멀티파트 업로드 완료 (파트 결합 → 파싱 → 요구사항 반영)
+    """
+    service = RequirementService(repository, DocumentRepository(db), DocumentContentRepository(db))
+    try:
+        result = await service.complete_upload(upload_id)
+    except ValueError as e:
+        raise _upload_error(e)
+    _schedule_indexing(background_tasks, result)
+    return result
+
+
+@router.delete("/upload/{upload_id}")
+async def abort_upload(
+    upload_id: UUID,
+    repository: IRequirementRepository = Depends(get_requirement_repository),
+    db: Session = Depends(get_db)
+):
+    """
+    멀티파트 업로드 취소
+    """
+    service = RequirementService(repository, DocumentRepository(db))
+    try:
+        await service.abort_upload(upload_id)
+    except ValueError as e:
+        raise _upload_error(e)
+    return {"upload_id": str(upload_id), "status": "failed"}
 
 
 @router.get("/{requirement_id}", response_model=RequirementResponse)
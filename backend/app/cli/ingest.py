@@ -0,0 +1,120 @@
+"""
+지식 베이스 일괄 수집 CLI
+
+파일/디렉터리의 문서를 청킹하고 배치 임베딩으로 벡터 스토어에 저장한다.
+청크 ID가 (파일 내용 해시 + 청크 텍스트) 기준이므로 같은 파일을 다시 실행해도 중복 저장되지 않고,
+파일이 바뀌었으면 같은 경로로 수집했던 이전 버전의 청크는 삭제된다.
+
+실행:
+    cd backend
+    python -m app.cli.ingest docs/knowledge --glob "*.md" --source aws-best-practices
+    python -m app.cli.ingest spec.pdf --dry-run
+"""
+import argparse
+import asyncio
+import hashlib
+import sys
+from pathlib import Path
+from typing import Iterable, List
+
+from app.core.config import settings
+from app.core.logging_config import setup_logging, get_logger
+from app.services.ingestion_service import IngestDocument, IngestionService, chunk_text
+from app.services.parsing_engine import get_parsing_engine, shutdown_parsing_engine
+
+logger = get_logger("app.cli.ingest")
+
+TEXT_TYPES = {"txt", "md"}
+
+
+def _collect_files(paths: Iterable[str], pattern: str) -> List[Path]:
+    """입력 경로 → 수집 대상 파일 목록 (디렉터리는 pattern으로 재귀 검색)"""
+    supported = TEXT_TYPES | set(settings.ALLOWED_FILE_TYPES)
+    files = []
+    for raw in paths:
+        path = Path(raw)
+        candidates = sorted(path.rglob(pattern)) if path.is_dir() else [path]
+        for candidate in candidates:
+            if candidate.is_file() and candidate.suffix.lstrip(".").lower() in supported:
+                files.append(candidate)
+    return files
+
+
+async def _load_documents(files: List[Path], source: str) -> List[IngestDocument]:
+    """파일 읽기/파싱 (PDF/DOCX/PPTX/HWP는 파싱 엔진에서 병렬 처리)"""
+    engine = get_parsing_engine()
+
+    async def load(path: Path) -> IngestDocument:
+        file_type = path.suffix.lstrip(".").lower()
+        data = await asyncio.to_thread(path.read_bytes)
+        if file_type in TEXT_TYPES:
+            text = data.decode("utf-8", errors="ignore")
+        else:
+            text = (await engine.parse(str(path), file_type)).get("text", "")
+        content_hash = hashlib.sha256(data).hexdigest()
+        return IngestDocument(
+            text=text,
+            source_key=content_hash,
+            metadata={"source": source, "file_name": path.name, "file_type": file_type},
+            source_id=f"{source}:{path.resolve().as_posix()}",
+        )
+
+    results = await asyncio.gather(*(load(path) for path in files), return_exceptions=True)
+    documents = []
+    for path, result in zip(files, results):
+        if isinstance(result, Exception):
+            logger.warning(f"파일 읽기 실패: {path}: {result}")
+        elif result.text.strip():
+            documents.append(result)
+    return documents
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="수집할 파일 또는 디렉터리")
+    parser.add_argument("--glob", default="*", help="디렉터리 검색 패턴 (기본값: *)")
+    parser.add_argument("--source", default="knowledge_base", help="청크 메타데이터의 source 값")
+    parser.add_argument("--chunk-size", type=int, default=settings.CHUNK_SIZE, help="청크당 최대 토큰 수")
+    parser.add_argument("--overlap", type=int, default=settings.CHUNK_OVERLAP, help="청크 overlap 토큰 수")
+    parser.add_argument("--batch-size", type=int, default=settings.EMBEDDING_BATCH_SIZE, help="임베딩 호출당 청크 수")
+    parser.add_argument("--dry-run", action="store_true", help="임베딩/저장 없이 청크 수만 출력")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    files = _collect_files(args.paths, args.glob)
+    if not files:
+        print("수집할 파일이 없습니다", file=sys.stderr)
+        return 1
+
+    try:
+        documents = asyncio.run(_load_documents(files, args.source))
+    finally:
+        shutdown_parsing_engine()
+
+    if args.dry_run:
+        total = 0
+        for document in documents:
+            count = len(chunk_text(document.text, args.chunk_size, args.overlap))
+            total += count
+            print(f"{document.metadata['file_name']}: {count} chunks")
+        print(f"files={len(documents)} chunks={total}")
+        return 0
+
+    from app.services.llm_service import LLMService
+
+    service = IngestionService(
+        LLMService()._get_vector_store(),
+        batch_size=args.batch_size,
+        chunk_size=args.chunk_size,
+        overlap=args.overlap,
+    )
+    result = service.ingest_many(documents)
+    print(
+        f"files={result.documents} chunks={result.chunks} added={result.added} "
+        f"skipped={result.skipped} removed={result.removed} embedding_calls={result.batches}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+엔티티 캐시
+
+- 1차: 프로세스 내 LRU (TTL)
+- 2차(선택): Redis 호환 공유 캐시 (REDIS_URL)
+- 무효화: 프로세스 내 값은 바로 지우고, Redis를 사용하면 키별 공유 버전을 올려
+  다른 워커 프로세스가 가진 이전 버전 값도 즉시 무효가 된다.
+  Redis 없이 여러 워커로 실행하면 다른 워커의 쓰기가 TTL 동안 반영되지 않으므로
+  엔티티 캐시는 기본적으로 Redis를 쓸 때만 켜진다 (settings.entity_cache_enabled).
+"""
+from __future__ import annotations
+
+import copy
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.core.cache")
+
+_KEY_PREFIX = "solmakase:cache:"
+
+
+class LRUCache:
+    """
+    프로세스 내 LRU 캐시 (TTL 지원, 스레드 안전)
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """값 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class EntityCache:
+    """
+    리포지토리 엔티티 read-through 캐시
+
+    - get_or_load: 캐시에 현재 버전의 값이 있으면 반환, 없으면 loader로 조회 후 저장
+    - invalidate: 키의 캐시 값을 지우고 (Redis 사용 시) 공유 버전을 올려 다른 프로세스의 값도 무효화
+      (create/update/delete 시 호출)
+
+    조회 중 같은 키가 무효화되면 조회 결과는 저장하지 않는다. 이를 위해 조회 중인 키만
+    무효화 세대를 기록하므로 추가 상태는 동시 조회 수에 비례한다.
+
+    반환값은 복사본이므로 호출자가 엔티티를 수정해도 캐시에 영향이 없다.
+    """
+
+    def __init__(self, max_size: int, ttl: float, redis_client=None):
+        self.ttl = ttl
+        self._local = LRUCache(max_size=max_size, ttl=ttl)
+        # 조회 중인 키 → [동시 조회 수, 무효화 세대]
+        self._loading: Dict[str, List[int]] = {}
+        self._loading_lock = threading.Lock()
+        self._redis = redis_client
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시 조회, 없으면 loader 결과를 저장 후 반환 (None은 캐시하지 않음)"""
+        version, shared, shared_value = self._current(key)
+
+        entry = self._local.get(key)
+        if entry is not None and entry[0] == version:
+            return copy.deepcopy(entry[1])
+
+        if shared_value is not None:
+            self._local.set(key, (version, shared_value))
+            return copy.deepcopy(shared_value)
+
+        generation = self._begin_load(key)
+        try:
+            value = loader()
+        except BaseException:
+            self._end_load(key, generation)
+            raise
+        # 조회 전 버전을 기준으로 저장하므로, 다른 프로세스에서 조회 중 쓰기가 발생하면 공유 값은 바로 무효가 된다
+        if self._end_load(key, generation, (version, value) if value is not None else None):
+            if shared:
+                self._shared_set(key, version, value)
+        return copy.deepcopy(value) if value is not None else None
+
+    def _begin_load(self, key: str) -> int:
+        with self._loading_lock:
+            state = self._loading.setdefault(key, [0, 0])
+            state[0] += 1
+            return state[1]
+
+    def _end_load(self, key: str, generation: int, entry: Optional[Tuple[int, Any]] = None) -> bool:
+        """조회 종료, 조회 중 무효화가 없었으면 entry를 저장 (저장했으면 True)"""
+        with self._loading_lock:
+            state = self._loading[key]
+            state[0] -= 1
+            if state[0] == 0:
+                del self._loading[key]
+            if entry is None or state[1] != generation:
+                return False
+            # 무효화와 같은 락 안에서 저장해 무효화 직후 이전 값이 저장되지 않게 한다
+            self._local.set(key, entry)
+            return True
+
+    def invalidate(self, *keys: str) -> None:
+        """키 무효화"""
+        with self._loading_lock:
+            for key in keys:
+                self._local.delete(key)
+                state = self._loading.get(key)
+                if state is not None:
+                    state[1] += 1
+
+        if self._redis is not None and keys:
+            try:
+                pipe = self._redis.pipeline()
+                for key in keys:
+                    pipe.incr(_KEY_PREFIX + "ver:" + key)
+                    pipe.delete(_KEY_PREFIX + "val:" + key)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"공유 캐시 무효화 실패: keys={keys}, error={str(e)}")
+
+    def clear(self) -> None:
+        """프로세스 내 캐시 전체 삭제"""
+        self._local.clear()
+
+    def _current(self, key: str) -> Tuple[int, bool, Optional[Any]]:
+        """
+        현재 버전 조회
+
+        Redis 사용 시 버전과 공유 캐시 값을 한 번의 MGET으로 가져온다.
+        Redis를 쓰지 않거나 장애 시 버전은 0 (프로세스 내 무효화는 값 삭제로 반영된다).
+
+        Returns:
+            (버전, 공유 버전 여부, 공유 캐시 값)
+        """
+        if self._redis is None:
+            return 0, False, None
+
+        try:
+            raw_version, raw_value = self._redis.mget(
+                _KEY_PREFIX + "ver:" + key,
+                _KEY_PREFIX + "val:" + key,
+            )
+        except Exception as e:
+            logger.warning(f"공유 캐시 조회 실패: key={key}, error={str(e)}")
+            return 0, False, None
+
+        version = int(raw_version or 0)
+        if raw_value is None:
+            return version, True, None
+
+        stored_version, value = pickle.loads(raw_value)
+        return version, True, value if stored_version == version else None
+
+    def _shared_set(self, key: str, version: int, value: Any) -> None:
+        try:
+            self._redis.set(
+                _KEY_PREFIX + "val:" + key,
+                pickle.dumps((version, value)),
+                ex=max(1, int(self.ttl)),
+            )
+        except Exception as e:
+            logger.warning(f"공유 캐시 저장 실패: key={key}, error={str(e)}")
+
+
+def _create_redis_client():
+    """Redis 클라이언트 생성 (redis 패키지가 없거나 연결 불가하면 None)"""
+    try:
+        import redis
+    except ImportError:
+        logger.warning("redis가 설치되지 않아 공유 캐시 없이 동작합니다. pip install redis")
+        return None
+
+    try:
+        client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
+        client.ping()
+        return client
+    except Exception as e:
+        logger.warning(f"Redis 연결 실패, 공유 캐시 없이 동작합니다: {str(e)}")
+        return None
+
+
+_entity_cache: Optional[EntityCache] = None
+_entity_cache_lock = threading.Lock()
+
+
+def get_entity_cache() -> EntityCache:
+    """프로세스 전역 엔티티 캐시"""
+    global _entity_cache
+    if _entity_cache is None:
+        with _entity_cache_lock:
+            if _entity_cache is None:
+                redis_client = _create_redis_client() if settings.ENTITY_CACHE_USE_REDIS else None
+                _entity_cache = EntityCache(
+                    max_size=settings.ENTITY_CACHE_MAX_SIZE,
+                    ttl=settings.ENTITY_CACHE_TTL,
+                    redis_client=redis_client,
+                )
+    return _entity_cache
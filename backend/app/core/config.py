@@ -2,7 +2,7 @@
 애플리케이션 설정
 """
 from pydantic_settings import BaseSettings
-from typing import List, Union
+from typing import List, Optional, Union
 import os
 
 
@@ -16,7 +16,20 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
-    
+
+    # 엔티티 캐시 (리포지토리 read-through 캐시)
+    ENTITY_CACHE_ENABLED: Optional[bool] = None  # 미설정이면 ENTITY_CACHE_USE_REDIS를 따른다
+    ENTITY_CACHE_TTL: int = 10  # 초
+    ENTITY_CACHE_MAX_SIZE: int = 10000
+    ENTITY_CACHE_USE_REDIS: bool = False  # True면 REDIS_URL을 공유 캐시/버전 저장소로 사용
+
+    @property
+    def entity_cache_enabled(self) -> bool:
+        """엔티티 캐시 사용 여부 (Redis 없이 켜면 다른 워커의 쓰기가 TTL 동안 반영되지 않는다)"""
+        if self.ENTITY_CACHE_ENABLED is None:
+            return self.ENTITY_CACHE_USE_REDIS
+        return self.ENTITY_CACHE_ENABLED
+
     # 보안
     SECRET_KEY: str = "your-secret-key-here"
     ALGORITHM: str = "HS256"
@@ -36,18 +49,132 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50MB
     ALLOWED_FILE_TYPES: List[str] = ["pdf", "docx", "pptx", "hwp"]
     UPLOAD_DIR: str = "./uploads"
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 1MB (스트리밍 저장 청크 크기)
+    UPLOAD_PART_SIZE: int = 8 * 1024 * 1024  # 8MB (멀티파트 업로드 기본 파트 크기)
+    UPLOAD_MIN_PART_SIZE: int = 256 * 1024  # 256KB
+    
+    # 문서 파싱 (프로세스 풀)
+    PARSER_MAX_WORKERS: int = 0  # 0이면 CPU 코어 수
+    PARSER_TIMEOUT: int = 120  # 문서별 타임아웃 (초)
+    PARSER_MEMORY_LIMIT_MB: int = 1024  # 워커별 메모리 제한 (0이면 제한 없음)
+    PARSER_PDF_PAGES_PER_TASK: int = 20  # PDF 병렬 추출 단위 (페이지)
     
     # LLM
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4"
+    OPENAI_API_BASE: str = "https://api.openai.com/v1"
     LLM_TIMEOUT: int = 300  # 5분
+    LLM_HTTP_MAX_CONNECTIONS: int = 20  # OpenAI 호출 공유 커넥션 풀 크기
+    LLM_PREWARM: bool = False  # 시작 시 벡터 스토어 로드 + API 연결을 미리 수행
+    
+    # RAG 수집 (청킹/임베딩)
+    CHUNK_SIZE: int = 500  # 청크당 최대 토큰 수
+    CHUNK_OVERLAP: int = 50  # 인접 청크 사이 겹치는 토큰 수
+    EMBEDDING_BATCH_SIZE: int = 64  # 임베딩 호출당 청크 수
+    DOCUMENT_INDEXING_ENABLED: bool = True  # 업로드된 요구사항 문서를 벡터 스토어에 수집
+    EMBEDDING_CACHE_ENABLED: bool = True  # 임베딩 결과를 디스크에 캐시 (모델 + 텍스트 해시)
+    EMBEDDING_CACHE_DIR: str = ""  # 비어 있으면 UPLOAD_DIR/embedding_cache
+    EMBEDDING_CACHE_DTYPE: str = "float16"  # 저장 dtype (float16: 용량 절반, float32: 원본 정밀도)
+    EMBEDDING_QUERY_CACHE_SIZE: int = 1024  # 질의 임베딩 프로세스 내 LRU 크기 (질의는 디스크에 저장하지 않음)
+    EMBEDDING_QUERY_CACHE_TTL: float = 3600.0  # 질의 임베딩 캐시 TTL (초)
+    
+    # 벡터 스토어
+    VECTOR_STORE_BACKEND: str = "chroma"  # chroma | local (프로세스 내 NumPy 인덱스)
+    VECTOR_INDEX_DTYPE: str = "float16"  # local 벡터 저장 dtype: float32 | float16 | int8
+    VECTOR_INDEX_TYPE: str = "flat"  # local 검색 방식: flat (정확) | ivf (근사)
+    VECTOR_INDEX_IVF_MIN_ROWS: int = 20000  # 이 행 수 이상일 때 IVF 사용
+    VECTOR_INDEX_IVF_NPROBE: int = 8  # IVF 검색 시 조회할 목록 수
+    
+    # RAG 검색 (BM25 + 벡터 하이브리드)
+    RETRIEVAL_TOP_K: int = 3  # 반환 청크 수
+    RETRIEVAL_FETCH_K: int = 20  # BM25/벡터 각각의 후보 수
+    RETRIEVAL_RRF_K: int = 60  # Reciprocal Rank Fusion 상수
+    RETRIEVAL_MMR_ENABLED: bool = True  # 결합 후보를 MMR로 다양화
+    RETRIEVAL_MMR_LAMBDA: float = 0.7  # 1에 가까울수록 관련도 우선, 0에 가까울수록 다양성 우선
+    RETRIEVAL_MAX_CONTEXT_TOKENS: int = 1500  # 프롬프트에 넣을 검색 결과 토큰 상한 (0이면 제한 없음)
+    RETRIEVAL_CACHE_SIZE: int = 256
+    RETRIEVAL_CACHE_TTL: int = 600  # 초
+    RETRIEVAL_BM25_SYNC_INTERVAL: float = 30.0  # 버전이 같아도 이 간격(초)마다 ID 목록을 비교해 BM25 색인 동기화
     
     # 문서 보관
     DOCUMENT_RETENTION_DAYS: int = 7
+    RETENTION_SWEEP_ENABLED: bool = True
+    RETENTION_SWEEP_INTERVAL: int = 3600  # 정리 주기 (초)
+    RETENTION_SWEEP_BATCH_SIZE: int = 500  # 배치당 문서 수
+    RETENTION_SWEEP_MAX_BATCHES: int = 20  # 실행당 최대 배치 수
+    RETENTION_SWEEP_BATCH_PAUSE: float = 0.5  # 배치 사이 대기 (초)
     
     # 배포
     DEPLOYMENT_TIMEOUT: int = 1800  # 30분
     
+    # VM 연결성 확인
+    VM_CHECK_CACHE_TTL: float = 10.0  # 초, 확인 결과 캐시 (요청/배포 전 확인이 공유)
+    VM_CHECK_CACHE_SIZE: int = 256
+    VM_CHECK_CONNECT_TIMEOUT: float = 2.0  # 초, 네트워크 포트 연결 타임아웃
+    CONNECTIVITY_PROBE_ENABLED: bool = False  # 백그라운드 주기 확인 (엔드포인트/배포 전 확인은 결과 캐시를 읽음)
+    CONNECTIVITY_PROBE_INTERVAL: float = 30.0  # 초, 확인 라운드 간격
+    CONNECTIVITY_PROBE_JITTER: float = 0.5  # 대상별 시작 지연 상한 (간격 대비 비율)
+    CONNECTIVITY_PROBE_CONCURRENCY: int = 50  # 동시 확인 수 상한
+    CONNECTIVITY_PROBE_HISTORY: int = 20  # 대상별 보관 이력 수
+    CONNECTIVITY_PROBE_STALE_SECONDS: float = 90.0  # 이보다 오래된 결과는 stale (요청 시 직접 확인)
+    CONNECTIVITY_PROBE_VMS: str = ""  # 추가로 확인할 VirtualBox VM 이름 (쉼표 구분)
+    CONNECTIVITY_PROBE_HOSTS: str = ""  # 추가로 확인할 host:port (쉼표 구분, 예: 192.168.56.10:22, 시작 시 검증)
+    
+    # 네트워크 대역 포트 스윕
+    NETWORK_SWEEP_CONCURRENCY: int = 512  # 동시 연결 수 (프로세스 전체, 동시에 실행되는 스윕이 나눠 씀)
+    NETWORK_SWEEP_RATE: float = 2000.0  # 초당 연결 시도 수 (프로세스 전체, 0이면 제한 없음)
+    NETWORK_SWEEP_TIMEOUT: float = 1.0  # 초, 포트별 연결 타임아웃
+    NETWORK_SWEEP_HOST_BUDGET: float = 3.0  # 초, 호스트별 시간 예산 (넘으면 남은 포트 건너뜀)
+    NETWORK_SWEEP_MAX_HOSTS: int = 4096  # 요청당 최대 호스트 수 (/20)
+    # 스윕 허용 대역 (쉼표 구분 CIDR, 기본: 사설/CGNAT/ULA), 밖의 대역 요청은 거절
+    # 루프백(서버 자신의 포트)과 링크 로컬(169.254.169.254 클라우드 메타데이터 등)은 기본에서 제외
+    NETWORK_SWEEP_ALLOWED_CIDRS: str = "10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,100.64.0.0/10,fc00::/7"
+    NETWORK_SWEEP_MAX_PORTS: int = 64  # 요청당 최대 포트 수
+    NETWORK_SWEEP_INVENTORY_TTL: int = 300  # 초, 스윕 결과 재사용 기간
+    NETWORK_SWEEP_INVENTORY_SIZE: int = 100000  # 인벤토리 최대 항목 수 (host, port)
+    
+    # 모니터링 메트릭 저장소
+    METRICS_STORE_DIR: str = "./data/metrics"
+    METRICS_PARTITION_SECONDS: int = 86400  # 파티션 파일 폭 (초)
+    METRICS_RETENTION_DAYS: int = 30  # 원본 점 보관 기간, 0이면 무제한
+    METRICS_ROLLUP_RETENTION_DAYS: int = 365  # 롤업(1분/5분/1시간/1일) 보관 기간, 0이면 무제한
+    METRICS_RETENTION_INTERVAL: int = 3600  # 보관 기간 정리 주기 (초)
+    METRICS_MOCK_FALLBACK: bool = True  # 저장된 메트릭이 없으면 임시 메트릭 생성
+    METRICS_MAX_POINTS: int = 1000  # 메트릭 조회 기본 최대 점 수 (차트 응답 크기 고정)
+    METRICS_SOURCE: str = "store"  # 메트릭 조회 소스: store(내장 저장소) 또는 prometheus
+
+    # 메트릭 수집 (POST /monitoring/ingest, 에이전트 push)
+    METRICS_INGEST_BUFFER_MAX_POINTS: int = 500000  # 메모리 버퍼 상한, 넘으면 429 (backpressure)
+    METRICS_INGEST_FLUSH_POINTS: int = 50000  # 버퍼가 이만큼 차면 즉시 저장소에 기록
+    METRICS_INGEST_FLUSH_INTERVAL: float = 1.0  # 초, 주기적 기록 간격
+    METRICS_INGEST_MAX_BODY_BYTES: int = 10 * 1024 * 1024  # 요청 본문 최대 크기
+    METRICS_INGEST_DEPLOYMENT_CACHE_TTL: float = 300.0  # 초, 수집 요청의 배포 존재 확인 결과 캐시
+    METRICS_INGEST_RECENT_SERIES: int = 100000  # 중복 검사용 최근 타임스탬프를 남겨 둘 최대 시계열 수 (LRU)
+    METRICS_INGEST_RECENT_TTL: float = 3600.0  # 초, 이 시간 동안 기록이 없는 시계열의 최근 타임스탬프는 버림
+
+    # 실시간 메트릭 스트림 (WebSocket/SSE)
+    METRICS_STREAM_INTERVAL: float = 2.0  # 초, 배포별 신규 점 조회 주기 (구독자 수와 무관하게 한 번)
+    METRICS_STREAM_LOOKBACK: int = 30  # 초, 늦게 기록된 점을 놓치지 않도록 다시 읽는 구간
+    METRICS_STREAM_SLOW_CONSUMER_SECONDS: float = 30.0  # 이 시간 동안 메시지를 가져가지 않는 구독자는 끊음
+    METRICS_STREAM_MAX_PENDING: int = 5000  # 구독자별 미전송 시계열 수 상한 (넘으면 끊음)
+    METRICS_STREAM_HEARTBEAT: float = 15.0  # 초, SSE keep-alive 주석 간격
+
+    # 알림 규칙 (수집 시 증분 평가)
+    ALERT_ENABLED: bool = True
+    ALERT_RULES_FILE: str = ""  # 규칙 JSON 파일 경로, 비어 있으면 기본 규칙 (percent > 80 warning, > 95 critical)
+    ALERT_EVALUATION_INTERVAL: int = 15  # 초, 데이터 없음(absent) 규칙 평가 주기
+    ALERT_SERIES_TTL: int = 86400  # 초, 이 시간 동안 점이 없고 firing 알림도 없는 시계열의 평가 상태는 버린다
+    ALERT_STATUS_STALE_SECONDS: int = 300  # 초, 배포의 마지막 점이 이보다 오래되면 firing 알림이 없어도 상태는 unknown
+
+    # Prometheus (METRICS_SOURCE=prometheus)
+    PROMETHEUS_URL: str = "http://localhost:9090"
+    PROMETHEUS_TIMEOUT: float = 10.0  # 초
+    PROMETHEUS_MAX_CONNECTIONS: int = 20  # 공유 커넥션 풀 크기 (동시 쿼리 수 상한)
+    PROMETHEUS_DEPLOYMENT_LABEL: str = "deployment_id"  # 배포를 구분하는 레이블
+    PROMETHEUS_MIN_STEP: int = 15  # 범위 조회 최소 step (초, scrape 간격)
+    PROMETHEUS_CACHE_SIZE: int = 512
+    PROMETHEUS_CACHE_TTL: int = 30  # 초, 범위 조회 결과 캐시 (키: 쿼리, step, step 정렬 범위)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -5,6 +5,8 @@ from typing import Generator
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.cache import get_entity_cache
 from app.db.session import SessionLocal
 from app.repositories.interfaces.requirement_repository import IRequirementRepository
 from app.repositories.implementations.requirement_repository import RequirementRepository
@@ -16,6 +18,14 @@ from app.repositories.interfaces.chat_repository import IChatRepository
 from app.repositories.implementations.chat_repository import ChatRepository
 from app.repositories.interfaces.iac_repository import IIaCRepository
 from app.repositories.implementations.iac_repository import IaCRepository
+from app.repositories.interfaces.alert_repository import IAlertRepository
+from app.repositories.implementations.alert_repository import AlertRepository
+from app.repositories.implementations.cached_repositories import (
+    CachedRequirementRepository,
+    CachedInfrastructureRepository,
+    CachedDeploymentRepository,
+    CachedIaCRepository,
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -35,7 +45,10 @@ def get_requirement_repository(
     """
     요구사항 리포지토리 의존성
     """
-    return RequirementRepository(db)
+    repository = RequirementRepository(db)
+    if settings.entity_cache_enabled:
+        return CachedRequirementRepository(repository, get_entity_cache())
+    return repository
 
 
 def get_infrastructure_repository(
@@ -44,7 +57,10 @@ def get_infrastructure_repository(
     """
     인프라 설계 리포지토리 의존성
     """
-    return InfrastructureRepository(db)
+    repository = InfrastructureRepository(db)
+    if settings.entity_cache_enabled:
+        return CachedInfrastructureRepository(repository, get_entity_cache())
+    return repository
 
 
 def get_deployment_repository(
@@ -53,7 +69,10 @@ def get_deployment_repository(
     """
     배포 리포지토리 의존성
     """
-    return DeploymentRepository(db)
+    repository = DeploymentRepository(db)
+    if settings.entity_cache_enabled:
+        return CachedDeploymentRepository(repository, get_entity_cache())
+    return repository
 
 
 def get_chat_repository(
@@ -71,5 +90,16 @@ def get_iac_repository(
     """
     IaC 코드 리포지토리 의존성
     """
-    return IaCRepository(db)
+    repository = IaCRepository(db)
+    if settings.entity_cache_enabled:
+        return CachedIaCRepository(repository, get_entity_cache())
+    return repository
 
+
+def get_alert_repository(
+    db: Session = Depends(get_db)
+) -> IAlertRepository:
+    """
+    알림 이벤트 리포지토리 의존성
+    """
+    return AlertRepository(db)
@@ -0,0 +1,204 @@
+"""
+애플리케이션 전역 리소스 레지스트리
+
+LLM 클라이언트, 임베딩 클라이언트, ChromaDB 클라이언트/벡터 스토어는 생성 비용이 크고
+(HTTP 커넥션 풀, 로컬 DB 파일 열기) 스레드 안전하므로 요청마다 만들지 않고 프로세스 전체에서 공유한다.
+
+- 처음 사용할 때 한 번만 생성 (double-checked locking)
+- 모든 OpenAI 호출은 하나의 httpx 커넥션 풀을 공유
+- LLM_PREWARM이면 애플리케이션 시작 시 컬렉션 로드 + API 연결을 미리 수행해 첫 요청 지연을 없앤다
+"""
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.core.resources")
+
+VECTOR_STORE_COLLECTION = "infrastructure_knowledge"
+# 업로드된 요구사항 문서 청크 (사용자 문서이므로 공용 지식 검색과 다른 컬렉션에 둔다)
+DOCUMENT_STORE_COLLECTION = "requirement_documents"
+
+
+class ResourceRegistry:
+    """
+    LLM/임베딩/벡터 스토어 공유 리소스
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._http_client = None
+        self._http_async_client = None
+        self._llm = None
+        self._embeddings = None
+        self._chroma_client = None
+        self._vector_stores: Dict[str, Any] = {}
+
+    def _require_api_key(self) -> None:
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
+
+    def _http_clients(self):
+        """OpenAI 호출용 공유 httpx 커넥션 풀 (동기/비동기)"""
+        if self._http_client is None:
+            import httpx
+
+            limits = httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+            )
+            timeout = httpx.Timeout(settings.LLM_TIMEOUT, connect=10.0)
+            self._http_client = httpx.Client(limits=limits, timeout=timeout)
+            self._http_async_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        return self._http_client, self._http_async_client
+
+    def get_llm(self):
+        """공유 ChatOpenAI 인스턴스"""
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    try:
+                        from langchain_openai import ChatOpenAI
+                    except ImportError:
+                        raise ImportError("langchain-openai가 설치되지 않았습니다. pip install langchain-openai")
+                    self._require_api_key()
+                    http_client, http_async_client = self._http_clients()
+                    self._llm = ChatOpenAI(
+                        model=settings.OPENAI_MODEL,
+                        temperature=0,
+                        openai_api_key=settings.OPENAI_API_KEY,
+                        openai_api_base=settings.OPENAI_API_BASE,
+                        timeout=settings.LLM_TIMEOUT,
+                        http_client=http_client,
+                        http_async_client=http_async_client,
+                    )
+        return self._llm
+
+    def get_embeddings(self):
+        """공유 임베딩 클라이언트 (디스크 임베딩 캐시 적용)"""
+        if self._embeddings is None:
+            with self._lock:
+                if self._embeddings is None:
+                    try:
+                        from langchain_openai import OpenAIEmbeddings
+                    except ImportError:
+                        raise ImportError("langchain-openai가 설치되지 않았습니다. pip install langchain-openai")
+                    from app.services.embedding_cache import cached_embeddings
+
+                    self._require_api_key()
+                    http_client, http_async_client = self._http_clients()
+                    embeddings = OpenAIEmbeddings(
+                        openai_api_key=settings.OPENAI_API_KEY,
+                        openai_api_base=settings.OPENAI_API_BASE,
+                        http_client=http_client,
+                        http_async_client=http_async_client,
+                    )
+                    # 같은 텍스트는 다시 임베딩하지 않도록 디스크 캐시로 감싼다
+                    self._embeddings = cached_embeddings(embeddings)
+        return self._embeddings
+
+    def get_chroma_client(self):
+        """공유 ChromaDB PersistentClient"""
+        if self._chroma_client is None:
+            with self._lock:
+                if self._chroma_client is None:
+                    try:
+                        import chromadb
+                    except ImportError:
+                        raise ImportError("chromadb가 설치되지 않았습니다. pip install chromadb")
+                    self._chroma_client = chromadb.PersistentClient(
+                        path=os.path.join(settings.UPLOAD_DIR, "chroma_db")
+                    )
+        return self._chroma_client
+
+    def get_vector_store(self, collection: str = VECTOR_STORE_COLLECTION):
+        """공유 벡터 스토어 (VECTOR_STORE_BACKEND: chroma 또는 local, 컬렉션별 하나)"""
+        vector_store = self._vector_stores.get(collection)
+        if vector_store is None:
+            with self._lock:
+                vector_store = self._vector_stores.get(collection)
+                if vector_store is None:
+                    vector_store = self._vector_stores[collection] = self._create_vector_store(collection)
+        return vector_store
+
+    def _create_vector_store(self, collection: str):
+        if settings.VECTOR_STORE_BACKEND == "local":
+            from app.services.vector_store.local_store import LocalVectorStore
+
+            return LocalVectorStore(
+                path=os.path.join(settings.UPLOAD_DIR, "vector_index", collection),
+                embedding_function=self.get_embeddings(),
+                dtype=settings.VECTOR_INDEX_DTYPE,
+                index_type=settings.VECTOR_INDEX_TYPE,
+                ivf_min_rows=settings.VECTOR_INDEX_IVF_MIN_ROWS,
+                nprobe=settings.VECTOR_INDEX_IVF_NPROBE,
+            )
+        if settings.VECTOR_STORE_BACKEND == "chroma":
+            try:
+                from langchain_community.vectorstores import Chroma
+            except ImportError:
+                raise ImportError("langchain-community가 설치되지 않았습니다. pip install langchain-community")
+            from app.services.vector_store.chroma_store import ChromaVectorStore
+
+            return ChromaVectorStore(Chroma(
+                client=self.get_chroma_client(),
+                collection_name=collection,
+                embedding_function=self.get_embeddings(),
+            ))
+        raise ValueError(f"Unsupported vector store backend: {settings.VECTOR_STORE_BACKEND}")
+
+    def prewarm(self) -> None:
+        """
+        리소스 미리 생성 (애플리케이션 시작 시 스레드에서 실행)
+
+        - 벡터 스토어(Chroma 컬렉션 또는 로컬 인덱스)를 열고 count()로 인덱스를 메모리에 로드
+        - LLM 클라이언트를 만들고 API 서버와 TLS 연결을 맺어 커넥션 풀에 남겨 둔다 (과금 없는 /models 조회)
+        """
+        try:
+            count = self.get_vector_store().count()
+            logger.info(f"벡터 스토어 준비 완료: collection={VECTOR_STORE_COLLECTION}, count={count}")
+        except Exception as e:
+            logger.warning(f"벡터 스토어 준비 실패: {str(e)}")
+
+        try:
+            self.get_llm()
+            http_client, _ = self._http_clients()
+            http_client.get(
+                f"{settings.OPENAI_API_BASE.rstrip('/')}/models",
+                headers={"Authorization": f"Bearer {settings.OPENAI_API_KEY}"},
+            )
+            logger.info("LLM 클라이언트 준비 완료")
+        except Exception as e:
+            logger.warning(f"LLM 클라이언트 준비 실패: {str(e)}")
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료 (애플리케이션 종료 시)"""
+        with self._lock:
+            http_client, self._http_client = self._http_client, None
+            http_async_client, self._http_async_client = self._http_async_client, None
+            self._llm = None
+            self._embeddings = None
+            self._vector_stores = {}
+            self._chroma_client = None
+        if http_client is not None:
+            http_client.close()
+        if http_async_client is not None:
+            await http_async_client.aclose()
+
+
+_registry: Optional[ResourceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_resource_registry() -> ResourceRegistry:
+    """프로세스 전역 리소스 레지스트리"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ResourceRegistry()
+    return _registry
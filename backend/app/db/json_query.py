@@ -0,0 +1,68 @@
+"""
+JSON 컬럼 조회 조건 빌더
+
+JSONDocument 컬럼에 대한 필터/집계 식을 DB 방언별로 생성한다.
+
+- PostgreSQL: JSONB 포함 연산(@>) → GIN(jsonb_path_ops) 인덱스 사용
+- SQLite: json_extract 식 인덱스(스칼라 필드), json_each(배열 필드)
+
+SQLite 식 인덱스가 쓰이려면 인덱스 정의와 조회 식의 JSON 경로가 같은
+리터럴이어야 하므로 경로는 바인드 파라미터가 아닌 리터럴로 렌더링한다.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import String, exists, func, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def json_path(*keys: str) -> ColumnElement:
+    """SQLite JSON 경로 리터럴 ('$.a.b')"""
+    path = "$." + ".".join(keys)
+    return literal_column("'" + path.replace("'", "''") + "'")
+
+
+def json_contains(column, document: Any) -> ColumnElement:
+    """PostgreSQL JSONB 포함 조건 (column @> document)"""
+    return column.op("@>")(literal(document, JSONB))
+
+
+def json_field_equals(dialect: str, column, key: str, value: Any) -> ColumnElement:
+    """최상위 스칼라 필드 일치 조건 (column.key == value)"""
+    if dialect == "postgresql":
+        return json_contains(column, {key: value})
+    return func.json_extract(column, json_path(key)) == value
+
+
+def json_array_contains(dialect: str, column, key: str, value: Any) -> ColumnElement:
+    """배열 필드 포함 조건 (value in column.key)"""
+    if dialect == "postgresql":
+        return json_contains(column, {key: [value]})
+    elements = func.json_each(column, json_path(key)).table_valued("value")
+    return exists(select(1).select_from(elements).where(elements.c.value == value))
+
+
+def json_array_has_object(dialect: str, column, key: str, field: str, value: Any) -> ColumnElement:
+    """객체 배열 중 field == value인 원소가 있는지 (any(item.field == value for item in column.key))"""
+    if dialect == "postgresql":
+        return json_contains(column, {key: [{field: value}]})
+    elements = func.json_each(column, json_path(key)).table_valued("value")
+    return exists(
+        select(1).select_from(elements).where(func.json_extract(elements.c.value, json_path(field)) == value)
+    )
+
+
+def json_array_field_values(dialect: str, column, key: str, field: str):
+    """
+    객체 배열 원소의 field 값을 행으로 펼치는 테이블 값 식
+
+    Returns:
+        (FROM 절에 사용할 테이블 값 식, field 값 컬럼 식)
+    """
+    if dialect == "postgresql":
+        elements = func.jsonb_array_elements(column.op("->")(literal(key, String))).table_valued("value")
+        return elements, elements.c.value.op("->>")(literal(field, String))
+    elements = func.json_each(column, json_path(key)).table_valued("value")
+    return elements, func.json_extract(elements.c.value, json_path(field))
@@ -0,0 +1,150 @@
+"""
+쿼리 실행 계획 검사 유틸리티
+
+리포지토리가 실행하는 SQL을 기록한 뒤 EXPLAIN으로 실행 계획을 확인하여,
+대용량 테이블에 대한 순차 스캔(인덱스 미사용)을 찾아낸다.
+
+- SQLite: EXPLAIN QUERY PLAN 결과의 "SCAN <table>" (인덱스 없이 전체 스캔)
+- PostgreSQL: EXPLAIN (FORMAT JSON) 결과의 "Seq Scan" 노드
+  (테이블이 작으면 플래너가 인덱스가 있어도 순차 스캔을 고르므로 enable_seqscan=off로 확인)
+
+사용 예:
+    with QueryPlanRecorder(engine) as recorder:
+        repository.get_by_infrastructure_id(infra_id)
+    issues = find_sequential_scans(engine, recorder.statements, tables={"deployments"})
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+# 실행 계획을 확인할 문장 (INSERT는 인덱스 조회와 무관하므로 제외)
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+# SQLite 3.36+ "SCAN deployments", 이전 버전 "SCAN TABLE deployments"
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(.*)$")
+
+
+@dataclass
+class SequentialScan:
+    """순차 스캔 검출 결과"""
+    table: str
+    statement: str
+    detail: str
+
+
+class QueryPlanRecorder:
+    """
+    엔진에서 실행되는 SQL 기록기
+
+    컨텍스트 안에서 실행된 SELECT/UPDATE/DELETE 문과 바인드 파라미터를 수집한다.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: List[Tuple[str, Any]] = []
+
+    def __enter__(self) -> "QueryPlanRecorder":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if executemany:
+            return
+        if statement.lstrip().upper().startswith(_EXPLAINABLE):
+            self.statements.append((statement, parameters))
+
+
+def explain(connection: Connection, statement: str, parameters: Any = None) -> List[str]:
+    """
+    실행 계획 조회
+
+    Returns:
+        스캔 노드 설명 리스트 (SQLite: detail 문자열, PostgreSQL: "<Node Type> on <relation>")
+    """
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+        return [row[-1] for row in rows]
+
+    if dialect == "postgresql":
+        result = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters or {})
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        nodes: List[str] = []
+        _walk_pg_plan(plan[0]["Plan"], nodes)
+        return nodes
+
+    raise ValueError(f"Unsupported dialect for EXPLAIN: {dialect}")
+
+
+def _walk_pg_plan(node: dict, nodes: List[str]) -> None:
+    """PostgreSQL JSON 실행 계획을 순회하며 스캔 노드를 수집"""
+    relation = node.get("Relation Name")
+    if relation:
+        nodes.append(f"{node['Node Type']} on {relation}")
+    for child in node.get("Plans", []):
+        _walk_pg_plan(child, nodes)
+
+
+def _sequential_scan_table(dialect: str, detail: str) -> Optional[str]:
+    """실행 계획 항목이 순차 스캔이면 테이블 이름을 반환"""
+    if dialect == "sqlite":
+        match = _SQLITE_SCAN.match(detail)
+        # "SCAN t USING INDEX ..."는 인덱스 순회이므로 순차 스캔으로 보지 않음
+        if match and "USING" not in match.group(2):
+            return match.group(1)
+        return None
+
+    if detail.startswith("Seq Scan on "):
+        return detail[len("Seq Scan on "):]
+    return None
+
+
+def find_sequential_scans(
+    engine: Engine,
+    statements: Iterable[Tuple[str, Any]],
+    tables: Optional[Set[str]] = None,
+) -> List[SequentialScan]:
+    """
+    기록된 문장들의 실행 계획에서 순차 스캔 검출
+
+    Args:
+        engine: 대상 엔진
+        statements: QueryPlanRecorder.statements
+        tables: 검사할 (대용량) 테이블 이름. None이면 모든 테이블
+
+    Returns:
+        순차 스캔 목록 (비어 있으면 모든 조회가 인덱스를 사용)
+    """
+    issues: List[SequentialScan] = []
+    seen: Set[str] = set()
+
+    with engine.connect() as connection:
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+        for statement, parameters in statements:
+            if statement in seen:
+                continue
+            seen.add(statement)
+
+            for detail in explain(connection, statement, parameters):
+                table = _sequential_scan_table(dialect, detail)
+                if table and (tables is None or table in tables):
+                    issues.append(SequentialScan(table=table, statement=statement, detail=detail))
+
+        connection.rollback()
+
+    return issues
@@ -1,16 +1,16 @@
 """
-커스텀 타입 정의 (UUID 호환 GUID)
+커스텀 타입 정의 (UUID 호환 GUID, JSONB 호환 JSONDocument)
 
-PostgreSQL에서는 고유 UUID 타입을 사용하고,
-SQLite 등 기타 DB에서는 문자열(CHAR(36))로 UUID를 저장하기 위한 타입입니다.
+PostgreSQL에서는 고유 UUID/JSONB 타입을 사용하고,
+SQLite 등 기타 DB에서는 문자열(CHAR(36))/JSON으로 저장하기 위한 타입입니다.
 """
 from __future__ import annotations
 
 import uuid
 from typing import Any, Optional
 
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.types import CHAR, TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB, UUID as PG_UUID
+from sqlalchemy.types import CHAR, JSON, TypeDecorator
 
 
 class GUID(TypeDecorator):
@@ -44,3 +44,18 @@ class GUID(TypeDecorator):
         return uuid.UUID(str(value))
 
 
+class JSONDocument(TypeDecorator):
+    """
+    플랫폼 독립적인 JSON 문서 타입
+
+    - PostgreSQL: JSONB (GIN 인덱스, @> 포함 연산 지원)
+    - 기타 DB: JSON (SQLite에서는 json_extract/json_each로 조회)
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_JSONB())
+        return dialect.type_descriptor(JSON())
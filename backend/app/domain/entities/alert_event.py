@@ -0,0 +1,41 @@
+"""
+알림 이벤트 도메인 엔티티
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+
+@dataclass(slots=True)
+class AlertEvent:
+    """
+    알림 상태 전이 (firing/resolved) 도메인 엔티티
+    """
+    id: Optional[UUID] = None
+    deployment_id: UUID = None
+    rule_name: str = None
+    severity: str = None  # 'warning', 'critical'
+    state: str = None  # 'firing', 'resolved'
+    metric_name: str = None
+    series_key: str = None  # 메트릭 이름 + 태그 해시 (같은 시계열의 전이를 묶는 키)
+    tags: Optional[Dict[str, str]] = None
+    value: Optional[float] = None
+    triggered_at: datetime = None  # 전이가 일어난 점의 시각
+    created_at: Optional[datetime] = None
+    
+    def dict(self) -> dict:
+        """엔티티를 딕셔너리로 변환"""
+        return {
+            "id": self.id,
+            "deployment_id": self.deployment_id,
+            "rule_name": self.rule_name,
+            "severity": self.severity,
+            "state": self.state,
+            "metric_name": self.metric_name,
+            "series_key": self.series_key,
+            "tags": self.tags,
+            "value": self.value,
+            "triggered_at": self.triggered_at,
+            "created_at": self.created_at,
+        }
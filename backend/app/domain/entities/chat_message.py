@@ -7,7 +7,7 @@ from typing import Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """
     채팅 메시지 도메인 엔티티
@@ -7,7 +7,7 @@ from typing import Optional
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Deployment:
     """
     배포 도메인 엔티티
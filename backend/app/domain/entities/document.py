@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """
     문서 도메인 엔티티
@@ -18,6 +18,7 @@ class Document:
     file_type: str = None  # 'pdf', 'docx', 'pptx', 'hwp'
     file_size: int = None
     file_path: str = None
+    content_hash: Optional[str] = None  # SHA-256
     extracted_text: Optional[str] = None
     parsed_data: Optional[Dict[str, Any]] = None
     status: str = "uploaded"  # 'uploaded', 'parsing', 'parsed', 'failed'
@@ -33,6 +34,7 @@ class Document:
             "file_type": self.file_type,
             "file_size": self.file_size,
             "file_path": self.file_path,
+            "content_hash": self.content_hash,
             "extracted_text": self.extracted_text,
             "parsed_data": self.parsed_data,
             "status": self.status,
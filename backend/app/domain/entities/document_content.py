@@ -0,0 +1,38 @@
+"""
+문서 내용 도메인 엔티티
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+
+@dataclass(slots=True)
+class DocumentContent:
+    """
+    문서 내용 도메인 엔티티 (내용 해시별 파싱 결과)
+    """
+    content_hash: str = None  # SHA-256
+    file_type: str = None
+    file_size: int = None
+    file_path: str = None
+    extracted_text: Optional[str] = None
+    parsed_data: Optional[Dict[str, Any]] = None
+    chunk_count: int = 0
+    indexed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    last_used_at: Optional[datetime] = None
+    
+    def dict(self) -> dict:
+        """엔티티를 딕셔너리로 변환"""
+        return {
+            "content_hash": self.content_hash,
+            "file_type": self.file_type,
+            "file_size": self.file_size,
+            "file_path": self.file_path,
+            "extracted_text": self.extracted_text,
+            "parsed_data": self.parsed_data,
+            "chunk_count": self.chunk_count,
+            "indexed_at": self.indexed_at,
+            "created_at": self.created_at,
+            "last_used_at": self.last_used_at,
+        }
@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class IaCCode:
     """
     IaC 코드 도메인 엔티티
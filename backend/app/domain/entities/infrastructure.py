@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Infrastructure:
     """
     인프라 설계 도메인 엔티티
@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Requirement:
     """
     요구사항 도메인 엔티티
@@ -1,6 +1,8 @@
 """
 FastAPI 애플리케이션 진입점
 """
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -62,6 +64,159 @@ async def init_db() -> None:
         logger.error(f"데이터베이스 초기화 실패: {exc}", exc_info=True)
 
 
+@app.on_event("startup")
+async def fail_stale_deployments() -> None:
+    """
+    'deploying' 상태로 DEPLOYMENT_TIMEOUT 이상 지난 배포를 'failed'로 일괄 변경
+    (서버 재시작으로 중단된 백그라운드 배포 정리, 단일 UPDATE executemany)
+    """
+    from app.db.session import SessionLocal
+    from app.core.dependencies import get_deployment_repository
+    from app.services.deployment_service import DeploymentService
+
+    db = SessionLocal()
+    try:
+        service = DeploymentService(get_deployment_repository(db))
+        await service.fail_stale_deployments(settings.DEPLOYMENT_TIMEOUT)
+    except Exception as exc:  # pragma: no cover - 로깅 용도
+        logger.error(f"중단된 배포 정리 실패: {exc}", exc_info=True)
+    finally:
+        db.close()
+
+
+_background_tasks = set()
+
+
+@app.on_event("startup")
+async def start_retention_sweeper() -> None:
+    """
+    문서 보관 기간(DOCUMENT_RETENTION_DAYS) 정리 주기 작업 시작
+    """
+    if not settings.RETENTION_SWEEP_ENABLED:
+        return
+    from app.services.retention_service import run_retention_sweeper
+
+    task = asyncio.create_task(run_retention_sweeper(settings.RETENTION_SWEEP_INTERVAL))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("startup")
+async def start_metrics_retention() -> None:
+    """
+    메트릭 저장소 보관 기간(METRICS_RETENTION_DAYS, METRICS_ROLLUP_RETENTION_DAYS) 정리 주기 작업 시작
+    """
+    if settings.METRICS_RETENTION_DAYS <= 0 and settings.METRICS_ROLLUP_RETENTION_DAYS <= 0:
+        return
+    from app.utils.metrics_store import run_metrics_retention
+
+    task = asyncio.create_task(run_metrics_retention(settings.METRICS_RETENTION_INTERVAL))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("startup")
+async def start_metrics_ingest_flusher() -> None:
+    """
+    메트릭 수집 버퍼 주기적 기록 작업 시작 (METRICS_INGEST_FLUSH_INTERVAL)
+    """
+    from app.utils.metrics_ingest import get_ingest_buffer
+
+    task = asyncio.create_task(get_ingest_buffer().run(settings.METRICS_INGEST_FLUSH_INTERVAL))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("startup")
+async def start_alert_evaluator() -> None:
+    """
+    알림 엔진 firing 상태 복원 및 데이터 없음(absent) 규칙 주기 평가 시작 (ALERT_EVALUATION_INTERVAL)
+    """
+    if not settings.ALERT_ENABLED:
+        return
+    from app.utils.alert_engine import run_alert_evaluator
+
+    task = asyncio.create_task(run_alert_evaluator(settings.ALERT_EVALUATION_INTERVAL))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("startup")
+async def start_connectivity_prober() -> None:
+    """
+    VM/호스트 연결성 백그라운드 확인 시작 (CONNECTIVITY_PROBE_INTERVAL, 대상 설정 오류면 시작 실패)
+    """
+    from app.utils.connectivity_prober import init_connectivity_prober
+
+    prober = init_connectivity_prober()
+    if prober is None:
+        return
+    task = asyncio.create_task(prober.run())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("startup")
+async def prewarm_resources() -> None:
+    """
+    LLM/벡터 스토어 공유 리소스 미리 생성 (LLM_PREWARM, 시작을 막지 않도록 백그라운드 스레드에서 실행)
+    """
+    if not settings.LLM_PREWARM:
+        return
+    from app.core.resources import get_resource_registry
+
+    task = asyncio.create_task(asyncio.to_thread(get_resource_registry().prewarm))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@app.on_event("shutdown")
+async def close_resources() -> None:
+    """LLM/임베딩 공유 커넥션 풀 종료"""
+    from app.core.resources import get_resource_registry
+
+    await get_resource_registry().aclose()
+
+
+@app.on_event("shutdown")
+async def close_prometheus() -> None:
+    """Prometheus 공유 커넥션 풀 종료"""
+    from app.utils.prometheus_client import close_prometheus_client
+
+    await close_prometheus_client()
+
+
+@app.on_event("shutdown")
+async def close_metrics_stream() -> None:
+    """실시간 메트릭 스트림 폴러 정지 및 구독 해제"""
+    from app.utils.metrics_stream import get_metrics_stream_hub
+
+    await get_metrics_stream_hub().close()
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks() -> None:
+    """백그라운드 주기 작업 중지"""
+    for task in list(_background_tasks):
+        task.cancel()
+
+
+@app.on_event("shutdown")
+async def flush_metrics_ingest() -> None:
+    """메트릭 수집 버퍼에 남은 점 기록"""
+    from app.utils.metrics_ingest import get_ingest_buffer
+
+    await asyncio.to_thread(get_ingest_buffer().flush)
+
+
+@app.on_event("shutdown")
+async def shutdown_parsing_engine() -> None:
+    """문서 파싱 워커 풀 종료"""
+    from app.services.parsing_engine import shutdown_parsing_engine as shutdown
+
+    shutdown()
+
+
 @app.get("/")
 async def root():
     return {"message": "Solmakase API", "version": "1.0.0"}
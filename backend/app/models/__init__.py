@@ -4,18 +4,22 @@
 from app.models.user import UserModel
 from app.models.requirement import RequirementModel
 from app.models.document import DocumentModel
+from app.models.document_content import DocumentContentModel
 from app.models.chat_message import ChatMessageModel
 from app.models.infrastructure import InfrastructureModel
 from app.models.iac_code import IaCCodeModel
 from app.models.deployment import DeploymentModel
+from app.models.alert_event import AlertEventModel
 
 __all__ = [
     "UserModel",
     "RequirementModel",
     "DocumentModel",
+    "DocumentContentModel",
     "ChatMessageModel",
     "InfrastructureModel",
     "IaCCodeModel",
     "DeploymentModel",
+    "AlertEventModel",
 ]
 
@@ -0,0 +1,41 @@
+"""
+알림 이벤트 ORM 모델
+"""
+from sqlalchemy import Column, String, Float, JSON, DateTime, Index
+from sqlalchemy.sql import func
+import uuid
+
+from app.db.base import Base
+from app.db.types import GUID
+
+
+class AlertEventModel(Base):
+    """
+    알림 이벤트 ORM 모델
+
+    deployment_id는 FK로 묶지 않는다 (에이전트 수집 메트릭은 배포 행 존재를 확인하지 않음)
+    """
+    __tablename__ = "alert_events"
+    
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    deployment_id = Column(GUID(), nullable=False)
+    rule_name = Column(String(100), nullable=False)
+    severity = Column(String(20), nullable=False)  # 'warning', 'critical'
+    state = Column(String(20), nullable=False)  # 'firing', 'resolved'
+    metric_name = Column(String(200), nullable=False)
+    series_key = Column(String(64), nullable=False)
+    tags = Column(JSON)
+    value = Column(Float)
+    triggered_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# 배포별 최근 이벤트 조회 / (배포, 규칙, 시계열)별 마지막 상태 조회
+Index("ix_alert_events_deployment_id_triggered_at", AlertEventModel.deployment_id, AlertEventModel.triggered_at)
+Index(
+    "ix_alert_events_series",
+    AlertEventModel.deployment_id,
+    AlertEventModel.rule_name,
+    AlertEventModel.series_key,
+    AlertEventModel.triggered_at,
+)
@@ -16,9 +16,9 @@ class DeploymentModel(Base):
     __tablename__ = "deployments"
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    infrastructure_design_id = Column(GUID(), ForeignKey("infrastructure_designs.id"), nullable=False)
+    infrastructure_design_id = Column(GUID(), ForeignKey("infrastructure_designs.id"), nullable=False, index=True)
     iac_code_id = Column(GUID(), ForeignKey("iac_codes.id"), nullable=False)
-    status = Column(String(50), default="pending")
+    status = Column(String(50), default="pending", index=True)
     deployment_log = Column(Text)
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
@@ -1,7 +1,7 @@
 """
 문서 ORM 모델
 """
-from sqlalchemy import Column, String, BigInteger, Text, JSON, ForeignKey, DateTime
+from sqlalchemy import Column, String, BigInteger, Text, JSON, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 import uuid
 
@@ -14,6 +14,10 @@ class DocumentModel(Base):
     문서 ORM 모델
     """
     __tablename__ = "documents"
+    __table_args__ = (
+        # 보관 기간 만료 조회: WHERE deleted_at IS NULL AND created_at < ? ORDER BY created_at
+        Index("ix_documents_deleted_at_created_at", "deleted_at", "created_at"),
+    )
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     requirement_id = Column(GUID(), ForeignKey("requirements.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -21,6 +25,7 @@ class DocumentModel(Base):
     file_type = Column(String(50), nullable=False)  # 'pdf', 'docx', 'pptx', 'hwp'
     file_size = Column(BigInteger, nullable=False)
     file_path = Column(String(500), nullable=False)
+    content_hash = Column(String(64), index=True)  # SHA-256 (내용 주소 저장 경로의 키)
     extracted_text = Column(Text)
     parsed_data = Column(JSON)  # 파싱된 구조화 데이터
     status = Column(String(50), default="uploaded")  # 'uploaded', 'parsing', 'parsed', 'failed'
@@ -0,0 +1,28 @@
+"""
+문서 내용 ORM 모델 (내용 해시별 파싱 결과 캐시)
+"""
+from sqlalchemy import Column, String, BigInteger, Integer, Text, JSON, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class DocumentContentModel(Base):
+    """
+    문서 내용 ORM 모델
+
+    같은 파일(SHA-256 동일)이 여러 요구사항에 업로드되어도 파싱/임베딩은 한 번만 수행하고,
+    documents 행은 content_hash로 이 결과를 참조한다.
+    """
+    __tablename__ = "document_contents"
+    
+    content_hash = Column(String(64), primary_key=True)  # SHA-256
+    file_type = Column(String(50), nullable=False)  # 'pdf', 'docx', 'pptx', 'hwp'
+    file_size = Column(BigInteger, nullable=False)
+    file_path = Column(String(500), nullable=False)  # 내용 주소 저장 경로
+    extracted_text = Column(Text)
+    parsed_data = Column(JSON)  # 파싱된 구조화 데이터
+    chunk_count = Column(Integer, default=0)  # 벡터 스토어에 저장된 청크 수
+    indexed_at = Column(DateTime(timezone=True))  # 임베딩 완료 시각
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now())  # 마지막 업로드(캐시 적중) 시각
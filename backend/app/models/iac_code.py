@@ -1,7 +1,7 @@
 """
 IaC 코드 ORM 모델
 """
-from sqlalchemy import Column, String, Integer, Text, JSON, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Text, JSON, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 import uuid
 
@@ -14,9 +14,15 @@ class IaCCodeModel(Base):
     IaC 코드 ORM 모델
     """
     __tablename__ = "iac_codes"
+    __table_args__ = (
+        # get_current_version: (infrastructure_design_id, is_current) 조회
+        Index("ix_iac_codes_infrastructure_design_id_is_current", "infrastructure_design_id", "is_current"),
+        # get_by_infrastructure_id: infrastructure_design_id 필터 + version 정렬
+        Index("ix_iac_codes_infrastructure_design_id_version", "infrastructure_design_id", "version"),
+    )
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    infrastructure_design_id = Column(GUID(), ForeignKey("infrastructure_designs.id", ondelete="CASCADE"), nullable=False, index=True)
+    infrastructure_design_id = Column(GUID(), ForeignKey("infrastructure_designs.id", ondelete="CASCADE"), nullable=False)
     iac_tool = Column(String(50), nullable=False)  # 'terraform', 'ansible', 'kubernetes'
     version = Column(Integer, nullable=False, default=1)
     code_content = Column(Text, nullable=False)
@@ -1,12 +1,12 @@
 """
 인프라 설계 ORM 모델
 """
-from sqlalchemy import Column, String, Text, JSON, ForeignKey, DateTime
+from sqlalchemy import Column, String, Text, JSON, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 import uuid
 
 from app.db.base import Base
-from app.db.types import GUID
+from app.db.types import GUID, JSONDocument
 
 
 class InfrastructureModel(Base):
@@ -16,13 +16,22 @@ class InfrastructureModel(Base):
     __tablename__ = "infrastructure_designs"
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    requirement_id = Column(GUID(), ForeignKey("requirements.id"), nullable=False)
+    requirement_id = Column(GUID(), ForeignKey("requirements.id"), nullable=False, index=True)
     design_type = Column(String(50), nullable=False)
     provider = Column(String(50))
-    architecture = Column(JSON, nullable=False)
+    architecture = Column(JSONDocument(), nullable=False)
     cost_estimate = Column(JSON)
     plan_document = Column(Text)
     status = Column(String(50), default="draft")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+
+
+# 아키텍처 조회 인덱스 (PostgreSQL JSONB GIN, @> 포함 조회)
+Index(
+    "ix_infrastructure_designs_architecture_gin",
+    InfrastructureModel.architecture,
+    postgresql_using="gin",
+    postgresql_ops={"architecture": "jsonb_path_ops"},
+).ddl_if(dialect="postgresql")
@@ -1,12 +1,13 @@
 """
 요구사항 ORM 모델
 """
-from sqlalchemy import Column, String, Numeric, Boolean, Text, JSON, ForeignKey, DateTime
+from sqlalchemy import Column, String, Numeric, Boolean, Text, ForeignKey, DateTime, Index
 from sqlalchemy.sql import func
 import uuid
 
 from app.db.base import Base
-from app.db.types import GUID
+from app.db.types import GUID, JSONDocument
+from app.db.json_query import json_path
 
 
 class RequirementModel(Base):
@@ -16,7 +17,7 @@ class RequirementModel(Base):
     __tablename__ = "requirements"
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False, index=True)
     input_type = Column(String(50), nullable=False)
     service_type = Column(String(100))
     deployment_type = Column(String(50))
@@ -24,8 +25,27 @@ class RequirementModel(Base):
     budget = Column(Numeric(15, 2))
     has_ops_team = Column(Boolean)
     special_requirements = Column(Text)
-    structured_data = Column(JSON)
-    status = Column(String(50), default="pending")
+    structured_data = Column(JSONDocument())
+    status = Column(String(50), default="pending", index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+
+
+# 구조화 데이터 조회 인덱스
+# - PostgreSQL: JSONB GIN 인덱스 (@> 포함 조회)
+# - SQLite: 자주 필터링하는 스칼라 필드에 대한 json_extract 식 인덱스
+Index(
+    "ix_requirements_structured_data_gin",
+    RequirementModel.structured_data,
+    postgresql_using="gin",
+    postgresql_ops={"structured_data": "jsonb_path_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_requirements_structured_data_deployment_type",
+    func.json_extract(RequirementModel.structured_data, json_path("deployment_type")),
+).ddl_if(dialect="sqlite")
+Index(
+    "ix_requirements_structured_data_scale",
+    func.json_extract(RequirementModel.structured_data, json_path("scale")),
+).ddl_if(dialect="sqlite")
@@ -0,0 +1,68 @@
+"""
+알림 이벤트 리포지토리 구현체
+"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.repositories.interfaces.alert_repository import IAlertRepository
+from app.domain.entities.alert_event import AlertEvent
+from app.models.alert_event import AlertEventModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
+
+
+_mapper = EntityMapper(AlertEventModel, AlertEvent)
+
+
+class AlertRepository(BulkRepositoryMixin[AlertEvent], IAlertRepository):
+    """
+    알림 이벤트 리포지토리 구현체
+    """
+    
+    _model = AlertEventModel
+    _mapper = _mapper
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_by_deployment_id(
+        self,
+        deployment_id: UUID,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[AlertEvent]:
+        """배포의 알림 이벤트 조회 (최신순)"""
+        query = self.db.query(AlertEventModel).filter(AlertEventModel.deployment_id == deployment_id)
+        if since is not None:
+            query = query.filter(AlertEventModel.triggered_at >= since)
+        query = query.order_by(AlertEventModel.triggered_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return [self._to_entity(event) for event in query.all()]
+    
+    def get_firing(self) -> List[AlertEvent]:
+        """(배포, 규칙, 시계열)별 마지막 전이가 firing인 이벤트"""
+        latest = self.db.query(
+            AlertEventModel.deployment_id,
+            AlertEventModel.rule_name,
+            AlertEventModel.series_key,
+            func.max(AlertEventModel.triggered_at).label("triggered_at"),
+        ).group_by(
+            AlertEventModel.deployment_id,
+            AlertEventModel.rule_name,
+            AlertEventModel.series_key,
+        ).subquery()
+        db_events = self.db.query(AlertEventModel).join(latest, and_(
+            AlertEventModel.deployment_id == latest.c.deployment_id,
+            AlertEventModel.rule_name == latest.c.rule_name,
+            AlertEventModel.series_key == latest.c.series_key,
+            AlertEventModel.triggered_at == latest.c.triggered_at,
+        )).filter(AlertEventModel.state == "firing").all()
+        return [self._to_entity(event) for event in db_events]
+    
+    def _to_entity(self, db_model: AlertEventModel) -> AlertEvent:
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
@@ -0,0 +1,97 @@
+"""
+리포지토리 대량 처리 믹스인
+
+bulk_create / bulk_update / bulk_get_by_ids를 SQLAlchemy ORM 대량 구문으로 구현한다.
+
+- bulk_create: insert(Model).returning(Model) + 행 목록 → 다중 VALUES INSERT (insertmanyvalues)
+  한 번으로 삽입하고, 서버 기본값(created_at 등)이 채워진 엔티티를 입력 순서대로 반환
+- bulk_update: update(table) + 기본 키가 포함된 행 목록 → executemany UPDATE ... WHERE id = ?
+  (updated_at 같은 onupdate 컬럼은 행에서 빼서 갱신 시각이 자동으로 채워지게 함),
+  실제로 업데이트된 행 수(rowcount 합)를 반환
+- bulk_get_by_ids: WHERE id IN (...) 조회 (파라미터 한도를 넘지 않도록 나누어 조회)
+"""
+from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import Session
+
+from app.repositories.implementations.mapper import EntityMapper
+
+E = TypeVar("E")
+
+# IN 목록 한 번에 넣을 최대 ID 수 (SQLite 바인드 파라미터 한도 고려)
+_IN_BATCH_SIZE = 1000
+
+# executemany UPDATE의 기본 키 바인드 이름 (SET 절 컬럼 이름과 겹치지 않게)
+_PK_PARAM = "_pk"
+
+
+class BulkRepositoryMixin(Generic[E]):
+    """
+    대량 처리 믹스인
+
+    사용하는 클래스는 db(Session), _model(ORM 모델), _mapper(EntityMapper)를 제공해야 한다.
+    """
+
+    db: Session
+    _model: type
+    _mapper: EntityMapper
+
+    def bulk_create(self, entities: List[E]) -> List[E]:
+        """엔티티 일괄 생성 (단일 다중 행 INSERT)"""
+        if not entities:
+            return []
+        rows = [self._mapper.to_insert_row(entity) for entity in entities]
+        try:
+            db_models = self.db.scalars(
+                insert(self._model).returning(self._model, sort_by_parameter_order=True),
+                rows,
+            ).all()
+            created = [self._mapper.to_entity(db_model) for db_model in db_models]
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return created
+
+    def bulk_update(self, entities: List[E], where: Optional[Dict[str, Any]] = None) -> int:
+        """
+        엔티티 일괄 업데이트 (기본 키 기준 executemany)
+
+        Args:
+            where: 추가 조건 (컬럼 → 값), 조회 후 다른 요청이 바꾼 행은 덮어쓰지 않도록 현재 값을 확인
+
+        Returns:
+            실제로 업데이트된 행 수 (그 사이 삭제됐거나 where 조건이 맞지 않는 행은 제외)
+        """
+        if not entities:
+            return 0
+        table = self._model.__table__
+        rows = []
+        for entity in entities:
+            row = self._mapper.to_update_row(entity)
+            row[_PK_PARAM] = row.pop("id")
+            rows.append(row)
+        stmt = update(table).where(table.c.id == bindparam(_PK_PARAM))
+        for column, value in (where or {}).items():
+            stmt = stmt.where(table.c[column] == value)
+        try:
+            result = self.db.execute(stmt, rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return result.rowcount
+
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[E]:
+        """ID 목록으로 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        ids = list(dict.fromkeys(ids))
+        found = {}
+        for start in range(0, len(ids), _IN_BATCH_SIZE):
+            batch = ids[start:start + _IN_BATCH_SIZE]
+            db_models = self.db.query(self._model).filter(self._model.id.in_(batch)).all()
+            for db_model in db_models:
+                entity = self._mapper.to_entity(db_model)
+                found[entity.id] = entity
+        return [found[entity_id] for entity_id in ids if entity_id in found]
@@ -0,0 +1,307 @@
+"""
+캐시 리포지토리 구현체 (read-through 캐시 래퍼)
+
+I*Repository 구현체를 감싸 ID 조회 등 폴링이 잦은 조회를 EntityCache에서 제공하고,
+create/update/delete 시 관련 키를 무효화한다.
+"""
+from datetime import datetime
+from typing import Any, Optional, List, Dict, Iterable
+from uuid import UUID
+
+from app.core.cache import EntityCache
+from app.domain.entities.requirement import Requirement
+from app.domain.entities.infrastructure import Infrastructure
+from app.domain.entities.deployment import Deployment
+from app.domain.entities.iac_code import IaCCode
+from app.repositories.interfaces.requirement_repository import IRequirementRepository
+from app.repositories.interfaces.infrastructure_repository import IInfrastructureRepository
+from app.repositories.interfaces.deployment_repository import IDeploymentRepository
+from app.repositories.interfaces.iac_repository import IIaCRepository
+
+
+class CachedRequirementRepository(IRequirementRepository):
+    """
+    요구사항 캐시 리포지토리
+
+    - 캐시: get_by_id (분석 결과 폴링)
+    """
+
+    def __init__(self, repository: IRequirementRepository, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _key(requirement_id: UUID) -> str:
+        return f"requirement:{requirement_id}"
+
+    def create(self, requirement: Requirement) -> Requirement:
+        """요구사항 생성"""
+        created = self.repository.create(requirement)
+        self.cache.invalidate(self._key(created.id))
+        return created
+
+    def get_by_id(self, requirement_id: UUID) -> Optional[Requirement]:
+        """ID로 요구사항 조회"""
+        return self.cache.get_or_load(
+            self._key(requirement_id),
+            lambda: self.repository.get_by_id(requirement_id)
+        )
+
+    def get_by_user_id(self, user_id: UUID) -> List[Requirement]:
+        """사용자 ID로 요구사항 목록 조회"""
+        return self.repository.get_by_user_id(user_id)
+
+    def search_by_structured_data(
+        self,
+        deployment_type: Optional[str] = None,
+        scale: Optional[str] = None,
+        technical_stack: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Requirement]:
+        """구조화 데이터(분석 결과) 필드로 요구사항 검색"""
+        return self.repository.search_by_structured_data(deployment_type, scale, technical_stack, limit)
+
+    def update(self, requirement: Requirement) -> Requirement:
+        """요구사항 업데이트"""
+        try:
+            return self.repository.update(requirement)
+        finally:
+            self.cache.invalidate(self._key(requirement.id))
+
+    def delete(self, requirement_id: UUID) -> bool:
+        """요구사항 삭제"""
+        try:
+            return self.repository.delete(requirement_id)
+        finally:
+            self.cache.invalidate(self._key(requirement_id))
+
+    def bulk_create(self, requirements: List[Requirement]) -> List[Requirement]:
+        """요구사항 일괄 생성"""
+        created = self.repository.bulk_create(requirements)
+        self.cache.invalidate(*(self._key(item.id) for item in created))
+        return created
+
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Requirement]:
+        """ID 목록으로 요구사항 일괄 조회 (단일 IN 쿼리, 캐시 미사용)"""
+        return self.repository.bulk_get_by_ids(ids)
+
+    def bulk_update(self, requirements: List[Requirement]) -> int:
+        """요구사항 일괄 업데이트"""
+        try:
+            return self.repository.bulk_update(requirements)
+        finally:
+            self.cache.invalidate(*(self._key(item.id) for item in requirements))
+
+
+class CachedInfrastructureRepository(IInfrastructureRepository):
+    """
+    인프라 설계 캐시 리포지토리
+
+    - 캐시: get_by_id
+    """
+
+    def __init__(self, repository: IInfrastructureRepository, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _key(infrastructure_id: UUID) -> str:
+        return f"infrastructure:{infrastructure_id}"
+
+    def create(self, infrastructure: Infrastructure) -> Infrastructure:
+        """인프라 설계 생성"""
+        created = self.repository.create(infrastructure)
+        self.cache.invalidate(self._key(created.id))
+        return created
+
+    def get_by_id(self, infrastructure_id: UUID) -> Optional[Infrastructure]:
+        """ID로 인프라 설계 조회"""
+        return self.cache.get_or_load(
+            self._key(infrastructure_id),
+            lambda: self.repository.get_by_id(infrastructure_id)
+        )
+
+    def get_by_requirement_id(self, requirement_id: UUID) -> List[Infrastructure]:
+        """요구사항 ID로 인프라 설계 목록 조회"""
+        return self.repository.get_by_requirement_id(requirement_id)
+
+    def search_by_architecture(
+        self,
+        component_type: Optional[str] = None,
+        design_type: Optional[str] = None,
+        provider: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Infrastructure]:
+        """아키텍처 구성(컴포넌트 타입 등)으로 인프라 설계 검색"""
+        return self.repository.search_by_architecture(component_type, design_type, provider, limit)
+
+    def count_component_types(self, design_type: Optional[str] = None) -> Dict[str, int]:
+        """생성된 아키텍처의 컴포넌트 타입별 개수 집계"""
+        return self.repository.count_component_types(design_type)
+
+    def update(self, infrastructure: Infrastructure) -> Infrastructure:
+        """인프라 설계 업데이트"""
+        try:
+            return self.repository.update(infrastructure)
+        finally:
+            self.cache.invalidate(self._key(infrastructure.id))
+
+    def bulk_create(self, infrastructures: List[Infrastructure]) -> List[Infrastructure]:
+        """인프라 설계 일괄 생성"""
+        created = self.repository.bulk_create(infrastructures)
+        self.cache.invalidate(*(self._key(item.id) for item in created))
+        return created
+
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Infrastructure]:
+        """ID 목록으로 인프라 설계 일괄 조회 (단일 IN 쿼리, 캐시 미사용)"""
+        return self.repository.bulk_get_by_ids(ids)
+
+    def bulk_update(self, infrastructures: List[Infrastructure]) -> int:
+        """인프라 설계 일괄 업데이트"""
+        try:
+            return self.repository.bulk_update(infrastructures)
+        finally:
+            self.cache.invalidate(*(self._key(item.id) for item in infrastructures))
+
+
+class CachedDeploymentRepository(IDeploymentRepository):
+    """
+    배포 캐시 리포지토리
+
+    - 캐시: get_by_id (배포 상태 폴링)
+    """
+
+    def __init__(self, repository: IDeploymentRepository, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _key(deployment_id: UUID) -> str:
+        return f"deployment:{deployment_id}"
+
+    def create(self, deployment: Deployment) -> Deployment:
+        """배포 생성"""
+        created = self.repository.create(deployment)
+        self.cache.invalidate(self._key(created.id))
+        return created
+
+    def get_by_id(self, deployment_id: UUID) -> Optional[Deployment]:
+        """ID로 배포 조회"""
+        return self.cache.get_or_load(
+            self._key(deployment_id),
+            lambda: self.repository.get_by_id(deployment_id)
+        )
+
+    def get_by_infrastructure_id(self, infrastructure_id: UUID) -> List[Deployment]:
+        """인프라 설계 ID로 배포 목록 조회"""
+        return self.repository.get_by_infrastructure_id(infrastructure_id)
+
+    def get_list(
+        self,
+        status: Optional[str] = None,
+        started_before: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Deployment]:
+        """배포 목록 조회"""
+        return self.repository.get_list(status, started_before, limit)
+
+    def update(self, deployment: Deployment) -> Deployment:
+        """배포 업데이트"""
+        try:
+            return self.repository.update(deployment)
+        finally:
+            self.cache.invalidate(self._key(deployment.id))
+
+    def bulk_create(self, deployments: List[Deployment]) -> List[Deployment]:
+        """배포 일괄 생성"""
+        created = self.repository.bulk_create(deployments)
+        self.cache.invalidate(*(self._key(item.id) for item in created))
+        return created
+
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Deployment]:
+        """ID 목록으로 배포 일괄 조회 (단일 IN 쿼리, 캐시 미사용)"""
+        return self.repository.bulk_get_by_ids(ids)
+
+    def bulk_update(self, deployments: List[Deployment], where: Optional[Dict[str, Any]] = None) -> int:
+        """배포 일괄 업데이트"""
+        try:
+            return self.repository.bulk_update(deployments, where)
+        finally:
+            self.cache.invalidate(*(self._key(item.id) for item in deployments))
+
+
+class CachedIaCRepository(IIaCRepository):
+    """
+    IaC 코드 캐시 리포지토리
+
+    - 캐시: get_by_id, get_current_version (현재 IaC 코드 폴링)
+    - 쓰기 시 해당 인프라 설계의 현재 버전 키도 함께 무효화
+    """
+
+    def __init__(self, repository: IIaCRepository, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _key(iac_code_id: UUID) -> str:
+        return f"iac_code:{iac_code_id}"
+
+    @staticmethod
+    def _current_key(infrastructure_id: UUID) -> str:
+        return f"iac_code:current:{infrastructure_id}"
+
+    def _keys(self, iac_codes: List[IaCCode]) -> List[str]:
+        """IaC 코드와 해당 인프라 설계의 현재 버전 키"""
+        keys = []
+        for iac_code in iac_codes:
+            keys.append(self._key(iac_code.id))
+            keys.append(self._current_key(iac_code.infrastructure_design_id))
+        return keys
+
+    def create(self, iac_code: IaCCode) -> IaCCode:
+        """IaC 코드 생성"""
+        created = self.repository.create(iac_code)
+        self.cache.invalidate(self._key(created.id), self._current_key(created.infrastructure_design_id))
+        return created
+
+    def get_by_id(self, iac_code_id: UUID) -> Optional[IaCCode]:
+        """ID로 IaC 코드 조회"""
+        return self.cache.get_or_load(
+            self._key(iac_code_id),
+            lambda: self.repository.get_by_id(iac_code_id)
+        )
+
+    def get_by_infrastructure_id(self, infrastructure_id: UUID) -> List[IaCCode]:
+        """인프라 설계 ID로 IaC 코드 목록 조회"""
+        return self.repository.get_by_infrastructure_id(infrastructure_id)
+
+    def get_current_version(self, infrastructure_id: UUID) -> Optional[IaCCode]:
+        """현재 버전의 IaC 코드 조회"""
+        return self.cache.get_or_load(
+            self._current_key(infrastructure_id),
+            lambda: self.repository.get_current_version(infrastructure_id)
+        )
+
+    def update(self, iac_code: IaCCode) -> IaCCode:
+        """IaC 코드 업데이트"""
+        try:
+            return self.repository.update(iac_code)
+        finally:
+            self.cache.invalidate(self._key(iac_code.id), self._current_key(iac_code.infrastructure_design_id))
+
+    def bulk_create(self, iac_codes: List[IaCCode]) -> List[IaCCode]:
+        """IaC 코드 일괄 생성"""
+        created = self.repository.bulk_create(iac_codes)
+        self.cache.invalidate(*self._keys(created))
+        return created
+
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[IaCCode]:
+        """ID 목록으로 IaC 코드 일괄 조회 (단일 IN 쿼리, 캐시 미사용)"""
+        return self.repository.bulk_get_by_ids(ids)
+
+    def bulk_update(self, iac_codes: List[IaCCode]) -> int:
+        """IaC 코드 일괄 업데이트"""
+        try:
+            return self.repository.bulk_update(iac_codes)
+        finally:
+            self.cache.invalidate(*self._keys(iac_codes))
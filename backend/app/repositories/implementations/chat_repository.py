@@ -8,19 +8,27 @@ from sqlalchemy.orm import Session
 from app.repositories.interfaces.chat_repository import IChatRepository
 from app.domain.entities.chat_message import ChatMessage
 from app.models.chat_message import ChatMessageModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
 
 
-class ChatRepository(IChatRepository):
+_mapper = EntityMapper(ChatMessageModel, ChatMessage)
+
+
+class ChatRepository(BulkRepositoryMixin[ChatMessage], IChatRepository):
     """
     채팅 메시지 리포지토리 구현체
     """
     
+    _model = ChatMessageModel
+    _mapper = _mapper
+    
     def __init__(self, db: Session):
         self.db = db
     
     def create(self, chat_message: ChatMessage) -> ChatMessage:
         """채팅 메시지 생성"""
-        db_chat = ChatMessageModel(**chat_message.dict())
+        db_chat = ChatMessageModel(**_mapper.to_columns(chat_message))
         self.db.add(db_chat)
         self.db.commit()
         self.db.refresh(db_chat)
@@ -34,6 +42,5 @@ class ChatRepository(IChatRepository):
         return [self._to_entity(chat) for chat in db_chats]
     
     def _to_entity(self, db_model: ChatMessageModel) -> ChatMessage:
-        """ORM 모델을 도메인 엔티티로 변환"""
-        return ChatMessage(**db_model.__dict__)
-
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
@@ -3,24 +3,34 @@
 """
 from typing import Optional, List
 from uuid import UUID
+from datetime import datetime
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.repositories.interfaces.deployment_repository import IDeploymentRepository
 from app.domain.entities.deployment import Deployment
 from app.models.deployment import DeploymentModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
 
 
-class DeploymentRepository(IDeploymentRepository):
+_mapper = EntityMapper(DeploymentModel, Deployment)
+
+
+class DeploymentRepository(BulkRepositoryMixin[Deployment], IDeploymentRepository):
     """
     배포 리포지토리 구현체
     """
     
+    _model = DeploymentModel
+    _mapper = _mapper
+    
     def __init__(self, db: Session):
         self.db = db
     
     def create(self, deployment: Deployment) -> Deployment:
         """배포 생성"""
-        db_deployment = DeploymentModel(**deployment.dict())
+        db_deployment = DeploymentModel(**_mapper.to_columns(deployment))
         self.db.add(db_deployment)
         self.db.commit()
         self.db.refresh(db_deployment)
@@ -40,6 +50,26 @@ class DeploymentRepository(IDeploymentRepository):
         ).all()
         return [self._to_entity(dep) for dep in db_deployments]
     
+    def get_list(
+        self,
+        status: Optional[str] = None,
+        started_before: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Deployment]:
+        """배포 목록 조회 (최신순, 상태/시작 시각 필터)"""
+        query = self.db.query(DeploymentModel)
+        if status is not None:
+            query = query.filter(DeploymentModel.status == status)
+        if started_before is not None:
+            query = query.filter(or_(
+                DeploymentModel.started_at.is_(None),
+                DeploymentModel.started_at < started_before
+            ))
+        query = query.order_by(DeploymentModel.created_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return [self._to_entity(dep) for dep in query.all()]
+    
     def update(self, deployment: Deployment) -> Deployment:
         """배포 업데이트"""
         db_deployment = self.db.query(DeploymentModel).filter(
@@ -47,7 +77,7 @@ class DeploymentRepository(IDeploymentRepository):
         ).first()
         
         if db_deployment:
-            for key, value in deployment.dict().items():
+            for key, value in _mapper.to_columns(deployment).items():
                 setattr(db_deployment, key, value)
             self.db.commit()
             self.db.refresh(db_deployment)
@@ -55,22 +85,5 @@ class DeploymentRepository(IDeploymentRepository):
         raise ValueError(f"Deployment {deployment.id} not found")
     
     def _to_entity(self, db_model: DeploymentModel) -> Deployment:
-        """ORM 모델을 도메인 엔티티로 변환
-        
-        SQLAlchemy 내부 상태(_sa_instance_state 등)를 제거하고,
-        도메인 엔티티에서 정의한 필드만 명시적으로 매핑한다.
-        """
-        if db_model is None:
-            return None
-        
-        return Deployment(
-            id=db_model.id,
-            infrastructure_design_id=db_model.infrastructure_design_id,
-            iac_code_id=db_model.iac_code_id,
-            status=db_model.status,
-            deployment_log=db_model.deployment_log,
-            started_at=db_model.started_at,
-            completed_at=db_model.completed_at,
-            created_at=db_model.created_at,
-        )
-
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
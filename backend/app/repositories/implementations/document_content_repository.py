@@ -0,0 +1,111 @@
+"""
+문서 내용 리포지토리 구현체
+"""
+from typing import Optional, List
+from sqlalchemy import delete, exists, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.repositories.interfaces.document_content_repository import IDocumentContentRepository
+from app.domain.entities.document_content import DocumentContent
+from app.models.document import DocumentModel
+from app.models.document_content import DocumentContentModel
+from app.repositories.implementations.mapper import EntityMapper
+
+
+_mapper = EntityMapper(DocumentContentModel, DocumentContent)
+
+
+class DocumentContentRepository(IDocumentContentRepository):
+    """
+    문서 내용 리포지토리 구현체
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create(self, content: DocumentContent) -> DocumentContent:
+        """문서 내용 생성 (동시 업로드로 같은 해시가 먼저 저장되었으면 기존 내용 반환)"""
+        db_content = DocumentContentModel(**_mapper.to_insert_row(content))
+        self.db.add(db_content)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            existing = self.get_by_hash(content.content_hash)
+            if existing is None:
+                raise
+            return existing
+        self.db.refresh(db_content)
+        return self._to_entity(db_content)
+    
+    def get_by_hash(self, content_hash: str) -> Optional[DocumentContent]:
+        """내용 해시로 문서 내용 조회"""
+        db_content = self.db.get(DocumentContentModel, content_hash)
+        return self._to_entity(db_content) if db_content else None
+    
+    def touch(self, content_hash: str) -> bool:
+        """마지막 사용 시각 갱신 (행이 없으면 False)"""
+        result = self.db.execute(
+            update(DocumentContentModel)
+            .where(DocumentContentModel.content_hash == content_hash)
+            .values(last_used_at=func.now())
+        )
+        self.db.commit()
+        return result.rowcount > 0
+    
+    def update(self, content: DocumentContent) -> DocumentContent:
+        """문서 내용 업데이트"""
+        db_content = self.db.get(DocumentContentModel, content.content_hash)
+        
+        if db_content:
+            for key, value in _mapper.to_columns(content).items():
+                setattr(db_content, key, value)
+            self.db.commit()
+            self.db.refresh(db_content)
+            return self._to_entity(db_content)
+        raise ValueError(f"Document content {content.content_hash} not found")
+    
+    def delete(self, content_hash: str) -> bool:
+        """문서 내용 삭제"""
+        db_content = self.db.get(DocumentContentModel, content_hash)
+        if db_content:
+            self.db.delete(db_content)
+            self.db.commit()
+            return True
+        return False
+    
+    def delete_many(self, content_hashes: List[str]) -> int:
+        """문서 내용 일괄 삭제 (DELETE ... WHERE content_hash IN (...) 한 번)"""
+        if not content_hashes:
+            return 0
+        result = self.db.execute(
+            delete(DocumentContentModel)
+            .where(DocumentContentModel.content_hash.in_(content_hashes))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+    
+    def delete_unreferenced(self, content_hashes: List[str]) -> List[str]:
+        """살아있는 문서가 참조하지 않는 문서 내용만 삭제 (DELETE ... WHERE NOT EXISTS ... RETURNING 한 번)"""
+        if not content_hashes:
+            return []
+        live = exists().where(
+            DocumentModel.content_hash == DocumentContentModel.content_hash,
+            DocumentModel.deleted_at.is_(None)
+        )
+        result = self.db.execute(
+            delete(DocumentContentModel)
+            .where(DocumentContentModel.content_hash.in_(content_hashes), ~live)
+            .returning(DocumentContentModel.content_hash)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = [row[0] for row in result]
+        self.db.commit()
+        return deleted
+    
+    def _to_entity(self, db_model: DocumentContentModel) -> DocumentContent:
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
@@ -1,26 +1,36 @@
 """
 문서 리포지토리 구현체
 """
-from typing import Optional, List
+from typing import Optional, List, Iterable, Set
 from uuid import UUID
+from datetime import datetime
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.repositories.interfaces.document_repository import IDocumentRepository
 from app.domain.entities.document import Document
 from app.models.document import DocumentModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
 
 
-class DocumentRepository(IDocumentRepository):
+_mapper = EntityMapper(DocumentModel, Document)
+
+
+class DocumentRepository(BulkRepositoryMixin[Document], IDocumentRepository):
     """
     문서 리포지토리 구현체
     """
     
+    _model = DocumentModel
+    _mapper = _mapper
+    
     def __init__(self, db: Session):
         self.db = db
     
     def create(self, document: Document) -> Document:
         """문서 생성"""
-        db_document = DocumentModel(**document.dict())
+        db_document = DocumentModel(**_mapper.to_columns(document))
         self.db.add(db_document)
         self.db.commit()
         self.db.refresh(db_document)
@@ -47,14 +57,45 @@ class DocumentRepository(IDocumentRepository):
         ).first()
         
         if db_document:
-            for key, value in document.dict().items():
+            for key, value in _mapper.to_columns(document).items():
                 setattr(db_document, key, value)
             self.db.commit()
             self.db.refresh(db_document)
             return self._to_entity(db_document)
         raise ValueError(f"Document {document.id} not found")
     
+    def get_expired(self, created_before: datetime, limit: int) -> List[Document]:
+        """보관 기간이 지난 문서 조회 (deleted_at, created_at 인덱스 사용)"""
+        db_documents = self.db.query(DocumentModel).filter(
+            DocumentModel.deleted_at.is_(None),
+            DocumentModel.created_at < created_before
+        ).order_by(DocumentModel.created_at.asc()).limit(limit).all()
+        return [self._to_entity(doc) for doc in db_documents]
+    
+    def mark_deleted(self, document_ids: List[UUID], deleted_at: datetime) -> int:
+        """문서 일괄 삭제 표시 (UPDATE ... WHERE id IN (...) 한 번)"""
+        if not document_ids:
+            return 0
+        result = self.db.execute(
+            update(DocumentModel)
+            .where(DocumentModel.id.in_(document_ids), DocumentModel.deleted_at.is_(None))
+            .values(deleted_at=deleted_at)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+    
+    def get_live_content_hashes(self, content_hashes: Iterable[str]) -> Set[str]:
+        """삭제 표시되지 않은 문서가 참조 중인 내용 해시"""
+        content_hashes = list(content_hashes)
+        if not content_hashes:
+            return set()
+        rows = self.db.query(DocumentModel.content_hash).filter(
+            DocumentModel.content_hash.in_(content_hashes),
+            DocumentModel.deleted_at.is_(None)
+        ).distinct().all()
+        return {row[0] for row in rows}
+    
     def _to_entity(self, db_model: DocumentModel) -> Document:
-        """ORM 모델을 도메인 엔티티로 변환"""
-        return Document(**db_model.__dict__)
-
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
@@ -8,19 +8,27 @@ from sqlalchemy.orm import Session
 from app.repositories.interfaces.iac_repository import IIaCRepository
 from app.domain.entities.iac_code import IaCCode
 from app.models.iac_code import IaCCodeModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
 
 
-class IaCRepository(IIaCRepository):
+_mapper = EntityMapper(IaCCodeModel, IaCCode)
+
+
+class IaCRepository(BulkRepositoryMixin[IaCCode], IIaCRepository):
     """
     IaC 코드 리포지토리 구현체
     """
     
+    _model = IaCCodeModel
+    _mapper = _mapper
+    
     def __init__(self, db: Session):
         self.db = db
     
     def create(self, iac_code: IaCCode) -> IaCCode:
         """IaC 코드 생성"""
-        db_iac = IaCCodeModel(**iac_code.dict())
+        db_iac = IaCCodeModel(**_mapper.to_columns(iac_code))
         self.db.add(db_iac)
         self.db.commit()
         self.db.refresh(db_iac)
@@ -55,7 +63,7 @@ class IaCRepository(IIaCRepository):
         ).first()
         
         if db_iac:
-            for key, value in iac_code.dict().items():
+            for key, value in _mapper.to_columns(iac_code).items():
                 setattr(db_iac, key, value)
             self.db.commit()
             self.db.refresh(db_iac)
@@ -63,6 +71,5 @@ class IaCRepository(IIaCRepository):
         raise ValueError(f"IaC code {iac_code.id} not found")
     
     def _to_entity(self, db_model: IaCCodeModel) -> IaCCode:
-        """ORM 모델을 도메인 엔티티로 변환"""
-        return IaCCode(**db_model.__dict__)
-
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
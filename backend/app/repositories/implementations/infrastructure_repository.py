@@ -1,26 +1,36 @@
 """
 인프라 설계 리포지토리 구현체
 """
-from typing import Optional, List
+from typing import Optional, List, Dict
 from uuid import UUID
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.repositories.interfaces.infrastructure_repository import IInfrastructureRepository
 from app.domain.entities.infrastructure import Infrastructure
 from app.models.infrastructure import InfrastructureModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
+from app.db.json_query import json_array_has_object, json_array_field_values
 
 
-class InfrastructureRepository(IInfrastructureRepository):
+_mapper = EntityMapper(InfrastructureModel, Infrastructure)
+
+
+class InfrastructureRepository(BulkRepositoryMixin[Infrastructure], IInfrastructureRepository):
     """
     인프라 설계 리포지토리 구현체
     """
     
+    _model = InfrastructureModel
+    _mapper = _mapper
+    
     def __init__(self, db: Session):
         self.db = db
     
     def create(self, infrastructure: Infrastructure) -> Infrastructure:
         """인프라 설계 생성"""
-        db_infrastructure = InfrastructureModel(**infrastructure.dict())
+        db_infrastructure = InfrastructureModel(**_mapper.to_columns(infrastructure))
         self.db.add(db_infrastructure)
         self.db.commit()
         self.db.refresh(db_infrastructure)
@@ -40,6 +50,53 @@ class InfrastructureRepository(IInfrastructureRepository):
         ).all()
         return [self._to_entity(infra) for infra in db_infrastructures]
     
+    def search_by_architecture(
+        self,
+        component_type: Optional[str] = None,
+        design_type: Optional[str] = None,
+        provider: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Infrastructure]:
+        """아키텍처 구성(컴포넌트 타입 등)으로 인프라 설계 검색"""
+        dialect = self.db.get_bind().dialect.name
+        
+        query = self.db.query(InfrastructureModel)
+        if component_type:
+            query = query.filter(
+                json_array_has_object(dialect, InfrastructureModel.architecture, "components", "type", component_type)
+            )
+        if design_type:
+            query = query.filter(InfrastructureModel.design_type == design_type)
+        if provider:
+            query = query.filter(InfrastructureModel.provider == provider)
+        
+        query = query.order_by(InfrastructureModel.created_at.desc())
+        if limit:
+            query = query.limit(limit)
+        return [self._to_entity(infra) for infra in query.all()]
+    
+    def count_component_types(self, design_type: Optional[str] = None) -> Dict[str, int]:
+        """생성된 아키텍처의 컴포넌트 타입별 개수 집계 (DB에서 GROUP BY)"""
+        dialect = self.db.get_bind().dialect.name
+        elements, component_type = json_array_field_values(
+            dialect, InfrastructureModel.architecture, "components", "type"
+        )
+        
+        stmt = (
+            select(component_type.label("component_type"), func.count().label("count"))
+            .select_from(InfrastructureModel)
+            .join(elements, InfrastructureModel.architecture.isnot(None))
+            .group_by("component_type")
+        )
+        if design_type:
+            stmt = stmt.where(InfrastructureModel.design_type == design_type)
+        
+        return {
+            row.component_type: row.count
+            for row in self.db.execute(stmt)
+            if row.component_type is not None
+        }
+    
     def update(self, infrastructure: Infrastructure) -> Infrastructure:
         """인프라 설계 업데이트"""
         db_infrastructure = self.db.query(InfrastructureModel).filter(
@@ -47,7 +104,7 @@ class InfrastructureRepository(IInfrastructureRepository):
         ).first()
         
         if db_infrastructure:
-            for key, value in infrastructure.dict().items():
+            for key, value in _mapper.to_columns(infrastructure).items():
                 setattr(db_infrastructure, key, value)
             self.db.commit()
             self.db.refresh(db_infrastructure)
@@ -55,6 +112,5 @@ class InfrastructureRepository(IInfrastructureRepository):
         raise ValueError(f"Infrastructure {infrastructure.id} not found")
     
     def _to_entity(self, db_model: InfrastructureModel) -> Infrastructure:
-        """ORM 모델을 도메인 엔티티로 변환"""
-        return Infrastructure(**db_model.__dict__)
-
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
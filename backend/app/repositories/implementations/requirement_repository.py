@@ -8,19 +8,28 @@ from sqlalchemy.orm import Session
 from app.repositories.interfaces.requirement_repository import IRequirementRepository
 from app.domain.entities.requirement import Requirement
 from app.models.requirement import RequirementModel
+from app.repositories.implementations.mapper import EntityMapper
+from app.repositories.implementations.bulk import BulkRepositoryMixin
+from app.db.json_query import json_field_equals, json_array_contains
 
 
-class RequirementRepository(IRequirementRepository):
+_mapper = EntityMapper(RequirementModel, Requirement, converters={"budget": float, "has_ops_team": bool})
+
+
+class RequirementRepository(BulkRepositoryMixin[Requirement], IRequirementRepository):
     """
     요구사항 리포지토리 구현체
     """
     
+    _model = RequirementModel
+    _mapper = _mapper
+    
     def __init__(self, db: Session):
         self.db = db
     
     def create(self, requirement: Requirement) -> Requirement:
         """요구사항 생성"""
-        db_requirement = RequirementModel(**requirement.dict())
+        db_requirement = RequirementModel(**_mapper.to_columns(requirement))
         self.db.add(db_requirement)
         self.db.commit()
         self.db.refresh(db_requirement)
@@ -40,6 +49,35 @@ class RequirementRepository(IRequirementRepository):
         ).all()
         return [self._to_entity(req) for req in db_requirements]
     
+    def search_by_structured_data(
+        self,
+        deployment_type: Optional[str] = None,
+        scale: Optional[str] = None,
+        technical_stack: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Requirement]:
+        """구조화 데이터(분석 결과) 필드로 요구사항 검색
+        
+        필터는 DB에서 JSON 인덱스(PostgreSQL GIN / SQLite 식 인덱스)로 평가한다.
+        """
+        dialect = self.db.get_bind().dialect.name
+        column = RequirementModel.structured_data
+        
+        query = self.db.query(RequirementModel)
+        if deployment_type:
+            query = query.filter(json_field_equals(dialect, column, "deployment_type", deployment_type))
+        if scale:
+            query = query.filter(json_field_equals(dialect, column, "scale", scale))
+        if technical_stack:
+            query = query.filter(
+                json_array_contains(dialect, column, "technical_stack_suggestions", technical_stack)
+            )
+        
+        query = query.order_by(RequirementModel.created_at.desc())
+        if limit:
+            query = query.limit(limit)
+        return [self._to_entity(req) for req in query.all()]
+    
     def update(self, requirement: Requirement) -> Requirement:
         """요구사항 업데이트"""
         db_requirement = self.db.query(RequirementModel).filter(
@@ -47,7 +85,7 @@ class RequirementRepository(IRequirementRepository):
         ).first()
         
         if db_requirement:
-            for key, value in requirement.dict().items():
+            for key, value in _mapper.to_columns(requirement).items():
                 setattr(db_requirement, key, value)
             self.db.commit()
             self.db.refresh(db_requirement)
@@ -67,24 +105,5 @@ class RequirementRepository(IRequirementRepository):
         return False
     
     def _to_entity(self, db_model: RequirementModel) -> Requirement:
-        """ORM 모델을 도메인 엔티티로 변환
-
-        SQLAlchemy 내부 상태(_sa_instance_state 등)를 제거하고,
-        도메인 엔티티에서 정의한 필드만 명시적으로 매핑한다.
-        """
-        return Requirement(
-            id=db_model.id,
-            user_id=db_model.user_id,
-            input_type=db_model.input_type,
-            service_type=db_model.service_type,
-            deployment_type=db_model.deployment_type,
-            scale=db_model.scale,
-            budget=float(db_model.budget) if db_model.budget is not None else None,
-            has_ops_team=bool(db_model.has_ops_team) if db_model.has_ops_team is not None else None,
-            special_requirements=db_model.special_requirements,
-            structured_data=db_model.structured_data,
-            status=db_model.status,
-            created_at=db_model.created_at,
-            updated_at=db_model.updated_at,
-        )
-
+        """ORM 모델을 도메인 엔티티로 변환 (모델별로 미리 컴파일된 컬럼 매퍼 사용)"""
+        return _mapper.to_entity(db_model)
@@ -0,0 +1,35 @@
+"""
+알림 이벤트 리포지토리 인터페이스
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.entities.alert_event import AlertEvent
+
+
+class IAlertRepository(ABC):
+    """
+    알림 이벤트 리포지토리 인터페이스
+    """
+    
+    @abstractmethod
+    def bulk_create(self, events: List[AlertEvent]) -> List[AlertEvent]:
+        """알림 이벤트 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def get_by_deployment_id(
+        self,
+        deployment_id: UUID,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[AlertEvent]:
+        """배포의 알림 이벤트 조회 (최신순, since: 해당 시각 이후 전이만)"""
+        pass
+    
+    @abstractmethod
+    def get_firing(self) -> List[AlertEvent]:
+        """(배포, 규칙, 시계열)별 마지막 전이가 firing인 이벤트 (재시작 시 알림 상태 복원용)"""
+        pass
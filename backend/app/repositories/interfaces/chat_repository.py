@@ -2,7 +2,7 @@
 채팅 메시지 리포지토리 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Iterable
 from uuid import UUID
 
 from app.domain.entities.chat_message import ChatMessage
@@ -22,4 +22,13 @@ class IChatRepository(ABC):
     def get_by_requirement_id(self, requirement_id: UUID) -> List[ChatMessage]:
         """요구사항 ID로 채팅 메시지 목록 조회"""
         pass
-
+    
+    @abstractmethod
+    def bulk_create(self, chat_messages: List[ChatMessage]) -> List[ChatMessage]:
+        """채팅 메시지 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[ChatMessage]:
+        """ID 목록으로 채팅 메시지 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        pass
@@ -2,8 +2,9 @@
 배포 리포지토리 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Iterable
 from uuid import UUID
+from datetime import datetime
 
 from app.domain.entities.deployment import Deployment
 
@@ -28,8 +29,32 @@ class IDeploymentRepository(ABC):
         """인프라 설계 ID로 배포 목록 조회"""
         pass
     
+    @abstractmethod
+    def get_list(
+        self,
+        status: Optional[str] = None,
+        started_before: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Deployment]:
+        """배포 목록 조회 (최신순, status: 상태 필터, started_before: 해당 시각 이전에 시작됐거나 시작 시각이 없는 배포만)"""
+        pass
+    
     @abstractmethod
     def update(self, deployment: Deployment) -> Deployment:
         """배포 업데이트"""
         pass
-
+    
+    @abstractmethod
+    def bulk_create(self, deployments: List[Deployment]) -> List[Deployment]:
+        """배포 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Deployment]:
+        """ID 목록으로 배포 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        pass
+    
+    @abstractmethod
+    def bulk_update(self, deployments: List[Deployment], where: Optional[Dict[str, Any]] = None) -> int:
+        """배포 일괄 업데이트 (기본 키 + where 조건), 실제로 업데이트된 행 수 반환"""
+        pass
@@ -0,0 +1,53 @@
+"""
+문서 내용 리포지토리 인터페이스
+"""
+from abc import ABC, abstractmethod
+from typing import Optional, List
+
+from app.domain.entities.document_content import DocumentContent
+
+
+class IDocumentContentRepository(ABC):
+    """
+    문서 내용 리포지토리 인터페이스
+    """
+    
+    @abstractmethod
+    def create(self, content: DocumentContent) -> DocumentContent:
+        """문서 내용 생성 (같은 해시가 이미 있으면 기존 내용 반환)"""
+        pass
+    
+    @abstractmethod
+    def get_by_hash(self, content_hash: str) -> Optional[DocumentContent]:
+        """내용 해시로 문서 내용 조회"""
+        pass
+    
+    @abstractmethod
+    def touch(self, content_hash: str) -> bool:
+        """마지막 사용 시각 갱신 (캐시 적중 시), 행이 없으면(그 사이 정리됨) False"""
+        pass
+    
+    @abstractmethod
+    def update(self, content: DocumentContent) -> DocumentContent:
+        """문서 내용 업데이트"""
+        pass
+    
+    @abstractmethod
+    def delete(self, content_hash: str) -> bool:
+        """문서 내용 삭제"""
+        pass
+    
+    @abstractmethod
+    def delete_many(self, content_hashes: List[str]) -> int:
+        """문서 내용 일괄 삭제 (단일 DELETE), 삭제된 행 수 반환"""
+        pass
+    
+    @abstractmethod
+    def delete_unreferenced(self, content_hashes: List[str]) -> List[str]:
+        """
+        살아있는 문서가 참조하지 않는 문서 내용만 일괄 삭제 (참조 확인과 삭제를 DELETE 한 번으로)
+        
+        Returns:
+            실제로 삭제한 내용 해시
+        """
+        pass
@@ -2,8 +2,9 @@
 문서 리포지토리 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterable, Set
 from uuid import UUID
+from datetime import datetime
 
 from app.domain.entities.document import Document
 
@@ -32,4 +33,33 @@ class IDocumentRepository(ABC):
     def update(self, document: Document) -> Document:
         """문서 업데이트"""
         pass
-
+    
+    @abstractmethod
+    def get_expired(self, created_before: datetime, limit: int) -> List[Document]:
+        """보관 기간이 지난(삭제 표시되지 않은) 문서 조회 (오래된 순)"""
+        pass
+    
+    @abstractmethod
+    def mark_deleted(self, document_ids: List[UUID], deleted_at: datetime) -> int:
+        """문서 일괄 삭제 표시 (단일 UPDATE), 변경된 행 수 반환"""
+        pass
+    
+    @abstractmethod
+    def get_live_content_hashes(self, content_hashes: Iterable[str]) -> Set[str]:
+        """삭제 표시되지 않은 문서가 참조 중인 내용 해시"""
+        pass
+    
+    @abstractmethod
+    def bulk_create(self, documents: List[Document]) -> List[Document]:
+        """문서 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Document]:
+        """ID 목록으로 문서 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        pass
+    
+    @abstractmethod
+    def bulk_update(self, documents: List[Document]) -> int:
+        """문서 일괄 업데이트 (기본 키 기준), 업데이트된 행 수 반환"""
+        pass
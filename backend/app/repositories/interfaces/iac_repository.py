@@ -2,7 +2,7 @@
 IaC 코드 리포지토리 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from uuid import UUID
 
 from app.domain.entities.iac_code import IaCCode
@@ -37,4 +37,18 @@ class IIaCRepository(ABC):
     def update(self, iac_code: IaCCode) -> IaCCode:
         """IaC 코드 업데이트"""
         pass
-
+    
+    @abstractmethod
+    def bulk_create(self, iac_codes: List[IaCCode]) -> List[IaCCode]:
+        """IaC 코드 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[IaCCode]:
+        """ID 목록으로 IaC 코드 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        pass
+    
+    @abstractmethod
+    def bulk_update(self, iac_codes: List[IaCCode]) -> int:
+        """IaC 코드 일괄 업데이트 (기본 키 기준), 업데이트된 행 수 반환"""
+        pass
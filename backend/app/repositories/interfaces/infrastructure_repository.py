@@ -2,7 +2,7 @@
 인프라 설계 리포지토리 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 
 from app.domain.entities.infrastructure import Infrastructure
@@ -28,8 +28,38 @@ class IInfrastructureRepository(ABC):
         """요구사항 ID로 인프라 설계 목록 조회"""
         pass
     
+    @abstractmethod
+    def search_by_architecture(
+        self,
+        component_type: Optional[str] = None,
+        design_type: Optional[str] = None,
+        provider: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Infrastructure]:
+        """아키텍처 구성(컴포넌트 타입 등)으로 인프라 설계 검색"""
+        pass
+    
+    @abstractmethod
+    def count_component_types(self, design_type: Optional[str] = None) -> Dict[str, int]:
+        """생성된 아키텍처의 컴포넌트 타입별 개수 집계"""
+        pass
+    
     @abstractmethod
     def update(self, infrastructure: Infrastructure) -> Infrastructure:
         """인프라 설계 업데이트"""
         pass
-
+    
+    @abstractmethod
+    def bulk_create(self, infrastructures: List[Infrastructure]) -> List[Infrastructure]:
+        """인프라 설계 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Infrastructure]:
+        """ID 목록으로 인프라 설계 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        pass
+    
+    @abstractmethod
+    def bulk_update(self, infrastructures: List[Infrastructure]) -> int:
+        """인프라 설계 일괄 업데이트 (기본 키 기준), 업데이트된 행 수 반환"""
+        pass
@@ -2,7 +2,7 @@
 요구사항 리포지토리 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from uuid import UUID
 
 from app.domain.entities.requirement import Requirement
@@ -28,6 +28,17 @@ class IRequirementRepository(ABC):
         """사용자 ID로 요구사항 목록 조회"""
         pass
     
+    @abstractmethod
+    def search_by_structured_data(
+        self,
+        deployment_type: Optional[str] = None,
+        scale: Optional[str] = None,
+        technical_stack: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Requirement]:
+        """구조화 데이터(분석 결과) 필드로 요구사항 검색"""
+        pass
+    
     @abstractmethod
     def update(self, requirement: Requirement) -> Requirement:
         """요구사항 업데이트"""
@@ -37,4 +48,18 @@ class IRequirementRepository(ABC):
     def delete(self, requirement_id: UUID) -> bool:
         """요구사항 삭제"""
         pass
-
+    
+    @abstractmethod
+    def bulk_create(self, requirements: List[Requirement]) -> List[Requirement]:
+        """요구사항 일괄 생성 (단일 INSERT, 입력 순서대로 반환)"""
+        pass
+    
+    @abstractmethod
+    def bulk_get_by_ids(self, ids: Iterable[UUID]) -> List[Requirement]:
+        """ID 목록으로 요구사항 일괄 조회 (입력 순서 유지, 없는 ID는 제외)"""
+        pass
+    
+    @abstractmethod
+    def bulk_update(self, requirements: List[Requirement]) -> int:
+        """요구사항 일괄 업데이트 (기본 키 기준), 업데이트된 행 수 반환"""
+        pass
@@ -0,0 +1,34 @@
+"""
+문서 업로드 스키마 (Pydantic)
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from uuid import UUID
+
+
+class UploadInitRequest(BaseModel):
+    """멀티파트 업로드 시작 스키마"""
+    requirement_id: UUID
+    file_name: str
+    file_size: int = Field(..., gt=0, description="전체 파일 크기 (bytes)")
+    part_size: Optional[int] = Field(None, gt=0, description="파트 크기 (bytes, 기본값: UPLOAD_PART_SIZE)")
+
+
+class UploadStatusResponse(BaseModel):
+    """멀티파트 업로드 상태 응답 스키마"""
+    upload_id: UUID
+    requirement_id: UUID
+    file_name: str
+    file_size: int
+    part_size: int
+    total_parts: int
+    received_parts: List[int]
+    missing_parts: List[int]
+    status: str  # 'uploading', 'parsing', 'parsed', 'failed'
+
+
+class UploadPartResponse(BaseModel):
+    """파트 업로드 응답 스키마"""
+    upload_id: UUID
+    part_number: int
+    size: int
@@ -6,6 +6,8 @@ from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
 
+from app.domain.entities.alert_event import AlertEvent
+
 
 class MonitoringMetric(BaseModel):
     """모니터링 메트릭"""
@@ -16,12 +18,50 @@ class MonitoringMetric(BaseModel):
     tags: Optional[Dict[str, str]] = None
 
 
+class ActiveAlert(BaseModel):
+    """firing 중인 알림"""
+    rule_name: str
+    severity: str  # 'warning', 'critical'
+    metric_name: str
+    tags: Optional[Dict[str, str]] = None
+    value: Optional[float] = None
+    since: datetime
+
+
+class AlertEventResponse(BaseModel):
+    """알림 상태 전이 기록"""
+    rule_name: str
+    severity: str
+    state: str  # 'firing', 'resolved'
+    metric_name: str
+    tags: Optional[Dict[str, str]] = None
+    value: Optional[float] = None
+    triggered_at: datetime
+    
+    @classmethod
+    def from_entity(cls, entity: AlertEvent) -> "AlertEventResponse":
+        """도메인 엔티티로부터 스키마 생성"""
+        return cls.model_validate(entity)
+    
+    class Config:
+        from_attributes = True
+
+
+class AlertsResponse(BaseModel):
+    """배포 알림 조회 응답"""
+    deployment_id: UUID
+    status: Optional[str] = None  # 알림 엔진이 평가한 적 없는 배포는 None
+    active: List[ActiveAlert]
+    history: List[AlertEventResponse]
+
+
 class MonitoringResponse(BaseModel):
     """모니터링 응답 스키마"""
     deployment_id: UUID
     metrics: List[MonitoringMetric]
-    status: str  # 'healthy', 'warning', 'critical'
+    status: str  # 'healthy', 'warning', 'critical', 'unknown'(알림 엔진 기준 데이터 끊김)
     last_updated: datetime
+    alerts: List[ActiveAlert] = []
     
     class Config:
         from_attributes = True
@@ -33,3 +73,10 @@ class HealthCheckResponse(BaseModel):
     services: Dict[str, str]  # 서비스별 상태
     timestamp: datetime
 
+
+
+class NetworkSweepRequest(BaseModel):
+    """네트워크 대역 포트 스윕 요청"""
+    cidrs: List[str]  # 예: ["192.168.56.0/24", "10.0.0.5"]
+    ports: str = "22"  # 예: "22,80,443,8000-8010"
+    refresh: bool = False  # True면 인벤토리 캐시를 무시하고 모두 다시 확인
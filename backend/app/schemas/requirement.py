@@ -39,8 +39,8 @@ class RequirementResponse(BaseModel):
     
     @classmethod
     def from_entity(cls, entity: Requirement) -> "RequirementResponse":
-        """도메인 엔티티로부터 스키마 생성"""
-        return cls(**entity.dict())
+        """도메인 엔티티로부터 스키마 생성 (속성에서 직접 검증, 중간 dict 없음)"""
+        return cls.model_validate(entity)
     
     class Config:
         from_attributes = True
@@ -3,7 +3,7 @@
 """
 from typing import Optional, List
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.domain.entities.deployment import Deployment
 from app.schemas.deployment import DeploymentCreate, DeploymentResponse, DeploymentUpdate
@@ -81,6 +81,42 @@ class DeploymentService:
         deployments = self.deployment_repository.get_by_infrastructure_id(infrastructure_id)
         return [DeploymentResponse.from_entity(dep) for dep in deployments]
     
+    async def get_deployments(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[DeploymentResponse]:
+        """
+        배포 목록 조회 (최신순, 상태로 필터링 가능)
+        """
+        deployments = self.deployment_repository.get_list(status=status, limit=limit)
+        return [DeploymentResponse.from_entity(dep) for dep in deployments]
+    
+    async def fail_stale_deployments(self, timeout_seconds: int) -> int:
+        """
+        중단된 배포 정리
+        
+        - 'deploying' 상태로 timeout_seconds 이상 지난 배포를 'failed'로 일괄 변경
+        - 프로세스 재시작으로 백그라운드 배포 작업이 사라진 경우를 정리하기 위해 시작 시 호출
+        """
+        now = datetime.utcnow()
+        stale = self.deployment_repository.get_list(
+            status="deploying",
+            started_before=now - timedelta(seconds=timeout_seconds)
+        )
+        if not stale:
+            return 0
+        
+        for deployment in stale:
+            deployment.status = "failed"
+            deployment.completed_at = now
+            deployment.deployment_log = (deployment.deployment_log or "") + "\n배포 시간 초과 또는 서버 재시작으로 중단됨"
+        
+        # 조회 후 완료/삭제된 배포는 건너뛴다 (아직 deploying인 행만 변경)
+        updated = self.deployment_repository.bulk_update(stale, where={"status": "deploying"})
+        logger.warning(f"중단된 배포 실패 처리: count={updated}")
+        return updated
+    
     async def update_deployment(
         self,
         deployment_id: UUID,
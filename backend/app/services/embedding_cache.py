@@ -0,0 +1,253 @@
+"""
+임베딩 캐시 (디스크, memmap)
+
+(모델, 텍스트 해시) → 임베딩 벡터를 디스크에 저장해 같은 텍스트를 다시 임베딩하지 않는다.
+
+저장 형식 (EMBEDDING_CACHE_DIR/<모델>/):
+- meta.json: 차원, dtype
+- vectors.bin: 고정 길이 벡터 행 (float16 또는 float32), 추가 전용, 읽기는 np.memmap
+- keys.bin: 16바이트 키(SHA-256 앞부분) 행, vectors.bin과 같은 순서로 추가
+
+벡터를 먼저 쓰고 키를 나중에 쓰므로, 쓰기 도중 중단되어도 키가 없는 행은 무시된다.
+다른 프로세스가 추가한 항목은 keys.bin 크기가 늘어난 것을 보고 뒷부분만 다시 읽는다.
+
+디스크에는 문서 임베딩만 저장한다. 질의는 종류가 끝없이 늘어나므로 프로세스 내 LRU
+(EMBEDDING_QUERY_CACHE_SIZE)에만 보관한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.services.embedding_cache")
+
+_KEY_SIZE = 16
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class EmbeddingStore:
+    """
+    모델별 디스크 임베딩 저장소
+
+    Args:
+        path: 저장 디렉터리
+        dtype: 저장 dtype ('float16' 또는 'float32')
+    """
+
+    def __init__(self, path: str, dtype: str = "float16"):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.dim: Optional[int] = None
+        self._index: Dict[bytes, int] = {}
+        self._keys_offset = 0
+        self._vectors: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        self._meta_path = os.path.join(path, "meta.json")
+        self._vectors_path = os.path.join(path, "vectors.bin")
+        self._keys_path = os.path.join(path, "keys.bin")
+        self._lock_path = os.path.join(path, ".lock")
+
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path) as f:
+                meta = json.load(f)
+            self.dim = meta["dim"]
+            self.dtype = np.dtype(meta["dtype"])
+        with self._lock:
+            self._refresh()
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """캐시 키 (모델 + 텍스트의 SHA-256 앞 16바이트)"""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()[:_KEY_SIZE]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[List[float]]]:
+        """키 목록 → 벡터 목록 (없으면 None)"""
+        with self._lock:
+            rows = [self._index.get(key) for key in keys]
+            if any(row is None for row in rows):
+                # 다른 프로세스가 추가한 항목 반영
+                self._refresh()
+                rows = [self._index.get(key) for key in keys]
+            vectors = self._vectors
+        return [
+            vectors[row].astype(np.float32).tolist() if row is not None else None
+            for row in rows
+        ]
+
+    def put_many(self, keys: List[bytes], vectors: List[List[float]]) -> None:
+        """벡터 추가 (이미 있는 키는 건너뜀)"""
+        if not keys:
+            return
+        with self._lock, self._file_lock():
+            self._refresh()
+            new = {}
+            for key, vector in zip(keys, vectors):
+                if key not in self._index and key not in new:
+                    new[key] = vector
+            if not new:
+                return
+
+            matrix = np.asarray(list(new.values()), dtype=self.dtype)
+            if self.dim is None:
+                self.dim = int(matrix.shape[1])
+                with open(self._meta_path, "w") as f:
+                    json.dump({"dim": self.dim, "dtype": self.dtype.name}, f)
+            elif matrix.shape[1] != self.dim:
+                raise ValueError(f"Embedding dimension {matrix.shape[1]} != cached dimension {self.dim}")
+
+            # 키가 없는 꼬리 행(중단된 쓰기)은 잘라내고 이어서 기록
+            row_bytes = self.dim * self.dtype.itemsize
+            start = len(self._index)
+            with open(self._vectors_path, "ab") as f:
+                f.truncate(start * row_bytes)
+                f.write(matrix.tobytes())
+            with open(self._keys_path, "ab") as f:
+                f.write(b"".join(new.keys()))
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """keys.bin에 새로 추가된 키를 읽고 vectors.bin memmap을 다시 연다 (잠금 보유 상태에서 호출)"""
+        if self.dim is None or not os.path.exists(self._keys_path):
+            return
+        size = os.path.getsize(self._keys_path)
+        row_bytes = self.dim * self.dtype.itemsize
+        vector_rows = os.path.getsize(self._vectors_path) // row_bytes if os.path.exists(self._vectors_path) else 0
+        complete = min(size // _KEY_SIZE, vector_rows)
+        if complete * _KEY_SIZE <= self._keys_offset and self._vectors is not None:
+            return
+
+        with open(self._keys_path, "rb") as f:
+            f.seek(self._keys_offset)
+            data = f.read(complete * _KEY_SIZE - self._keys_offset)
+        row = self._keys_offset // _KEY_SIZE
+        for offset in range(0, len(data), _KEY_SIZE):
+            self._index.setdefault(data[offset:offset + _KEY_SIZE], row)
+            row += 1
+        self._keys_offset = complete * _KEY_SIZE
+
+        if complete:
+            self._vectors = np.memmap(self._vectors_path, dtype=self.dtype, mode="r", shape=(complete, self.dim))
+
+    @contextmanager
+    def _file_lock(self):
+        """프로세스 간 쓰기 잠금 (fcntl이 없으면 프로세스 내 잠금만 사용)"""
+        with open(self._lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class CachedEmbeddings:
+    """
+    임베딩 캐시 래퍼 (LangChain Embeddings 인터페이스: embed_documents / embed_query)
+
+    캐시에 없는 텍스트만 한 번의 embed_documents 호출로 임베딩하고 저장한다.
+    질의 임베딩은 디스크에 저장하지 않고 프로세스 내 LRU에만 보관한다.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        store: EmbeddingStore,
+        model: Optional[str] = None,
+        query_cache: Optional[LRUCache] = None
+    ):
+        self.embeddings = embeddings
+        self.store = store
+        self.model = model or getattr(embeddings, "model", None) or type(embeddings).__name__
+        if query_cache is None:
+            query_cache = LRUCache(max_size=settings.EMBEDDING_QUERY_CACHE_SIZE, ttl=settings.EMBEDDING_QUERY_CACHE_TTL)
+        self.query_cache = query_cache
+        self.hits = 0
+        self.misses = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (캐시 우선)"""
+        keys = [EmbeddingStore.key(self.model, text) for text in texts]
+        vectors = self.store.get_many(keys)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            # 같은 호출 안의 중복 텍스트는 한 번만 임베딩
+            unique: Dict[bytes, int] = {}
+            for i in missing:
+                unique.setdefault(keys[i], i)
+            embedded = self.embeddings.embed_documents([texts[i] for i in unique.values()])
+            by_key = dict(zip(unique.keys(), embedded))
+            for i in missing:
+                vectors[i] = by_key[keys[i]]
+            try:
+                self.store.put_many(list(by_key.keys()), embedded)
+            except Exception as e:
+                logger.warning(f"임베딩 캐시 저장 실패: {str(e)}")
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """질의 임베딩 (같은 텍스트의 문서 임베딩 → 질의 LRU 순으로 확인)"""
+        key = EmbeddingStore.key(self.model, text)
+        vector = self.query_cache.get(key.hex())
+        if vector is None:
+            vector = self.store.get_many([key])[0]
+        if vector is not None:
+            self.hits += 1
+            return vector
+        self.misses += 1
+        vector = self.embeddings.embed_query(text)
+        self.query_cache.set(key.hex(), vector)
+        return vector
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self.embed_query, text)
+
+
+_stores: Dict[str, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(model: str) -> EmbeddingStore:
+    """모델별 프로세스 전역 임베딩 저장소"""
+    with _stores_lock:
+        store = _stores.get(model)
+        if store is None:
+            base_dir = settings.EMBEDDING_CACHE_DIR or os.path.join(settings.UPLOAD_DIR, "embedding_cache")
+            slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model)
+            store = EmbeddingStore(os.path.join(base_dir, slug), dtype=settings.EMBEDDING_CACHE_DTYPE)
+            _stores[model] = store
+        return store
+
+
+def cached_embeddings(embeddings, model: Optional[str] = None):
+    """EMBEDDING_CACHE_ENABLED이면 임베딩 함수를 디스크 캐시로 감싼다"""
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return embeddings
+    model = model or getattr(embeddings, "model", None) or type(embeddings).__name__
+    return CachedEmbeddings(embeddings, get_embedding_store(model), model)
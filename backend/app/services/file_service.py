@@ -1,11 +1,86 @@
 """
 파일 서비스 (문서 업로드 및 파싱)
+
+업로드 파일은 고정 크기 청크로 스트리밍 저장한다.
+- 청크마다 SHA-256을 갱신하고 크기 한도를 검사 (업로드당 메모리 사용량 = 청크 크기)
+- 임시 파일(UPLOAD_DIR/tmp)에 기록 후 내용 주소 경로(UPLOAD_DIR/objects/ab/cd/<sha256>.<ext>)로 이동
+  → 같은 이름의 동시 업로드가 충돌하지 않고, 같은 내용의 파일은 (확장자가 달라도) 한 번만 저장된다.
+
+대용량 문서는 재개 가능한 멀티파트 업로드로 받을 수 있다.
+- 파트는 UPLOAD_DIR/parts/<upload_id>/<N>.part 에 파트별로 원자적으로 저장 (병렬 수신 가능)
+- 완료 시 파트를 순서대로 이어 붙이며 SHA-256을 계산해 내용 주소 경로로 이동
+  (파트는 결과가 문서에 기록되고 객체가 옮겨진 뒤에 지운다)
 """
 from fastapi import UploadFile
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, BinaryIO, Optional
+from dataclasses import dataclass, replace
+import asyncio
+import hashlib
 import os
+import shutil
+import uuid
 
 from app.core.config import settings
+from app.services.parsing_engine import get_parsing_engine
+
+
+@dataclass
+class StoredFile:
+    """
+    저장된 업로드 파일 정보
+    """
+    file_path: str
+    content_hash: str  # SHA-256 (hex)
+    file_size: int
+    file_type: str
+    tmp_path: Optional[str] = None  # 아직 file_path로 옮기지 않은 임시 파일 (stage 단계)
+
+
+def content_path(content_hash: str, file_ext: str) -> str:
+    """내용 주소 경로 (UPLOAD_DIR/objects/ab/cd/<sha256>.<ext>)"""
+    return os.path.join(
+        settings.UPLOAD_DIR, "objects", content_hash[:2], content_hash[2:4], f"{content_hash}.{file_ext}"
+    )
+
+
+def _existing_object(content_hash: str, file_ext: str) -> str:
+    """
+    같은 내용의 기존 객체 경로 (확장자가 달라도 재사용, 없으면 새 내용 주소 경로)
+
+    document_contents는 내용 해시만으로 식별하므로 같은 바이트가 다른 확장자로 올라와도
+    객체는 하나만 둔다 (보관 기간 정리가 해시 단위로 파일을 지우므로 중복 객체는 누수된다).
+    """
+    file_path = content_path(content_hash, file_ext)
+    directory = os.path.dirname(file_path)
+    if not os.path.exists(file_path) and os.path.isdir(directory):
+        prefix = f"{content_hash}."
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_file():
+                    return entry.path
+    return file_path
+
+
+def _write_chunk(out: BinaryIO, digest, chunk: bytes) -> None:
+    out.write(chunk)
+    digest.update(chunk)
+
+
+def _concat_parts(part_paths, out_path: str, chunk_size: int):
+    """파트 파일을 순서대로 이어 붙이며 SHA-256 계산 (청크 단위 복사)"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(out_path, "wb") as out:
+        for part_path in part_paths:
+            with open(part_path, "rb") as part:
+                while True:
+                    chunk = part.read(chunk_size)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+    return digest, size
 
 
 class FileService:
@@ -17,23 +92,41 @@ class FileService:
         """
         파일 업로드 및 파싱
         """
-        # 파일 검증
-        self._validate_file(file)
-        
-        # 파일 저장
-        file_path = await self._save_file(file)
+        # 파일 검증 및 저장 (스트리밍)
+        stored = await self.save_upload(file)
         
         # 파일 파싱
-        parsed_data = await self._parse_file(file_path, file.filename)
+        parsed_data = await self.parse_stored_file(stored, file.filename)
+        parsed_data.update(
+            file_path=stored.file_path,
+            content_hash=stored.content_hash,
+            file_size=stored.file_size,
+        )
         
         return parsed_data
     
+    async def save_upload(self, file: UploadFile) -> StoredFile:
+        """
+        파일 검증 후 내용 주소 경로에 저장 (파싱 없음)
+        """
+        return self.store(await self.stage_upload(file))
+    
+    async def stage_upload(self, file: UploadFile) -> StoredFile:
+        """
+        파일 검증 후 임시 파일로 수신 (내용 해시와 저장할 경로만 결정, 이동은 store())
+        
+        호출자는 내용 해시를 문서에 먼저 기록한 뒤 store()를 호출해, 보관 기간 정리가
+        같은 내용의 기존 객체를 지우는 중에 그 객체를 재사용하는 일이 없게 한다.
+        """
+        self._validate_file(file)
+        return await self._save_file(file)
+    
     def _validate_file(self, file: UploadFile):
         """
         파일 검증
         """
-        # 파일 크기 검증
-        if file.size > settings.MAX_UPLOAD_SIZE:
+        # 파일 크기 검증 (크기를 알 수 없는 경우 저장 중에 검증)
+        if file.size is not None and file.size > settings.MAX_UPLOAD_SIZE:
             raise ValueError(f"File size exceeds {settings.MAX_UPLOAD_SIZE} bytes")
         
         # 파일 형식 검증
@@ -41,18 +134,165 @@ class FileService:
         if file_ext not in settings.ALLOWED_FILE_TYPES:
             raise ValueError(f"File type {file_ext} not allowed")
     
-    async def _save_file(self, file: UploadFile) -> str:
+    async def _save_file(self, file: UploadFile) -> StoredFile:
         """
-        파일 저장
+        임시 파일로 수신 (청크 단위 스트리밍, SHA-256 계산, 크기 한도 검사)
         """
-        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-        file_path = os.path.join(settings.UPLOAD_DIR, file.filename)
+        file_ext = file.filename.split(".")[-1].lower()
+        tmp_path = self._tmp_path()
         
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp_path, "wb") as out:
+                while True:
+                    chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > settings.MAX_UPLOAD_SIZE:
+                        raise ValueError(f"File size exceeds {settings.MAX_UPLOAD_SIZE} bytes")
+                    # 디스크 쓰기와 해시 계산은 이벤트 루프 밖에서 수행
+                    await asyncio.to_thread(_write_chunk, out, digest, chunk)
+            
+            return self._stage(tmp_path, digest.hexdigest(), size, file_ext)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _tmp_path(self) -> str:
+        """임시 파일 경로 (UPLOAD_DIR/tmp/<uuid>.part)"""
+        tmp_dir = os.path.join(settings.UPLOAD_DIR, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        return os.path.join(tmp_dir, f"{uuid.uuid4().hex}.part")
+    
+    def _stage(self, tmp_path: str, content_hash: str, size: int, file_ext: str) -> StoredFile:
+        """저장할 내용 주소 경로 결정 (임시 파일은 아직 옮기지 않음)"""
+        return StoredFile(
+            file_path=_existing_object(content_hash, file_ext),
+            content_hash=content_hash,
+            file_size=size,
+            file_type=file_ext,
+            tmp_path=tmp_path,
+        )
+    
+    def store(self, staged: StoredFile) -> StoredFile:
+        """
+        stage한 임시 파일을 내용 주소 경로로 이동
+        
+        같은 내용의 객체가 이미 있어도 같은 바이트로 교체하므로, 그 사이 객체가 지워졌어도 다시 생긴다.
+        """
+        os.makedirs(os.path.dirname(staged.file_path), exist_ok=True)
+        os.replace(staged.tmp_path, staged.file_path)
+        return replace(staged, tmp_path=None)
+    
+    def discard(self, staged: StoredFile) -> None:
+        """옮기지 않은 임시 파일 삭제"""
+        if staged.tmp_path and os.path.exists(staged.tmp_path):
+            os.remove(staged.tmp_path)
+    
+    async def parse_stored_file(self, stored: StoredFile, filename: str) -> Dict[str, Any]:
+        """
+        저장된 파일 파싱
+        """
+        return await self._parse_file(stored.file_path, filename)
+    
+    # ---- 재개 가능한 멀티파트 업로드 ----
+    
+    def init_multipart(self, file_name: str, file_size: int, part_size: int) -> int:
+        """
+        멀티파트 업로드 검증
+        
+        Returns:
+            전체 파트 수
+        """
+        file_ext = file_name.split(".")[-1].lower()
+        if file_ext not in settings.ALLOWED_FILE_TYPES:
+            raise ValueError(f"File type {file_ext} not allowed")
+        if file_size <= 0 or file_size > settings.MAX_UPLOAD_SIZE:
+            raise ValueError(f"File size must be between 1 and {settings.MAX_UPLOAD_SIZE} bytes")
+        if part_size < settings.UPLOAD_MIN_PART_SIZE:
+            raise ValueError(f"Part size must be at least {settings.UPLOAD_MIN_PART_SIZE} bytes")
+        return (file_size + part_size - 1) // part_size
+    
+    def parts_dir(self, upload_id: str) -> str:
+        """파트 저장 디렉터리 (UPLOAD_DIR/parts/<upload_id>)"""
+        return os.path.join(settings.UPLOAD_DIR, "parts", str(upload_id))
+    
+    async def save_part(
+        self,
+        upload_id: str,
+        part_number: int,
+        stream: AsyncIterator[bytes],
+        expected_size: int
+    ) -> int:
+        """
+        파트 저장 (스트리밍)
+        
+        임시 파일에 기록한 뒤 크기가 맞으면 <N>.part 로 원자적으로 교체하므로
+        같은 파트를 다시 보내도(재시도) 안전하고, 서로 다른 파트를 동시에 받을 수 있다.
+        """
+        parts_dir = self.parts_dir(upload_id)
+        os.makedirs(parts_dir, exist_ok=True)
+        tmp_path = os.path.join(parts_dir, f"{part_number}.{uuid.uuid4().hex}.tmp")
         
-        return file_path
+        size = 0
+        try:
+            with open(tmp_path, "wb") as out:
+                async for chunk in stream:
+                    if not chunk:
+                        continue
+                    size += len(chunk)
+                    if size > expected_size:
+                        raise ValueError(f"Part {part_number} exceeds {expected_size} bytes")
+                    await asyncio.to_thread(out.write, chunk)
+            if size != expected_size:
+                raise ValueError(f"Part {part_number} size {size} != expected {expected_size}")
+            os.replace(tmp_path, os.path.join(parts_dir, f"{part_number}.part"))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return size
+    
+    def received_parts(self, upload_id: str) -> Dict[int, int]:
+        """수신 완료된 파트 번호 → 크기"""
+        parts_dir = self.parts_dir(upload_id)
+        if not os.path.isdir(parts_dir):
+            return {}
+        received = {}
+        with os.scandir(parts_dir) as entries:
+            for entry in entries:
+                name, _, ext = entry.name.partition(".")
+                if ext == "part" and name.isdigit():
+                    received[int(name)] = entry.stat().st_size
+        return received
+    
+    async def stage_multipart(self, upload_id: str, file_name: str, total_parts: int) -> StoredFile:
+        """
+        멀티파트 업로드 결합 (파트 → 임시 파일, SHA-256 계산)
+        
+        파트 디렉터리는 그대로 두므로, 호출자는 결과를 문서에 기록하고 store()로 옮긴 뒤
+        abort_multipart()로 파트를 지운다 (그 전에 실패하면 파트로 다시 완료할 수 있다).
+        """
+        parts_dir = self.parts_dir(upload_id)
+        part_paths = [os.path.join(parts_dir, f"{n}.part") for n in range(1, total_parts + 1)]
+        file_ext = file_name.split(".")[-1].lower()
+        tmp_path = self._tmp_path()
+        try:
+            digest, size = await asyncio.to_thread(
+                _concat_parts, part_paths, tmp_path, settings.UPLOAD_CHUNK_SIZE
+            )
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return self._stage(tmp_path, digest.hexdigest(), size, file_ext)
+    
+    def abort_multipart(self, upload_id: str) -> None:
+        """파트 디렉터리 삭제"""
+        shutil.rmtree(self.parts_dir(upload_id), ignore_errors=True)
     
     async def _parse_file(self, file_path: str, filename: str) -> Dict[str, Any]:
         """
@@ -72,22 +312,17 @@ class FileService:
             raise ValueError(f"Unsupported file type: {file_ext}")
     
     async def _parse_pdf(self, file_path: str) -> Dict[str, Any]:
-        """PDF 파싱"""
-        # TODO: PyPDF2 또는 pdfplumber 구현
-        return {"type": "pdf", "text": ""}
+        """PDF 파싱 (PyPDF2, 페이지 범위 병렬 추출)"""
+        return await get_parsing_engine().parse(file_path, "pdf")
     
     async def _parse_docx(self, file_path: str) -> Dict[str, Any]:
-        """DOCX 파싱"""
-        # TODO: python-docx 구현
-        return {"type": "docx", "text": ""}
+        """DOCX 파싱 (python-docx)"""
+        return await get_parsing_engine().parse(file_path, "docx")
     
     async def _parse_pptx(self, file_path: str) -> Dict[str, Any]:
-        """PPTX 파싱"""
-        # TODO: python-pptx 구현
-        return {"type": "pptx", "text": ""}
+        """PPTX 파싱 (python-pptx)"""
+        return await get_parsing_engine().parse(file_path, "pptx")
     
     async def _parse_hwp(self, file_path: str) -> Dict[str, Any]:
-        """한글 파일 파싱"""
-        # TODO: olefile 또는 pyhwp 구현
-        return {"type": "hwp", "text": ""}
-
+        """한글 파일 파싱 (olefile)"""
+        return await get_parsing_engine().parse(file_path, "hwp")
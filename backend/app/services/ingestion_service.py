@@ -0,0 +1,337 @@
+"""
+문서 청킹 및 임베딩 수집 파이프라인 (RAG)
+
+- 청킹: 한국어 문장 경계(종결 어미/문장 부호/목록 기호)로 분리한 뒤 토큰 수 기준으로 묶고,
+  인접 청크 사이에 overlap 토큰만큼 문장을 겹친다
+- 임베딩: 여러 문서의 청크를 모아 EMBEDDING_BATCH_SIZE 단위로 한 번에 임베딩
+- 저장: 청크 ID = SHA-256(출처 키 + 청크 텍스트) → 같은 문서를 다시 수집해도 이미 있는 청크는 건너뛰고
+  (upsert) 중복 벡터가 생기지 않는다
+- 정리: 문서에 source_id(파일 경로 등 버전과 무관한 식별자)가 있으면 같은 source_id의
+  이전 버전 청크 중 이번 수집에 없는 청크를 삭제한다
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.services.ingestion")
+
+
+# ---- 토큰 수 ----
+
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def _approx_tokens(text: str) -> int:
+    """근사 토큰 수 (한글 음절 ≈ 1토큰, 그 외 4문자 ≈ 1토큰)"""
+    hangul = len(_HANGUL.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def _load_token_counter() -> Callable[[str], int]:
+    """tiktoken이 있으면 cl100k_base 인코더, 없으면 근사값 사용"""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text))
+    except Exception:
+        return _approx_tokens
+
+
+_token_counter: Optional[Callable[[str], int]] = None
+
+
+def count_tokens(text: str) -> int:
+    """토큰 수"""
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = _load_token_counter()
+    return _token_counter(text)
+
+
+# ---- 문장 분리 / 청킹 ----
+
+# 문장 경계: 문장 부호 뒤 공백, 종결 어미(다/요/죠/까) 뒤 줄바꿈, 목록 기호로 시작하는 줄, 빈 줄
+_SENTENCE_BOUNDARY = re.compile(
+    r"(?<=[.!?。！？…])\s+"
+    r"|(?<=[다요죠까])\s*\n+"
+    r"|\n+(?=\s*(?:[-*•·▪○■□]|\d+[.)]|[가-하][.)])\s)"
+    r"|\n\s*\n+"
+)
+
+
+def split_sentences(text: str) -> List[str]:
+    """한국어를 고려한 문장 분리"""
+    sentences = []
+    for piece in _SENTENCE_BOUNDARY.split(text):
+        piece = re.sub(r"\s+", " ", piece).strip()
+        if piece:
+            sentences.append(piece)
+    return sentences
+
+
+def _token_prefix(word: str, limit: int) -> int:
+    """count_tokens(word[:n]) <= limit을 만족하는 가장 긴 n (최소 1, 이진 탐색)"""
+    low, high = 1, len(word)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(word[:mid]) <= limit:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _split_long(sentence: str, chunk_size: int) -> List[str]:
+    """
+    chunk_size 토큰을 넘는 문장을 단어 단위로 분할
+
+    단어 하나(URL 등)가 한도를 넘으면 chunk_text와 같은 토큰 카운터 기준으로
+    한도에 맞는 가장 긴 앞부분씩 자른다. 잘린 조각은 각각 한도를 꽉 채우므로
+    청크로 묶을 때 같은 단어의 조각이 공백으로 이어 붙지 않는다.
+    """
+    pieces, current = [], ""
+    for word in sentence.split(" "):
+        candidate = f"{current} {word}" if current else word
+        if count_tokens(candidate) <= chunk_size:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        while count_tokens(word) > chunk_size:
+            cut = _token_prefix(word, chunk_size)
+            pieces.append(word[:cut])
+            word = word[cut:]
+        current = word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_text(text: str, chunk_size: int = None, overlap: int = None) -> List[str]:
+    """
+    텍스트 청킹 (문장 단위, 토큰 수 기준, overlap)
+
+    Args:
+        chunk_size: 청크당 최대 토큰 수 (기본값: CHUNK_SIZE)
+        overlap: 인접 청크 사이 겹치는 최대 토큰 수 (기본값: CHUNK_OVERLAP)
+    """
+    chunk_size = chunk_size or settings.CHUNK_SIZE
+    overlap = settings.CHUNK_OVERLAP if overlap is None else overlap
+    overlap = min(overlap, chunk_size // 2)
+
+    sentences: List[Tuple[str, int]] = []
+    for sentence in split_sentences(text):
+        tokens = count_tokens(sentence)
+        if tokens > chunk_size:
+            sentences.extend((piece, count_tokens(piece)) for piece in _split_long(sentence, chunk_size))
+        else:
+            sentences.append((sentence, tokens))
+
+    chunks: List[str] = []
+    window: List[Tuple[str, int]] = []
+    window_tokens = 0
+    for sentence, tokens in sentences:
+        if window and window_tokens + tokens > chunk_size:
+            chunks.append(" ".join(s for s, _ in window))
+            # 마지막 문장들 중 overlap 토큰 이내를 다음 청크로 이어간다
+            carried, carried_tokens = [], 0
+            for s, t in reversed(window):
+                if carried_tokens + t > overlap or carried_tokens + t + tokens > chunk_size:
+                    break
+                carried.insert(0, (s, t))
+                carried_tokens += t
+            window, window_tokens = carried, carried_tokens
+        window.append((sentence, tokens))
+        window_tokens += tokens
+    if window:
+        chunks.append(" ".join(s for s, _ in window))
+    return chunks
+
+
+def chunk_id(source_key: str, text: str) -> str:
+    """청크 ID (출처 키 + 청크 텍스트의 SHA-256)"""
+    return hashlib.sha256(f"{source_key}\0{text}".encode("utf-8")).hexdigest()
+
+
+# ---- 수집 ----
+
+@dataclass
+class IngestDocument:
+    """
+    수집 대상 문서
+    """
+    text: str
+    source_key: str  # 청크 ID 네임스페이스 (예: 내용 해시, 파일 경로)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    source_id: Optional[str] = None  # 버전과 무관한 문서 식별자 (있으면 이전 버전 청크 삭제)
+
+
+@dataclass
+class IngestResult:
+    """
+    수집 결과
+    """
+    documents: int = 0
+    chunks: int = 0
+    added: int = 0  # 새로 임베딩/저장한 청크 수
+    skipped: int = 0  # 이미 저장되어 있어 건너뛴 청크 수
+    removed: int = 0  # 삭제한 이전 버전 청크 수
+    batches: int = 0  # 임베딩 호출 수
+    chunk_counts: Dict[str, int] = field(default_factory=dict)  # source_key → 청크 수
+
+
+class IngestionService:
+    """
+    청킹/임베딩 수집 서비스
+
+    Args:
+        vector_store: 벡터 스토어 (IVectorStore: get(ids=...), add_texts(texts, metadatas, ids))
+        batch_size: 임베딩 호출당 청크 수 (기본값: EMBEDDING_BATCH_SIZE)
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        batch_size: int = None,
+        chunk_size: int = None,
+        overlap: int = None
+    ):
+        self.vector_store = vector_store
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+
+    def ingest(self, text: str, source_key: str, metadata: Optional[Dict[str, Any]] = None) -> IngestResult:
+        """문서 하나 수집"""
+        return self.ingest_many([IngestDocument(text=text, source_key=source_key, metadata=metadata or {})])
+
+    def ingest_many(self, documents: Iterable[IngestDocument]) -> IngestResult:
+        """
+        여러 문서 일괄 수집
+
+        모든 문서의 청크를 모아 이미 저장된 ID를 한 번에 조회하고,
+        새 청크만 batch_size 단위로 임베딩해 저장한 뒤 이전 버전 청크를 삭제한다.
+        """
+        result = IngestResult()
+        ids: List[str] = []
+        texts: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        seen = set()
+        current: Dict[str, set] = {}  # source_id → 이번 수집의 청크 ID
+
+        for document in documents:
+            result.documents += 1
+            chunks = chunk_text(document.text, self.chunk_size, self.overlap)
+            result.chunk_counts[document.source_key] = len(chunks)
+            metadata = {**document.metadata, "source_key": document.source_key}
+            if document.source_id is not None:
+                metadata["source_id"] = document.source_id
+                current.setdefault(document.source_id, set())
+            for index, chunk in enumerate(chunks):
+                cid = chunk_id(document.source_key, chunk)
+                if document.source_id is not None:
+                    current[document.source_id].add(cid)
+                if cid in seen:
+                    continue
+                seen.add(cid)
+                ids.append(cid)
+                texts.append(chunk)
+                metadatas.append({**metadata, "chunk_index": index})
+
+        result.chunks = len(ids)
+        if not ids:
+            result.removed = self._remove_stale(current)
+            return result
+
+        existing = self._existing_ids(ids)
+        pending = [i for i, cid in enumerate(ids) if cid not in existing]
+        result.skipped = len(ids) - len(pending)
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            self.vector_store.add_texts(
+                texts=[texts[i] for i in batch],
+                metadatas=[metadatas[i] for i in batch],
+                ids=[ids[i] for i in batch],
+            )
+            result.added += len(batch)
+            result.batches += 1
+
+        # 새 청크를 모두 저장한 뒤 삭제하므로 수집 도중 실패해도 문서가 검색에서 사라지지 않는다
+        result.removed = self._remove_stale(current)
+
+        logger.info(
+            f"문서 수집 완료: documents={result.documents}, chunks={result.chunks}, "
+            f"added={result.added}, skipped={result.skipped}, removed={result.removed}, batches={result.batches}"
+        )
+        return result
+
+    def _remove_stale(self, current: Dict[str, set]) -> int:
+        """source_id별로 이번 수집에 없는 (이전 버전) 청크 삭제"""
+        if not current:
+            return 0
+        found = self.vector_store.get(where={"source_id": {"$in": list(current)}}, include=["metadatas"])
+        stale = [
+            cid for cid, metadata in zip(found.get("ids") or [], found.get("metadatas") or [])
+            if cid not in current.get((metadata or {}).get("source_id"), ())
+        ]
+        for start in range(0, len(stale), 1000):
+            self.vector_store.delete(ids=stale[start:start + 1000])
+        if stale:
+            logger.info(f"이전 버전 청크 삭제: sources={len(current)}, removed={len(stale)}")
+        return len(stale)
+
+    def _existing_ids(self, ids: List[str]) -> set:
+        """이미 저장된 청크 ID"""
+        existing = set()
+        for start in range(0, len(ids), 1000):
+            found = self.vector_store.get(ids=ids[start:start + 1000], include=[])
+            existing.update(found.get("ids") or [])
+        return existing
+
+
+def index_document_content(content_hash: str) -> Optional[IngestResult]:
+    """
+    업로드된 요구사항 문서(document_contents)를 벡터 스토어에 수집
+
+    - 이미 수집된 내용(indexed_at 있음)은 건너뛴다
+    - 공용 지식 컬렉션이 아닌 요구사항 문서 컬렉션(DOCUMENT_STORE_COLLECTION)에 넣어
+      다른 사용자의 요구사항 분석 검색에 섞이지 않게 한다
+    - 청크 메타데이터에 content_hash를 넣어 보관 기간 정리 시 함께 삭제되도록 한다
+    (업로드 응답 후 BackgroundTasks로 실행, 실패해도 업로드에는 영향 없음)
+    """
+    from app.db.session import SessionLocal
+    from app.repositories.implementations.document_content_repository import DocumentContentRepository
+    from app.services.llm_service import LLMService
+
+    db = SessionLocal()
+    try:
+        repository = DocumentContentRepository(db)
+        content = repository.get_by_hash(content_hash)
+        if content is None or content.indexed_at is not None or not content.extracted_text:
+            return None
+
+        service = IngestionService(LLMService()._get_document_store())
+        result = service.ingest(
+            content.extracted_text,
+            source_key=content_hash,
+            metadata={"source": "requirement_document", "content_hash": content_hash, "file_type": content.file_type},
+        )
+        content.chunk_count = result.chunk_counts.get(content_hash, 0)
+        content.indexed_at = datetime.utcnow()
+        repository.update(content)
+        return result
+    except Exception as e:
+        logger.warning(f"요구사항 문서 수집 실패: content_hash={content_hash}, error={str(e)}")
+        return None
+    finally:
+        db.close()
@@ -3,11 +3,17 @@ LLM/RAG 서비스
 """
 from typing import Dict, Any, List, Optional
 from uuid import UUID
-import os
+import asyncio
+import hashlib
 
-from app.core.config import settings
+from app.core.resources import DOCUMENT_STORE_COLLECTION, get_resource_registry
 from app.repositories.interfaces.requirement_repository import IRequirementRepository
 from app.repositories.interfaces.document_repository import IDocumentRepository
+from app.services.ingestion_service import IngestionService
+from app.services.retrieval_service import get_hybrid_retriever
+
+# 업로드된 요구사항 문서 청크의 source 메타데이터 (ingestion_service.index_document_content)
+_UPLOAD_SOURCE = "requirement_document"
 
 
 class LLMService:
@@ -23,59 +29,27 @@ class LLMService:
         self.requirement_repository = requirement_repository
         self.document_repository = document_repository
         self._vector_store = None
+        self._document_store = None
         self._llm = None
     
     def _get_llm(self):
-        """LLM 인스턴스 가져오기"""
+        """LLM 인스턴스 가져오기 (프로세스 전역 공유 인스턴스)"""
         if self._llm is None:
-            try:
-                from langchain_openai import ChatOpenAI
-                
-                if not settings.OPENAI_API_KEY:
-                    raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
-                
-                self._llm = ChatOpenAI(
-                    model=settings.OPENAI_MODEL,
-                    temperature=0,
-                    openai_api_key=settings.OPENAI_API_KEY,
-                    timeout=settings.LLM_TIMEOUT,
-                )
-            except ImportError:
-                raise ImportError("langchain-openai가 설치되지 않았습니다. pip install langchain-openai")
-        
+            self._llm = get_resource_registry().get_llm()
         return self._llm
     
     def _get_vector_store(self):
-        """벡터 스토어 인스턴스 가져오기"""
+        """벡터 스토어 인스턴스 가져오기 (프로세스 전역 공유 인스턴스)"""
         if self._vector_store is None:
-            try:
-                import chromadb
-                from langchain_community.vectorstores import Chroma
-                from langchain_openai import OpenAIEmbeddings
-                
-                if not settings.OPENAI_API_KEY:
-                    raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다")
-                
-                # ChromaDB 클라이언트 생성
-                chroma_client = chromadb.PersistentClient(
-                    path=os.path.join(settings.UPLOAD_DIR, "chroma_db")
-                )
-                
-                # 임베딩 모델
-                embeddings = OpenAIEmbeddings(openai_api_key=settings.OPENAI_API_KEY)
-                
-                # 벡터 스토어 생성 또는 로드
-                collection_name = "infrastructure_knowledge"
-                self._vector_store = Chroma(
-                    client=chroma_client,
-                    collection_name=collection_name,
-                    embedding_function=embeddings,
-                )
-            except ImportError:
-                raise ImportError("chromadb가 설치되지 않았습니다. pip install chromadb")
-        
+            self._vector_store = get_resource_registry().get_vector_store()
         return self._vector_store
     
+    def _get_document_store(self):
+        """업로드된 요구사항 문서용 벡터 스토어 (지식 베이스와 분리된 컬렉션)"""
+        if self._document_store is None:
+            self._document_store = get_resource_registry().get_vector_store(DOCUMENT_STORE_COLLECTION)
+        return self._document_store
+    
     async def analyze_requirement(self, requirement_id: UUID) -> Dict[str, Any]:
         """
         요구사항 분석 (RAG + LLM)
@@ -122,16 +96,28 @@ class LLMService:
         
         return "\n".join(parts)
     
-    async def _search_relevant_documents(self, query: str, k: int = 3) -> List[str]:
-        """RAG를 통한 관련 문서 검색"""
+    async def _search_relevant_documents(
+        self,
+        query: str,
+        k: int = 3,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        RAG를 통한 관련 문서 검색 (BM25 + 벡터 하이브리드, RRF/MMR, 질의 캐시)
+        
+        공용 지식 컬렉션만 검색한다. 업로드된 요구사항 문서는 다른 사용자의 문서이므로 결과에 넣지 않는다.
+        
+        where: 메타데이터 필터 (예: {"provider": "aws", "design_type": "cloud"})
+        """
         try:
             vector_store = self._get_vector_store()
+            retriever = get_hybrid_retriever(vector_store)
             
             # 유사 문서 검색
-            docs = vector_store.similarity_search(query, k=k)
+            chunks = await asyncio.to_thread(retriever.search, query, k, where)
             
-            # 문서 텍스트 추출
-            return [doc.page_content for doc in docs]
+            # 문서 텍스트 추출 (분리 전에 지식 컬렉션에 수집된 사용자 업로드 문서 청크는 제외)
+            return [chunk.text for chunk in chunks if chunk.metadata.get("source") != _UPLOAD_SOURCE]
         except Exception as e:
             # 벡터 스토어가 비어있거나 에러가 발생한 경우 빈 리스트 반환
             print(f"문서 검색 중 에러 발생: {str(e)}")
@@ -199,16 +185,42 @@ class LLMService:
         
         return analysis_result
     
-    async def add_knowledge_document(self, text: str, metadata: Optional[Dict[str, Any]] = None):
-        """지식 베이스에 문서 추가"""
+    async def add_knowledge_document(
+        self,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        source_key: Optional[str] = None
+    ):
+        """
+        지식 베이스에 문서 추가 (청킹 → 배치 임베딩 → 청크 ID 기준 upsert)
+        
+        source_key: 청크 ID 네임스페이스 (기본값: 텍스트의 SHA-256, 같은 문서를 다시 추가해도 중복 없음)
+        """
         try:
             vector_store = self._get_vector_store()
-            
-            # 문서 추가
-            vector_store.add_texts(
-                texts=[text],
-                metadatas=[metadata or {}]
+            source_key = source_key or hashlib.sha256(text.encode("utf-8")).hexdigest()
+            return await asyncio.to_thread(
+                IngestionService(vector_store).ingest, text, source_key, metadata
             )
         except Exception as e:
             raise ValueError(f"지식 베이스에 문서 추가 실패: {str(e)}")
-
+    
+    def delete_document_chunks(self, content_hashes: List[str]) -> int:
+        """
+        문서 내용 해시에 해당하는 벡터 스토어 청크 일괄 삭제
+        
+        (분리 전에 지식 컬렉션에 수집된 청크도 함께 삭제)
+        
+        Returns:
+            삭제된 청크 수
+        """
+        if not content_hashes:
+            return 0
+        where = {"content_hash": {"$in": list(content_hashes)}}
+        deleted = 0
+        for vector_store in (self._get_document_store(), self._get_vector_store()):
+            ids = vector_store.get(where=where, include=[]).get("ids") or []
+            if ids:
+                vector_store.delete(ids=ids)
+            deleted += len(ids)
+        return deleted
@@ -0,0 +1,416 @@
+"""
+문서 파싱 엔진 (워커 프로세스 기반)
+
+PDF/DOCX/PPTX/HWP 텍스트 추출은 CPU 바운드 작업이므로 이벤트 루프가 아닌
+별도 워커 프로세스에서 실행한다 (동시 워커 수 제한).
+
+- 문서별 타임아웃: 초과 시 해당 문서의 워커 프로세스만 종료 (다른 문서의 파싱은 계속 진행)
+- 대용량 PDF: 페이지 범위 단위로 나누어 여러 워커에서 병렬 추출
+- 워커별 메모리 제한: RLIMIT_AS (Linux/macOS), 초과 시 해당 문서만 실패
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import re
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.services.parsing_engine")
+
+
+# ---- 워커 프로세스에서 실행되는 함수 (pickle 가능하도록 모듈 수준에 정의) ----
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """워커 초기화: 주소 공간(메모리) 제한 설정"""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _pdf_reader(file_path: str):
+    try:
+        from PyPDF2 import PdfReader
+    except ImportError:
+        raise ImportError("PyPDF2가 설치되지 않았습니다. pip install PyPDF2")
+    return PdfReader(file_path)
+
+
+def _pdf_page_count(file_path: str) -> int:
+    """PDF 페이지 수"""
+    return len(_pdf_reader(file_path).pages)
+
+
+def _pdf_extract_pages(file_path: str, start: int, end: int) -> List[str]:
+    """PDF 페이지 범위 [start, end)의 텍스트 추출"""
+    reader = _pdf_reader(file_path)
+    return [(reader.pages[i].extract_text() or "") for i in range(start, end)]
+
+
+def _parse_docx(file_path: str) -> Dict[str, Any]:
+    """DOCX 파싱 (본문 단락 + 표)"""
+    try:
+        import docx
+    except ImportError:
+        raise ImportError("python-docx가 설치되지 않았습니다. pip install python-docx")
+
+    document = docx.Document(file_path)
+    paragraphs = [p.text for p in document.paragraphs if p.text.strip()]
+    tables = [
+        [[cell.text.strip() for cell in row.cells] for row in table.rows]
+        for table in document.tables
+    ]
+    table_text = ["\t".join(row) for table in tables for row in table]
+    return {
+        "type": "docx",
+        "text": "\n".join(paragraphs + table_text),
+        "paragraph_count": len(paragraphs),
+        "tables": tables,
+    }
+
+
+def _parse_pptx(file_path: str) -> Dict[str, Any]:
+    """PPTX 파싱 (슬라이드별 텍스트 프레임 + 표)"""
+    try:
+        from pptx import Presentation
+    except ImportError:
+        raise ImportError("python-pptx가 설치되지 않았습니다. pip install python-pptx")
+
+    presentation = Presentation(file_path)
+    slides = []
+    for slide in presentation.slides:
+        texts = []
+        for shape in slide.shapes:
+            if getattr(shape, "has_text_frame", False) and shape.has_text_frame:
+                text = shape.text_frame.text.strip()
+                if text:
+                    texts.append(text)
+            if getattr(shape, "has_table", False) and shape.has_table:
+                for row in shape.table.rows:
+                    texts.append("\t".join(cell.text.strip() for cell in row.cells))
+        slides.append("\n".join(texts))
+    return {
+        "type": "pptx",
+        "text": "\n\n".join(s for s in slides if s),
+        "slide_count": len(slides),
+        "slides": slides,
+    }
+
+
+_HWPTAG_PARA_TEXT = 67
+# 한글 문단 텍스트의 제어 문자 (인라인/확장 컨트롤은 8 WCHAR를 차지)
+_HWP_EXTENDED_CONTROLS = {1, 2, 3, 11, 12, 14, 15, 16, 17, 18, 21, 22, 23}
+_HWP_INLINE_CONTROLS = {4, 5, 6, 7, 8, 9, 19, 20}
+
+
+def _hwp_para_text(data: bytes) -> str:
+    """HWPTAG_PARA_TEXT 레코드 → 문자열 (제어 문자 제거)"""
+    chars = []
+    i = 0
+    n = len(data) // 2
+    while i < n:
+        code = struct.unpack_from("<H", data, i * 2)[0]
+        if code in _HWP_EXTENDED_CONTROLS or code in _HWP_INLINE_CONTROLS:
+            i += 8
+            continue
+        if code == 10 or code == 13:
+            chars.append("\n")
+        elif code >= 32:
+            chars.append(chr(code))
+        i += 1
+    return "".join(chars)
+
+
+def _hwp_section_text(data: bytes) -> str:
+    """BodyText/SectionN 레코드 스트림 → 텍스트"""
+    texts = []
+    offset = 0
+    length = len(data)
+    while offset + 4 <= length:
+        header = struct.unpack_from("<I", data, offset)[0]
+        offset += 4
+        tag_id = header & 0x3FF
+        size = (header >> 20) & 0xFFF
+        if size == 0xFFF:
+            size = struct.unpack_from("<I", data, offset)[0]
+            offset += 4
+        if tag_id == _HWPTAG_PARA_TEXT:
+            texts.append(_hwp_para_text(data[offset:offset + size]))
+        offset += size
+    return "".join(texts)
+
+
+def _parse_hwp(file_path: str) -> Dict[str, Any]:
+    """한글(HWP 5.x) 파싱: BodyText 섹션 본문, 실패 시 PrvText(미리보기 텍스트)"""
+    try:
+        import olefile
+    except ImportError:
+        raise ImportError("olefile이 설치되지 않았습니다. pip install olefile")
+
+    with olefile.OleFileIO(file_path) as ole:
+        header = ole.openstream("FileHeader").read()
+        flags = struct.unpack_from("<I", header, 36)[0]
+        compressed = bool(flags & 0x01)
+        if flags & 0x02:
+            raise ValueError("암호화된 HWP 문서는 파싱할 수 없습니다")
+
+        sections = sorted(
+            (entry for entry in ole.listdir() if len(entry) == 2 and entry[0] == "BodyText"),
+            key=lambda entry: int(re.sub(r"\D", "", entry[1]) or 0),
+        )
+        texts = []
+        for entry in sections:
+            data = ole.openstream(entry).read()
+            if compressed:
+                data = zlib.decompress(data, -15)
+            texts.append(_hwp_section_text(data))
+        text = "\n".join(t for t in texts if t)
+
+        source = "body"
+        if not text.strip() and ole.exists("PrvText"):
+            text = ole.openstream("PrvText").read().decode("utf-16-le", errors="ignore")
+            source = "preview"
+
+    return {
+        "type": "hwp",
+        "text": text,
+        "section_count": len(sections),
+        "text_source": source,
+    }
+
+
+# ---- 엔진 ----
+
+def _worker_main(conn, memory_limit_mb: int, func: Callable, args: Tuple) -> None:
+    """작업 하나를 실행하는 워커 프로세스 진입점 (결과/예외를 파이프로 반환)"""
+    _init_worker(memory_limit_mb)
+    try:
+        result = ("ok", func(*args))
+    except BaseException as e:
+        result = ("error", e)
+    try:
+        conn.send(result)
+    except Exception as e:  # pickle 불가능한 예외 등
+        conn.send(("error", RuntimeError(f"{type(result[1]).__name__}: {e}")))
+    finally:
+        conn.close()
+
+
+class _ParseJob:
+    """
+    문서 한 건의 파싱에 속한 워커 프로세스 묶음
+
+    타임아웃 시 이 문서의 프로세스만 종료하므로 다른 문서의 파싱에는 영향이 없다.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self._processes: Set[Any] = set()
+        self._lock = threading.Lock()
+
+    def attach(self, process) -> bool:
+        """프로세스 등록 (이미 취소된 작업이면 False)"""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self._processes.add(process)
+            return True
+
+    def detach(self, process) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def kill(self) -> None:
+        """남은 프로세스 종료, 이후 시작하려는 작업도 실행하지 않음"""
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+
+class _ParseCancelled(Exception):
+    """작업이 취소되어 (타임아웃) 결과가 없음"""
+
+
+class ParsingEngine:
+    """
+    워커 프로세스 문서 파싱 엔진
+
+    작업(문서 또는 PDF 페이지 범위)마다 별도 워커 프로세스에서 실행하고,
+    동시에 실행되는 워커 수는 max_workers로 제한한다.
+
+    Args:
+        max_workers: 동시 워커 프로세스 수 (0 이하이면 CPU 코어 수)
+        timeout: 문서별 파싱 타임아웃 (초)
+        memory_limit_mb: 워커별 주소 공간 제한 (MB, 0 이하이면 제한 없음)
+        pdf_pages_per_task: PDF를 나누어 병렬 처리할 페이지 단위
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        timeout: float = 120,
+        memory_limit_mb: int = 1024,
+        pdf_pages_per_task: int = 20
+    ):
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.pdf_pages_per_task = max(1, pdf_pages_per_task)
+        # fork는 스레드가 있는 서버 프로세스에서 안전하지 않으므로 forkserver(없으면 spawn) 사용
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        # 워커 프로세스를 기다리는 스레드 (스레드 수 = 동시 워커 수 상한)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Set[_ParseJob] = set()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="parsing-engine"
+                )
+            return self._executor
+
+    def _execute(self, job: _ParseJob, func: Callable, args: Tuple) -> Any:
+        """워커 프로세스 하나를 띄워 작업 실행 후 결과 대기 (스레드에서 실행)"""
+        if job.cancelled:
+            raise _ParseCancelled()
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main, args=(sender, self.memory_limit_mb, func, args), daemon=True
+        )
+        try:
+            process.start()
+            sender.close()
+            if not job.attach(process):
+                process.kill()
+                raise _ParseCancelled()
+            try:
+                status, value = receiver.recv()
+            except EOFError:
+                if job.cancelled:
+                    raise _ParseCancelled()
+                raise ValueError("파싱 워커가 비정상 종료되었습니다 (메모리 제한 초과 또는 손상된 문서)")
+        finally:
+            receiver.close()
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            job.detach(process)
+
+        if status == "error":
+            raise value
+        return value
+
+    async def _run(self, job: _ParseJob, func: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self._execute, job, func, args)
+
+    async def parse(self, file_path: str, file_type: str) -> Dict[str, Any]:
+        """
+        문서 파싱 (타임아웃 적용)
+
+        타임아웃/실패 시 이 문서의 워커 프로세스만 종료한다.
+        """
+        job = _ParseJob()
+        if file_type == "pdf":
+            coro = self._parse_pdf(job, file_path)
+        elif file_type == "docx":
+            coro = self._run(job, _parse_docx, file_path)
+        elif file_type == "pptx":
+            coro = self._run(job, _parse_pptx, file_path)
+        elif file_type == "hwp":
+            coro = self._run(job, _parse_hwp, file_path)
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
+
+        with self._lock:
+            self._jobs.add(job)
+        try:
+            return await asyncio.wait_for(coro, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"문서 파싱 타임아웃: file_path={file_path}, timeout={self.timeout}s")
+            raise ValueError(f"문서 파싱 시간 초과 ({self.timeout}초)")
+        except MemoryError:
+            raise ValueError(f"문서 파싱 메모리 제한 초과 ({self.memory_limit_mb}MB)")
+        finally:
+            # 실패한 PDF 페이지 범위 외에 아직 실행 중인 나머지 범위도 정리
+            job.kill()
+            with self._lock:
+                self._jobs.discard(job)
+
+    async def _parse_pdf(self, job: _ParseJob, file_path: str) -> Dict[str, Any]:
+        """PDF 파싱 (페이지 범위 병렬 추출)"""
+        page_count = await self._run(job, _pdf_page_count, file_path)
+        ranges: List[Tuple[int, int]] = [
+            (start, min(start + self.pdf_pages_per_task, page_count))
+            for start in range(0, page_count, self.pdf_pages_per_task)
+        ]
+        results = await asyncio.gather(*(
+            self._run(job, _pdf_extract_pages, file_path, start, end) for start, end in ranges
+        ))
+        pages = [text for chunk in results for text in chunk]
+        return {
+            "type": "pdf",
+            "text": "\n".join(pages),
+            "page_count": page_count,
+            "pages": pages,
+        }
+
+    def shutdown(self) -> None:
+        """진행 중인 파싱의 워커 프로세스 종료 및 대기 스레드 정리"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            jobs, self._jobs = list(self._jobs), set()
+        for job in jobs:
+            job.kill()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_parsing_engine: Optional[ParsingEngine] = None
+_parsing_engine_lock = threading.Lock()
+
+
+def get_parsing_engine() -> ParsingEngine:
+    """프로세스 전역 파싱 엔진"""
+    global _parsing_engine
+    if _parsing_engine is None:
+        with _parsing_engine_lock:
+            if _parsing_engine is None:
+                _parsing_engine = ParsingEngine(
+                    max_workers=settings.PARSER_MAX_WORKERS,
+                    timeout=settings.PARSER_TIMEOUT,
+                    memory_limit_mb=settings.PARSER_MEMORY_LIMIT_MB,
+                    pdf_pages_per_task=settings.PARSER_PDF_PAGES_PER_TASK,
+                )
+    return _parsing_engine
+
+
+def shutdown_parsing_engine() -> None:
+    """프로세스 전역 파싱 엔진 종료 (애플리케이션 종료 시)"""
+    global _parsing_engine
+    with _parsing_engine_lock:
+        engine, _parsing_engine = _parsing_engine, None
+    if engine is not None:
+        engine.shutdown()
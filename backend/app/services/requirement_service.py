@@ -1,17 +1,39 @@
 """
 요구사항 서비스 (비즈니스 로직)
 """
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator, Awaitable, Callable, Dict, Tuple
 from uuid import UUID
 from datetime import datetime
+import asyncio
+import os
 from fastapi import UploadFile
 
 from app.repositories.interfaces.requirement_repository import IRequirementRepository
 from app.repositories.interfaces.document_repository import IDocumentRepository
+from app.repositories.interfaces.document_content_repository import IDocumentContentRepository
+from app.core.config import settings
 from app.schemas.requirement import RequirementCreate, RequirementResponse
+from app.schemas.document import UploadInitRequest, UploadStatusResponse, UploadPartResponse
 from app.domain.entities.requirement import Requirement
 from app.domain.entities.document import Document
-from app.services.file_service import FileService
+from app.domain.entities.document_content import DocumentContent
+from app.services.file_service import FileService, StoredFile
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.services.requirement")
+
+# 내용 해시별 진행 중인 파싱 (같은 파일이 동시에 업로드되면 한 번만 파싱)
+_parsing: Dict[str, "asyncio.Task[dict]"] = {}
+
+
+async def _parse_once(content_hash: str, parse: Callable[[], Awaitable[dict]]) -> dict:
+    task = _parsing.get(content_hash)
+    if task is None:
+        task = asyncio.ensure_future(parse())
+        _parsing[content_hash] = task
+        task.add_done_callback(lambda _: _parsing.pop(content_hash, None))
+    # 한 요청이 취소되어도 다른 요청이 기다리는 파싱은 계속되도록 shield
+    return dict(await asyncio.shield(task))
 
 
 class RequirementService:
@@ -19,9 +41,15 @@ class RequirementService:
     요구사항 서비스
     """
     
-    def __init__(self, repository: IRequirementRepository, document_repository: Optional[IDocumentRepository] = None):
+    def __init__(
+        self,
+        repository: IRequirementRepository,
+        document_repository: Optional[IDocumentRepository] = None,
+        document_content_repository: Optional[IDocumentContentRepository] = None
+    ):
         self.repository = repository
         self.document_repository = document_repository
+        self.document_content_repository = document_content_repository
         self.file_service = FileService()
     
     async def create_requirement(self, requirement_data: RequirementCreate) -> RequirementResponse:
@@ -71,44 +99,281 @@ class RequirementService:
         requirement.status = "analyzing"
         self.repository.update(requirement)
         
-        # 파일 저장 및 파싱
+        # 파일 수신 → 문서 행에 내용 해시를 먼저 기록 → 객체 저장 → 파싱 (같은 내용이 이미 파싱되었으면 캐시 사용)
+        # 문서 행이 먼저 커밋되므로 보관 기간 정리가 같은 내용의 객체를 지우는 중이어도 이 문서가 참조로 보인다
+        staged = None
+        document = None
         try:
-            parsed_data = await self.file_service.process_file(file)
-            
-            # 문서 엔티티 생성
-            import os
-            file_path = parsed_data.get("file_path", "")
-            file_size = os.path.getsize(file_path) if file_path and os.path.exists(file_path) else 0
-            
-            document = Document(
+            staged = await self.file_service.stage_upload(file)
+            document = self.document_repository.create(Document(
                 requirement_id=requirement_id,
                 file_name=file.filename or "unknown",
-                file_type=parsed_data.get("type", ""),
-                file_size=file_size,
-                file_path=file_path,
+                file_type=staged.file_type,
+                file_size=staged.file_size,
+                file_path=staged.file_path,
+                content_hash=staged.content_hash,
+                status="parsing",
+            ))
+            stored = self.file_service.store(staged)
+            staged = None
+            parsed_data, cached = await self._parse_with_cache(stored, file.filename)
+            return self._save_parsed_document(requirement, document, stored, parsed_data, cached)
+        except Exception as e:
+            # 에러 발생 시 상태를 failed로 변경
+            if staged is not None:
+                self.file_service.discard(staged)
+            if document is not None:
+                document.status = "failed"
+                self.document_repository.update(document)
+            requirement.status = "failed"
+            self.repository.update(requirement)
+            raise ValueError(f"문서 처리 실패: {str(e)}")
+    
+    async def _parse_with_cache(self, stored: StoredFile, file_name: str) -> Tuple[dict, bool]:
+        """
+        내용 해시 기준 파싱 결과 캐시
+        
+        Returns:
+            (파싱 결과, 캐시 적중 여부)
+        """
+        contents = self.document_content_repository
+        if contents:
+            cached = contents.get_by_hash(stored.content_hash)
+            # 적중 후 touch 전에 정리되었으면(행 없음) 다시 파싱
+            if cached and contents.touch(stored.content_hash):
+                logger.info(f"문서 파싱 캐시 적중: content_hash={stored.content_hash}")
+                return dict(cached.parsed_data or {}), True
+        
+        parsed_data = await _parse_once(
+            stored.content_hash,
+            lambda: self.file_service.parse_stored_file(stored, file_name)
+        )
+        
+        if contents:
+            contents.create(DocumentContent(
+                content_hash=stored.content_hash,
+                file_type=stored.file_type,
+                file_size=stored.file_size,
+                file_path=stored.file_path,
                 extracted_text=parsed_data.get("text", ""),
                 parsed_data=parsed_data,
-                status="parsed",
-            )
-            
-            # 문서 저장
-            created_document = self.document_repository.create(document)
-            
-            # 요구사항의 structured_data 업데이트
-            requirement.structured_data = parsed_data
-            requirement.status = "completed"
-            updated = self.repository.update(requirement)
-            
-            return {
-                "requirement_id": str(updated.id),
-                "document_id": str(created_document.id),
-                "file_name": file.filename,
-                "status": "parsed",
-                "parsed_data": parsed_data
-            }
+            ))
+        return parsed_data, False
+    
+    def _save_parsed_document(
+        self,
+        requirement: Requirement,
+        document: Document,
+        stored: StoredFile,
+        parsed_data: dict,
+        cached: bool = False,
+        upload: Optional[dict] = None
+    ) -> dict:
+        """
+        파싱 결과를 문서/요구사항에 반영 (document.id가 없으면 생성, 있으면 업데이트)
+        
+        - 문서 내용 리포지토리가 있으면 텍스트/파싱 결과는 document_contents에만 두고
+          문서는 content_hash로 참조한다
+        - upload: 멀티파트 업로드 정보 (완료 후에도 상태 조회가 가능하도록 문서에만 보관)
+        """
+        document.file_path = stored.file_path
+        document.content_hash = stored.content_hash
+        document.file_size = stored.file_size
+        document.file_type = parsed_data.get("type", stored.file_type)
+        if self.document_content_repository:
+            document.extracted_text = None
+            document.parsed_data = {"upload": upload} if upload else None
+        else:
+            document.extracted_text = parsed_data.get("text", "")
+            document.parsed_data = {**parsed_data, "upload": upload} if upload else parsed_data
+        document.status = "parsed"
+        
+        # 문서 저장
+        if document.id is None:
+            saved_document = self.document_repository.create(document)
+        else:
+            saved_document = self.document_repository.update(document)
+        
+        # 요구사항의 structured_data 업데이트
+        requirement.structured_data = parsed_data
+        requirement.status = "completed"
+        updated = self.repository.update(requirement)
+        
+        return {
+            "requirement_id": str(updated.id),
+            "document_id": str(saved_document.id),
+            "file_name": document.file_name,
+            "content_hash": stored.content_hash,
+            "cached": cached,
+            "status": "parsed",
+            "parsed_data": parsed_data
+        }
+    
+    # ---- 재개 가능한 멀티파트 업로드 ----
+    
+    async def init_upload(self, upload: UploadInitRequest) -> UploadStatusResponse:
+        """
+        멀티파트 업로드 시작
+        
+        - 'uploading' 상태의 문서를 만들고 문서 ID를 upload_id로 사용
+        - 파트 크기/개수는 문서의 parsed_data["upload"]에 보관
+        """
+        if not self.repository.get_by_id(upload.requirement_id):
+            raise ValueError(f"Requirement {upload.requirement_id} not found")
+        
+        if not self.document_repository:
+            raise ValueError("Document repository is not initialized")
+        
+        part_size = upload.part_size or settings.UPLOAD_PART_SIZE
+        total_parts = self.file_service.init_multipart(upload.file_name, upload.file_size, part_size)
+        
+        document = self.document_repository.create(Document(
+            requirement_id=upload.requirement_id,
+            file_name=upload.file_name,
+            file_type=upload.file_name.split(".")[-1].lower(),
+            file_size=upload.file_size,
+            file_path="",
+            parsed_data={"upload": {"part_size": part_size, "total_parts": total_parts}},
+            status="uploading",
+        ))
+        document.file_path = self.file_service.parts_dir(str(document.id))
+        document = self.document_repository.update(document)
+        return self._upload_status(document)
+    
+    async def upload_part(
+        self,
+        upload_id: UUID,
+        part_number: int,
+        stream: AsyncIterator[bytes]
+    ) -> UploadPartResponse:
+        """
+        파트 업로드 (같은 파트 재전송 가능, 서로 다른 파트 병렬 전송 가능)
+        """
+        document = self._get_uploading_document(upload_id)
+        upload = document.parsed_data["upload"]
+        total_parts = upload["total_parts"]
+        if not 1 <= part_number <= total_parts:
+            raise ValueError(f"Part number must be between 1 and {total_parts}")
+        
+        # 마지막 파트만 파트 크기보다 작을 수 있다
+        part_size = upload["part_size"]
+        expected_size = part_size if part_number < total_parts else document.file_size - part_size * (total_parts - 1)
+        
+        size = await self.file_service.save_part(str(upload_id), part_number, stream, expected_size)
+        return UploadPartResponse(upload_id=upload_id, part_number=part_number, size=size)
+    
+    async def get_upload_status(self, upload_id: UUID) -> UploadStatusResponse:
+        """
+        멀티파트 업로드 상태 조회 (재개 시 누락된 파트 확인용)
+        """
+        document = self.document_repository.get_by_id(upload_id) if self.document_repository else None
+        if not document or not (document.parsed_data or {}).get("upload"):
+            raise ValueError(f"Upload {upload_id} not found")
+        return self._upload_status(document)
+    
+    async def complete_upload(self, upload_id: UUID) -> dict:
+        """
+        멀티파트 업로드 완료
+        
+        - 모든 파트가 수신되었는지 확인
+        - 파트 결합(SHA-256 계산) → 저장 객체를 문서에 기록 → 내용 주소 저장 → 파트 삭제
+          → 파싱 → 문서/요구사항 반영
+        - 파싱 실패/시간 초과로 failed가 된 업로드는 다시 완료 요청하면 저장된 객체로 파싱만 다시 한다
+        """
+        document = self._get_uploading_document(upload_id, statuses=("uploading", "failed"))
+        upload = document.parsed_data["upload"]
+        stored = self._stored_object(document)
+        if stored is None:
+            status = self._upload_status(document)
+            if status.missing_parts:
+                raise ValueError(f"Missing parts: {status.missing_parts}")
+        
+        requirement = self.repository.get_by_id(document.requirement_id)
+        if not requirement:
+            raise ValueError(f"Requirement {document.requirement_id} not found")
+        
+        # 중복 완료 요청 방지
+        document.status = "parsing"
+        document = self.document_repository.update(document)
+        requirement.status = "analyzing"
+        self.repository.update(requirement)
+        
+        staged = None
+        try:
+            if stored is None:
+                staged = await self.file_service.stage_multipart(
+                    str(upload_id), document.file_name, upload["total_parts"]
+                )
+                # 파싱 전에 저장 객체를 문서에 기록 (실패해도 객체가 고아가 되지 않고 다시 완료할 수 있다)
+                document.content_hash = staged.content_hash
+                document.file_path = staged.file_path
+                document.file_size = staged.file_size
+                document = self.document_repository.update(document)
+                stored = self.file_service.store(staged)
+                self.file_service.abort_multipart(str(upload_id))
+            parsed_data, cached = await self._parse_with_cache(stored, document.file_name)
+            return self._save_parsed_document(requirement, document, stored, parsed_data, cached, upload)
         except Exception as e:
-            # 에러 발생 시 상태를 failed로 변경
+            if staged is not None:
+                self.file_service.discard(staged)
+            document.status = "failed"
+            self.document_repository.update(document)
             requirement.status = "failed"
             self.repository.update(requirement)
             raise ValueError(f"문서 처리 실패: {str(e)}")
-
+    
+    async def abort_upload(self, upload_id: UUID) -> None:
+        """
+        멀티파트 업로드 취소 (파트 삭제, 문서 failed 처리)
+        """
+        document = self._get_uploading_document(upload_id, statuses=("uploading", "failed"))
+        self.file_service.abort_multipart(str(upload_id))
+        document.status = "failed"
+        self.document_repository.update(document)
+    
+    def _get_uploading_document(self, upload_id: UUID, statuses: Tuple[str, ...] = ("uploading",)) -> Document:
+        """업로드 문서 조회 (statuses 상태가 아니면 ValueError)"""
+        if not self.document_repository:
+            raise ValueError("Document repository is not initialized")
+        document = self.document_repository.get_by_id(upload_id)
+        if not document or not (document.parsed_data or {}).get("upload"):
+            raise ValueError(f"Upload {upload_id} not found")
+        if document.status not in statuses:
+            raise ValueError(f"Upload {upload_id} is not in {'/'.join(statuses)} status: {document.status}")
+        return document
+    
+    @staticmethod
+    def _stored_object(document: Document) -> Optional[StoredFile]:
+        """파트 결합까지 끝난 업로드의 저장 객체 (아직이면 None)"""
+        if not document.content_hash or not os.path.isfile(document.file_path or ""):
+            return None
+        return StoredFile(
+            file_path=document.file_path,
+            content_hash=document.content_hash,
+            file_size=document.file_size,
+            file_type=document.file_name.split(".")[-1].lower(),
+        )
+    
+    def _upload_status(self, document: Document) -> UploadStatusResponse:
+        """업로드 문서 → 상태 응답 (디스크의 수신 파트 기준)"""
+        upload = document.parsed_data["upload"]
+        total_parts = upload["total_parts"]
+        if document.status in ("parsing", "parsed") or document.content_hash:
+            # 파트 결합이 끝난 업로드는 파트 디렉터리가 정리되었으므로 모든 파트를 수신한 것으로 본다
+            received = list(range(1, total_parts + 1))
+        else:
+            received = sorted(
+                n for n in self.file_service.received_parts(str(document.id)) if 1 <= n <= total_parts
+            )
+        received_set = set(received)
+        return UploadStatusResponse(
+            upload_id=document.id,
+            requirement_id=document.requirement_id,
+            file_name=document.file_name,
+            file_size=document.file_size,
+            part_size=upload["part_size"],
+            total_parts=total_parts,
+            received_parts=received,
+            missing_parts=[n for n in range(1, total_parts + 1) if n not in received_set],
+            status=document.status,
+        )
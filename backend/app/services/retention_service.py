@@ -0,0 +1,255 @@
+"""
+문서 보관 기간(DOCUMENT_RETENTION_DAYS) 정리 서비스
+
+보관 기간이 지난 문서를 배치 단위로 정리한다.
+- 배치마다 만료 문서 조회 → deleted_at 일괄 표시(UPDATE 한 번)
+- 더 이상 살아있는 문서가 참조하지 않는 내용 해시에 대해
+  파일, 파싱 결과 캐시(document_contents), 벡터 스토어 청크를 일괄 삭제
+- 배치 사이에 대기해 DB/디스크 부하를 제한하고, 회수한 바이트 수를 보고
+"""
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.domain.entities.document import Document
+from app.repositories.interfaces.document_repository import IDocumentRepository
+from app.repositories.interfaces.document_content_repository import IDocumentContentRepository
+
+logger = get_logger("app.services.retention")
+
+# 업로드 중단으로 남은 임시 파일을 정리하기까지의 시간
+_TMP_FILE_MAX_AGE = 24 * 60 * 60
+
+
+@dataclass
+class SweepResult:
+    """
+    정리 결과
+    """
+    documents: int = 0  # 삭제 표시한 문서 수
+    files: int = 0  # 삭제한 파일/디렉터리 수
+    contents: int = 0  # 삭제한 파싱 결과 캐시 수
+    chunks: int = 0  # 삭제한 벡터 스토어 청크 수
+    bytes_reclaimed: int = 0
+    batches: int = 0
+
+
+def _remove_path(path: str) -> int:
+    """파일 또는 디렉터리(멀티파트 파트) 삭제, 회수한 바이트 수 반환"""
+    if not path or not os.path.lexists(path):
+        return 0
+    if os.path.isdir(path):
+        size = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        shutil.rmtree(path, ignore_errors=True)
+        return size
+    try:
+        size = os.path.getsize(path)
+        os.remove(path)
+        return size
+    except FileNotFoundError:
+        return 0
+
+
+def _remove_paths(paths: Iterable[str]) -> List[int]:
+    return [_remove_path(path) for path in paths]
+
+
+def _quarantine(paths: Iterable[str]) -> Dict[str, str]:
+    """
+    파일을 UPLOAD_DIR/tmp/<uuid>.trash 로 옮겨 둠 (원래 경로 → 격리 경로)
+    
+    바로 지우지 않고 옮겨 두면, 그 사이 같은 내용을 참조하게 된 업로드가 있을 때 되돌릴 수 있다.
+    """
+    tmp_dir = os.path.join(settings.UPLOAD_DIR, "tmp")
+    os.makedirs(tmp_dir, exist_ok=True)
+    moved = {}
+    for path in paths:
+        trash = os.path.join(tmp_dir, f"{uuid.uuid4().hex}.trash")
+        try:
+            os.replace(path, trash)
+        except FileNotFoundError:
+            continue
+        moved[path] = trash
+    return moved
+
+
+def _restore(moved: Dict[str, str]) -> None:
+    """격리한 파일을 원래 경로로 되돌림 (업로드가 같은 바이트로 다시 만들었으면 격리본만 삭제)"""
+    for path, trash in moved.items():
+        if os.path.exists(path):
+            os.remove(trash)
+        else:
+            os.replace(trash, path)
+
+
+def _remove_stale_tmp_files(max_age: float) -> List[int]:
+    """UPLOAD_DIR/tmp 에 남은 오래된 임시 파일 삭제"""
+    tmp_dir = os.path.join(settings.UPLOAD_DIR, "tmp")
+    if not os.path.isdir(tmp_dir):
+        return []
+    cutoff = time.time() - max_age
+    removed = []
+    with os.scandir(tmp_dir) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    removed.append(_remove_path(entry.path))
+            except OSError:
+                pass
+    return removed
+
+
+class RetentionService:
+    """
+    문서 보관 기간 정리 서비스
+    
+    Args:
+        document_repository: 문서 리포지토리
+        content_repository: 문서 내용(파싱 결과 캐시) 리포지토리
+        delete_chunks: 내용 해시 목록 → 삭제한 벡터 청크 수 (없으면 벡터 스토어 정리 생략)
+    """
+    
+    def __init__(
+        self,
+        document_repository: IDocumentRepository,
+        content_repository: Optional[IDocumentContentRepository] = None,
+        delete_chunks: Optional[Callable[[List[str]], int]] = None
+    ):
+        self.document_repository = document_repository
+        self.content_repository = content_repository
+        self.delete_chunks = delete_chunks
+    
+    async def sweep(
+        self,
+        retention_days: int = None,
+        batch_size: int = None,
+        max_batches: int = None,
+        batch_pause: float = None
+    ) -> SweepResult:
+        """
+        보관 기간이 지난 문서 정리
+        
+        Args:
+            retention_days: 보관 기간 (기본값: DOCUMENT_RETENTION_DAYS)
+            batch_size: 배치당 문서 수
+            max_batches: 한 번 실행에서 처리할 최대 배치 수 (나머지는 다음 주기에 처리)
+            batch_pause: 배치 사이 대기 시간 (초)
+        """
+        retention_days = settings.DOCUMENT_RETENTION_DAYS if retention_days is None else retention_days
+        batch_size = batch_size or settings.RETENTION_SWEEP_BATCH_SIZE
+        max_batches = max_batches or settings.RETENTION_SWEEP_MAX_BATCHES
+        batch_pause = settings.RETENTION_SWEEP_BATCH_PAUSE if batch_pause is None else batch_pause
+        
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        result = SweepResult()
+        
+        for _ in range(max_batches):
+            expired = self.document_repository.get_expired(cutoff, batch_size)
+            if not expired:
+                break
+            await self._sweep_batch(expired, result)
+            result.batches += 1
+            if len(expired) < batch_size:
+                break
+            await asyncio.sleep(batch_pause)
+        
+        removed = await asyncio.to_thread(_remove_stale_tmp_files, _TMP_FILE_MAX_AGE)
+        result.files += len(removed)
+        result.bytes_reclaimed += sum(removed)
+        
+        if result.documents or removed:
+            logger.info(
+                f"문서 보관 기간 정리: documents={result.documents}, files={result.files}, "
+                f"contents={result.contents}, chunks={result.chunks}, "
+                f"bytes_reclaimed={result.bytes_reclaimed}, batches={result.batches}"
+            )
+        return result
+    
+    async def _sweep_batch(self, documents: List[Document], result: SweepResult) -> None:
+        """
+        배치 하나 정리
+        
+        업로드는 문서 행(content_hash)을 먼저 커밋한 뒤 객체를 저장하므로, 정리 쪽은
+        파일 격리 → 참조 재확인 → (다시 참조되면) 복원 순서로 지워 업로드와 경합해도 객체를 잃지 않는다.
+        파싱 결과 캐시 행은 참조 확인과 삭제를 DELETE 한 번으로 처리한다.
+        """
+        now = datetime.utcnow()
+        # 먼저 삭제 표시해 다른 요청이 파일을 참조하지 않도록 한다
+        result.documents += self.document_repository.mark_deleted([doc.id for doc in documents], now)
+        
+        # 다른 살아있는 문서가 참조하지 않는 내용만 삭제 (같은 파일이 여러 요구사항에 업로드될 수 있음)
+        hashes = {doc.content_hash for doc in documents if doc.content_hash}
+        candidates = hashes - self.document_repository.get_live_content_hashes(hashes)
+        
+        # 내용 해시가 없는 경로(파트 디렉터리 등)는 공유되지 않으므로 바로 삭제
+        unhashed = sorted({doc.file_path for doc in documents if doc.file_path and not doc.content_hash})
+        hashed = {
+            doc.file_path: doc.content_hash for doc in documents
+            if doc.file_path and doc.content_hash in candidates
+        }
+        removed = await asyncio.to_thread(_remove_paths, unhashed)
+        
+        moved = await asyncio.to_thread(_quarantine, sorted(hashed))
+        revived = self.document_repository.get_live_content_hashes(candidates) if candidates else set()
+        if revived:
+            restore = {path: trash for path, trash in moved.items() if hashed[path] in revived}
+            await asyncio.to_thread(_restore, restore)
+            moved = {path: trash for path, trash in moved.items() if path not in restore}
+            logger.info(f"정리 중 다시 참조된 내용 유지: count={len(revived)}")
+        removed += await asyncio.to_thread(_remove_paths, sorted(moved.values()))
+        result.files += sum(1 for size in removed if size)
+        result.bytes_reclaimed += sum(removed)
+        
+        orphaned = sorted(candidates - revived)
+        if not orphaned:
+            return
+        if self.content_repository:
+            # 재확인 이후에 참조가 생긴 행은 DELETE의 NOT EXISTS 조건이 남긴다
+            orphaned = self.content_repository.delete_unreferenced(orphaned)
+            result.contents += len(orphaned)
+        if self.delete_chunks and orphaned:
+            try:
+                result.chunks += await asyncio.to_thread(self.delete_chunks, orphaned)
+            except Exception as e:
+                logger.warning(f"벡터 스토어 청크 삭제 실패: count={len(orphaned)}, error={str(e)}")
+
+
+async def run_retention_sweeper(interval: float) -> None:
+    """
+    주기적 보관 기간 정리 작업 (애플리케이션 시작 시 백그라운드 태스크로 실행)
+    """
+    from app.db.session import SessionLocal
+    from app.repositories.implementations.document_repository import DocumentRepository
+    from app.repositories.implementations.document_content_repository import DocumentContentRepository
+    from app.services.llm_service import LLMService
+    
+    llm_service = LLMService()
+    while True:
+        db = SessionLocal()
+        try:
+            service = RetentionService(
+                DocumentRepository(db),
+                DocumentContentRepository(db),
+                llm_service.delete_document_chunks,
+            )
+            await service.sweep()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"문서 보관 기간 정리 실패: {str(e)}", exc_info=True)
+        finally:
+            db.close()
+        await asyncio.sleep(interval)
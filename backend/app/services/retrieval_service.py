@@ -0,0 +1,397 @@
+"""
+하이브리드 검색 (BM25 + 벡터, RRF 결합, MMR 다양화)
+
+- BM25: 벡터 스토어의 청크로 만든 프로세스 내 역색인 (한국어는 어절 + 조사 제거 + 음절 bigram 토큰),
+  스토어 버전이 바뀌면 추가/삭제된 청크만 반영 (증분)
+- 벡터: 벡터 스토어 유사도 검색
+- 결합: Reciprocal Rank Fusion (score = Σ 1 / (rrf_k + rank))
+- MMR (선택): 결합 후보 중 질의와 가깝고 서로 겹치지 않는 청크를 고른다
+- 메타데이터 필터: provider, design_type 등 동등 조건 (BM25/벡터 양쪽에 적용)
+- 결과는 (질의, 옵션, 인덱스 버전) 해시로 캐시하고, 컨텍스트 토큰 예산을 넘지 않도록 자른다
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.services.ingestion_service import count_tokens
+
+logger = get_logger("app.services.retrieval")
+
+
+# ---- 토큰화 ----
+
+_TOKEN = re.compile(r"[가-힣]+|[a-z0-9][a-z0-9_.+#-]*")
+# 어절 끝 조사/어미 (긴 것부터 검사)
+_JOSA = sorted(
+    ["으로써", "으로서", "에서는", "에게서", "이라는", "라는", "으로", "에서", "에게", "까지", "부터", "보다",
+     "처럼", "하고", "이나", "이며", "이다", "와", "과", "은", "는", "이", "가", "을", "를", "의", "에", "도", "만", "로"],
+    key=len,
+    reverse=True,
+)
+
+
+def _strip_josa(word: str) -> str:
+    for josa in _JOSA:
+        if len(word) > len(josa) + 1 and word.endswith(josa):
+            return word[: -len(josa)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰화
+
+    - 영문/숫자: 소문자 단어
+    - 한글: 조사를 떼어 낸 어절 + 음절 bigram (형태소 분석기 없이 복합어 부분 일치)
+    """
+    tokens = []
+    for word in _TOKEN.findall(text.lower()):
+        if "가" <= word[0] <= "힣":
+            stem = _strip_josa(word)
+            tokens.append(stem)
+            if len(stem) > 2:
+                tokens.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+# ---- BM25 ----
+
+class BM25Index:
+    """
+    역색인 BM25 (증분 추가/삭제)
+
+    삭제된 문서는 번호를 비워 두고(tombstone) 검색에서 제외하며,
+    삭제된 문서가 살아 있는 문서보다 많아지면 역색인을 다시 만든다.
+
+    Args:
+        k1, b: BM25 파라미터
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._reset()
+
+    def _reset(self) -> None:
+        self.texts: List[Optional[str]] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self.ids: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}  # 문서 ID → 문서 번호
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        self._live = 0
+        self._live_length = 0
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, doc_key: str) -> bool:
+        return doc_key in self._positions
+
+    def add(
+        self,
+        texts: List[str],
+        metadatas: List[Optional[Dict[str, Any]]],
+        ids: Optional[List[str]] = None
+    ) -> None:
+        """문서 추가 (같은 ID가 있으면 교체)"""
+        ids = ids or [None] * len(texts)
+        for text, metadata, doc_key in zip(texts, metadatas, ids):
+            if doc_key is not None and doc_key in self._positions:
+                self.remove([doc_key])
+            doc_id = len(self.texts)
+            tokens = tokenize(text)
+            for term, tf in Counter(tokens).items():
+                self._postings[term].append((doc_id, tf))
+            self.texts.append(text)
+            self.metadatas.append(metadata or {})
+            self.ids.append(doc_key)
+            self._lengths.append(len(tokens))
+            if doc_key is not None:
+                self._positions[doc_key] = doc_id
+            self._live += 1
+            self._live_length += len(tokens)
+
+    def remove(self, ids: List[str]) -> None:
+        """문서 삭제 (없는 ID는 무시)"""
+        for doc_key in ids:
+            doc_id = self._positions.pop(doc_key, None)
+            if doc_id is None:
+                continue
+            self.texts[doc_id] = None
+            self.metadatas[doc_id] = {}
+            self.ids[doc_id] = None
+            self._live -= 1
+            self._live_length -= self._lengths[doc_id]
+            self._dead += 1
+        if self._dead > max(self._live, 1024):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """삭제된 문서를 빼고 역색인 재구성"""
+        alive = [doc_id for doc_id, doc_key in enumerate(self.ids) if doc_key is not None]
+        texts = [self.texts[doc_id] for doc_id in alive]
+        metadatas = [self.metadatas[doc_id] for doc_id in alive]
+        ids = [self.ids[doc_id] for doc_id in alive]
+        self._reset()
+        self.add(texts, metadatas, ids)
+
+    def search(self, query: str, k: int, where: Optional[Dict[str, Any]] = None) -> List[Tuple[int, float]]:
+        """BM25 상위 k개 (문서 번호, 점수)"""
+        n = self._live
+        if n == 0:
+            return []
+        avg_length = self._live_length / n or 1
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            if self._dead:
+                postings = [(doc_id, tf) for doc_id, tf in postings if self.texts[doc_id] is not None]
+                if not postings:
+                    continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        if where:
+            scores = {d: s for d, s in scores.items() if _matches(self.metadatas[d], where)}
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+
+def _matches(metadata: Dict[str, Any], where: Dict[str, Any]) -> bool:
+    return all(metadata.get(key) == value for key, value in where.items())
+
+
+def _chroma_where(where: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """동등 조건 dict → Chroma where 절"""
+    if not where:
+        return None
+    if len(where) == 1:
+        return dict(where)
+    return {"$and": [{key: value} for key, value in where.items()]}
+
+
+# ---- 결합 / 다양화 ----
+
+def reciprocal_rank_fusion(rankings: List[List[str]], rrf_k: int = 60) -> List[Tuple[str, float]]:
+    """여러 순위 목록을 RRF로 결합 (키, 점수) 내림차순"""
+    scores: Dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] += 1.0 / (rrf_k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def mmr(query_vector: np.ndarray, vectors: np.ndarray, k: int, lambda_mult: float = 0.7) -> List[int]:
+    """Maximal Marginal Relevance: 후보 행 번호를 k개 선택"""
+    if len(vectors) == 0:
+        return []
+    vectors = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12)
+    query_vector = query_vector / (np.linalg.norm(query_vector) + 1e-12)
+    relevance = vectors @ query_vector
+    selected = [int(np.argmax(relevance))]
+    max_similarity = vectors @ vectors[selected[0]]
+    while len(selected) < min(k, len(vectors)):
+        score = lambda_mult * relevance - (1 - lambda_mult) * max_similarity
+        score[selected] = -np.inf
+        best = int(np.argmax(score))
+        selected.append(best)
+        max_similarity = np.maximum(max_similarity, vectors @ vectors[best])
+    return selected
+
+
+# ---- 검색기 ----
+
+@dataclass
+class RetrievedChunk:
+    """
+    검색 결과 청크
+    """
+    text: str
+    score: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class HybridRetriever:
+    """
+    BM25 + 벡터 하이브리드 검색기
+
+    Args:
+        vector_store: 벡터 스토어 (IVectorStore)
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        fetch_k: int = None,
+        rrf_k: int = None,
+        use_mmr: bool = None,
+        mmr_lambda: float = None,
+        cache_size: int = None,
+        cache_ttl: float = None,
+        sync_interval: float = None
+    ):
+        self.vector_store = vector_store
+        self.fetch_k = fetch_k or settings.RETRIEVAL_FETCH_K
+        self.rrf_k = rrf_k or settings.RETRIEVAL_RRF_K
+        self.use_mmr = settings.RETRIEVAL_MMR_ENABLED if use_mmr is None else use_mmr
+        self.mmr_lambda = settings.RETRIEVAL_MMR_LAMBDA if mmr_lambda is None else mmr_lambda
+        self._cache = LRUCache(
+            max_size=cache_size or settings.RETRIEVAL_CACHE_SIZE,
+            ttl=settings.RETRIEVAL_CACHE_TTL if cache_ttl is None else cache_ttl,
+        )
+        self.sync_interval = settings.RETRIEVAL_BM25_SYNC_INTERVAL if sync_interval is None else sync_interval
+        self._bm25 = BM25Index()
+        self._bm25_version: Optional[str] = None
+        self._bm25_synced_at: Optional[float] = None
+        self._bm25_generation = 0  # BM25 색인 내용이 바뀔 때마다 증가 (결과 캐시 키)
+        self._lock = threading.Lock()
+
+    def _sync_bm25(self) -> None:
+        """
+        벡터 스토어 변경 반영 (증분)
+
+        스토어 버전이 바뀌었거나 sync_interval이 지났을 때만 ID 목록을 비교해
+        추가된 청크만 읽어 색인하고 삭제된 청크는 색인에서 뺀다.
+        """
+        version = self.vector_store.version
+        now = time.monotonic()
+        if (
+            self._bm25_synced_at is not None
+            and version == self._bm25_version
+            and now - self._bm25_synced_at < self.sync_interval
+        ):
+            return
+        with self._lock:
+            if (
+                self._bm25_synced_at is not None
+                and version == self._bm25_version
+                and now - self._bm25_synced_at < self.sync_interval
+            ):
+                return
+            live = set(self.vector_store.get(include=[]).get("ids") or [])
+            bm25 = self._bm25
+            removed = [doc_key for doc_key in bm25.ids if doc_key is not None and doc_key not in live]
+            added = [doc_key for doc_key in live if doc_key not in bm25]
+            if removed:
+                bm25.remove(removed)
+            for start in range(0, len(added), 1000):
+                data = self.vector_store.get(ids=added[start:start + 1000], include=["documents", "metadatas"])
+                bm25.add(data.get("documents") or [], data.get("metadatas") or [], data.get("ids") or [])
+            if added or removed:
+                self._bm25_generation += 1
+                logger.info(f"BM25 색인 갱신: added={len(added)}, removed={len(removed)}, documents={len(bm25)}")
+            self._bm25_version, self._bm25_synced_at = version, now
+
+    def search(
+        self,
+        query: str,
+        k: int = None,
+        where: Optional[Dict[str, Any]] = None,
+        max_tokens: int = None
+    ) -> List[RetrievedChunk]:
+        """
+        하이브리드 검색
+
+        Args:
+            k: 반환할 최대 청크 수 (기본값: RETRIEVAL_TOP_K)
+            where: 메타데이터 동등 조건 (예: {"provider": "aws", "design_type": "cloud"})
+            max_tokens: 반환 청크 토큰 합 상한 (기본값: RETRIEVAL_MAX_CONTEXT_TOKENS, 0이면 제한 없음)
+        """
+        k = k or settings.RETRIEVAL_TOP_K
+        max_tokens = settings.RETRIEVAL_MAX_CONTEXT_TOKENS if max_tokens is None else max_tokens
+        self._sync_bm25()
+        cache_key = hashlib.sha256(json.dumps(
+            [query, k, where, max_tokens, self.use_mmr, self._bm25_version, self._bm25_generation],
+            sort_keys=True, ensure_ascii=False, default=str
+        ).encode("utf-8")).hexdigest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        # 1) 후보 수집: 벡터 / BM25 순위 (BM25 색인은 동기화 중 변경되므로 잠금 안에서 조회)
+        vector_docs = self.vector_store.similarity_search(query, k=self.fetch_k, filter=_chroma_where(where))
+        with self._lock:
+            bm25 = self._bm25
+            bm25_docs = [
+                (bm25.texts[doc_id], bm25.metadatas[doc_id]) for doc_id, _ in bm25.search(query, self.fetch_k, where)
+            ]
+
+        candidates: Dict[str, Dict[str, Any]] = {}
+        for doc in vector_docs:
+            candidates.setdefault(doc.page_content, doc.metadata or {})
+        for text, metadata in bm25_docs:
+            candidates.setdefault(text, metadata)
+
+        # 2) RRF 결합
+        fused = reciprocal_rank_fusion(
+            [[doc.page_content for doc in vector_docs], [text for text, _ in bm25_docs]],
+            self.rrf_k,
+        )
+
+        # 3) MMR 다양화 (결합 상위 후보 안에서)
+        if self.use_mmr and len(fused) > k:
+            pool = fused[: self.fetch_k]
+            selected = self._mmr_select(query, [text for text, _ in pool], k)
+            if selected is not None:
+                fused = [pool[i] for i in selected]
+
+        # 4) 토큰 예산
+        results: List[RetrievedChunk] = []
+        used = 0
+        for text, score in fused[:k]:
+            tokens = count_tokens(text)
+            if max_tokens and results and used + tokens > max_tokens:
+                break
+            used += tokens
+            results.append(RetrievedChunk(text=text, score=score, metadata=candidates.get(text, {})))
+
+        self._cache.set(cache_key, tuple(results))
+        return results
+
+    def _mmr_select(self, query: str, texts: List[str], k: int) -> Optional[List[int]]:
+        """후보 텍스트를 임베딩(캐시 사용)해 MMR 선택, 실패 시 None"""
+        try:
+            embeddings = self.vector_store.embeddings
+            query_vector = np.asarray(embeddings.embed_query(query), dtype=np.float32)
+            vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"MMR 임베딩 실패, RRF 순위 사용: {str(e)}")
+            return None
+        return mmr(query_vector, vectors, k, self.mmr_lambda)
+
+    def clear_cache(self) -> None:
+        """검색 결과 캐시 비우기"""
+        self._cache.clear()
+
+
+_retriever: Optional[HybridRetriever] = None
+_retriever_lock = threading.Lock()
+
+
+def get_hybrid_retriever(vector_store) -> HybridRetriever:
+    """프로세스 전역 하이브리드 검색기 (공유 벡터 스토어 기준)"""
+    global _retriever
+    if _retriever is None or _retriever.vector_store is not vector_store:
+        with _retriever_lock:
+            if _retriever is None or _retriever.vector_store is not vector_store:
+                _retriever = HybridRetriever(vector_store)
+    return _retriever
@@ -0,0 +1,13 @@
+"""
+벡터 스토어 백엔드
+
+- chroma: ChromaDB (LangChain Chroma 어댑터)
+- local: 프로세스 내 NumPy 인덱스 (memmap 임베딩 행렬, flat/IVF, float16/int8 양자화)
+"""
+from app.services.vector_store.base import IVectorStore, VectorDocument, match_where
+
+__all__ = [
+    "IVectorStore",
+    "VectorDocument",
+    "match_where",
+]
@@ -0,0 +1,121 @@
+"""
+벡터 스토어 인터페이스
+
+LangChain 벡터 스토어와 같은 메서드 이름(add_texts, get, delete, similarity_search)을 사용하고,
+where 필터는 Chroma 문법(동등, $eq, $ne, $in, $nin, $and, $or)을 따른다.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class VectorDocument:
+    """
+    검색 결과 문서 (LangChain Document와 같은 속성)
+    """
+    page_content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+
+
+def match_where(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """Chroma 문법 where 필터 평가"""
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(match_where(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(match_where(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, operand in condition.items():
+                if op == "$eq" and value != operand:
+                    return False
+                if op == "$ne" and value == operand:
+                    return False
+                if op == "$in" and value not in operand:
+                    return False
+                if op == "$nin" and value in operand:
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+class IVectorStore(ABC):
+    """
+    벡터 스토어 인터페이스
+    """
+    
+    @property
+    @abstractmethod
+    def embeddings(self):
+        """임베딩 함수 (embed_documents / embed_query)"""
+        pass
+    
+    @abstractmethod
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """텍스트 임베딩 후 저장 (같은 ID가 있으면 덮어씀)"""
+        pass
+    
+    @abstractmethod
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        ID/메타데이터로 조회
+        
+        include: "documents", "metadatas", "embeddings" 중 반환할 항목 (기본값: documents, metadatas)
+        Returns: {"ids": [...], "documents": [...], "metadatas": [...], "embeddings": [...]}
+        """
+        pass
+    
+    @abstractmethod
+    def delete(self, ids: List[str]) -> None:
+        """ID로 삭제"""
+        pass
+    
+    @abstractmethod
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Any, float]]:
+        """유사도 검색 (문서, 점수), 점수는 클수록 유사"""
+        pass
+    
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """유사도 검색"""
+        return [doc for doc, _ in self.similarity_search_with_score(query, k=k, filter=filter)]
+    
+    @abstractmethod
+    def count(self) -> int:
+        """저장된 문서 수"""
+        pass
+    
+    @property
+    def version(self) -> Optional[str]:
+        """
+        변경 버전 (추가/삭제 시 바뀌는 값, 추적할 수 없으면 None)
+        
+        검색기는 이 값이 바뀌었을 때만 ID 목록을 비교해 BM25 색인을 갱신한다.
+        """
+        return None
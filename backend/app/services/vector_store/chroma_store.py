@@ -0,0 +1,76 @@
+"""
+ChromaDB 벡터 스토어 (LangChain Chroma 어댑터)
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.vector_store.base import IVectorStore
+
+
+class ChromaVectorStore(IVectorStore):
+    """
+    ChromaDB 벡터 스토어
+    
+    Args:
+        store: langchain_community.vectorstores.Chroma 인스턴스
+    """
+    
+    def __init__(self, store):
+        self.store = store
+        # 이 프로세스에서의 추가/삭제 횟수 (다른 프로세스의 변경은 검색기의 주기적 동기화로 반영)
+        self._mutations = 0
+    
+    @property
+    def embeddings(self):
+        return self.store.embeddings
+    
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None
+    ) -> List[str]:
+        result = self.store.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+        self._mutations += 1
+        return result
+    
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if include is not None:
+            kwargs["include"] = include
+        return self.store.get(ids=ids, where=where, **kwargs)
+    
+    def delete(self, ids: List[str]) -> None:
+        self.store.delete(ids=ids)
+        self._mutations += 1
+    
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Any, float]]:
+        # Chroma 점수는 거리(작을수록 유사) → 부호를 바꿔 인터페이스 규약(클수록 유사)에 맞춘다
+        return [
+            (doc, -distance)
+            for doc, distance in self.store.similarity_search_with_score(query, k=k, filter=filter)
+        ]
+    
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        return self.store.similarity_search(query, k=k, filter=filter)
+    
+    def count(self) -> int:
+        return self.store._collection.count()
+    
+    @property
+    def version(self) -> str:
+        return str(self._mutations)
@@ -0,0 +1,576 @@
+"""
+프로세스 내 NumPy 벡터 인덱스 (단일 노드용 Chroma 대체)
+
+저장 형식 (UPLOAD_DIR/vector_index/<컬렉션>/):
+- manifest.json: 차원, dtype, 세대(generation, 압축할 때마다 증가)
+- vectors.bin: 정규화된 임베딩 행 (float32/float16/int8), 추가 전용, 읽기는 np.memmap
+- scales.bin: int8 양자화 행별 스케일 (float32)
+- texts.bin: 청크 텍스트 (UTF-8), records의 (offset, length)로 읽는다
+- records.jsonl: 추가 {"id", "row", "offset", "length", "metadata"} / 삭제 {"delete": [ids]} 로그
+- ivf.npz: IVF 중심점과 학습 시점까지의 행 배정 (index_type="ivf")
+
+records.jsonl 한 줄이 커밋 지점이다. 벡터/텍스트를 먼저 쓰고 레코드를 마지막에 쓰므로
+중단된 쓰기의 꼬리 데이터는 다음 추가 때 잘라낸다. 메모리에는 ID/메타데이터/생존 여부만 두고
+벡터와 텍스트는 디스크에서 읽으므로 지식 베이스가 커져도 메모리 사용량이 제한된다.
+
+검색은 코사인 유사도:
+- flat: memmap 행렬을 블록 단위로 내적 (정확)
+- ivf: k-means 중심점 중 nprobe개 목록의 행만 내적 (근사, 행 수가 ivf_min_rows 이상일 때)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.logging_config import get_logger
+from app.services.vector_store.base import IVectorStore, VectorDocument, match_where
+
+logger = get_logger("app.services.vector_store.local")
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_BLOCK_ROWS = 65536
+_KMEANS_ITERATIONS = 10
+
+
+class LocalVectorStore(IVectorStore):
+    """
+    memmap 기반 로컬 벡터 인덱스
+
+    Args:
+        path: 저장 디렉터리
+        embedding_function: 임베딩 함수 (embed_documents / embed_query)
+        dtype: 벡터 저장 dtype ('float32', 'float16', 'int8')
+        index_type: 'flat' 또는 'ivf'
+        ivf_min_rows: IVF를 사용할 최소 행 수 (미만이면 flat 검색)
+        nprobe: IVF 검색 시 조회할 목록 수
+    """
+
+    def __init__(
+        self,
+        path: str,
+        embedding_function,
+        dtype: str = "float16",
+        index_type: str = "flat",
+        ivf_min_rows: int = 20000,
+        nprobe: int = 8
+    ):
+        if dtype not in ("float32", "float16", "int8"):
+            raise ValueError(f"Unsupported vector index dtype: {dtype}")
+        if index_type not in ("flat", "ivf"):
+            raise ValueError(f"Unsupported vector index type: {index_type}")
+
+        self.path = path
+        self._embedding_function = embedding_function
+        self.dtype = np.dtype(dtype)
+        self.index_type = index_type
+        self.ivf_min_rows = ivf_min_rows
+        self.nprobe = nprobe
+        self.dim: Optional[int] = None
+        self._lock = threading.RLock()
+
+        os.makedirs(path, exist_ok=True)
+        self._manifest_path = os.path.join(path, "manifest.json")
+        self._vectors_path = os.path.join(path, "vectors.bin")
+        self._scales_path = os.path.join(path, "scales.bin")
+        self._texts_path = os.path.join(path, "texts.bin")
+        self._records_path = os.path.join(path, "records.jsonl")
+        self._ivf_path = os.path.join(path, "ivf.npz")
+        self._lock_path = os.path.join(path, ".lock")
+
+        with self._lock, self._file_lock(shared=True):
+            self._load()
+
+    @property
+    def embeddings(self):
+        return self._embedding_function
+
+    # ---- 상태 로드 / 다른 프로세스 변경 반영 ----
+
+    def _reset_state(self) -> None:
+        self._n = 0
+        self._ids: List[Optional[str]] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._alive = np.zeros(0, dtype=bool)
+        self._offsets = np.zeros(0, dtype=np.int64)
+        self._lengths = np.zeros(0, dtype=np.int64)
+        self._text_end = 0
+        self._records_offset = 0
+        self._vectors: Optional[np.memmap] = None
+        self._scales: Optional[np.memmap] = None
+        self._mapped_rows = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._lists: List[np.ndarray] = []
+        self._ivf_rows = 0
+
+    def _load(self) -> None:
+        """manifest + records.jsonl 전체 재생 (잠금 보유 상태에서 호출)"""
+        self._reset_state()
+        self.generation = 0
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path) as f:
+                manifest = json.load(f)
+            self.dim = manifest["dim"]
+            self.dtype = np.dtype(manifest["dtype"])
+            self.generation = manifest.get("generation", 0)
+        self._replay()
+        self._load_ivf()
+
+    def _replay(self) -> None:
+        """records.jsonl에서 아직 반영하지 않은 레코드 적용"""
+        if not os.path.exists(self._records_path):
+            return
+        with open(self._records_path, "rb") as f:
+            f.seek(self._records_offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # 마지막 줄이 완전히 쓰이지 않았으면 다음에 읽는다
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+        self._records_offset += end
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if "delete" in record:
+            for doc_id in record["delete"]:
+                row = self._rows.pop(doc_id, None)
+                if row is not None:
+                    self._alive[row] = False
+            return
+
+        row = record["row"]
+        if row != self._n:
+            raise ValueError(f"Vector index records out of order: row {row} != {self._n}")
+        if self._n >= len(self._alive):
+            capacity = max(1024, 2 * len(self._alive))
+            self._alive = np.concatenate([self._alive, np.zeros(capacity - len(self._alive), dtype=bool)])
+            self._offsets = np.concatenate([self._offsets, np.zeros(capacity - len(self._offsets), dtype=np.int64)])
+            self._lengths = np.concatenate([self._lengths, np.zeros(capacity - len(self._lengths), dtype=np.int64)])
+
+        old = self._rows.get(record["id"])
+        if old is not None:
+            self._alive[old] = False
+        self._rows[record["id"]] = row
+        self._ids.append(record["id"])
+        self._metadatas.append(record.get("metadata") or {})
+        self._alive[row] = True
+        self._offsets[row] = record["offset"]
+        self._lengths[row] = record["length"]
+        self._text_end = max(self._text_end, record["offset"] + record["length"])
+        self._n += 1
+
+    def _refresh(self) -> None:
+        """다른 프로세스의 추가/삭제/압축 반영 (잠금 보유 상태에서 호출)"""
+        generation = self.generation
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path) as f:
+                generation = json.load(f).get("generation", 0)
+        if generation != self.generation:
+            with self._file_lock(shared=True):
+                self._load()
+            return
+        size = os.path.getsize(self._records_path) if os.path.exists(self._records_path) else 0
+        if size > self._records_offset:
+            with self._file_lock(shared=True):
+                self._replay()
+
+    def _matrix(self) -> Tuple[Optional[np.memmap], Optional[np.memmap]]:
+        """현재 행 수에 맞춘 벡터/스케일 memmap"""
+        if self._n == 0:
+            return None, None
+        if self._mapped_rows != self._n:
+            self._vectors = np.memmap(self._vectors_path, dtype=self.dtype, mode="r", shape=(self._n, self.dim))
+            if self.dtype == np.int8:
+                self._scales = np.memmap(self._scales_path, dtype=np.float32, mode="r", shape=(self._n,))
+            self._mapped_rows = self._n
+        return self._vectors, self._scales
+
+    @contextmanager
+    def _file_lock(self, shared: bool = False):
+        """프로세스 간 잠금 (읽기 공유 / 쓰기 배타, fcntl이 없으면 프로세스 내 잠금만 사용)"""
+        with open(self._lock_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    # ---- 양자화 ----
+
+    def _quantize(self, vectors: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """정규화 후 저장 dtype으로 변환 (int8은 행별 스케일 함께 반환)"""
+        vectors = vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12)
+        if self.dtype == np.int8:
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+        return vectors.astype(self.dtype), None
+
+    def _dequantize(self, rows: np.ndarray, scales: Optional[np.ndarray]) -> np.ndarray:
+        rows = rows.astype(np.float32)
+        if scales is not None:
+            rows *= np.asarray(scales, dtype=np.float32)[:, None]
+        return rows
+
+    # ---- 쓰기 ----
+
+    def add_texts(
+        self,
+        texts: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None
+    ) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+        if ids is None:
+            import uuid
+            ids = [str(uuid.uuid4()) for _ in texts]
+        metadatas = metadatas or [{} for _ in texts]
+        vectors = np.asarray(self._embedding_function.embed_documents(texts), dtype=np.float32)
+        matrix, scales = self._quantize(vectors)
+
+        with self._lock, self._file_lock():
+            self._refresh_locked()
+            if self.dim is None:
+                self.dim = int(matrix.shape[1])
+                self._write_manifest()
+            elif matrix.shape[1] != self.dim:
+                raise ValueError(f"Embedding dimension {matrix.shape[1]} != index dimension {self.dim}")
+
+            # 중단된 쓰기의 꼬리 데이터를 잘라내고 이어서 기록
+            row_bytes = self.dim * self.dtype.itemsize
+            with open(self._vectors_path, "ab") as f:
+                f.truncate(self._n * row_bytes)
+                f.write(matrix.tobytes())
+            if scales is not None:
+                with open(self._scales_path, "ab") as f:
+                    f.truncate(self._n * 4)
+                    f.write(scales.tobytes())
+
+            encoded = [text.encode("utf-8") for text in texts]
+            records = []
+            offset = self._text_end
+            for doc_id, data, metadata, row in zip(ids, encoded, metadatas, range(self._n, self._n + len(texts))):
+                records.append({"id": doc_id, "row": row, "offset": offset, "length": len(data), "metadata": metadata or {}})
+                offset += len(data)
+            with open(self._texts_path, "ab") as f:
+                f.truncate(self._text_end)
+                f.write(b"".join(encoded))
+            with open(self._records_path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+
+            self._replay()
+            self._assign_new_rows()
+        return list(ids)
+
+    def delete(self, ids: List[str]) -> None:
+        if not ids:
+            return
+        with self._lock, self._file_lock():
+            self._refresh_locked()
+            with open(self._records_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"delete": list(ids)}, ensure_ascii=False) + "\n")
+            self._replay()
+            dead = self._n - len(self._rows)
+            if self._n >= 1024 and dead * 2 > self._n:
+                self._compact()
+
+    def _refresh_locked(self) -> None:
+        """배타 잠금 보유 상태에서 다른 프로세스 변경 반영"""
+        generation = self.generation
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path) as f:
+                generation = json.load(f).get("generation", 0)
+        if generation != self.generation:
+            self._load()
+        else:
+            self._replay()
+
+    def _write_manifest(self) -> None:
+        tmp_path = self._manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"dim": self.dim, "dtype": self.dtype.name, "generation": self.generation}, f)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _compact(self) -> None:
+        """삭제된 행을 제거해 파일 재작성 (배타 잠금 보유 상태에서 호출)"""
+        live = np.flatnonzero(self._alive[:self._n])
+        vectors, scales = self._matrix()
+        texts = self._read_texts(live)
+        tmp = {name: path + ".tmp" for name, path in (
+            ("vectors", self._vectors_path), ("scales", self._scales_path),
+            ("texts", self._texts_path), ("records", self._records_path),
+        )}
+
+        with open(tmp["vectors"], "wb") as vf, open(tmp["texts"], "wb") as tf, \
+                open(tmp["records"], "w", encoding="utf-8") as rf:
+            offset = 0
+            for start in range(0, len(live), _BLOCK_ROWS):
+                block = live[start:start + _BLOCK_ROWS]
+                vf.write(np.asarray(vectors[block]).tobytes())
+            for new_row, (row, text) in enumerate(zip(live, texts)):
+                data = text.encode("utf-8")
+                tf.write(data)
+                rf.write(json.dumps({
+                    "id": self._ids[row], "row": new_row, "offset": offset, "length": len(data),
+                    "metadata": self._metadatas[row],
+                }, ensure_ascii=False) + "\n")
+                offset += len(data)
+        if scales is not None:
+            with open(tmp["scales"], "wb") as f:
+                f.write(np.asarray(scales[live]).tobytes())
+
+        self._vectors = self._scales = None
+        os.replace(tmp["vectors"], self._vectors_path)
+        if scales is not None:
+            os.replace(tmp["scales"], self._scales_path)
+        os.replace(tmp["texts"], self._texts_path)
+        os.replace(tmp["records"], self._records_path)
+        if os.path.exists(self._ivf_path):
+            os.remove(self._ivf_path)
+        self.generation += 1
+        self._write_manifest()
+        logger.info(f"벡터 인덱스 압축: rows={self._n} → {len(live)}")
+        self._load()
+
+    # ---- 읽기 ----
+
+    def _read_texts(self, rows) -> List[str]:
+        rows = list(rows)
+        if not rows:
+            return []
+        with open(self._texts_path, "rb") as f:
+            if len(rows) > 64:
+                data = f.read(self._text_end)
+                return [
+                    data[self._offsets[row]:self._offsets[row] + self._lengths[row]].decode("utf-8")
+                    for row in rows
+                ]
+            texts = []
+            for row in rows:
+                f.seek(int(self._offsets[row]))
+                texts.append(f.read(int(self._lengths[row])).decode("utf-8"))
+            return texts
+
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        include = ["documents", "metadatas"] if include is None else include
+        with self._lock:
+            self._refresh()
+            if ids is not None:
+                rows = [self._rows[doc_id] for doc_id in ids if doc_id in self._rows]
+            else:
+                rows = [int(row) for row in np.flatnonzero(self._alive[:self._n])]
+            if where:
+                rows = [row for row in rows if match_where(self._metadatas[row], where)]
+
+            result: Dict[str, Any] = {"ids": [self._ids[row] for row in rows]}
+            if "documents" in include:
+                result["documents"] = self._read_texts(rows)
+            if "metadatas" in include:
+                result["metadatas"] = [dict(self._metadatas[row]) for row in rows]
+            if "embeddings" in include:
+                vectors, scales = self._matrix()
+                index = np.asarray(rows, dtype=np.int64)
+                result["embeddings"] = (
+                    self._dequantize(vectors[index], scales[index] if scales is not None else None).tolist()
+                    if rows else []
+                )
+            return result
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+    @property
+    def version(self) -> str:
+        """세대 + 반영한 레코드 로그 위치 (다른 프로세스의 추가/삭제/압축도 반영)"""
+        with self._lock:
+            self._refresh()
+            return f"{self.generation}:{self._records_offset}"
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[VectorDocument, float]]:
+        query_vector = np.asarray(self._embedding_function.embed_query(query), dtype=np.float32)
+        return self.similarity_search_by_vector_with_score(query_vector, k=k, filter=filter)
+
+    def similarity_search_by_vector_with_score(
+        self,
+        query_vector: np.ndarray,
+        k: int = 4,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[VectorDocument, float]]:
+        """임베딩 벡터로 유사도 검색 (코사인 유사도)"""
+        query_vector = np.asarray(query_vector, dtype=np.float32)
+        query_vector = query_vector / (np.linalg.norm(query_vector) + 1e-12)
+        with self._lock:
+            self._refresh()
+            if self._n == 0 or not self._rows:
+                return []
+            mask = self._alive[:self._n].copy()
+            if filter:
+                for row in np.flatnonzero(mask):
+                    if not match_where(self._metadatas[row], filter):
+                        mask[row] = False
+
+            candidates = self._ivf_candidates(query_vector) if self._use_ivf(filter) else None
+            if candidates is not None:
+                candidates = candidates[mask[candidates]]
+                if len(candidates) < k:
+                    candidates = None  # 조회 목록에 결과가 부족하면 flat 검색으로 보완
+            rows, scores = (
+                self._score_rows(query_vector, candidates) if candidates is not None
+                else self._score_all(query_vector, mask)
+            )
+
+            if len(rows) > k:
+                top = np.argpartition(-scores, k)[:k]
+                rows, scores = rows[top], scores[top]
+            order = np.argsort(-scores)
+            rows, scores = rows[order], scores[order]
+            texts = self._read_texts(rows)
+            return [
+                (VectorDocument(page_content=text, metadata=dict(self._metadatas[row]), id=self._ids[row]), float(score))
+                for row, text, score in zip(rows, texts, scores)
+            ]
+
+    def _score_all(self, query_vector: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """flat: 전체 행을 블록 단위로 내적"""
+        vectors, scales = self._matrix()
+        scores = np.empty(self._n, dtype=np.float32)
+        for start in range(0, self._n, _BLOCK_ROWS):
+            end = min(start + _BLOCK_ROWS, self._n)
+            block = self._dequantize(vectors[start:end], scales[start:end] if scales is not None else None)
+            scores[start:end] = block @ query_vector
+        rows = np.flatnonzero(mask)
+        return rows, scores[rows]
+
+    def _score_rows(self, query_vector: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """후보 행만 내적"""
+        vectors, scales = self._matrix()
+        rows = np.sort(rows)
+        block = self._dequantize(vectors[rows], scales[rows] if scales is not None else None)
+        return rows, block @ query_vector
+
+    # ---- IVF ----
+
+    def _use_ivf(self, filter: Optional[Dict[str, Any]]) -> bool:
+        if self.index_type != "ivf" or len(self._rows) < self.ivf_min_rows:
+            return False
+        # 학습 후 행 수가 4배 이상 늘었으면 다시 학습
+        if self._centroids is None or self._n >= 4 * max(self._ivf_rows, 1):
+            self._train_ivf()
+        return self._centroids is not None
+
+    def _train_ivf(self) -> None:
+        """구형 k-means로 중심점 학습 후 전체 행 배정"""
+        vectors, scales = self._matrix()
+        live = np.flatnonzero(self._alive[:self._n])
+        nlist = int(min(4096, max(16, np.sqrt(len(live)))))
+        rng = np.random.default_rng(0)
+        sample = np.sort(rng.choice(live, size=min(len(live), nlist * 50), replace=False))
+        data = self._dequantize(vectors[sample], scales[sample] if scales is not None else None)
+
+        centroids = data[rng.choice(len(data), size=nlist, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = np.argmax(data @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = data[labels == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            centroids /= np.linalg.norm(centroids, axis=1, keepdims=True) + 1e-12
+
+        self._centroids = centroids
+        self._assignments = self._assign(0, self._n)
+        self._ivf_rows = self._n
+        self._build_lists()
+        logger.info(f"IVF 인덱스 학습: rows={self._n}, nlist={nlist}")
+        self._save_ivf()
+
+    def _save_ivf(self) -> None:
+        """
+        ivf.npz 저장 (다른 쓰기와 같은 배타 파일 잠금)
+
+        학습은 잠금 없이 하고 저장할 때만 잠그며, 그사이 다른 프로세스가 압축해
+        세대가 바뀌었으면 행 번호가 달라졌으므로 저장하지 않는다 (메모리에서만 사용).
+        """
+        with self._file_lock():
+            generation = self.generation
+            if os.path.exists(self._manifest_path):
+                with open(self._manifest_path) as f:
+                    generation = json.load(f).get("generation", 0)
+            if generation != self.generation:
+                return
+            tmp_path = self._ivf_path + ".tmp.npz"
+            np.savez(tmp_path, centroids=self._centroids, assignments=self._assignments,
+                     generation=np.int64(self.generation))
+            os.replace(tmp_path, self._ivf_path)
+
+    def _assign(self, start: int, end: int) -> np.ndarray:
+        """행 [start, end)를 가장 가까운 중심점에 배정"""
+        vectors, scales = self._matrix()
+        assignments = np.empty(end - start, dtype=np.int32)
+        for block_start in range(start, end, _BLOCK_ROWS):
+            block_end = min(block_start + _BLOCK_ROWS, end)
+            block = self._dequantize(
+                vectors[block_start:block_end],
+                scales[block_start:block_end] if scales is not None else None,
+            )
+            assignments[block_start - start:block_end - start] = np.argmax(block @ self._centroids.T, axis=1)
+        return assignments
+
+    def _assign_new_rows(self) -> None:
+        """IVF 학습 이후 추가된 행 배정"""
+        if self._centroids is None or len(self._assignments) >= self._n:
+            return
+        new = self._assign(len(self._assignments), self._n)
+        self._assignments = np.concatenate([self._assignments, new])
+        self._build_lists()
+
+    def _build_lists(self) -> None:
+        order = np.argsort(self._assignments, kind="stable")
+        bounds = np.searchsorted(self._assignments[order], np.arange(len(self._centroids) + 1))
+        self._lists = [order[bounds[c]:bounds[c + 1]] for c in range(len(self._centroids))]
+
+    def _load_ivf(self) -> None:
+        if self.index_type != "ivf" or not os.path.exists(self._ivf_path):
+            return
+        try:
+            with np.load(self._ivf_path) as data:
+                if int(data["generation"]) != self.generation:
+                    return
+                self._centroids = data["centroids"]
+                self._assignments = data["assignments"][:self._n]
+        except Exception as e:
+            logger.warning(f"IVF 인덱스 로드 실패, 다시 학습합니다: {str(e)}")
+            return
+        self._ivf_rows = len(self._assignments)
+        self._assign_new_rows()
+        if len(self._lists) == 0:
+            self._build_lists()
+
+    def _ivf_candidates(self, query_vector: np.ndarray) -> Optional[np.ndarray]:
+        self._assign_new_rows()
+        probes = np.argsort(-(self._centroids @ query_vector))[:self.nprobe]
+        return np.concatenate([self._lists[p] for p in probes])
@@ -0,0 +1,502 @@
+"""
+알림 규칙 엔진
+
+메트릭이 기록될 때(수집 버퍼 플러시, MetricsCollector.record) 새 점만으로 규칙을 증분 평가하고
+시계열별 상태(조건 시작 시각, 변화율 창, 마지막 수신 시각)를 메모리에 유지한다.
+
+- threshold: 값 op 임계치가 for_seconds 이상 계속되면 firing, 조건이 풀리면 resolved
+- rate: window_seconds 창의 초당 변화율 op 임계치 (for_seconds 적용)
+- absent: for_seconds(없으면 window_seconds) 동안 점이 없으면 firing (주기 평가 tick), 점이 다시 오면 resolved
+
+firing/resolved 전이는 alert_events 테이블에 기록하고, 배포별 firing 알림 목록을 유지해
+헬스 상태 조회는 요청 시 계산 없이 미리 계산된 상태를 읽는다.
+firing 알림이 없어도 배포의 마지막 점이 status_stale_seconds보다 오래되면 healthy 대신 unknown으로 본다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.domain.entities.alert_event import AlertEvent
+from app.utils.metrics_store import from_millis, to_millis
+
+logger = get_logger("app.utils.alert_engine")
+
+RULE_TYPES = ("threshold", "rate", "absent")
+SEVERITY_RANK = {"warning": 1, "critical": 2}
+STATUS_BY_RANK = {0: "healthy", 1: "warning", 2: "critical"}
+STATUS_UNKNOWN = "unknown"
+
+_OPS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+# (배포 ID, 시계열 키)
+SeriesRef = Tuple[str, str]
+
+
+def series_key(metric_name: str, tags: Optional[Dict[str, str]]) -> str:
+    """메트릭 이름 + 태그 → 시계열 키 (sha1 hex)"""
+    raw = json.dumps([metric_name, tags or {}], sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class AlertRule:
+    """
+    알림 규칙
+
+    Args:
+        metric: 메트릭 이름 ("*"면 전체)
+        unit: 단위 조건 (예: percent)
+        tags: 태그 동등 조건
+        for_seconds: 조건 유지 시간 (absent는 데이터 없음 허용 시간)
+        window_seconds: rate 규칙 변화율 창 (absent 기본 허용 시간)
+    """
+    name: str
+    type: str = "threshold"
+    metric: str = "*"
+    unit: Optional[str] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+    op: str = ">"
+    threshold: float = 0.0
+    for_seconds: float = 0.0
+    window_seconds: float = 300.0
+    severity: str = "warning"
+
+    def __post_init__(self):
+        if self.type not in RULE_TYPES:
+            raise ValueError(f"Unsupported alert rule type: {self.type} ({', '.join(RULE_TYPES)})")
+        if self.op not in _OPS:
+            raise ValueError(f"Unsupported alert rule op: {self.op} ({', '.join(_OPS)})")
+        if self.severity not in SEVERITY_RANK:
+            raise ValueError(f"Unsupported alert severity: {self.severity} ({', '.join(SEVERITY_RANK)})")
+
+    def matches(self, metric_name: str, unit: Optional[str], tags: Optional[Dict[str, str]]) -> bool:
+        if self.metric != "*" and self.metric != metric_name:
+            return False
+        if self.unit is not None and self.unit != unit:
+            return False
+        tags = tags or {}
+        return all(tags.get(key) == value for key, value in self.tags.items())
+
+
+DEFAULT_ALERT_RULES = [
+    AlertRule(name="percent_warning", metric="*", unit="percent", op=">", threshold=80.0, severity="warning"),
+    AlertRule(name="percent_critical", metric="*", unit="percent", op=">", threshold=95.0, severity="critical"),
+]
+
+
+def load_alert_rules(path: Optional[str] = None) -> List[AlertRule]:
+    """규칙 JSON 파일(규칙 객체 리스트) 로드, 경로가 없으면 기본 규칙"""
+    path = settings.ALERT_RULES_FILE if path is None else path
+    if not path:
+        return list(DEFAULT_ALERT_RULES)
+    with open(path, "r", encoding="utf-8") as f:
+        items = json.load(f)
+    rules = [AlertRule(**item) for item in items]
+    names = [rule.name for rule in rules]
+    if len(names) != len(set(names)):
+        raise ValueError("Alert rule names must be unique")
+    return rules
+
+
+class _RuleState:
+    """(규칙, 시계열)별 평가 상태"""
+
+    __slots__ = ("pending_since", "firing", "last_seen", "window_ts", "window_values")
+
+    def __init__(self):
+        self.pending_since: Optional[int] = None  # 조건이 참이 된 시각 (epoch 밀리초)
+        self.firing = False
+        self.last_seen: Optional[int] = None  # 마지막으로 평가한 점 시각
+        self.window_ts = np.zeros(0, dtype=np.int64)  # rate 규칙 창
+        self.window_values = np.zeros(0, dtype=np.float64)
+
+
+@dataclass
+class _SeriesInfo:
+    deployment_id: str
+    metric_name: str
+    tags: Dict[str, str]
+    rules: List[AlertRule]
+    last_seen: int  # 마지막 점 시각 (복원된 시계열은 복원 시각, epoch 밀리초)
+    restored: bool = False  # DB에서 복원된 시계열 (단위를 몰라 첫 점 수신 시 규칙 재매칭)
+
+
+class AlertEngine:
+    """
+    알림 규칙 증분 평가기 (스레드 안전)
+
+    Args:
+        rules: 알림 규칙
+        sink: 전이 이벤트 기록 함수 (없으면 기록하지 않음)
+        series_ttl: 이 시간(초) 동안 점이 없고 firing 알림도 없는 시계열은 tick에서 상태를 버린다
+        status_stale_seconds: 배포의 마지막 점이 이 시간(초)보다 오래되면 firing 알림이 없을 때 상태는 unknown
+    """
+
+    def __init__(
+        self,
+        rules: List[AlertRule],
+        sink: Optional[Callable[[List[AlertEvent]], None]] = None,
+        series_ttl: float = None,
+        status_stale_seconds: float = None
+    ):
+        self.rules = rules
+        self.sink = sink
+        self.series_ttl = series_ttl or settings.ALERT_SERIES_TTL
+        self.status_stale_seconds = status_stale_seconds or settings.ALERT_STATUS_STALE_SECONDS
+        self._series: Dict[SeriesRef, _SeriesInfo] = {}
+        self._states: Dict[Tuple[str, SeriesRef], _RuleState] = {}
+        # 배포 ID → {(규칙 이름, 시계열 키): firing 알림}
+        self._firing: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        # 배포 ID → 마지막 점 시각 (epoch 밀리초, 복원된 배포는 복원 시각)
+        self._last_seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ---- 평가 ----
+
+    def observe(
+        self,
+        deployment_id,
+        metric_name: str,
+        tags: Optional[Dict[str, str]],
+        unit: Optional[str],
+        timestamps: np.ndarray,
+        values: np.ndarray
+    ) -> List[AlertEvent]:
+        """
+        새 점 평가 (timestamps: epoch 밀리초 오름차순)
+
+        Returns:
+            이번 평가에서 생긴 전이 이벤트
+        """
+        deployment_id = str(deployment_id)
+        ref = (deployment_id, series_key(metric_name, tags))
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        events: List[AlertEvent] = []
+        with self._lock:
+            info = self._series.get(ref)
+            if info is None or info.restored:
+                rules = [rule for rule in self.rules if rule.matches(metric_name, unit, tags)]
+                info = self._series[ref] = _SeriesInfo(
+                    deployment_id, metric_name, dict(tags or {}), rules, last_seen=0
+                )
+                self._firing.setdefault(deployment_id, {})
+            if len(timestamps):
+                info.last_seen = max(info.last_seen, int(timestamps[-1]))
+                self._last_seen[deployment_id] = max(self._last_seen.get(deployment_id, 0), info.last_seen)
+            for rule in info.rules:
+                state = self._states.get((rule.name, ref))
+                if state is None:
+                    state = self._states[(rule.name, ref)] = _RuleState()
+                # 이미 평가한 시각 이전 점은 무시 (늦게 도착한 점)
+                fresh = timestamps > state.last_seen if state.last_seen is not None else slice(None)
+                ts, vals = timestamps[fresh], values[fresh]
+                if len(ts) == 0:
+                    continue
+                if rule.type == "threshold":
+                    events.extend(self._apply(rule, ref, info, state, ts, vals, _OPS[rule.op](vals, rule.threshold)))
+                elif rule.type == "rate":
+                    rates = self._rates(rule, state, ts, vals)
+                    condition = _OPS[rule.op](np.nan_to_num(rates, nan=0.0), rule.threshold) & ~np.isnan(rates)
+                    events.extend(self._apply(rule, ref, info, state, ts, rates, condition))
+                elif state.firing:  # absent: 점이 다시 들어옴
+                    events.append(self._transition(rule, ref, info, state, False, int(ts[0]), float(vals[0])))
+                state.last_seen = int(ts[-1])
+        self._emit(events)
+        return events
+
+    def _apply(
+        self,
+        rule: AlertRule,
+        ref: SeriesRef,
+        info: _SeriesInfo,
+        state: _RuleState,
+        ts: np.ndarray,
+        values: np.ndarray,
+        condition: np.ndarray
+    ) -> List[AlertEvent]:
+        """조건 배열을 구간(run) 단위로 훑어 for_seconds 경과 시 firing, 조건 해제 시 resolved"""
+        events = []
+        for_ms = int(rule.for_seconds * 1000)
+        bounds = np.flatnonzero(np.diff(condition.astype(np.int8))) + 1
+        starts = np.concatenate([[0], bounds])
+        ends = np.concatenate([bounds, [len(condition)]])
+        for start, end in zip(starts, ends):
+            if condition[start]:
+                if state.pending_since is None:
+                    state.pending_since = int(ts[start])
+                if not state.firing:
+                    ready = np.flatnonzero(ts[start:end] - state.pending_since >= for_ms)
+                    if len(ready):
+                        i = start + int(ready[0])
+                        events.append(self._transition(rule, ref, info, state, True, int(ts[i]), float(values[i])))
+            else:
+                state.pending_since = None
+                if state.firing:
+                    events.append(
+                        self._transition(rule, ref, info, state, False, int(ts[start]), float(values[start]))
+                    )
+        return events
+
+    @staticmethod
+    def _rates(rule: AlertRule, state: _RuleState, ts: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """창(window_seconds) 안 가장 오래된 점 대비 초당 변화율 (창에 점이 하나뿐이면 NaN)"""
+        window_ms = int(rule.window_seconds * 1000)
+        all_ts = np.concatenate([state.window_ts, ts])
+        all_values = np.concatenate([state.window_values, values])
+        offset = len(state.window_ts)
+        new_index = np.arange(offset, len(all_ts))
+        oldest = np.searchsorted(all_ts, all_ts[new_index] - window_ms, side="left")
+        elapsed = (all_ts[new_index] - all_ts[oldest]) / 1000.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = np.where(elapsed > 0, (all_values[new_index] - all_values[oldest]) / elapsed, np.nan)
+        keep = all_ts >= all_ts[-1] - window_ms
+        state.window_ts, state.window_values = all_ts[keep], all_values[keep]
+        return rates
+
+    def tick(self, now: Optional[datetime] = None) -> List[AlertEvent]:
+        """데이터 없음(absent) 규칙 평가 후 오래된 시계열 정리 (주기적으로 호출)"""
+        now_ms = to_millis(now or datetime.utcnow())
+        events: List[AlertEvent] = []
+        with self._lock:
+            for ref, info in self._series.items():
+                for rule in info.rules:
+                    if rule.type != "absent":
+                        continue
+                    state = self._states.get((rule.name, ref))
+                    if state is None or state.firing:
+                        continue
+                    # 복원 후 아직 점이 없는 시계열은 복원 시각부터 센다
+                    last_seen = state.last_seen if state.last_seen is not None else info.last_seen
+                    if now_ms - last_seen >= _absent_limit_ms(rule):
+                        events.append(self._transition(rule, ref, info, state, True, now_ms, None))
+            self._prune(now_ms)
+        self._emit(events)
+        return events
+
+    def _prune(self, now_ms: int) -> None:
+        """series_ttl(absent 규칙이 있으면 허용 시간과 중 긴 쪽) 동안 점이 없고 firing이 아닌 시계열 제거"""
+        ttl_ms = int(self.series_ttl * 1000)
+        stale = []
+        for ref, info in self._series.items():
+            keep_ms = max([ttl_ms] + [_absent_limit_ms(rule) for rule in info.rules if rule.type == "absent"])
+            if now_ms - info.last_seen < keep_ms:
+                continue
+            states = [self._states.get((rule.name, ref)) for rule in info.rules]
+            if any(state is not None and state.firing for state in states):
+                continue
+            stale.append(ref)
+        for ref in stale:
+            info = self._series.pop(ref)
+            for rule in info.rules:
+                self._states.pop((rule.name, ref), None)
+        # 남은 시계열도 firing 알림도 없는 배포는 상태 조회 대상에서 뺀다
+        live = {ref[0] for ref in self._series}
+        for deployment_id in {ref[0] for ref in stale} - live:
+            if not self._firing.get(deployment_id):
+                self._firing.pop(deployment_id, None)
+                self._last_seen.pop(deployment_id, None)
+        if stale:
+            logger.debug(f"알림 시계열 정리: removed={len(stale)}, remaining={len(self._series)}")
+
+    def _transition(
+        self,
+        rule: AlertRule,
+        ref: SeriesRef,
+        info: _SeriesInfo,
+        state: _RuleState,
+        firing: bool,
+        at_ms: int,
+        value: Optional[float]
+    ) -> AlertEvent:
+        state.firing = firing
+        triggered_at = from_millis(at_ms)
+        deployment_alerts = self._firing.setdefault(info.deployment_id, {})
+        if firing:
+            deployment_alerts[(rule.name, ref[1])] = {
+                "rule_name": rule.name,
+                "severity": rule.severity,
+                "metric_name": info.metric_name,
+                "tags": info.tags or None,
+                "value": value,
+                "since": triggered_at,
+            }
+        else:
+            deployment_alerts.pop((rule.name, ref[1]), None)
+        return AlertEvent(
+            deployment_id=UUID(info.deployment_id),
+            rule_name=rule.name,
+            severity=rule.severity,
+            state="firing" if firing else "resolved",
+            metric_name=info.metric_name,
+            series_key=ref[1],
+            tags=info.tags or None,
+            value=value,
+            triggered_at=triggered_at,
+        )
+
+    def _emit(self, events: List[AlertEvent]) -> None:
+        if not events:
+            return
+        for event in events:
+            logger.info(
+                f"알림 {event.state}: deployment_id={event.deployment_id}, rule={event.rule_name}, "
+                f"metric={event.metric_name}, value={event.value}"
+            )
+        if self.sink is not None:
+            try:
+                self.sink(events)
+            except Exception as e:
+                logger.error(f"알림 이벤트 기록 실패: count={len(events)}, error={str(e)}", exc_info=True)
+
+    # ---- 조회 ----
+
+    def status(self, deployment_id, now: Optional[datetime] = None) -> Optional[str]:
+        """
+        배포 헬스 상태 (firing 알림 중 가장 높은 심각도, 평가한 적 없는 배포는 None)
+
+        firing 알림이 없는데 마지막 점이 status_stale_seconds보다 오래됐으면 unknown
+        (에이전트가 전송을 멈춘 배포를 시계열 정리 전까지 healthy로 보이지 않게)
+        """
+        deployment_id = str(deployment_id)
+        alerts = self._firing.get(deployment_id)
+        if alerts is None:
+            return None
+        rank = max((SEVERITY_RANK[alert["severity"]] for alert in list(alerts.values())), default=0)
+        if rank == 0:
+            now_ms = to_millis(now or datetime.utcnow())
+            if now_ms - self._last_seen.get(deployment_id, 0) > self.status_stale_seconds * 1000:
+                return STATUS_UNKNOWN
+        return STATUS_BY_RANK[rank]
+
+    def active_alerts(self, deployment_id) -> List[Dict[str, Any]]:
+        """배포의 firing 알림 목록"""
+        return [dict(alert) for alert in list(self._firing.get(str(deployment_id), {}).values())]
+
+    def restore(self, events: List[AlertEvent], now: Optional[datetime] = None) -> None:
+        """
+        기록된 firing 상태 복원 (애플리케이션 시작 시, 규칙이 바뀌어 없어진 규칙은 무시)
+
+        복원된 시계열에는 단위 조건이 없는 absent 규칙도 붙여 복원 시각부터 데이터 없음을 센다.
+        """
+        rules = {rule.name: rule for rule in self.rules}
+        now_ms = to_millis(now or datetime.utcnow())
+        with self._lock:
+            for event in events:
+                rule = rules.get(event.rule_name)
+                if rule is None:
+                    continue
+                deployment_id = str(event.deployment_id)
+                ref = (deployment_id, event.series_key)
+                info = self._series.get(ref)
+                if info is None:
+                    absent = [
+                        r for r in self.rules
+                        if r.type == "absent" and r.unit is None and r.matches(event.metric_name, None, event.tags)
+                    ]
+                    info = self._series[ref] = _SeriesInfo(
+                        deployment_id, event.metric_name, dict(event.tags or {}), absent,
+                        last_seen=now_ms, restored=True
+                    )
+                    for r in absent:
+                        self._states.setdefault((r.name, ref), _RuleState())
+                if info.restored and rule not in info.rules:
+                    info.rules.append(rule)
+                self._last_seen[deployment_id] = max(self._last_seen.get(deployment_id, 0), now_ms)
+                state = self._states.setdefault((rule.name, ref), _RuleState())
+                state.firing = True
+                state.pending_since = to_millis(event.triggered_at)
+                self._firing.setdefault(deployment_id, {})[(rule.name, event.series_key)] = {
+                    "rule_name": rule.name,
+                    "severity": rule.severity,
+                    "metric_name": event.metric_name,
+                    "tags": event.tags or None,
+                    "value": event.value,
+                    "since": event.triggered_at,
+                }
+        if events:
+            logger.info(f"알림 상태 복원: firing={len(events)}")
+
+
+def _absent_limit_ms(rule: AlertRule) -> int:
+    """absent 규칙 데이터 없음 허용 시간 (밀리초)"""
+    return int((rule.for_seconds or rule.window_seconds) * 1000)
+
+
+def persist_alert_events(events: List[AlertEvent]) -> None:
+    """전이 이벤트를 alert_events 테이블에 일괄 기록 (별도 DB 세션)"""
+    from app.db.session import SessionLocal
+    from app.repositories.implementations.alert_repository import AlertRepository
+
+    db = SessionLocal()
+    try:
+        AlertRepository(db).bulk_create(events)
+    finally:
+        db.close()
+
+
+def restore_alert_state(engine: "AlertEngine") -> None:
+    """DB에 기록된 마지막 firing 상태로 엔진 복원"""
+    from app.db.session import SessionLocal
+    from app.repositories.implementations.alert_repository import AlertRepository
+
+    db = SessionLocal()
+    try:
+        engine.restore(AlertRepository(db).get_firing())
+    finally:
+        db.close()
+
+
+_alert_engine: Optional[AlertEngine] = None
+_alert_engine_lock = threading.Lock()
+
+
+def get_alert_engine() -> Optional[AlertEngine]:
+    """프로세스 전역 알림 엔진 (ALERT_ENABLED가 False면 None)"""
+    global _alert_engine
+    if not settings.ALERT_ENABLED:
+        return None
+    if _alert_engine is None:
+        with _alert_engine_lock:
+            if _alert_engine is None:
+                _alert_engine = AlertEngine(load_alert_rules(), sink=persist_alert_events)
+    return _alert_engine
+
+
+async def run_alert_evaluator(interval: float) -> None:
+    """
+    주기적 absent 규칙 평가 (애플리케이션 시작 시 백그라운드 태스크로 실행)
+    """
+    engine = get_alert_engine()
+    if engine is None:
+        return
+    try:
+        await asyncio.to_thread(restore_alert_state, engine)
+    except Exception as e:
+        logger.error(f"알림 상태 복원 실패: {str(e)}", exc_info=True)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(engine.tick)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"알림 규칙 평가 실패: {str(e)}", exc_info=True)
@@ -0,0 +1,276 @@
+"""
+백그라운드 연결성 프로버
+
+설정된 VM/호스트 포트를 CONNECTIVITY_PROBE_INTERVAL마다 확인해 최신 결과와 짧은 이력을 메모리에 둔다.
+요청 경로(/monitoring/vm/*, 배포 전 확인)는 직접 확인하는 대신 이 결과를 읽고,
+결과가 CONNECTIVITY_PROBE_STALE_SECONDS보다 오래되면 stale로 표시한다.
+
+- 대상: 기본 VM 전체 확인(check_all), 추가 VirtualBox VM 상태, host:port TCP 연결
+- 대상마다 라운드 시작 후 무작위 지연(jitter)을 두어 수백 개 대상이 한꺼번에 몰리지 않게 하고,
+  동시 확인 수는 세마포어(CONNECTIVITY_PROBE_CONCURRENCY)로 제한한다
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.utils.vm_connectivity import VMConnectivityChecker
+
+logger = get_logger("app.utils.connectivity_prober")
+
+PROBE_KINDS = ("vm", "virtualbox", "port")
+
+
+@dataclass(frozen=True)
+class ProbeTarget:
+    """
+    확인 대상
+
+    kind:
+        vm: VM 전체 확인 (VirtualBox + Vagrant + SSH + 기본 서비스 포트)
+        virtualbox: VirtualBox VM 실행 여부
+        port: host:port TCP 연결
+    """
+    kind: str
+    name: str
+    host: Optional[str] = None
+    port: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        if self.kind == "port":
+            return f"port:{self.host}:{self.port}"
+        return f"{self.kind}:{self.name}"
+
+
+def parse_targets(vms: str = None, hosts: str = None, default_vm: Optional[str] = None) -> List[ProbeTarget]:
+    """
+    설정 → 확인 대상
+
+    Args:
+        vms: 추가 VirtualBox VM 이름 (쉼표 구분)
+        hosts: 추가 host:port (쉼표 구분)
+        default_vm: 전체 확인할 기본 VM 이름
+    """
+    vms = settings.CONNECTIVITY_PROBE_VMS if vms is None else vms
+    hosts = settings.CONNECTIVITY_PROBE_HOSTS if hosts is None else hosts
+    default_vm = default_vm or VMConnectivityChecker().vm_name
+
+    targets = [ProbeTarget("vm", default_vm)]
+    for name in filter(None, (item.strip() for item in vms.split(","))):
+        if name != default_vm:
+            targets.append(ProbeTarget("virtualbox", name))
+    for item in filter(None, (item.strip() for item in hosts.split(","))):
+        host, sep, port = item.rpartition(":")
+        if not sep or not host or not port.isdigit():
+            raise ValueError(f"Invalid probe host (host:port): {item}")
+        targets.append(ProbeTarget("port", item, host=host.strip("[]"), port=int(port)))
+    # 중복 제거 (순서 유지)
+    return list({target.key: target for target in targets}.values())
+
+
+class ConnectivityProber:
+    """
+    주기적 연결성 확인 + 결과 캐시
+
+    Args:
+        targets: 확인 대상
+        interval: 라운드 간격 (초)
+        jitter: 대상별 시작 지연 상한 (interval 대비 비율)
+        concurrency: 동시 확인 수 상한
+        history: 대상별 보관 이력 수
+        stale_seconds: 이 시간보다 오래된 결과는 stale
+    """
+
+    def __init__(
+        self,
+        targets: List[ProbeTarget],
+        interval: float = None,
+        jitter: float = None,
+        concurrency: int = None,
+        history: int = None,
+        stale_seconds: float = None
+    ):
+        self.targets = targets
+        self.interval = interval or settings.CONNECTIVITY_PROBE_INTERVAL
+        self.jitter = settings.CONNECTIVITY_PROBE_JITTER if jitter is None else jitter
+        self.concurrency = concurrency or settings.CONNECTIVITY_PROBE_CONCURRENCY
+        self.history_size = history or settings.CONNECTIVITY_PROBE_HISTORY
+        self.stale_seconds = stale_seconds or settings.CONNECTIVITY_PROBE_STALE_SECONDS
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.rounds = 0
+
+    # ---- 확인 ----
+
+    async def probe(self, target: ProbeTarget) -> Dict[str, Any]:
+        """대상 하나 확인 후 결과 기록"""
+        checker = VMConnectivityChecker(vm_name=target.name, use_cache=False)
+        started = time.monotonic()
+        try:
+            if target.kind == "vm":
+                result = await checker.check_all()
+                available = result["overall"]["available"]
+            elif target.kind == "virtualbox":
+                result = await checker.check_virtualbox_vm_status()
+                available = result.get("is_running", False)
+            else:
+                result = await checker.check_ssh_connection(
+                    target.host, target.port, timeout=settings.VM_CHECK_CONNECT_TIMEOUT
+                )
+                available = result["available"]
+            status = "up" if available else "down"
+        except Exception as e:
+            logger.error(f"연결성 확인 실패: target={target.key}, error={str(e)}", exc_info=True)
+            result, available, status = {"error": str(e)}, False, "error"
+
+        entry = {
+            "target": target.key,
+            "kind": target.kind,
+            "available": available,
+            "status": status,
+            "checked_at": datetime.utcnow(),
+            "_checked_monotonic": time.monotonic(),
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            "result": result,
+        }
+        history = self._history.get(target.key)
+        if history is None:
+            history = self._history[target.key] = deque(maxlen=self.history_size)
+        previous = history[-1] if history else None
+        history.append(entry)
+        if previous is not None and previous["status"] != status:
+            logger.info(f"연결성 변경: target={target.key}, {previous['status']} -> {status}")
+        return entry
+
+    async def _probe_with_jitter(self, target: ProbeTarget) -> None:
+        await asyncio.sleep(random.uniform(0, self.interval * self.jitter))
+        async with self._semaphore:
+            await self.probe(target)
+
+    async def run_round(self, jitter: bool = True) -> None:
+        """모든 대상 한 번씩 확인 (동시 확인 수는 세마포어로 제한)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        if jitter:
+            probes = (self._probe_with_jitter(target) for target in self.targets)
+        else:
+            probes = (self._bounded(target) for target in self.targets)
+        await asyncio.gather(*probes)
+        self.rounds += 1
+
+    async def _bounded(self, target: ProbeTarget) -> None:
+        async with self._semaphore:
+            await self.probe(target)
+
+    async def run(self) -> None:
+        """
+        주기적 확인 (애플리케이션 시작 시 백그라운드 태스크로 실행)
+
+        첫 라운드는 지연 없이 바로 실행해 시작 직후부터 결과를 제공한다.
+        """
+        jitter = False
+        while True:
+            started = time.monotonic()
+            try:
+                await self.run_round(jitter=jitter)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"연결성 확인 라운드 실패: {str(e)}", exc_info=True)
+            jitter = True
+            await asyncio.sleep(max(self.interval - (time.monotonic() - started), 0))
+
+    # ---- 조회 ----
+
+    def _view(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        age = time.monotonic() - entry["_checked_monotonic"]
+        view = {key: value for key, value in entry.items() if not key.startswith("_")}
+        view["age_seconds"] = round(age, 1)
+        view["stale"] = age > self.stale_seconds
+        return view
+
+    def latest(self, key: str) -> Optional[Dict[str, Any]]:
+        """대상의 최신 결과 (없으면 None, stale/age_seconds 포함)"""
+        history = self._history.get(key)
+        return self._view(history[-1]) if history else None
+
+    def fresh_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """stale이 아닌 최신 확인 결과 원본 (없으면 None)"""
+        latest = self.latest(key)
+        if latest is None or latest["stale"]:
+            return None
+        return latest["result"]
+
+    def history(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """대상의 최근 이력 (오래된 순, 확인 결과 원본 제외)"""
+        history = self._history.get(key)
+        if history is None:
+            return None
+        return [
+            {k: v for k, v in self._view(entry).items() if k != "result"}
+            for entry in list(history)
+        ]
+
+    def snapshot(self, include_results: bool = False) -> Dict[str, Any]:
+        """전체 대상 최신 상태 요약"""
+        targets = []
+        for target in self.targets:
+            view = self.latest(target.key)
+            if view is None:
+                view = {"target": target.key, "kind": target.kind, "available": None, "status": "pending",
+                        "checked_at": None, "age_seconds": None, "stale": True}
+            elif not include_results:
+                view.pop("result", None)
+            targets.append(view)
+        up = sum(1 for view in targets if view["status"] == "up")
+        return {
+            "interval": self.interval,
+            "rounds": self.rounds,
+            "total_count": len(targets),
+            "up_count": up,
+            "stale_count": sum(1 for view in targets if view["stale"]),
+            "targets": targets,
+        }
+
+
+_prober: Optional[ConnectivityProber] = None
+_prober_error: Optional[str] = None  # 대상 설정 오류 (한 번만 파싱하고 이후에는 프로버 없이 동작)
+_prober_lock = threading.Lock()
+
+
+def get_connectivity_prober() -> Optional[ConnectivityProber]:
+    """프로세스 전역 연결성 프로버 (CONNECTIVITY_PROBE_ENABLED가 False이거나 대상 설정이 잘못됐으면 None)"""
+    global _prober, _prober_error
+    if not settings.CONNECTIVITY_PROBE_ENABLED:
+        return None
+    if _prober is None and _prober_error is None:
+        with _prober_lock:
+            if _prober is None and _prober_error is None:
+                try:
+                    _prober = ConnectivityProber(parse_targets())
+                except ValueError as e:
+                    _prober_error = str(e)
+                    logger.error(f"연결성 프로버 대상 설정 오류, 프로버 없이 동작: {_prober_error}")
+    return _prober
+
+
+def init_connectivity_prober() -> Optional[ConnectivityProber]:
+    """
+    애플리케이션 시작 시 대상 설정 검증 및 프로버 생성
+
+    Raises:
+        ValueError: CONNECTIVITY_PROBE_HOSTS 형식 오류 (시작 실패)
+    """
+    prober = get_connectivity_prober()
+    if _prober_error is not None:
+        raise ValueError(_prober_error)
+    return prober
@@ -13,6 +13,7 @@ from uuid import UUID
 
 from app.core.logging_config import get_logger
 from app.core.config import settings
+from app.utils.connectivity_prober import get_connectivity_prober
 from app.utils.vm_connectivity import VMConnectivityChecker
 
 logger = get_logger("app.utils.deployment_executor")
@@ -53,7 +54,11 @@ class DeploymentExecutor:
             # VM 연결성 확인 (선택적)
             if check_vm_connectivity:
                 logger.info(f"배포 전 VM 연결성 확인: deployment_id={self.deployment_id}")
-                connectivity = await self.vm_checker.check_all()
+                # 백그라운드 프로버의 최신 결과가 있으면 그대로 사용 (없거나 오래됐으면 직접 확인)
+                prober = get_connectivity_prober()
+                connectivity = prober.fresh_result(f"vm:{self.vm_checker.vm_name}") if prober else None
+                if connectivity is None:
+                    connectivity = await self.vm_checker.check_all()
                 
                 if not connectivity["overall"]["available"]:
                     warning_msg = f"VM 연결성 확인 실패. 배포를 계속 진행하지만 문제가 발생할 수 있습니다.\n{connectivity}"
@@ -0,0 +1,257 @@
+"""
+메트릭 집계 엔진 (NumPy)
+
+여러 시계열을 하나의 연속 배열(CSR: values + 시계열별 시작 오프셋)로 묶어
+파이썬 루프 없이 한 번에 집계한다.
+
+- 집계: latest, mean, min, max, sum, count, pNN(백분위수, 예: p50/p95/p99), rate(초당 증가량, 카운터 리셋 보정)
+- group_by: 태그 값이 같은 시계열을 묶는다
+  - latest: 그룹 내 시계열 최신값의 평균
+  - rate: 그룹 내 시계열 rate의 합 (Prometheus sum(rate(...))와 동일)
+  - 그 밖의 집계: 그룹 내 모든 점을 합쳐서 계산
+- 임계치: 값 배열 → healthy/warning/critical 상태, 시계열별 임계치 초과 점 수/최초 초과 시각
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.metrics_store import MetricSeries
+
+AGGREGATIONS = ("latest", "mean", "min", "max", "sum", "count", "rate")
+_PERCENTILE = re.compile(r"^p(\d{1,2}(?:\.\d+)?)$")
+
+STATUS_LEVELS = np.array(["healthy", "warning", "critical"])
+
+
+def is_valid_aggregation(agg: str) -> bool:
+    return agg in AGGREGATIONS or _PERCENTILE.match(agg) is not None
+
+
+@dataclass
+class SeriesBatch:
+    """
+    여러 시계열을 연속 배열로 묶은 배치
+
+    series i의 점: timestamps[offsets[i]:offsets[i + 1]], values[offsets[i]:offsets[i + 1]]
+    """
+    names: List[str]
+    tags: List[Dict[str, str]]
+    units: List[Optional[str]]
+    timestamps: np.ndarray
+    values: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_series(cls, series: Sequence[MetricSeries]) -> "SeriesBatch":
+        lengths = np.fromiter((len(s) for s in series), dtype=np.int64, count=len(series))
+        return cls(
+            names=[s.name for s in series],
+            tags=[s.tags or {} for s in series],
+            units=[s.unit for s in series],
+            timestamps=np.concatenate([s.timestamps for s in series]) if series else np.zeros(0, dtype=np.int64),
+            values=np.concatenate([s.values for s in series]).astype(np.float64) if series else np.zeros(0),
+            offsets=np.concatenate([[0], np.cumsum(lengths)]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+
+@dataclass
+class AggregateResult:
+    """
+    집계 결과 (그룹별 한 행)
+    """
+    keys: List[Tuple[str, Dict[str, str]]]  # (메트릭 이름, 그룹 태그)
+    values: np.ndarray  # 집계 값 (점이 없으면 NaN)
+    timestamps: np.ndarray  # 그룹의 마지막 점 시각 (epoch 밀리초, 점이 없으면 -1)
+    units: List[Optional[str]] = field(default_factory=list)
+
+
+# ---- 시계열별 집계 (세그먼트 리듀스) ----
+
+def _segment_reduce(ufunc: np.ufunc, values: np.ndarray, offsets: np.ndarray, empty: float) -> np.ndarray:
+    """offsets로 나뉜 세그먼트별 reduce (빈 세그먼트는 empty)"""
+    counts = np.diff(offsets)
+    result = np.full(len(counts), empty, dtype=np.float64)
+    nonempty = counts > 0
+    if nonempty.any():
+        result[nonempty] = ufunc.reduceat(values, offsets[:-1][nonempty])
+    return result
+
+
+def _segment_percentile(values: np.ndarray, offsets: np.ndarray, q: float) -> np.ndarray:
+    """세그먼트별 백분위수 (nearest-rank)"""
+    counts = np.diff(offsets)
+    result = np.full(len(counts), np.nan)
+    nonempty = counts > 0
+    if not nonempty.any():
+        return result
+    segment_ids = np.repeat(np.arange(len(counts)), counts)
+    ordered = values[np.lexsort((values, segment_ids))]
+    rank = np.maximum(np.ceil(q / 100.0 * counts[nonempty]).astype(np.int64) - 1, 0)
+    result[nonempty] = ordered[offsets[:-1][nonempty] + rank]
+    return result
+
+
+def _segment_rate(timestamps: np.ndarray, values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """세그먼트별 초당 증가량 (카운터 리셋 시 리셋 후 값을 증가량으로 계산)"""
+    counts = np.diff(offsets)
+    result = np.full(len(counts), np.nan)
+    if len(values) < 2:
+        return result
+    deltas = np.diff(values)
+    deltas = np.where(deltas < 0, values[1:], deltas)
+    # 세그먼트 경계를 넘는 차분은 제외
+    boundary = np.zeros(len(deltas), dtype=bool)
+    inner = offsets[1:-1]
+    boundary[inner[(inner > 0) & (inner <= len(deltas))] - 1] = True
+    deltas[boundary] = 0.0
+    cumulative = np.concatenate([[0.0], np.cumsum(deltas)])
+
+    valid = counts >= 2
+    first, last = offsets[:-1][valid], offsets[1:][valid] - 1
+    increase = cumulative[last] - cumulative[first]
+    duration = (timestamps[last] - timestamps[first]) / 1000.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result[valid] = np.where(duration > 0, increase / duration, np.nan)
+    return result
+
+
+def aggregate_series(batch: SeriesBatch, agg: str) -> np.ndarray:
+    """시계열별 집계 값"""
+    values, offsets = batch.values, batch.offsets
+    counts = batch.counts
+    if agg == "latest":
+        result = np.full(len(counts), np.nan)
+        nonempty = counts > 0
+        result[nonempty] = values[offsets[1:][nonempty] - 1]
+        return result
+    if agg == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _segment_reduce(np.add, values, offsets, np.nan) / counts
+    if agg == "min":
+        return _segment_reduce(np.minimum, values, offsets, np.nan)
+    if agg == "max":
+        return _segment_reduce(np.maximum, values, offsets, np.nan)
+    if agg == "sum":
+        return _segment_reduce(np.add, values, offsets, 0.0)
+    if agg == "count":
+        return counts.astype(np.float64)
+    if agg == "rate":
+        return _segment_rate(batch.timestamps, values, offsets)
+    match = _PERCENTILE.match(agg)
+    if match:
+        return _segment_percentile(values, offsets, float(match.group(1)))
+    raise ValueError(f"Unsupported aggregation: {agg}")
+
+
+def _last_timestamps(batch: SeriesBatch) -> np.ndarray:
+    counts = batch.counts
+    result = np.full(len(counts), -1, dtype=np.int64)
+    nonempty = counts > 0
+    result[nonempty] = batch.timestamps[batch.offsets[1:][nonempty] - 1]
+    return result
+
+
+def aggregate(batch: SeriesBatch, agg: str, group_by: Optional[str] = None) -> AggregateResult:
+    """
+    집계 (group_by가 없으면 시계열별, 있으면 (메트릭 이름, 태그 값) 그룹별)
+    """
+    if not is_valid_aggregation(agg):
+        raise ValueError(f"Unsupported aggregation: {agg}")
+    last_ts = _last_timestamps(batch)
+
+    if group_by is None:
+        return AggregateResult(
+            keys=[(name, tags) for name, tags in zip(batch.names, batch.tags)],
+            values=aggregate_series(batch, agg),
+            timestamps=last_ts,
+            units=list(batch.units),
+        )
+
+    # 시계열 → 그룹 번호
+    group_index: Dict[Tuple[str, Optional[str]], int] = {}
+    series_group = np.empty(len(batch), dtype=np.int64)
+    for i, (name, tags) in enumerate(zip(batch.names, batch.tags)):
+        series_group[i] = group_index.setdefault((name, tags.get(group_by)), len(group_index))
+    n_groups = len(group_index)
+    keys = [(name, {group_by: value} if value is not None else {}) for name, value in group_index]
+    units: List[Optional[str]] = [None] * n_groups
+    for i, unit in enumerate(batch.units):
+        units[series_group[i]] = units[series_group[i]] or unit
+
+    group_ts = np.full(n_groups, -1, dtype=np.int64)
+    np.maximum.at(group_ts, series_group, last_ts)
+
+    if agg in ("latest", "rate"):
+        per_series = aggregate_series(batch, agg)
+        valid = ~np.isnan(per_series)
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups)
+        np.add.at(sums, series_group[valid], per_series[valid])
+        np.add.at(counts, series_group[valid], 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = sums / counts if agg == "latest" else np.where(counts > 0, sums, np.nan)
+        return AggregateResult(keys=keys, values=values, timestamps=group_ts, units=units)
+
+    # 점 단위 집계: 점을 그룹 순서로 재배열해 그룹을 하나의 세그먼트로 만든다
+    point_group = np.repeat(series_group, batch.counts)
+    order = np.argsort(point_group, kind="stable")
+    group_counts = np.bincount(point_group, minlength=n_groups)
+    grouped = SeriesBatch(
+        names=[name for name, _ in keys],
+        tags=[tags for _, tags in keys],
+        units=units,
+        timestamps=batch.timestamps[order],
+        values=batch.values[order],
+        offsets=np.concatenate([[0], np.cumsum(group_counts)]),
+    )
+    return AggregateResult(keys=keys, values=aggregate_series(grouped, agg), timestamps=group_ts, units=units)
+
+
+# ---- 임계치 ----
+
+def threshold_status(
+    values: np.ndarray,
+    percent_mask: Optional[np.ndarray] = None,
+    warning: float = 80.0,
+    critical: float = 95.0
+) -> np.ndarray:
+    """값별 상태 (0: healthy, 1: warning, 2: critical), percent_mask가 False인 값은 검사하지 않음"""
+    values = np.asarray(values, dtype=np.float64)
+    checked = np.ones(len(values), dtype=bool) if percent_mask is None else np.asarray(percent_mask, dtype=bool)
+    return np.select(
+        [checked & (values > critical), checked & (values > warning)],
+        [2, 1],
+        default=0,
+    )
+
+
+def overall_status(values: np.ndarray, percent_mask: Optional[np.ndarray] = None) -> str:
+    """전체 상태 (가장 심각한 값 기준)"""
+    levels = threshold_status(values, percent_mask)
+    return str(STATUS_LEVELS[levels.max()]) if len(levels) else "healthy"
+
+
+def threshold_breaches(batch: SeriesBatch, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    시계열별 임계치 초과 점 수와 최초 초과 시각 (epoch 밀리초, 없으면 -1)
+    """
+    above = batch.values > threshold
+    counts = _segment_reduce(np.add, above.astype(np.float64), batch.offsets, 0.0).astype(np.int64)
+    first = np.full(len(batch), -1, dtype=np.int64)
+    hits = np.flatnonzero(above)
+    if len(hits):
+        series_of_hit = np.searchsorted(batch.offsets, hits, side="right") - 1
+        unique_series, first_hit = np.unique(series_of_hit, return_index=True)
+        first[unique_series] = batch.timestamps[hits[first_hit]]
+    return counts, first
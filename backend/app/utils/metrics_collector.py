@@ -4,11 +4,20 @@
 배포된 인프라의 메트릭을 수집하는 유틸리티
 """
 import asyncio
+import json
+import math
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from uuid import UUID
 
+import numpy as np
+
+from app.core.config import settings
 from app.core.logging_config import get_logger
+from app.utils.alert_engine import get_alert_engine
+from app.utils.metrics_aggregation import SeriesBatch, aggregate, overall_status
+from app.utils.metrics_store import MetricSeries, MetricsStore, from_millis, get_metrics_store, to_millis
+from app.utils.prometheus_client import PrometheusClient, build_selector, get_prometheus_client
 
 logger = get_logger("app.utils.metrics_collector")
 
@@ -19,10 +28,92 @@ class MetricsCollector:
     
     - 배포된 인프라의 메트릭 수집
     - CPU, 메모리, 네트워크, 디스크 등
+    - 수집된 점은 메트릭 시계열 저장소(MetricsStore)에 저장하고 범위 조회로 읽는다
+    - METRICS_SOURCE=prometheus이면 Prometheus HTTP API에서 읽는다
+      (배포 레이블 셀렉터 하나로 배포의 모든 시계열을 한 번에 조회)
     """
     
-    def __init__(self, deployment_id: UUID):
+    def __init__(
+        self,
+        deployment_id: UUID,
+        store: Optional[MetricsStore] = None,
+        prometheus: Optional[PrometheusClient] = None
+    ):
         self.deployment_id = deployment_id
+        self.store = store or get_metrics_store()
+        if prometheus is None and settings.METRICS_SOURCE == "prometheus":
+            prometheus = get_prometheus_client()
+        self.prometheus = prometheus
+    
+    def record(self, metrics: List[Dict[str, Any]]) -> int:
+        """
+        메트릭 점 저장
+        
+        Args:
+            metrics: [{"name", "value", "timestamp", "unit"?, "tags"?}, ...]
+            
+        Returns:
+            저장한 점 수
+        """
+        by_series: Dict[tuple, List[Dict[str, Any]]] = {}
+        for metric in metrics:
+            key = (metric["name"], json.dumps(metric.get("tags") or {}, sort_keys=True))
+            by_series.setdefault(key, []).append(metric)
+        
+        count = 0
+        alerts = get_alert_engine()
+        for (name, _), points in by_series.items():
+            count += self.store.append(
+                self.deployment_id,
+                name,
+                [p["timestamp"] for p in points],
+                [p["value"] for p in points],
+                unit=points[-1].get("unit"),
+                tags=points[-1].get("tags"),
+            )
+            if alerts is not None:
+                points = sorted(points, key=lambda p: p["timestamp"])
+                alerts.observe(
+                    self.deployment_id,
+                    name,
+                    points[-1].get("tags"),
+                    points[-1].get("unit"),
+                    np.array([to_millis(p["timestamp"]) for p in points], dtype=np.int64),
+                    np.array([p["value"] for p in points], dtype=np.float64),
+                )
+        return count
+    
+    def _read_store_series(
+        self,
+        metric_name: Optional[str],
+        start_time: datetime,
+        end_time: datetime,
+        step: Optional[int] = None,
+        max_points: Optional[int] = None
+    ) -> List[MetricSeries]:
+        """
+        저장소 시계열 조회 (스레드에서 호출)
+        
+        step/max_points가 있으면 롤업/다운샘플링 조회(query), 아니면 원본 점(read_range)
+        """
+        series = []
+        for name, tags in self.store.list_series(self.deployment_id, metric_name):
+            if step or max_points:
+                series.append(self.store.query(
+                    self.deployment_id, name, start_time, end_time, step=step, max_points=max_points, tags=tags
+                ))
+            else:
+                series.append(self.store.read_range(self.deployment_id, name, start_time, end_time, tags=tags))
+        return series
+    
+    def _read_store_latest(self, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        """저장소 시계열별 최신 점 (스레드에서 호출)"""
+        latest = []
+        for name, tags in self.store.list_series(self.deployment_id):
+            point = self.store.latest(self.deployment_id, name, before=end_time, tags=tags)
+            if point is not None and point["timestamp"] >= start_time:
+                latest.append(point)
+        return latest
     
     async def collect_metrics(
         self,
@@ -44,13 +135,18 @@ class MetricsCollector:
         if not start_time:
             start_time = end_time - timedelta(hours=1)
         
-        # TODO: 실제 메트릭 수집 로직
-        # - Prometheus 쿼리
-        # - CloudWatch 메트릭
-        # - 직접 모니터링 에이전트 연동
+        metrics = []
+        if self.prometheus is not None:
+            for series in await self._prometheus_series(None, start_time, end_time):
+                metrics.extend(series.to_points())
+        else:
+            # 저장소 읽기는 수집 flush와 같은 잠금을 쓰므로 이벤트 루프 밖에서 수행
+            for series in await asyncio.to_thread(self._read_store_series, None, start_time, end_time):
+                metrics.extend(series.to_points())
         
-        # 임시 메트릭 데이터 생성
-        metrics = await self._generate_mock_metrics(start_time, end_time)
+        # 저장된 메트릭이 없으면 임시 메트릭 데이터 생성 (METRICS_MOCK_FALLBACK)
+        if not metrics and settings.METRICS_MOCK_FALLBACK:
+            metrics = await self._generate_mock_metrics(start_time, end_time)
         
         logger.info(
             f"메트릭 수집 완료: deployment_id={self.deployment_id}, "
@@ -59,11 +155,132 @@ class MetricsCollector:
         
         return metrics
     
+    async def collect_latest_metrics(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        mock_fallback: Optional[bool] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        시계열별 최신 점 조회 (end_time 이전 마지막 점, start_time 이후인 것만)
+        
+        범위 전체를 읽지 않고 시계열별로 마지막 파티션만 이진 탐색한다.
+        mock_fallback: 결과가 없을 때 임시 데이터 생성 여부 (기본값: METRICS_MOCK_FALLBACK)
+        """
+        if not end_time:
+            end_time = datetime.utcnow()
+        if not start_time:
+            start_time = end_time - timedelta(hours=1)
+        
+        latest = []
+        if self.prometheus is not None:
+            latest = [p for p in await self._prometheus_latest(end_time) if p["timestamp"] >= start_time]
+        else:
+            latest = await asyncio.to_thread(self._read_store_latest, start_time, end_time)
+        
+        if mock_fallback is None:
+            mock_fallback = settings.METRICS_MOCK_FALLBACK
+        if not latest and mock_fallback:
+            latest = [
+                series.to_points()[-1]
+                for series in self._points_to_series(await self._generate_mock_metrics(start_time, end_time))
+                if len(series)
+            ]
+        
+        return latest
+    
+    async def collect_series(
+        self,
+        metric_name: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        step: Optional[int] = None,
+        max_points: Optional[int] = None,
+        mock_fallback: Optional[bool] = None
+    ) -> List[MetricSeries]:
+        """
+        시계열 단위 조회 (집계 입력용)
+        
+        Args:
+            metric_name: 메트릭 이름 (없으면 배포의 모든 메트릭)
+            step, max_points: 지정하면 롤업/다운샘플링 조회 (collect_metric_by_name과 동일)
+            mock_fallback: 결과가 없을 때 임시 데이터 생성 여부 (기본값: METRICS_MOCK_FALLBACK)
+            
+        Returns:
+            (메트릭 이름, 태그) 조합별 MetricSeries 리스트
+        """
+        if not end_time:
+            end_time = datetime.utcnow()
+        if not start_time:
+            start_time = end_time - timedelta(hours=1)
+        
+        if self.prometheus is not None:
+            candidates = await self._prometheus_series(metric_name, start_time, end_time, step, max_points)
+        else:
+            candidates = await asyncio.to_thread(
+                self._read_store_series, metric_name, start_time, end_time, step, max_points
+            )
+        series = [item for item in candidates if len(item)]
+        
+        if mock_fallback is None:
+            mock_fallback = settings.METRICS_MOCK_FALLBACK
+        if not series and mock_fallback:
+            if metric_name:
+                points = await self._generate_mock_metric_series(metric_name, start_time, end_time)
+            else:
+                points = await self._generate_mock_metrics(start_time, end_time)
+            series = self._points_to_series(points)
+        
+        return series
+    
+    async def collect_aggregated(
+        self,
+        agg: str,
+        group_by: Optional[str] = None,
+        metric_name: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        시계열 집계 (NumPy 배치 연산)
+        
+        Args:
+            agg: 집계 (latest, mean, min, max, sum, count, rate, pNN)
+            group_by: 묶을 태그 키 (없으면 시계열별)
+            metric_name: 메트릭 이름 (없으면 배포의 모든 메트릭)
+            
+        Returns:
+            그룹별 집계 점 리스트 (timestamp는 그룹의 마지막 점 시각)
+        """
+        series = await self.collect_series(metric_name, start_time, end_time)
+        result = aggregate(SeriesBatch.from_series(series), agg, group_by)
+        
+        metrics = []
+        for (name, tags), value, ts, unit in zip(result.keys, result.values, result.timestamps, result.units):
+            if np.isnan(value) or ts < 0:
+                continue
+            metrics.append({
+                "name": name,
+                "value": float(value),
+                "unit": "per_second" if agg == "rate" else unit,
+                "timestamp": from_millis(ts),
+                "tags": tags or None,
+            })
+        
+        logger.info(
+            f"메트릭 집계 완료: deployment_id={self.deployment_id}, agg={agg}, "
+            f"group_by={group_by}, series={len(series)}, groups={len(metrics)}"
+        )
+        
+        return metrics
+    
     async def collect_metric_by_name(
         self,
         metric_name: str,
         start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None,
+        step: Optional[int] = None,
+        max_points: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         특정 메트릭 수집
@@ -72,6 +289,8 @@ class MetricsCollector:
             metric_name: 메트릭 이름 (예: cpu_usage, memory_usage)
             start_time: 시작 시간
             end_time: 종료 시간
+            step: 점 간격 (초, 지정하면 해당 해상도의 롤업 평균)
+            max_points: 최대 점 수 (초과하면 더 거친 롤업 또는 LTTB 다운샘플링)
             
         Returns:
             메트릭 시계열 데이터
@@ -81,14 +300,27 @@ class MetricsCollector:
         if not start_time:
             start_time = end_time - timedelta(hours=1)
         
-        # TODO: 실제 메트릭 수집 로직
+        metrics = []
+        if self.prometheus is not None:
+            for series in await self._prometheus_series(metric_name, start_time, end_time, step, max_points):
+                metrics.extend(series.to_points())
+        else:
+            for series in await asyncio.to_thread(
+                self._read_store_series, metric_name, start_time, end_time, step, max_points
+            ):
+                metrics.extend(series.to_points())
         
-        # 임시 메트릭 데이터 생성
-        metrics = await self._generate_mock_metric_series(
-            metric_name,
-            start_time,
-            end_time
-        )
+        # 저장된 메트릭이 없으면 임시 메트릭 데이터 생성 (METRICS_MOCK_FALLBACK)
+        if not metrics and settings.METRICS_MOCK_FALLBACK:
+            interval = timedelta(seconds=step) if step else timedelta(minutes=5)
+            if max_points:
+                interval = max(interval, (end_time - start_time) / max_points)
+            metrics = await self._generate_mock_metric_series(
+                metric_name,
+                start_time,
+                end_time,
+                interval
+            )
         
         logger.info(
             f"메트릭 수집 완료: deployment_id={self.deployment_id}, "
@@ -106,9 +338,14 @@ class MetricsCollector:
         """
         # TODO: 실제 헬스 체크 로직
         # - 서비스 엔드포인트 확인
-        # - 리소스 사용률 확인
         # - 에러율 확인
         
+        # 리소스 사용률: 퍼센트 메트릭의 최신 값 (같은 이름의 시계열이 여러 개면 가장 높은 값)
+        resources: Dict[str, float] = {}
+        for metric in await self.collect_latest_metrics():
+            if metric.get("unit") == "percent":
+                resources[metric["name"]] = max(resources.get(metric["name"], metric["value"]), metric["value"])
+        
         # 임시 헬스 상태
         status = {
             "status": "healthy",
@@ -117,11 +354,7 @@ class MetricsCollector:
                 "database": "healthy",
                 "cache": "healthy"
             },
-            "resources": {
-                "cpu_usage": 45.2,
-                "memory_usage": 62.8,
-                "disk_usage": 38.5
-            },
+            "resources": resources,
             "errors": {
                 "count": 0,
                 "rate": 0.0
@@ -129,16 +362,81 @@ class MetricsCollector:
             "timestamp": datetime.utcnow()
         }
         
-        # 상태 판단
-        if any(v > 80 for k, v in status["resources"].items() if "usage" in k):
-            status["status"] = "warning"
-        if any(v > 95 for k, v in status["resources"].items() if "usage" in k):
-            status["status"] = "critical"
+        # 상태 판단: 알림 엔진이 평가한 배포면 미리 계산된 상태, 아니면 최신 값으로 계산
+        alerts = get_alert_engine()
+        alert_status = alerts.status(self.deployment_id) if alerts is not None else None
+        if alert_status is not None:
+            status["status"] = alert_status
+            status["alerts"] = alerts.active_alerts(self.deployment_id)
+        else:
+            status["status"] = overall_status(np.array(list(resources.values()), dtype=np.float64))
         
         logger.info(f"헬스 상태 조회: deployment_id={self.deployment_id}, status={status['status']}")
         
         return status
     
+    def _prometheus_selector(self, metric_name: Optional[str] = None) -> str:
+        labels = {settings.PROMETHEUS_DEPLOYMENT_LABEL: str(self.deployment_id)}
+        return build_selector(labels, [metric_name] if metric_name else None)
+    
+    async def _prometheus_series(
+        self,
+        metric_name: Optional[str],
+        start_time: datetime,
+        end_time: datetime,
+        step: Optional[int] = None,
+        max_points: Optional[int] = None
+    ) -> List[MetricSeries]:
+        """
+        Prometheus 범위 조회 (배포 전체 또는 메트릭 하나를 한 번의 요청으로)
+        
+        step이 없으면 범위/max_points(기본값: METRICS_MAX_POINTS)로 정하고 PROMETHEUS_MIN_STEP보다 작게 하지 않는다.
+        """
+        if not step:
+            span = max((end_time - start_time).total_seconds(), 1)
+            step = max(math.ceil(span / (max_points or settings.METRICS_MAX_POINTS)), settings.PROMETHEUS_MIN_STEP)
+        try:
+            return await self.prometheus.query_range(
+                self._prometheus_selector(metric_name),
+                start_time,
+                end_time,
+                step,
+                drop_labels=(settings.PROMETHEUS_DEPLOYMENT_LABEL,),
+            )
+        except Exception as e:
+            logger.warning(f"Prometheus 범위 조회 실패: deployment_id={self.deployment_id}, error={str(e)}")
+            return []
+    
+    async def _prometheus_latest(self, end_time: datetime) -> List[Dict[str, Any]]:
+        """Prometheus 즉시 조회 (배포의 시계열별 최신 점, 한 번의 요청)"""
+        try:
+            return await self.prometheus.query(
+                self._prometheus_selector(),
+                end_time,
+                drop_labels=(settings.PROMETHEUS_DEPLOYMENT_LABEL,),
+            )
+        except Exception as e:
+            logger.warning(f"Prometheus 즉시 조회 실패: deployment_id={self.deployment_id}, error={str(e)}")
+            return []
+    
+    @staticmethod
+    def _points_to_series(points: List[Dict[str, Any]]) -> List[MetricSeries]:
+        """점 리스트 → (메트릭 이름, 태그)별 MetricSeries"""
+        grouped: Dict[tuple, List[Dict[str, Any]]] = {}
+        for point in points:
+            key = (point["name"], json.dumps(point.get("tags") or {}, sort_keys=True))
+            grouped.setdefault(key, []).append(point)
+        return [
+            MetricSeries(
+                name=name,
+                timestamps=np.array([to_millis(p["timestamp"]) for p in items], dtype=np.int64),
+                values=np.array([p["value"] for p in items], dtype=np.float64),
+                unit=items[-1].get("unit"),
+                tags=items[-1].get("tags") or {},
+            )
+            for (name, _), items in grouped.items()
+        ]
+    
     async def _generate_mock_metrics(
         self,
         start_time: datetime,
@@ -188,7 +486,8 @@ class MetricsCollector:
         self,
         metric_name: str,
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        interval: timedelta = timedelta(minutes=5)
     ) -> List[Dict[str, Any]]:
         """특정 메트릭의 시계열 데이터 생성"""
         metrics = []
@@ -211,7 +510,7 @@ class MetricsCollector:
         elif metric_name == "disk_usage":
             base_value = 40.0
         
-        # 5분 간격으로 메트릭 생성
+        # interval(기본 5분) 간격으로 메트릭 생성
         while current_time <= end_time:
             metrics.append({
                 "name": metric_name,
@@ -220,7 +519,7 @@ class MetricsCollector:
                 "timestamp": current_time,
                 "tags": {"resource": "web-server-1"}
             })
-            current_time += timedelta(minutes=5)
+            current_time += interval
         
         return metrics
 
@@ -0,0 +1,385 @@
+"""
+메트릭 push 수집 (에이전트 → POST /monitoring/ingest)
+
+- 입력 형식
+  - line protocol (text/plain): measurement,tag=v field=value timestamp
+    - deployment_id 태그(또는 쿼리 파라미터)로 배포 구분, unit 태그는 시계열 단위 (예: percent)
+    - 문자열 필드 값("...") 안의 공백/쉼표는 구분자로 보지 않는다
+    - 필드 이름이 value면 메트릭 이름은 measurement, 아니면 measurement_field
+    - 정수(1i)/실수 필드만 저장, 문자열/불리언 필드는 무시
+  - compact JSON (application/json): 시계열별 [[epoch 밀리초, 값], ...]
+  - 타임스탬프는 2000-01-01 ~ 2100-01-01, 값은 유한한 수만 허용 (그 외는 ValueError → 400)
+- 요청은 메모리 버퍼에 쌓기만 하고, 백그라운드 플러셔가 시계열별로 묶어 저장소에 한 번에 기록
+- (시계열, 타임스탬프) 중복 제거: 버퍼 안에서는 마지막 값, 직전 기록분과 같은 타임스탬프는 버림 (에이전트 재전송)
+  직전 기록분은 최근 METRICS_INGEST_RECENT_SERIES개 시계열만 METRICS_INGEST_RECENT_TTL 동안 기억한다
+- 버퍼가 METRICS_INGEST_BUFFER_MAX_POINTS를 넘으면 요청을 거절 (IngestBufferFull → 429)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.utils.alert_engine import get_alert_engine
+from app.utils.metrics_store import MetricsStore, get_metrics_store
+
+logger = get_logger("app.utils.metrics_ingest")
+
+# (배포 ID, 메트릭 이름, 태그 JSON)
+SeriesKey = Tuple[str, str, str]
+
+_DEPLOYMENT_TAG = "deployment_id"
+_UNIT_TAG = "unit"
+_PRECISION_TO_MS = {"ns": 1e-6, "us": 1e-3, "ms": 1.0, "s": 1000.0}
+# 허용 타임스탬프 범위 (epoch 밀리초, 2000-01-01 ~ 2100-01-01): 단위 착오/NaN 변환값이 엉뚱한 파티션에 쓰이지 않도록
+_MIN_TIMESTAMP_MS = 946_684_800_000
+_MAX_TIMESTAMP_MS = 4_102_444_800_000
+# 직전 기록분 중복 검사에 남겨 둘 시계열별 타임스탬프 수
+_RECENT_TIMESTAMPS = 1024
+# 이스케이프되지 않은 구분자 기준 분리 (measurement/태그 부분, 따옴표는 일반 문자)
+_UNESCAPED_SPACE = re.compile(r"(?<!\\) ")
+_UNESCAPED_COMMA = re.compile(r"(?<!\\),")
+_UNESCAPED_EQUALS = re.compile(r"(?<!\\)=")
+_ESCAPE = re.compile(r"\\([ ,=\"\\])")
+
+
+class IngestBufferFull(RuntimeError):
+    """수집 버퍼가 가득 참 (클라이언트는 잠시 후 재시도)"""
+
+
+def _unescape(text: str) -> str:
+    return _ESCAPE.sub(r"\1", text)
+
+
+def _split_fields(text: str, separator: str) -> List[str]:
+    """필드/타임스탬프 부분을 separator로 분리 (이스케이프된 문자와 큰따옴표 문자열 안은 제외)"""
+    parts = []
+    start = 0
+    quoted = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == '"':
+            quoted = not quoted
+        elif char == separator and not quoted:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+    if quoted:
+        raise ValueError("unterminated string field value")
+    parts.append(text[start:])
+    return parts
+
+
+@lru_cache(maxsize=4096)
+def _normalize_deployment_id(deployment_id: str) -> str:
+    """배포 ID를 조회 API와 같은 UUID 문자열 형식으로 (잘못된 형식이면 ValueError)"""
+    try:
+        return str(UUID(str(deployment_id)))
+    except ValueError:
+        raise ValueError(f"invalid deployment_id: {deployment_id}")
+
+
+class IngestBatch:
+    """
+    시계열별로 묶은 수신 점
+    """
+
+    def __init__(self):
+        self.series: Dict[SeriesKey, Tuple[List[int], List[float]]] = {}
+        self.units: Dict[SeriesKey, str] = {}
+        self.point_count = 0
+
+    def add_many(
+        self,
+        deployment_id: str,
+        name: str,
+        tags: Optional[Dict[str, str]],
+        timestamps: List[int],
+        values: List[float],
+        unit: Optional[str] = None
+    ) -> None:
+        key = (_normalize_deployment_id(str(deployment_id)), name, json.dumps(tags or {}, sort_keys=True))
+        columns = self.series.get(key)
+        if columns is None:
+            columns = self.series[key] = ([], [])
+        columns[0].extend(timestamps)
+        columns[1].extend(values)
+        if unit:
+            self.units[key] = unit
+        self.point_count += len(timestamps)
+
+    @property
+    def deployment_ids(self) -> List[str]:
+        """배치에 포함된 배포 ID (정규화된 UUID 문자열)"""
+        return sorted({key[0] for key in self.series})
+
+
+def parse_line_protocol(
+    body: str,
+    deployment_id: Optional[str] = None,
+    precision: str = "ns",
+    now_ms: Optional[int] = None
+) -> IngestBatch:
+    """
+    line protocol 파싱
+
+    Raises:
+        ValueError: 형식 오류 (줄 번호 포함) 또는 배포 ID 없음
+    """
+    scale = _PRECISION_TO_MS.get(precision)
+    if scale is None:
+        raise ValueError(f"Unsupported precision: {precision} (ns, us, ms, s)")
+    now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+
+    batch = IngestBatch()
+    for line_number, line in enumerate(body.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        head = _UNESCAPED_SPACE.split(line, maxsplit=1)
+        try:
+            parts = head[:1] + (_split_fields(head[1], " ") if len(head) == 2 else [])
+        except ValueError as e:
+            raise ValueError(f"line {line_number}: {e}")
+        if len(parts) not in (2, 3):
+            raise ValueError(f"line {line_number}: expected 'measurement[,tags] fields [timestamp]'")
+        series_part, fields_part = parts[0], parts[1]
+
+        series_items = _UNESCAPED_COMMA.split(series_part)
+        measurement = _unescape(series_items[0])
+        tags = {}
+        for item in series_items[1:]:
+            pair = _UNESCAPED_EQUALS.split(item, maxsplit=1)
+            if len(pair) != 2:
+                raise ValueError(f"line {line_number}: invalid tag '{item}'")
+            tags[_unescape(pair[0])] = _unescape(pair[1])
+        series_deployment = tags.pop(_DEPLOYMENT_TAG, None) or deployment_id
+        unit = tags.pop(_UNIT_TAG, None)
+        if not series_deployment:
+            raise ValueError(f"line {line_number}: missing '{_DEPLOYMENT_TAG}' tag")
+
+        try:
+            ts = int(round(int(parts[2]) * scale)) if len(parts) == 3 else now_ms
+        except ValueError:
+            raise ValueError(f"line {line_number}: invalid timestamp '{parts[2]}'")
+        if not _MIN_TIMESTAMP_MS <= ts <= _MAX_TIMESTAMP_MS:
+            raise ValueError(f"line {line_number}: timestamp out of range '{parts[2]}' (precision={precision})")
+
+        for field in _split_fields(fields_part, ","):
+            pair = _UNESCAPED_EQUALS.split(field, maxsplit=1)
+            if len(pair) != 2:
+                raise ValueError(f"line {line_number}: invalid field '{field}'")
+            key, raw = _unescape(pair[0]), pair[1]
+            if raw.startswith('"') or raw in ("t", "T", "true", "True", "TRUE", "f", "F", "false", "False", "FALSE"):
+                continue
+            try:
+                value = float(raw[:-1]) if raw[-1:] in ("i", "u") else float(raw)
+            except ValueError:
+                raise ValueError(f"line {line_number}: invalid field value '{raw}'")
+            if not np.isfinite(value):
+                raise ValueError(f"line {line_number}: non-finite field value '{raw}'")
+            name = measurement if key == "value" else f"{measurement}_{key}"
+            batch.add_many(series_deployment, name, tags, [ts], [value], unit=unit)
+    return batch
+
+
+def parse_json_batch(payload: Any, deployment_id: Optional[str] = None) -> IngestBatch:
+    """
+    compact JSON 파싱
+
+    {"deployment_id": "...", "series": [{"name": "cpu_usage", "tags": {...}, "unit": "percent",
+                                         "points": [[epoch 밀리초, 값], ...]}, ...]}
+    시계열마다 deployment_id를 따로 줄 수도 있다.
+
+    Raises:
+        ValueError: 형식 오류 또는 배포 ID 없음
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("series"), list):
+        raise ValueError("expected an object with a 'series' list")
+    default_deployment = payload.get("deployment_id") or deployment_id
+
+    batch = IngestBatch()
+    for index, item in enumerate(payload["series"]):
+        if not isinstance(item, dict) or not item.get("name"):
+            raise ValueError(f"series[{index}]: 'name' is required")
+        series_deployment = item.get("deployment_id") or default_deployment
+        if not series_deployment:
+            raise ValueError(f"series[{index}]: missing deployment_id")
+        tags = item.get("tags") or {}
+        if not isinstance(tags, dict):
+            raise ValueError(f"series[{index}]: 'tags' must be an object")
+        try:
+            points = np.asarray(item.get("points") or [], dtype=np.float64).reshape(-1, 2)
+        except (TypeError, ValueError):
+            raise ValueError(f"series[{index}]: 'points' must be [[timestamp_ms, value], ...]")
+        # null은 NaN이 되고 NaN을 int64로 바꾸면 INT64_MIN이 되므로 변환 전에 검사
+        if not np.isfinite(points).all():
+            raise ValueError(f"series[{index}]: 'points' must contain finite numbers only")
+        if len(points) and (points[:, 0].min() < _MIN_TIMESTAMP_MS or points[:, 0].max() > _MAX_TIMESTAMP_MS):
+            raise ValueError(f"series[{index}]: timestamp out of range (expected epoch milliseconds)")
+        batch.add_many(
+            series_deployment,
+            str(item["name"]),
+            {str(k): str(v) for k, v in tags.items()},
+            points[:, 0].astype(np.int64).tolist(),
+            points[:, 1].tolist(),
+            unit=item.get("unit"),
+        )
+    return batch
+
+
+class MetricsIngestBuffer:
+    """
+    수집 점 메모리 버퍼 (스레드 안전)
+
+    Args:
+        store: 기록할 메트릭 저장소
+        max_points: 버퍼 최대 점 수 (초과 시 IngestBufferFull)
+        flush_points: 이 점 수 이상이면 즉시 플러시 요청
+    """
+
+    def __init__(self, store: Optional[MetricsStore] = None, max_points: int = None, flush_points: int = None):
+        self.store = store or get_metrics_store()
+        self.max_points = max_points or settings.METRICS_INGEST_BUFFER_MAX_POINTS
+        self.flush_points = flush_points or settings.METRICS_INGEST_FLUSH_POINTS
+        self._pending: Dict[SeriesKey, Tuple[List[int], List[float]]] = {}
+        self._units: Dict[SeriesKey, str] = {}
+        self._pending_points = 0
+        # 시계열별 직전 기록 타임스탬프 (오래 쓰이지 않은 시계열은 LRU/TTL로 버림)
+        self._recent = LRUCache(max_size=settings.METRICS_INGEST_RECENT_SERIES, ttl=settings.METRICS_INGEST_RECENT_TTL)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self.stats = {"received": 0, "written": 0, "duplicates": 0, "rejected": 0, "failed": 0}
+
+    @property
+    def pending_points(self) -> int:
+        return self._pending_points
+
+    def offer(self, batch: IngestBatch) -> int:
+        """
+        버퍼에 추가 (요청 단위로 전부 받거나 전부 거절)
+
+        Returns:
+            추가한 점 수
+
+        Raises:
+            IngestBufferFull: 버퍼 여유가 없음
+        """
+        with self._lock:
+            if self._pending_points + batch.point_count > self.max_points:
+                self.stats["rejected"] += batch.point_count
+                raise IngestBufferFull(
+                    f"ingest buffer full: pending={self._pending_points}, max={self.max_points}"
+                )
+            for key, (timestamps, values) in batch.series.items():
+                columns = self._pending.get(key)
+                if columns is None:
+                    self._pending[key] = (list(timestamps), list(values))
+                else:
+                    columns[0].extend(timestamps)
+                    columns[1].extend(values)
+            self._units.update(batch.units)
+            self._pending_points += batch.point_count
+            self.stats["received"] += batch.point_count
+            full = self._pending_points >= self.flush_points
+        if full and self._wakeup is not None:
+            self._wakeup.set()
+        return batch.point_count
+
+    def flush(self) -> int:
+        """
+        버퍼를 저장소에 기록 (시계열별 한 번의 append)
+
+        Returns:
+            기록한 점 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                units, self._units = self._units, {}
+                self._pending_points = 0
+            if not pending:
+                return 0
+
+            written = duplicates = 0
+            alerts = get_alert_engine()
+            for key, (timestamps, values) in pending.items():
+                deployment_id, name, tags_json = key
+                ts = np.asarray(timestamps, dtype=np.int64)
+                vals = np.asarray(values, dtype=np.float64)
+                # 같은 타임스탬프는 마지막 값만 (역순에서 첫 등장 = 원래 순서의 마지막)
+                unique_ts, reverse_index = np.unique(ts[::-1], return_index=True)
+                keep = len(ts) - 1 - reverse_index
+                ts, vals = unique_ts, vals[keep]
+                recent = self._recent.get(key)
+                if recent is not None:
+                    fresh = ~np.isin(ts, recent)
+                    ts, vals = ts[fresh], vals[fresh]
+                duplicates += len(timestamps) - len(ts)
+                if len(ts) == 0:
+                    continue
+                try:
+                    written += self.store.append_arrays(
+                        deployment_id, name, ts, vals, unit=units.get(key), tags=json.loads(tags_json) or None
+                    )
+                except Exception as e:
+                    self.stats["failed"] += len(ts)
+                    logger.error(f"메트릭 기록 실패: deployment_id={deployment_id}, metric={name}, error={str(e)}")
+                    continue
+                self._recent.set(key, ts[-_RECENT_TIMESTAMPS:])
+                if alerts is not None:
+                    alerts.observe(deployment_id, name, json.loads(tags_json) or None, units.get(key), ts, vals)
+
+            self.stats["written"] += written
+            self.stats["duplicates"] += duplicates
+            logger.debug(f"메트릭 버퍼 기록: series={len(pending)}, written={written}, duplicates={duplicates}")
+            return written
+
+    async def run(self, interval: float) -> None:
+        """
+        주기적 플러시 (애플리케이션 시작 시 백그라운드 태스크로 실행)
+
+        interval마다, 또는 버퍼가 flush_points 이상 차면 즉시 기록한다.
+        """
+        self._wakeup = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"메트릭 버퍼 플러시 실패: {str(e)}", exc_info=True)
+
+
+_ingest_buffer: Optional[MetricsIngestBuffer] = None
+_ingest_buffer_lock = threading.Lock()
+
+
+def get_ingest_buffer() -> MetricsIngestBuffer:
+    """프로세스 전역 수집 버퍼"""
+    global _ingest_buffer
+    if _ingest_buffer is None:
+        with _ingest_buffer_lock:
+            if _ingest_buffer is None:
+                _ingest_buffer = MetricsIngestBuffer()
+    return _ingest_buffer
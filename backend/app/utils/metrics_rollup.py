@@ -0,0 +1,115 @@
+"""
+메트릭 롤업 / 다운샘플링 (NumPy)
+
+- 롤업 행: 버킷 시작 시각, 개수, 합, 최솟값, 최댓값, p95
+  - 원본 점 → 1분 롤업: 정확한 통계 (p95는 nearest-rank)
+  - 세밀한 롤업 → 거친 롤업 (5분/1시간/1일): 개수/합/최솟값/최댓값은 정확,
+    p95는 하위 버킷 p95를 개수 가중으로 합친 근사값
+- LTTB (Largest-Triangle-Three-Buckets): 차트 모양을 유지하며 max_points개로 줄인다
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+ROLLUP_DTYPE = np.dtype([
+    ("ts", "<i8"),
+    ("count", "<i8"),
+    ("sum", "<f8"),
+    ("min", "<f8"),
+    ("max", "<f8"),
+    ("p95", "<f8"),
+])
+
+ROLLUP_STATS = ("avg", "min", "max", "p95", "sum", "count")
+
+
+def _group_bounds(buckets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """정렬된 버킷 배열 → (고유 버킷, 그룹 시작 인덱스)"""
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(buckets)) + 1])
+    return buckets[starts], starts
+
+
+def rollup_points(timestamps: np.ndarray, values: np.ndarray, resolution_ms: int) -> np.ndarray:
+    """원본 점(타임스탬프 오름차순) → 롤업 행"""
+    if len(timestamps) == 0:
+        return np.zeros(0, dtype=ROLLUP_DTYPE)
+    buckets = timestamps - timestamps % resolution_ms
+    keys, starts = _group_bounds(buckets)
+    counts = np.diff(np.concatenate([starts, [len(values)]]))
+
+    rows = np.zeros(len(keys), dtype=ROLLUP_DTYPE)
+    rows["ts"] = keys
+    rows["count"] = counts
+    rows["sum"] = np.add.reduceat(values, starts)
+    rows["min"] = np.minimum.reduceat(values, starts)
+    rows["max"] = np.maximum.reduceat(values, starts)
+    # 버킷 안에서 값 정렬 후 nearest-rank p95
+    order = np.lexsort((values, buckets))
+    rank = np.ceil(0.95 * counts).astype(np.int64) - 1
+    rows["p95"] = values[order][starts + rank]
+    return rows
+
+
+def rollup_rows(rows: np.ndarray, resolution_ms: int) -> np.ndarray:
+    """세밀한 롤업 행(ts 오름차순) → 거친 롤업 행"""
+    if len(rows) == 0:
+        return np.zeros(0, dtype=ROLLUP_DTYPE)
+    buckets = rows["ts"] - rows["ts"] % resolution_ms
+    keys, starts = _group_bounds(buckets)
+    ends = np.concatenate([starts[1:], [len(rows)]])
+
+    merged = np.zeros(len(keys), dtype=ROLLUP_DTYPE)
+    merged["ts"] = keys
+    merged["count"] = np.add.reduceat(rows["count"], starts)
+    merged["sum"] = np.add.reduceat(rows["sum"], starts)
+    merged["min"] = np.minimum.reduceat(rows["min"], starts)
+    merged["max"] = np.maximum.reduceat(rows["max"], starts)
+    # 하위 p95를 정렬해 누적 개수가 95%에 처음 도달하는 값 (개수 가중 근사)
+    order = np.lexsort((rows["p95"], buckets))
+    sorted_p95 = rows["p95"][order]
+    cumulative = np.cumsum(rows["count"][order])
+    before = np.concatenate([[0], cumulative])[starts]
+    targets = before + np.ceil(0.95 * merged["count"]).astype(np.int64)
+    positions = np.searchsorted(cumulative, targets, side="left")
+    merged["p95"] = sorted_p95[np.minimum(positions, ends - 1)]
+    return merged
+
+
+def rollup_values(rows: np.ndarray, stat: str = "avg") -> np.ndarray:
+    """롤업 행 → 통계 값 배열"""
+    if stat == "avg":
+        return rows["sum"] / np.maximum(rows["count"], 1)
+    if stat not in ROLLUP_STATS:
+        raise ValueError(f"Unsupported rollup stat: {stat}")
+    return rows[stat].astype(np.float64)
+
+
+def lttb(timestamps: np.ndarray, values: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets 다운샘플링"""
+    n = len(timestamps)
+    if max_points >= n or max_points < 3:
+        return timestamps, values
+
+    x = timestamps.astype(np.float64)
+    y = values.astype(np.float64)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 버킷 평균점
+        next_lo, next_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_lo:next_hi].mean() if next_hi > next_lo else x[-1]
+        avg_y = y[next_lo:next_hi].mean() if next_hi > next_lo else y[-1]
+        # 이전 선택점 - 후보 - 다음 평균점 삼각형 넓이가 최대인 후보
+        area = np.abs(
+            (x[previous] - avg_x) * (y[lo:hi] - y[previous])
+            - (x[previous] - x[lo:hi]) * (avg_y - y[previous])
+        )
+        previous = lo + int(np.argmax(area))
+        selected[i + 1] = previous
+    return timestamps[selected], values[selected]
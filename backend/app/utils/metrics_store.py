@@ -0,0 +1,611 @@
+"""
+배포 메트릭 시계열 저장소
+
+배포별/메트릭별 열 지향(columnar) 추가 전용 저장소.
+
+저장 형식 (METRICS_STORE_DIR/<배포 ID>/<시계열 키>/):
+- 시계열 키: 메트릭 이름 (태그가 있으면 "<메트릭>~<태그 해시>", 같은 메트릭도 태그 조합별로 따로 저장)
+- meta.json: 메트릭 이름, 단위, 태그
+- <파티션 시작 epoch 초>.ts: 타임스탬프 열 (int64, epoch 밀리초, 오름차순)
+- <파티션 시작 epoch 초>.val: 값 열 (float64)
+
+- 시간 파티션: METRICS_PARTITION_SECONDS 단위 파일로 나누어 범위 조회 시 겹치는 파티션만 연다
+- 읽기: np.memmap + 이진 탐색(searchsorted)으로 범위 슬라이스
+- 쓰기: 값 열을 먼저, 타임스탬프 열을 나중에 추가 (읽기는 두 열 중 짧은 길이까지만 사용)
+  파티션의 마지막 시각보다 이른 점이 들어오면 해당 파티션만 병합 정렬해 다시 쓴다
+- 보관 기간: METRICS_RETENTION_DAYS보다 오래된 파티션 파일 삭제
+- 롤업: 쓰기 시 1분/5분/1시간/1일 롤업(개수/합/최솟값/최댓값/p95)을 함께 갱신
+  (rollup_<초>s/<파티션 시작>.bin, 파티션당 1440행, METRICS_ROLLUP_RETENTION_DAYS 동안 보관)
+- 조회: step/max_points에 맞는 해상도를 골라 읽고, 그래도 많으면 LTTB로 줄인다
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.utils.metrics_rollup import ROLLUP_DTYPE, lttb, rollup_points, rollup_rows, rollup_values
+
+logger = get_logger("app.utils.metrics_store")
+
+_EPOCH = datetime(1970, 1, 1)
+
+ROLLUP_RESOLUTIONS = (60, 300, 3600, 86400)  # 초
+_ROLLUP_ROWS_PER_PARTITION = 1440
+
+
+def to_millis(timestamp: datetime) -> int:
+    """naive UTC datetime → epoch 밀리초"""
+    if timestamp.tzinfo is not None:
+        timestamp = (timestamp - timestamp.utcoffset()).replace(tzinfo=None)
+    return int((timestamp - _EPOCH).total_seconds() * 1000)
+
+
+def from_millis(millis: int) -> datetime:
+    """epoch 밀리초 → naive UTC datetime"""
+    return _EPOCH + timedelta(milliseconds=int(millis))
+
+
+@dataclass
+class MetricSeries:
+    """
+    메트릭 시계열 (배포 + 메트릭 이름)
+    """
+    name: str
+    timestamps: np.ndarray  # int64 epoch 밀리초
+    values: np.ndarray  # float64
+    unit: Optional[str] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+    resolution: int = 0  # 0이면 원본 점, 아니면 롤업/재버킷 폭 (초)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def to_points(self) -> List[Dict]:
+        """API 응답용 점 목록"""
+        return [
+            {"name": self.name, "value": float(value), "unit": self.unit,
+             "timestamp": from_millis(ts), "tags": self.tags or None}
+            for ts, value in zip(self.timestamps.tolist(), self.values.tolist())
+        ]
+
+
+class MetricsStore:
+    """
+    메트릭 시계열 저장소
+
+    Args:
+        root_dir: 저장 디렉터리
+        partition_seconds: 파티션 폭 (초)
+        retention_days: 원본 점 보관 기간 (일, 0 이하이면 무제한)
+        rollup_retention_days: 롤업 보관 기간 (일, 0 이하이면 무제한)
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        partition_seconds: int = 86400,
+        retention_days: int = 30,
+        rollup_retention_days: int = 365
+    ):
+        self.root_dir = root_dir
+        self.partition_ms = partition_seconds * 1000
+        self.retention_days = retention_days
+        self.rollup_retention_days = rollup_retention_days
+        self._lock = threading.RLock()
+        # 시계열 디렉터리 → 파티션 시작(ms) 오름차순 목록 / 파티션 → 마지막 시각
+        self._partitions: Dict[str, List[int]] = {}
+        self._last: Dict[Tuple[str, int], int] = {}
+        self._meta: Dict[str, Dict] = {}
+        os.makedirs(root_dir, exist_ok=True)
+
+    # ---- 경로 ----
+
+    @staticmethod
+    def _slug(name: str) -> str:
+        return re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+
+    def _series_dir(self, deployment_id, metric_name: str, tags: Optional[Dict[str, str]] = None) -> str:
+        key = self._slug(metric_name)
+        if tags:
+            digest = hashlib.sha1(json.dumps(tags, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+            key = f"{key}~{digest}"
+        return os.path.join(self.root_dir, self._slug(str(deployment_id)), key)
+
+    def _partition_path(self, series_dir: str, start_ms: int, column: str) -> str:
+        return os.path.join(series_dir, f"{start_ms // 1000}.{column}")
+
+    @staticmethod
+    def _rollup_dir(series_dir: str, resolution: int) -> str:
+        return os.path.join(series_dir, f"rollup_{resolution}s")
+
+    def _list_partitions(self, series_dir: str, suffix: str = ".ts") -> List[int]:
+        """파티션 시작 목록 (디렉터리 목록은 한 번만 읽고 캐시)"""
+        partitions = self._partitions.get(series_dir)
+        if partitions is None:
+            partitions = []
+            if os.path.isdir(series_dir):
+                partitions = sorted(
+                    int(name[:-len(suffix)]) * 1000 for name in os.listdir(series_dir)
+                    if name.endswith(suffix) and name[:-len(suffix)].isdigit()
+                )
+            self._partitions[series_dir] = partitions
+        return partitions
+
+    def _read_meta(self, series_dir: str) -> Dict:
+        meta = self._meta.get(series_dir)
+        if meta is None:
+            path = os.path.join(series_dir, "meta.json")
+            if not os.path.exists(path):
+                return {}
+            with open(path) as f:
+                meta = self._meta[series_dir] = json.load(f)
+        return meta
+
+    # ---- 쓰기 ----
+
+    def append(
+        self,
+        deployment_id,
+        metric_name: str,
+        timestamps: Iterable[datetime],
+        values: Iterable[float],
+        unit: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        점 추가
+
+        Returns:
+            저장한 점 수
+        """
+        ts = np.fromiter((to_millis(t) for t in timestamps), dtype=np.int64)
+        vals = np.asarray(list(values), dtype=np.float64)
+        if len(ts) != len(vals):
+            raise ValueError("timestamps and values must have the same length")
+        return self.append_arrays(deployment_id, metric_name, ts, vals, unit=unit, tags=tags)
+
+    def append_arrays(
+        self,
+        deployment_id,
+        metric_name: str,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        unit: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None
+    ) -> int:
+        """epoch 밀리초/값 배열로 점 추가"""
+        if len(timestamps) == 0:
+            return 0
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, values = timestamps[order], values[order]
+
+        series_dir = self._series_dir(deployment_id, metric_name, tags)
+        with self._lock:
+            os.makedirs(series_dir, exist_ok=True)
+            meta = self._read_meta(series_dir)
+            if "name" not in meta or (unit and meta.get("unit") != unit):
+                meta = {"name": metric_name, "unit": unit or meta.get("unit"), "tags": tags or {}}
+                with open(os.path.join(series_dir, "meta.json"), "w") as f:
+                    json.dump(meta, f)
+                self._meta[series_dir] = meta
+
+            partitions = self._list_partitions(series_dir)
+            starts = timestamps - timestamps % self.partition_ms
+            bounds = np.flatnonzero(np.diff(starts)) + 1
+            for chunk_ts, chunk_vals in zip(np.split(timestamps, bounds), np.split(values, bounds)):
+                start = int(chunk_ts[0] - chunk_ts[0] % self.partition_ms)
+                self._append_partition(series_dir, start, chunk_ts, chunk_vals)
+                if start not in partitions:
+                    partitions.append(start)
+                    partitions.sort()
+            self._update_rollups(series_dir, int(timestamps[0]), int(timestamps[-1]))
+        return len(timestamps)
+
+    def _append_partition(self, series_dir: str, start: int, timestamps: np.ndarray, values: np.ndarray) -> None:
+        ts_path = self._partition_path(series_dir, start, "ts")
+        val_path = self._partition_path(series_dir, start, "val")
+        last = self._last.get((series_dir, start))
+        if last is None:
+            existing = self._load_partition(series_dir, start)
+            last = int(existing[0][-1]) if existing is not None and len(existing[0]) else None
+
+        if last is not None and timestamps[0] < last:
+            # 순서가 어긋난 점: 파티션 병합 정렬 후 다시 쓰기
+            old_ts, old_vals = self._load_partition(series_dir, start)
+            merged_ts = np.concatenate([old_ts, timestamps])
+            merged_vals = np.concatenate([old_vals, values])
+            order = np.argsort(merged_ts, kind="stable")
+            for path, column in ((val_path, merged_vals[order]), (ts_path, merged_ts[order])):
+                with open(path + ".tmp", "wb") as f:
+                    f.write(column.tobytes())
+                os.replace(path + ".tmp", path)
+            self._last[(series_dir, start)] = int(merged_ts[order][-1])
+            return
+
+        length = self._valid_length(ts_path, val_path)
+        with open(val_path, "ab") as f:
+            f.truncate(length * 8)
+            f.write(values.tobytes())
+        with open(ts_path, "ab") as f:
+            f.truncate(length * 8)
+            f.write(timestamps.tobytes())
+        self._last[(series_dir, start)] = int(timestamps[-1])
+
+    @staticmethod
+    def _valid_length(ts_path: str, val_path: str) -> int:
+        """두 열이 모두 완전히 기록된 점 수"""
+        if not os.path.exists(ts_path) or not os.path.exists(val_path):
+            return 0
+        return min(os.path.getsize(ts_path), os.path.getsize(val_path)) // 8
+
+    # ---- 읽기 ----
+
+    def _load_partition(self, series_dir: str, start: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """파티션 열 memmap (없거나 비어 있으면 None)"""
+        ts_path = self._partition_path(series_dir, start, "ts")
+        val_path = self._partition_path(series_dir, start, "val")
+        length = self._valid_length(ts_path, val_path)
+        if length == 0:
+            return None
+        return (
+            np.memmap(ts_path, dtype=np.int64, mode="r", shape=(length,)),
+            np.memmap(val_path, dtype=np.float64, mode="r", shape=(length,)),
+        )
+
+    def _read_raw(self, series_dir: str, start_ms: int, end_ms: int) -> Tuple[np.ndarray, np.ndarray]:
+        """원본 점 [start_ms, end_ms] (파티션 이진 탐색 + 파티션 내 searchsorted, 잠금 보유 상태에서 호출)"""
+        partitions = self._list_partitions(series_dir)
+        first = np.searchsorted(partitions, start_ms - start_ms % self.partition_ms, side="left")
+        last = np.searchsorted(partitions, end_ms, side="right")
+        ts_chunks, val_chunks = [], []
+        for start in partitions[first:last]:
+            loaded = self._load_partition(series_dir, start)
+            if loaded is None:
+                continue
+            ts, vals = loaded
+            lo = np.searchsorted(ts, start_ms, side="left")
+            hi = np.searchsorted(ts, end_ms, side="right")
+            if hi > lo:
+                ts_chunks.append(np.array(ts[lo:hi]))
+                val_chunks.append(np.array(vals[lo:hi]))
+        return (
+            np.concatenate(ts_chunks) if ts_chunks else np.zeros(0, dtype=np.int64),
+            np.concatenate(val_chunks) if val_chunks else np.zeros(0, dtype=np.float64),
+        )
+
+    def _count_raw(self, series_dir: str, start_ms: int, end_ms: int) -> int:
+        """원본 점 개수 (데이터를 복사하지 않고 searchsorted로만 계산)"""
+        partitions = self._list_partitions(series_dir)
+        first = np.searchsorted(partitions, start_ms - start_ms % self.partition_ms, side="left")
+        last = np.searchsorted(partitions, end_ms, side="right")
+        count = 0
+        for start in partitions[first:last]:
+            loaded = self._load_partition(series_dir, start)
+            if loaded is not None:
+                ts = loaded[0]
+                count += int(np.searchsorted(ts, end_ms, side="right") - np.searchsorted(ts, start_ms, side="left"))
+        return count
+
+    def read_range(
+        self,
+        deployment_id,
+        metric_name: str,
+        start_time: datetime,
+        end_time: datetime,
+        tags: Optional[Dict[str, str]] = None
+    ) -> MetricSeries:
+        """[start_time, end_time] 범위 원본 점 조회 (tags: 시계열 태그 조합)"""
+        series_dir = self._series_dir(deployment_id, metric_name, tags)
+        with self._lock:
+            timestamps, values = self._read_raw(series_dir, to_millis(start_time), to_millis(end_time))
+            meta = self._read_meta(series_dir) if len(timestamps) else {}
+        return MetricSeries(
+            name=metric_name,
+            timestamps=timestamps,
+            values=values,
+            unit=meta.get("unit"),
+            tags=meta.get("tags") or {},
+        )
+
+    def query(
+        self,
+        deployment_id,
+        metric_name: str,
+        start_time: datetime,
+        end_time: datetime,
+        step: Optional[int] = None,
+        max_points: Optional[int] = None,
+        stat: str = "avg",
+        tags: Optional[Dict[str, str]] = None
+    ) -> MetricSeries:
+        """
+        차트용 범위 조회 (해상도 자동 선택)
+
+        Args:
+            step: 점 간격 (초). 이 간격 이하인 가장 거친 롤업을 읽고 step 단위로 다시 묶는다
+            max_points: 최대 점 수. 원본이 이보다 많으면 범위/해상도 ≤ max_points인 가장 세밀한 롤업을 고르고,
+                그래도 많으면 LTTB로 줄인다
+            stat: 롤업 통계 (avg, min, max, p95, sum, count)
+            tags: 시계열 태그 조합
+        """
+        start_ms, end_ms = to_millis(start_time), to_millis(end_time)
+        series_dir = self._series_dir(deployment_id, metric_name, tags)
+        with self._lock:
+            meta = self._read_meta(series_dir)
+            resolution = 0
+            if step:
+                resolution = max([r for r in ROLLUP_RESOLUTIONS if r <= step], default=0)
+            elif max_points and self._count_raw(series_dir, start_ms, end_ms) > max_points:
+                span = max(end_ms - start_ms, 1) / 1000
+                resolution = next((r for r in ROLLUP_RESOLUTIONS if span / r <= max_points), ROLLUP_RESOLUTIONS[-1])
+
+            rows = self._read_rollup(series_dir, resolution, start_ms, end_ms) if resolution else None
+            if rows is not None and len(rows) == 0:
+                rows = None  # 롤업이 없으면 원본 점 사용
+            if rows is None:
+                resolution = 0
+                timestamps, values = self._read_raw(series_dir, start_ms, end_ms)
+
+        if step and step > resolution:
+            # 선택한 해상도보다 넓은 step: 롤업(또는 원본)을 step 단위로 다시 묶는다
+            if rows is None:
+                rows = rollup_points(timestamps, values, step * 1000)
+            else:
+                rows = rollup_rows(rows, step * 1000)
+            resolution = step
+        if rows is not None:
+            timestamps, values = rows["ts"], rollup_values(rows, stat)
+
+        if max_points and len(timestamps) > max_points:
+            timestamps, values = lttb(timestamps, values, max_points)
+
+        return MetricSeries(
+            name=metric_name,
+            timestamps=timestamps,
+            values=values,
+            unit=meta.get("unit"),
+            tags=meta.get("tags") or {},
+            resolution=resolution,
+        )
+
+    # ---- 롤업 ----
+
+    def _rollup_partition_ms(self, resolution: int) -> int:
+        return resolution * 1000 * _ROLLUP_ROWS_PER_PARTITION
+
+    def _rollup_path(self, series_dir: str, resolution: int, start_ms: int) -> str:
+        return os.path.join(self._rollup_dir(series_dir, resolution), f"{start_ms // 1000}.bin")
+
+    def _load_rollup_partition(self, series_dir: str, resolution: int, start_ms: int) -> np.ndarray:
+        path = self._rollup_path(series_dir, resolution, start_ms)
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=ROLLUP_DTYPE)
+        length = os.path.getsize(path) // ROLLUP_DTYPE.itemsize
+        if length == 0:
+            return np.zeros(0, dtype=ROLLUP_DTYPE)
+        return np.memmap(path, dtype=ROLLUP_DTYPE, mode="r", shape=(length,))
+
+    def _read_rollup(self, series_dir: str, resolution: int, start_ms: int, end_ms: int) -> np.ndarray:
+        """롤업 행 [start_ms, end_ms] (버킷 시작 기준)"""
+        rollup_dir = self._rollup_dir(series_dir, resolution)
+        partition_ms = self._rollup_partition_ms(resolution)
+        partitions = self._list_partitions(rollup_dir, ".bin")
+        first = np.searchsorted(partitions, start_ms - start_ms % partition_ms, side="left")
+        last = np.searchsorted(partitions, end_ms, side="right")
+        chunks = []
+        for start in partitions[first:last]:
+            rows = self._load_rollup_partition(series_dir, resolution, start)
+            lo = np.searchsorted(rows["ts"], start_ms, side="left")
+            hi = np.searchsorted(rows["ts"], end_ms, side="right")
+            if hi > lo:
+                chunks.append(np.array(rows[lo:hi]))
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=ROLLUP_DTYPE)
+
+    def _upsert_rollup(self, series_dir: str, resolution: int, rows: np.ndarray) -> None:
+        """롤업 행 저장 (같은 버킷은 교체)"""
+        if len(rows) == 0:
+            return
+        rollup_dir = self._rollup_dir(series_dir, resolution)
+        os.makedirs(rollup_dir, exist_ok=True)
+        partition_ms = self._rollup_partition_ms(resolution)
+        partitions = self._list_partitions(rollup_dir, ".bin")
+
+        starts = rows["ts"] - rows["ts"] % partition_ms
+        bounds = np.flatnonzero(np.diff(starts)) + 1
+        for chunk in np.split(rows, bounds):
+            start = int(chunk["ts"][0] - chunk["ts"][0] % partition_ms)
+            path = self._rollup_path(series_dir, resolution, start)
+            existing = self._load_rollup_partition(series_dir, resolution, start)
+            position = int(np.searchsorted(existing["ts"], chunk["ts"][0], side="left"))
+            tail = existing["ts"][position:]
+            if len(tail) <= len(chunk) and np.array_equal(tail, chunk["ts"][:len(tail)]):
+                # 일반적인 경우: 마지막 버킷 갱신 + 새 버킷 추가 → 잘라내고 이어 쓰기
+                del existing
+                with open(path, "ab") as f:
+                    f.truncate(position * ROLLUP_DTYPE.itemsize)
+                    f.write(chunk.tobytes())
+            else:
+                keep = np.array(existing[~np.isin(existing["ts"], chunk["ts"])])
+                del existing
+                merged = np.concatenate([keep, chunk])
+                merged = merged[np.argsort(merged["ts"], kind="stable")]
+                with open(path + ".tmp", "wb") as f:
+                    f.write(merged.tobytes())
+                os.replace(path + ".tmp", path)
+            if start not in partitions:
+                partitions.append(start)
+                partitions.sort()
+
+    def _update_rollups(self, series_dir: str, first_ms: int, last_ms: int) -> None:
+        """쓰기 범위 [first_ms, last_ms]에 걸친 롤업 버킷 재계산 (원본 → 1분 → 5분 → 1시간 → 1일)"""
+        previous = None
+        for resolution in ROLLUP_RESOLUTIONS:
+            resolution_ms = resolution * 1000
+            lo = first_ms - first_ms % resolution_ms
+            hi = last_ms - last_ms % resolution_ms + resolution_ms - 1
+            if previous is None:
+                rows = rollup_points(*self._read_raw(series_dir, lo, hi), resolution_ms)
+            else:
+                rows = rollup_rows(self._read_rollup(series_dir, previous, lo, hi), resolution_ms)
+            self._upsert_rollup(series_dir, resolution, rows)
+            previous = resolution
+
+    def latest(
+        self,
+        deployment_id,
+        metric_name: str,
+        before: Optional[datetime] = None,
+        tags: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict]:
+        """before(기본값: 현재) 이전 마지막 점"""
+        before_ms = to_millis(before or datetime.utcnow())
+        series_dir = self._series_dir(deployment_id, metric_name, tags)
+        with self._lock:
+            partitions = self._list_partitions(series_dir)
+            index = int(np.searchsorted(partitions, before_ms, side="right"))
+            for start in reversed(partitions[:index]):
+                loaded = self._load_partition(series_dir, start)
+                if loaded is None:
+                    continue
+                ts, vals = loaded
+                position = int(np.searchsorted(ts, before_ms, side="right"))
+                if position > 0:
+                    meta = self._read_meta(series_dir)
+                    return {
+                        "name": metric_name,
+                        "value": float(vals[position - 1]),
+                        "unit": meta.get("unit"),
+                        "timestamp": from_millis(ts[position - 1]),
+                        "tags": meta.get("tags") or None,
+                    }
+        return None
+
+    def list_series(self, deployment_id, metric_name: Optional[str] = None) -> List[Tuple[str, Dict[str, str]]]:
+        """배포의 시계열 목록 [(메트릭 이름, 태그)] (metric_name을 주면 해당 메트릭만)"""
+        deployment_dir = os.path.join(self.root_dir, self._slug(str(deployment_id)))
+        if not os.path.isdir(deployment_dir):
+            return []
+        prefix = self._slug(metric_name) if metric_name else None
+        series = []
+        for entry in sorted(os.listdir(deployment_dir)):
+            if prefix is not None and entry != prefix and not entry.startswith(prefix + "~"):
+                continue
+            series_dir = os.path.join(deployment_dir, entry)
+            if os.path.isdir(series_dir):
+                meta = self._read_meta(series_dir)
+                name = meta.get("name", entry.split("~")[0])
+                if metric_name is None or name == metric_name:
+                    series.append((name, meta.get("tags") or {}))
+        return series
+
+    def list_metrics(self, deployment_id) -> List[str]:
+        """배포의 메트릭 이름 목록"""
+        return sorted({name for name, _ in self.list_series(deployment_id)})
+
+    # ---- 보관 기간 ----
+
+    def enforce_retention(self, now: Optional[datetime] = None) -> int:
+        """
+        보관 기간이 지난 파티션 삭제 (원본: retention_days, 롤업: rollup_retention_days)
+
+        Returns:
+            삭제한 파티션 수
+        """
+        now = now or datetime.utcnow()
+        raw_cutoff = to_millis(now - timedelta(days=self.retention_days)) if self.retention_days > 0 else None
+        rollup_cutoff = (
+            to_millis(now - timedelta(days=self.rollup_retention_days)) if self.rollup_retention_days > 0 else None
+        )
+        if raw_cutoff is None and rollup_cutoff is None:
+            return 0
+
+        removed = 0
+        with self._lock:
+            for deployment in os.listdir(self.root_dir):
+                deployment_dir = os.path.join(self.root_dir, deployment)
+                if not os.path.isdir(deployment_dir):
+                    continue
+                for metric in os.listdir(deployment_dir):
+                    series_dir = os.path.join(deployment_dir, metric)
+                    if not os.path.isdir(series_dir):
+                        continue
+                    partitions = self._list_partitions(series_dir)
+                    if raw_cutoff is not None:
+                        for start in [p for p in partitions if p + self.partition_ms <= raw_cutoff]:
+                            for column in ("ts", "val"):
+                                path = self._partition_path(series_dir, start, column)
+                                if os.path.exists(path):
+                                    os.remove(path)
+                            self._last.pop((series_dir, start), None)
+                            partitions.remove(start)
+                            removed += 1
+
+                    remaining = len(partitions)
+                    for resolution in ROLLUP_RESOLUTIONS:
+                        rollup_dir = self._rollup_dir(series_dir, resolution)
+                        rollup_partitions = self._list_partitions(rollup_dir, ".bin")
+                        if rollup_cutoff is not None:
+                            partition_ms = self._rollup_partition_ms(resolution)
+                            for start in [p for p in rollup_partitions if p + partition_ms <= rollup_cutoff]:
+                                os.remove(self._rollup_path(series_dir, resolution, start))
+                                rollup_partitions.remove(start)
+                                removed += 1
+                        remaining += len(rollup_partitions)
+
+                    if remaining == 0:
+                        shutil.rmtree(series_dir, ignore_errors=True)
+                        self._meta.pop(series_dir, None)
+                        for key in [k for k in self._partitions if k == series_dir or k.startswith(series_dir + os.sep)]:
+                            self._partitions.pop(key, None)
+                if not os.listdir(deployment_dir):
+                    os.rmdir(deployment_dir)
+        if removed:
+            logger.info(f"메트릭 보관 기간 정리: partitions={removed}")
+        return removed
+
+
+_metrics_store: Optional[MetricsStore] = None
+_metrics_store_lock = threading.Lock()
+
+
+def get_metrics_store() -> MetricsStore:
+    """프로세스 전역 메트릭 저장소"""
+    global _metrics_store
+    if _metrics_store is None:
+        with _metrics_store_lock:
+            if _metrics_store is None:
+                _metrics_store = MetricsStore(
+                    root_dir=settings.METRICS_STORE_DIR,
+                    partition_seconds=settings.METRICS_PARTITION_SECONDS,
+                    retention_days=settings.METRICS_RETENTION_DAYS,
+                    rollup_retention_days=settings.METRICS_ROLLUP_RETENTION_DAYS,
+                )
+    return _metrics_store
+
+
+async def run_metrics_retention(interval: float) -> None:
+    """
+    주기적 메트릭 보관 기간 정리 (애플리케이션 시작 시 백그라운드 태스크로 실행)
+    """
+    while True:
+        try:
+            await asyncio.to_thread(get_metrics_store().enforce_retention)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"메트릭 보관 기간 정리 실패: {str(e)}", exc_info=True)
+        await asyncio.sleep(interval)
@@ -0,0 +1,306 @@
+"""
+실시간 메트릭 스트림 허브 (WebSocket/SSE 구독자 fan-out)
+
+- 배포마다 폴러 하나가 METRICS_STREAM_INTERVAL마다 최근 METRICS_STREAM_LOOKBACK 구간만 읽고,
+  시계열별 워터마크 이후의 새 점만 구독자 전원에게 나눠 준다 (구독자 수와 무관하게 조회 한 번)
+- 헬스 상태(알림 엔진 상태, 엔진이 없거나 평가 전이면 percent 메트릭 최신 값 기준)가 바뀌면 상태 변경도 함께 보낸다
+- 구독자별 병합: 구독자가 이전 메시지를 아직 가져가지 않았으면 시계열별 최신 점만 남긴다
+- 느린 구독자 끊기: 미전송 메시지가 METRICS_STREAM_SLOW_CONSUMER_SECONDS 이상 쌓여 있거나
+  미전송 시계열 수가 METRICS_STREAM_MAX_PENDING을 넘으면 구독을 해제한다
+- 마지막 구독자가 떠나면 해당 배포 폴러를 멈춘다
+- 실제 저장소/Prometheus 값만 보낸다 (METRICS_MOCK_FALLBACK 임시 데이터는 사용하지 않음)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.utils.alert_engine import get_alert_engine
+from app.utils.metrics_aggregation import overall_status
+from app.utils.metrics_collector import MetricsCollector
+from app.utils.metrics_store import from_millis
+
+logger = get_logger("app.utils.metrics_stream")
+
+# (배포 ID, 메트릭 이름, 태그 JSON)
+SeriesKey = Tuple[str, str, str]
+
+
+def _series_key(deployment_id: str, point: Dict[str, Any]) -> SeriesKey:
+    return deployment_id, point["name"], json.dumps(point.get("tags") or {}, sort_keys=True)
+
+
+def _alert_status(deployment_id: str) -> Optional[str]:
+    """알림 엔진이 계산해 둔 배포 상태 (엔진이 꺼져 있거나 평가한 적 없는 배포는 None)"""
+    engine = get_alert_engine()
+    return engine.status(deployment_id) if engine is not None else None
+
+
+def _serialize(deployment_id: str, point: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "deployment_id": deployment_id,
+        "name": point["name"],
+        "value": point["value"],
+        "unit": point.get("unit"),
+        "timestamp": point["timestamp"].isoformat(),
+        "tags": point.get("tags") or None,
+    }
+
+
+class Subscription:
+    """
+    구독자 하나의 미전송 메시지 (이벤트 루프 안에서만 사용)
+    """
+
+    def __init__(self, deployment_ids: Iterable[str], max_pending: int):
+        self.deployment_ids: Set[str] = set(deployment_ids)
+        self.max_pending = max_pending
+        self.dropped: Optional[str] = None
+        self._samples: Dict[SeriesKey, List[Dict[str, Any]]] = {}
+        self._status: Dict[str, str] = {}
+        self._pending_since: Optional[float] = None
+        self._event = asyncio.Event()
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._samples or self._status)
+
+    def pending_age(self, now: float) -> float:
+        return now - self._pending_since if self._pending_since is not None else 0.0
+
+    def push(self, samples: Dict[SeriesKey, List[Dict[str, Any]]], status: Dict[str, str]) -> bool:
+        """
+        메시지 추가 (이미 미전송 점이 있는 시계열은 최신 점 하나로 병합)
+
+        Returns:
+            미전송 시계열 수가 상한 이내면 True
+        """
+        for key, points in samples.items():
+            if key in self._samples:
+                self._samples[key] = points[-1:]
+            else:
+                self._samples[key] = list(points)
+        self._status.update(status)
+        if self.has_pending:
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            self._event.set()
+        return len(self._samples) <= self.max_pending
+
+    def drop(self, reason: str) -> None:
+        self.dropped = reason
+        self._event.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        다음 메시지 (timeout 동안 없으면 None)
+
+        메시지: {"type": "update", "samples": [...], "status": {배포 ID: 상태}}
+               {"type": "dropped", "reason": ...} (이후 구독 종료)
+        """
+        if not self.has_pending and self.dropped is None:
+            self._event.clear()
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self.dropped is not None:
+            return {"type": "dropped", "reason": self.dropped}
+
+        samples, self._samples = self._samples, {}
+        status, self._status = self._status, {}
+        self._pending_since = None
+        return {
+            "type": "update",
+            "samples": [_serialize(key[0], p) for key, points in samples.items() for p in points],
+            "status": status,
+        }
+
+
+class _DeploymentState:
+    """배포별 폴러 상태"""
+
+    def __init__(self):
+        self.watermarks: Dict[SeriesKey, int] = {}
+        self.percent_values: Dict[SeriesKey, float] = {}
+        self.status: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+
+class MetricsStreamHub:
+    """
+    배포별 공유 폴러 + 구독자 fan-out
+    """
+
+    def __init__(
+        self,
+        interval: float = None,
+        lookback: float = None,
+        slow_consumer_seconds: float = None,
+        max_pending: int = None
+    ):
+        self.interval = interval or settings.METRICS_STREAM_INTERVAL
+        self.lookback = lookback or settings.METRICS_STREAM_LOOKBACK
+        self.slow_consumer_seconds = slow_consumer_seconds or settings.METRICS_STREAM_SLOW_CONSUMER_SECONDS
+        self.max_pending = max_pending or settings.METRICS_STREAM_MAX_PENDING
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._states: Dict[str, _DeploymentState] = {}
+        self.upstream_reads = 0
+
+    async def subscribe(self, deployment_ids: Iterable[str]) -> Subscription:
+        """구독 시작 (배포별 최신 점/상태 스냅샷을 첫 메시지로 넣는다)"""
+        subscription = Subscription((), self.max_pending)
+        await self.update(subscription, add=deployment_ids)
+        return subscription
+
+    async def update(
+        self,
+        subscription: Subscription,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = ()
+    ) -> None:
+        """구독 배포 추가/제거"""
+        for deployment_id in remove:
+            self._detach(subscription, deployment_id)
+        for deployment_id in add:
+            if deployment_id in subscription.deployment_ids:
+                continue
+            subscription.deployment_ids.add(deployment_id)
+            self._subscribers.setdefault(deployment_id, set()).add(subscription)
+            if deployment_id not in self._states:
+                state = self._states[deployment_id] = _DeploymentState()
+                state.task = asyncio.create_task(self._poll(deployment_id, state))
+            await self._send_snapshot(subscription, deployment_id)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독 해제"""
+        for deployment_id in list(subscription.deployment_ids):
+            self._detach(subscription, deployment_id)
+
+    def _detach(self, subscription: Subscription, deployment_id: str) -> None:
+        subscription.deployment_ids.discard(deployment_id)
+        subscribers = self._subscribers.get(deployment_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            # 마지막 구독자: 폴러 정지
+            del self._subscribers[deployment_id]
+            state = self._states.pop(deployment_id, None)
+            if state is not None and state.task is not None:
+                state.task.cancel()
+
+    async def _send_snapshot(self, subscription: Subscription, deployment_id: str) -> None:
+        collector = MetricsCollector(UUID(deployment_id))
+        latest = await collector.collect_latest_metrics(mock_fallback=False)
+        values = np.array([p["value"] for p in latest], dtype=np.float64)
+        percent = np.array([p.get("unit") == "percent" for p in latest], dtype=bool)
+        status = _alert_status(deployment_id) or overall_status(values, percent)
+        state = self._states.get(deployment_id)
+        if state is not None and state.status is None:
+            state.status = status  # 폴러는 스냅샷 이후 바뀐 상태만 보낸다
+        subscription.push({_series_key(deployment_id, p): [p] for p in latest}, {deployment_id: status})
+
+    async def _poll(self, deployment_id: str, state: _DeploymentState) -> None:
+        """배포 폴러: 새 점 조회 → 구독자 전원에게 전달"""
+        collector = MetricsCollector(UUID(deployment_id))
+        first = True
+        while True:
+            try:
+                samples = await self._read_new(collector, deployment_id, state)
+                status = _alert_status(deployment_id)
+                if status is None and state.percent_values:
+                    status = overall_status(np.array(list(state.percent_values.values()), dtype=np.float64))
+                changed = {deployment_id: status} if status is not None and status != state.status else {}
+                if changed:
+                    state.status = status
+                # 첫 조회 점은 워터마크 초기화용 (최신 점은 구독 시 스냅샷으로 이미 전달)
+                if first:
+                    samples = {}
+                if samples or changed:
+                    self._publish(deployment_id, samples, changed)
+                first = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"메트릭 스트림 조회 실패: deployment_id={deployment_id}, error={str(e)}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    async def _read_new(
+        self,
+        collector: MetricsCollector,
+        deployment_id: str,
+        state: _DeploymentState
+    ) -> Dict[SeriesKey, List[Dict[str, Any]]]:
+        """최근 lookback 구간을 읽어 시계열별 워터마크 이후 점만 반환"""
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(seconds=self.lookback)
+        self.upstream_reads += 1
+        new: Dict[SeriesKey, List[Dict[str, Any]]] = {}
+        for series in await collector.collect_series(None, start_time, end_time, mock_fallback=False):
+            key = (deployment_id, series.name, json.dumps(series.tags or {}, sort_keys=True))
+            watermark = state.watermarks.get(key, -1)
+            fresh = series.timestamps > watermark
+            if not fresh.any():
+                continue
+            state.watermarks[key] = int(series.timestamps[fresh][-1])
+            if series.unit == "percent":
+                state.percent_values[key] = float(series.values[fresh][-1])
+            new[key] = [
+                {"name": series.name, "value": float(v), "unit": series.unit,
+                 "timestamp": from_millis(int(t)), "tags": series.tags or None}
+                for t, v in zip(series.timestamps[fresh], series.values[fresh])
+            ]
+        return new
+
+    def _publish(
+        self,
+        deployment_id: str,
+        samples: Dict[SeriesKey, List[Dict[str, Any]]],
+        status: Dict[str, str]
+    ) -> None:
+        now = time.monotonic()
+        for subscription in list(self._subscribers.get(deployment_id, ())):
+            if subscription.pending_age(now) > self.slow_consumer_seconds:
+                self._drop(subscription, "slow consumer")
+            elif not subscription.push(samples, status):
+                self._drop(subscription, "too many pending series")
+
+    def _drop(self, subscription: Subscription, reason: str) -> None:
+        logger.warning(f"메트릭 스트림 구독자 끊김: reason={reason}, deployments={len(subscription.deployment_ids)}")
+        self.unsubscribe(subscription)
+        subscription.drop(reason)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len({id(s) for subscribers in self._subscribers.values() for s in subscribers})
+
+    async def close(self) -> None:
+        """모든 폴러 정지 및 구독 해제 (애플리케이션 종료 시)"""
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                self.unsubscribe(subscription)
+                subscription.drop("server shutdown")
+
+
+_stream_hub: Optional[MetricsStreamHub] = None
+_stream_hub_lock = threading.Lock()
+
+
+def get_metrics_stream_hub() -> MetricsStreamHub:
+    """프로세스 전역 메트릭 스트림 허브"""
+    global _stream_hub
+    if _stream_hub is None:
+        with _stream_hub_lock:
+            if _stream_hub is None:
+                _stream_hub = MetricsStreamHub()
+    return _stream_hub
@@ -0,0 +1,318 @@
+"""
+네트워크 대역 포트 스윕 (비동기 TCP connect)
+
+배포 전 온프레미스 대역(CIDR) × 포트 목록의 연결 가능 여부를 빠르게 확인한다.
+NETWORK_SWEEP_ALLOWED_CIDRS(기본: 사설/CGNAT/ULA 대역) 밖의 대역은 스윕하지 않는다.
+
+- 작업 큐 + 워커로 동시 연결, 동시 연결 수(NETWORK_SWEEP_CONCURRENCY)와 초당 연결 시도 수(NETWORK_SWEEP_RATE)는
+  프로세스 전역 제한(SweepLimits)으로 동시에 실행되는 스윕 전체에 적용한다 (요청 수만큼 늘어나지 않음)
+- 호스트별 시간 예산(NETWORK_SWEEP_HOST_BUDGET): 호스트 첫 시도부터 예산이 지나면 남은 포트는 건너뛴다
+  (응답 없는 호스트 하나가 전체 스윕을 붙잡지 않도록)
+- 결과는 끝나는 순서대로 바로 내보낸다 (스트리밍 응답)
+- 확인 결과는 인벤토리 캐시(NETWORK_SWEEP_INVENTORY_TTL)에 두고, 다시 스윕할 때 신선한 결과는 재사용한다
+
+상태: open(연결됨), closed(연결 거부), filtered(타임아웃), skipped(호스트 예산 초과), error(그 외)
+"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger("app.utils.network_sweep")
+
+SWEEP_STATUSES = ("open", "closed", "filtered", "skipped", "error")
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_ports(spec: str) -> List[int]:
+    """포트 목록 문자열 → 포트 리스트 (예: "22,80,8000-8010")"""
+    ports = set()
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        low, sep, high = item.partition("-")
+        try:
+            start, end = int(low), int(high) if sep else int(low)
+        except ValueError:
+            raise ValueError(f"Invalid port: {item}")
+        if not 1 <= start <= end <= 65535:
+            raise ValueError(f"Invalid port range: {item}")
+        ports.update(range(start, end + 1))
+    return sorted(ports)
+
+
+def allowed_networks(spec: str = None) -> List[Network]:
+    """허용 대역 문자열(쉼표 구분 CIDR) → 네트워크 리스트 (기본: NETWORK_SWEEP_ALLOWED_CIDRS)"""
+    spec = settings.NETWORK_SWEEP_ALLOWED_CIDRS if spec is None else spec
+    return [ipaddress.ip_network(item, strict=False) for item in filter(None, (p.strip() for p in spec.split(",")))]
+
+
+def expand_hosts(cidrs: List[str], max_hosts: int = None, allowed: Optional[List[Network]] = None) -> List[str]:
+    """
+    CIDR/단일 IP 목록 → 호스트 주소 (네트워크/브로드캐스트 주소 제외, 중복 제거)
+
+    Args:
+        allowed: 허용 대역 (없으면 NETWORK_SWEEP_ALLOWED_CIDRS), 대역 전체가 이 중 하나에 속해야 한다
+
+    Raises:
+        ValueError: 형식 오류, 허용 대역 밖, 또는 호스트 수가 max_hosts 초과
+    """
+    max_hosts = max_hosts or settings.NETWORK_SWEEP_MAX_HOSTS
+    allowed = allowed_networks() if allowed is None else allowed
+    hosts: Dict[str, None] = {}
+    for cidr in cidrs:
+        try:
+            network = ipaddress.ip_network(cidr.strip(), strict=False)
+        except ValueError:
+            raise ValueError(f"Invalid CIDR: {cidr}")
+        if not any(network.version == a.version and network.subnet_of(a) for a in allowed):
+            raise ValueError(f"Network not allowed (NETWORK_SWEEP_ALLOWED_CIDRS): {cidr}")
+        if len(hosts) + network.num_addresses > max_hosts + 2:
+            raise ValueError(f"Too many hosts (max {max_hosts}): {cidr}")
+        addresses = [network.network_address] if network.num_addresses == 1 else network.hosts()
+        for address in addresses:
+            hosts[str(address)] = None
+        if len(hosts) > max_hosts:
+            raise ValueError(f"Too many hosts (max {max_hosts})")
+    return list(hosts)
+
+
+async def connect(host: str, port: int, timeout: float) -> Tuple[str, Optional[str]]:
+    """TCP 연결 시도 → (상태, 오류)"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    except asyncio.TimeoutError:
+        return "filtered", None
+    except ConnectionRefusedError:
+        return "closed", None
+    except OSError as e:
+        return "error", str(e)
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return "open", None
+
+
+class RateLimiter:
+    """초당 시도 수 제한 (이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        now = time.monotonic()
+        wait = self._next - now
+        self._next = max(self._next, now) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class SweepLimits:
+    """
+    스윕 동시 연결 수 + 초당 연결 시도 수 제한 (동시에 실행되는 스윕이 함께 나눠 쓴다, 이벤트 루프 안에서만 사용)
+    """
+
+    def __init__(self, concurrency: int = None, rate: float = None):
+        self.concurrency = concurrency or settings.NETWORK_SWEEP_CONCURRENCY
+        self.rate = settings.NETWORK_SWEEP_RATE if rate is None else rate
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.limiter = RateLimiter(self.rate)
+
+
+class SweepInventory:
+    """
+    스윕 결과 인벤토리 ((host, port) → 최신 결과, TTL, 스레드 안전)
+    """
+
+    def __init__(self, ttl: float = None, max_entries: int = None):
+        self.ttl = ttl or settings.NETWORK_SWEEP_INVENTORY_TTL
+        self.max_entries = max_entries or settings.NETWORK_SWEEP_INVENTORY_SIZE
+        self._data: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, host: str, port: int) -> Optional[Dict[str, Any]]:
+        """신선한 결과 (없거나 만료되면 None)"""
+        with self._lock:
+            item = self._data.get((host, port))
+        if item is None or time.monotonic() - item[0] > self.ttl:
+            return None
+        return item[1]
+
+    def put(self, result: Dict[str, Any]) -> None:
+        """결과 저장 (건너뛴 포트는 저장하지 않음, 용량 초과 시 오래된 항목 제거)"""
+        if result["status"] == "skipped":
+            return
+        key = (result["host"], result["port"])
+        with self._lock:
+            self._data[key] = (time.monotonic(), result)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def query(self, cidr: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """인벤토리 조회 (cidr 대역 안, status 일치, 만료 항목 제외)"""
+        network = ipaddress.ip_network(cidr, strict=False) if cidr else None
+        now = time.monotonic()
+        with self._lock:
+            items = list(self._data.values())
+        results = []
+        for stored_at, result in items:
+            if now - stored_at > self.ttl:
+                continue
+            if status is not None and result["status"] != status:
+                continue
+            if network is not None and ipaddress.ip_address(result["host"]) not in network:
+                continue
+            results.append(result)
+        results.sort(key=lambda r: (ipaddress.ip_address(r["host"]), r["port"]))
+        return results
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class NetworkSweeper:
+    """
+    CIDR × 포트 비동기 스윕
+
+    Args:
+        timeout: 연결 타임아웃 (초)
+        host_budget: 호스트별 시간 예산 (초, 첫 시도부터)
+        limits: 동시 연결/속도 제한 (없으면 프로세스 전역 제한)
+    """
+
+    def __init__(
+        self,
+        timeout: float = None,
+        host_budget: float = None,
+        inventory: Optional[SweepInventory] = None,
+        limits: Optional[SweepLimits] = None
+    ):
+        self.limits = limits if limits is not None else get_sweep_limits()
+        self.timeout = timeout or settings.NETWORK_SWEEP_TIMEOUT
+        self.host_budget = host_budget or settings.NETWORK_SWEEP_HOST_BUDGET
+        self.inventory = inventory if inventory is not None else get_sweep_inventory()
+
+    async def sweep(
+        self,
+        hosts: List[str],
+        ports: List[int],
+        refresh: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        스윕 실행, 결과를 끝나는 순서대로 yield
+
+        결과: {"host", "port", "status", "latency_ms", "checked_at", "cached", "error"}
+        호출자가 순회를 멈추면(클라이언트 연결 종료 등) 남은 시도는 취소된다.
+        """
+        pending: List[Tuple[str, int]] = []
+        for host in hosts:
+            for port in ports:
+                cached = None if refresh else self.inventory.get(host, port)
+                if cached is not None:
+                    yield {**cached, "cached": True}
+                else:
+                    pending.append((host, port))
+        if not pending:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+        results: asyncio.Queue = asyncio.Queue()
+        deadlines: Dict[str, float] = {}
+
+        async def worker() -> None:
+            while True:
+                try:
+                    host, port = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                # 다른 스윕과 나눠 쓰는 제한을 기다린 시간은 호스트 예산에 넣지 않는다
+                async with self.limits.semaphore:
+                    await self.limits.limiter.acquire()
+                    now = time.monotonic()
+                    deadline = deadlines.setdefault(host, now + self.host_budget)
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        status, error, elapsed = "skipped", "host time budget exceeded", 0.0
+                    else:
+                        status, error = await connect(host, port, min(self.timeout, remaining))
+                        elapsed = time.monotonic() - now
+                result = {
+                    "host": host,
+                    "port": port,
+                    "status": status,
+                    "latency_ms": round(elapsed * 1000, 1) if status != "skipped" else None,
+                    "checked_at": datetime.utcnow(),
+                    "error": error,
+                }
+                self.inventory.put(result)
+                await results.put({**result, "cached": False})
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.limits.concurrency, len(pending)))]
+        try:
+            for _ in range(len(pending)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """스윕 결과 요약 (상태별 개수, 열린 포트가 있는 호스트)"""
+    counts = {status: 0 for status in SWEEP_STATUSES}
+    open_hosts: Dict[str, List[int]] = {}
+    for result in results:
+        counts[result["status"]] += 1
+        if result["status"] == "open":
+            open_hosts.setdefault(result["host"], []).append(result["port"])
+    return {
+        "total": len(results),
+        "counts": counts,
+        "cached": sum(1 for result in results if result.get("cached")),
+        "hosts_up": len(open_hosts),
+        "open": {host: sorted(ports) for host, ports in open_hosts.items()},
+    }
+
+
+_inventory: Optional[SweepInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_sweep_inventory() -> SweepInventory:
+    """프로세스 전역 스윕 인벤토리"""
+    global _inventory
+    if _inventory is None:
+        with _inventory_lock:
+            if _inventory is None:
+                _inventory = SweepInventory()
+    return _inventory
+
+
+_limits: Optional[SweepLimits] = None
+_limits_lock = threading.Lock()
+
+
+def get_sweep_limits() -> SweepLimits:
+    """프로세스 전역 스윕 동시 연결/속도 제한"""
+    global _limits
+    if _limits is None:
+        with _limits_lock:
+            if _limits is None:
+                _limits = SweepLimits()
+    return _limits
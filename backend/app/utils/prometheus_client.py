@@ -0,0 +1,229 @@
+"""
+Prometheus HTTP API 클라이언트
+
+- /api/v1/query_range, /api/v1/query 호출 (공유 httpx 커넥션 풀)
+- 배포 단위 배치: 메트릭마다 요청하지 않고 배포 레이블 셀렉터 하나로 배포의 모든 시계열을 한 번에 조회
+  (예: {deployment_id="..."} 또는 {__name__=~"cpu_usage|memory_usage",deployment_id="..."})
+- NaN/±Inf 샘플은 버린다 (JSON 응답/SSE에 넣을 수 없음)
+- 범위 조회 결과 캐시: 키 (쿼리, step, step 단위로 정렬한 범위) — 같은 패널을 새로 고쳐도 step 안에서는 재사용
+- 같은 키의 동시 요청은 하나의 HTTP 요청을 공유
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.utils.metrics_store import MetricSeries, from_millis, to_millis
+
+logger = get_logger("app.utils.prometheus_client")
+
+# Prometheus에는 단위 정보가 없으므로 이름 접미사로 퍼센트 메트릭을 구분
+_PERCENT_SUFFIXES = ("_usage", "_percent")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def build_selector(labels: Dict[str, str], metric_names: Optional[Sequence[str]] = None) -> str:
+    """
+    시계열 셀렉터 생성
+
+    metric_names가 하나면 name{...}, 여러 개면 {__name__=~"a|b",...}로 한 쿼리에 묶는다.
+    """
+    matchers = [f'{key}="{_escape(str(value))}"' for key, value in labels.items()]
+    if metric_names and len(metric_names) == 1:
+        return f"{metric_names[0]}{{{','.join(matchers)}}}"
+    if metric_names:
+        names = "|".join(re.escape(name) for name in metric_names)
+        matchers.insert(0, f'__name__=~"{_escape(names)}"')
+    return "{" + ",".join(matchers) + "}"
+
+
+def align_range(start: datetime, end: datetime, step: int) -> tuple:
+    """[start, end]를 step 경계로 넓혀 정렬 (epoch 초)"""
+    start_s = math.floor(to_millis(start) / 1000 / step) * step
+    end_s = math.ceil(to_millis(end) / 1000 / step) * step
+    return start_s, max(end_s, start_s)
+
+
+def metric_unit(name: str) -> Optional[str]:
+    return "percent" if name.endswith(_PERCENT_SUFFIXES) else None
+
+
+def _to_series(result: List[Dict[str, Any]], drop_labels: Iterable[str] = ()) -> List[MetricSeries]:
+    """matrix 결과 → MetricSeries 리스트"""
+    drop = set(drop_labels) | {"__name__"}
+    series = []
+    for item in result:
+        labels = item.get("metric") or {}
+        name = labels.get("__name__", "")
+        samples = np.array(item.get("values") or [], dtype=np.float64).reshape(-1, 2)
+        # NaN/±Inf 샘플(0으로 나눈 비율, 스테일 마커 등)은 JSON으로 내보낼 수 없고 집계도 망가뜨리므로 버린다
+        samples = samples[np.isfinite(samples[:, 1])]
+        series.append(MetricSeries(
+            name=name,
+            timestamps=np.round(samples[:, 0] * 1000).astype(np.int64),
+            values=samples[:, 1],
+            unit=metric_unit(name),
+            tags={key: value for key, value in labels.items() if key not in drop},
+            resolution=0,
+        ))
+    return series
+
+
+class PrometheusClient:
+    """
+    Prometheus HTTP API 클라이언트
+
+    Args:
+        base_url: Prometheus 주소 (예: http://localhost:9090)
+    """
+
+    def __init__(
+        self,
+        base_url: str = None,
+        timeout: float = None,
+        max_connections: int = None,
+        cache_size: int = None,
+        cache_ttl: float = None
+    ):
+        self.base_url = (base_url or settings.PROMETHEUS_URL).rstrip("/")
+        self.timeout = timeout or settings.PROMETHEUS_TIMEOUT
+        self.max_connections = max_connections or settings.PROMETHEUS_MAX_CONNECTIONS
+        self._cache = LRUCache(
+            max_size=cache_size or settings.PROMETHEUS_CACHE_SIZE,
+            ttl=settings.PROMETHEUS_CACHE_TTL if cache_ttl is None else cache_ttl,
+        )
+        self._client = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.request_count = 0
+
+    def _http(self):
+        """공유 httpx.AsyncClient (keep-alive 커넥션 풀)"""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.request_count += 1
+        response = await self._http().get(path, params=params)
+        body = response.json()
+        if response.status_code != 200 or body.get("status") != "success":
+            raise RuntimeError(
+                f"Prometheus 쿼리 실패: status={response.status_code}, "
+                f"error={body.get('errorType')}: {body.get('error')}"
+            )
+        return body["data"]
+
+    async def query_range(
+        self,
+        query: str,
+        start: datetime,
+        end: datetime,
+        step: int,
+        drop_labels: Iterable[str] = ()
+    ) -> List[MetricSeries]:
+        """
+        범위 조회 (/api/v1/query_range)
+
+        범위를 step 경계로 정렬해 캐시 키로 사용하므로 결과는 [start, end]보다 최대 step만큼 넓을 수 있다.
+        """
+        step = max(int(step), 1)
+        start_s, end_s = align_range(start, end, step)
+        key = (query, step, start_s, end_s)
+        cached = self._cache.get(repr(key))
+        if cached is not None:
+            return _to_series(cached, drop_labels)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._get("/api/v1/query_range", {"query": query, "start": start_s, "end": end_s, "step": step})
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        data = await asyncio.shield(future)
+        result = data.get("result") or []
+        self._cache.set(repr(key), result)
+        return _to_series(result, drop_labels)
+
+    async def query(
+        self,
+        query: str,
+        time: Optional[datetime] = None,
+        drop_labels: Iterable[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        즉시 조회 (/api/v1/query): 시계열별 최신 점 리스트
+        """
+        params: Dict[str, Any] = {"query": query}
+        if time is not None:
+            params["time"] = to_millis(time) / 1000
+        data = await self._get("/api/v1/query", params)
+        drop = set(drop_labels) | {"__name__"}
+        points = []
+        for item in data.get("result") or []:
+            labels = item.get("metric") or {}
+            ts, value = item["value"]
+            value = float(value)
+            if not math.isfinite(value):
+                continue
+            name = labels.get("__name__", "")
+            points.append({
+                "name": name,
+                "value": value,
+                "unit": metric_unit(name),
+                "timestamp": from_millis(round(float(ts) * 1000)),
+                "tags": {key: val for key, val in labels.items() if key not in drop} or None,
+            })
+        return points
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료"""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+
+_prometheus_client: Optional[PrometheusClient] = None
+_prometheus_client_lock = threading.Lock()
+
+
+def get_prometheus_client() -> PrometheusClient:
+    """프로세스 전역 Prometheus 클라이언트"""
+    global _prometheus_client
+    if _prometheus_client is None:
+        with _prometheus_client_lock:
+            if _prometheus_client is None:
+                _prometheus_client = PrometheusClient()
+    return _prometheus_client
+
+
+async def close_prometheus_client() -> None:
+    """전역 Prometheus 클라이언트 커넥션 풀 종료"""
+    global _prometheus_client
+    client, _prometheus_client = _prometheus_client, None
+    if client is not None:
+        await client.aclose()
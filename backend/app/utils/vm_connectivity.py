@@ -2,18 +2,50 @@
 VM 연결성 확인 유틸리티
 
 VirtualBox, Vagrant 등의 VM과의 통신 여부를 확인하는 유틸리티
+
+- 포트 확인은 asyncio.open_connection으로 이벤트 루프를 막지 않고 동시에 실행
+- 확인 결과는 프로세스 전역 TTL 캐시(VM_CHECK_CACHE_TTL)에 두고 요청/배포 간에 공유하며,
+  같은 확인이 동시에 들어오면 진행 중인 확인 하나를 함께 기다린다
 """
 import asyncio
-import subprocess
-import socket
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from app.core.cache import LRUCache
 from app.core.logging_config import get_logger
 from app.core.config import settings
 
 logger = get_logger("app.utils.vm_connectivity")
 
+_result_cache = LRUCache(max_size=settings.VM_CHECK_CACHE_SIZE, ttl=settings.VM_CHECK_CACHE_TTL)
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+def clear_connectivity_cache() -> None:
+    """확인 결과 캐시 비우기"""
+    _result_cache.clear()
+
+
+async def probe_port(host: str, port: int, timeout: float) -> Tuple[str, Optional[str]]:
+    """
+    TCP 연결 확인
+
+    Returns:
+        (상태, 오류): 상태는 'connected', 'disconnected'(거부/타임아웃), 'error'(이름 해석 실패 등)
+    """
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    except (asyncio.TimeoutError, ConnectionError) as e:
+        return "disconnected", str(e) or type(e).__name__
+    except OSError as e:
+        return "error", str(e)
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return "connected", None
+
 
 class VMConnectivityChecker:
     """
@@ -25,8 +57,29 @@ class VMConnectivityChecker:
     - Vagrant 상태 확인
     """
     
-    def __init__(self, vm_name: Optional[str] = None):
+    def __init__(self, vm_name: Optional[str] = None, use_cache: bool = True):
         self.vm_name = vm_name or "Solmakase-Dev-Server"
+        self.use_cache = use_cache
+    
+    async def _cached(self, key: tuple, check: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        캐시된 확인 결과 반환 (없으면 확인 실행 후 저장, 진행 중인 같은 확인은 함께 대기)
+        
+        use_cache가 False면 캐시를 읽지 않고 새로 확인한 결과로 갱신한다.
+        """
+        if self.use_cache:
+            cached = _result_cache.get(repr(key))
+            if cached is not None:
+                return dict(cached)
+        
+        future = _inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(check())
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+        result = await asyncio.shield(future)
+        _result_cache.set(repr(key), result)
+        return dict(result)
     
     async def check_virtualbox_vm_status(self) -> Dict[str, Any]:
         """
@@ -35,6 +88,9 @@ class VMConnectivityChecker:
         Returns:
             VM 상태 정보
         """
+        return await self._cached(("virtualbox", self.vm_name), self._check_virtualbox_vm_status)
+    
+    async def _check_virtualbox_vm_status(self) -> Dict[str, Any]:
         try:
             # VBoxManage 명령어로 VM 상태 확인
             result = await self._run_command(
@@ -93,6 +149,9 @@ class VMConnectivityChecker:
         Returns:
             Vagrant 상태 정보
         """
+        return await self._cached(("vagrant", vagrant_dir), lambda: self._check_vagrant_status(vagrant_dir))
+    
+    async def _check_vagrant_status(self, vagrant_dir: Optional[str]) -> Dict[str, Any]:
         try:
             if vagrant_dir:
                 work_dir = Path(vagrant_dir)
@@ -143,7 +202,7 @@ class VMConnectivityChecker:
         self,
         host: str = "localhost",
         port: int = 22,
-        timeout: int = 5
+        timeout: float = 5
     ) -> Dict[str, Any]:
         """
         SSH 연결 확인
@@ -156,32 +215,28 @@ class VMConnectivityChecker:
         Returns:
             SSH 연결 상태
         """
-        try:
-            # 소켓 연결 시도
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            
-            is_connected = result == 0
-            
-            return {
-                "available": is_connected,
-                "host": host,
-                "port": port,
-                "status": "connected" if is_connected else "disconnected",
-                "error": None if is_connected else f"포트 {port}에 연결할 수 없습니다"
-            }
-            
-        except Exception as e:
-            logger.exception(f"SSH 연결 확인 실패: {str(e)}")
-            return {
-                "available": False,
-                "host": host,
-                "port": port,
-                "status": "error",
-                "error": str(e)
-            }
+        status, error = await self._probe(host, port, timeout)
+        is_connected = status == "connected"
+        
+        return {
+            "available": is_connected,
+            "host": host,
+            "port": port,
+            "status": status,
+            "error": None if is_connected else (
+                error if status == "error" else f"포트 {port}에 연결할 수 없습니다"
+            )
+        }
+    
+    async def _probe(self, host: str, port: int, timeout: float) -> Tuple[str, Optional[str]]:
+        """포트 연결 확인 (캐시 공유, 결과: (상태, 오류))"""
+        async def check() -> Dict[str, Any]:
+            status, error = await probe_port(host, port, timeout)
+            return {"status": status, "error": error}
+        
+        # 타임아웃이 다르면 결과(타임아웃으로 인한 disconnected)도 다를 수 있으므로 키에 포함
+        result = await self._cached(("port", host, port, timeout), check)
+        return result["status"], result["error"]
     
     async def check_vagrant_ssh(self, vagrant_dir: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -193,6 +248,9 @@ class VMConnectivityChecker:
         Returns:
             SSH 연결 상태
         """
+        return await self._cached(("vagrant_ssh", vagrant_dir), lambda: self._check_vagrant_ssh(vagrant_dir))
+    
+    async def _check_vagrant_ssh(self, vagrant_dir: Optional[str]) -> Dict[str, Any]:
         try:
             if vagrant_dir:
                 work_dir = Path(vagrant_dir)
@@ -281,37 +339,29 @@ class VMConnectivityChecker:
         connected_count = 0
         total_count = len(hosts)
         
-        for host, port in hosts:
+        # 모든 포트를 동시에 확인 (전체 소요 시간 ≈ 가장 느린 포트 하나)
+        probes = await asyncio.gather(
+            *(self._probe(host, port, settings.VM_CHECK_CONNECT_TIMEOUT) for host, port in hosts)
+        )
+        
+        for (host, port), (probe_status, error) in zip(hosts, probes):
             service_name = service_names.get((host, port), f"{host}:{port}")
             key = f"{host}:{port}"
             
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result = sock.connect_ex((host, port))
-                sock.close()
-                
-                is_connected = result == 0
-                if is_connected:
-                    connected_count += 1
-                
-                results[key] = {
-                    "available": is_connected,
-                    "status": "connected" if is_connected else "disconnected",
-                    "service": service_name,
-                    "host": host,
-                    "port": port,
-                    "error": None if is_connected else self._get_connection_error_message(service_name, port)
-                }
-            except Exception as e:
-                results[key] = {
-                    "available": False,
-                    "status": "error",
-                    "service": service_name,
-                    "host": host,
-                    "port": port,
-                    "error": str(e)
-                }
+            is_connected = probe_status == "connected"
+            if is_connected:
+                connected_count += 1
+            
+            results[key] = {
+                "available": is_connected,
+                "status": probe_status,
+                "service": service_name,
+                "host": host,
+                "port": port,
+                "error": None if is_connected else (
+                    error if probe_status == "error" else self._get_connection_error_message(service_name, port)
+                )
+            }
         
         # 상태 판단
         if connected_count == total_count:
@@ -370,11 +420,18 @@ class VMConnectivityChecker:
         Returns:
             전체 연결성 상태
         """
+        # 서로 독립적인 확인이므로 동시에 실행
+        virtualbox, vagrant, vagrant_ssh, network = await asyncio.gather(
+            self.check_virtualbox_vm_status(),
+            self.check_vagrant_status(vagrant_dir),
+            self.check_vagrant_ssh(vagrant_dir),
+            self.check_network_connectivity(),
+        )
         results = {
-            "virtualbox": await self.check_virtualbox_vm_status(),
-            "vagrant": await self.check_vagrant_status(vagrant_dir),
-            "vagrant_ssh": await self.check_vagrant_ssh(vagrant_dir),
-            "network": await self.check_network_connectivity(),
+            "virtualbox": virtualbox,
+            "vagrant": vagrant,
+            "vagrant_ssh": vagrant_ssh,
+            "network": network,
         }
         
         # 전체 상태 판단
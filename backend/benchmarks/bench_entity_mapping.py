@@ -0,0 +1,84 @@
+"""
+ORM → 엔티티 → 응답 스키마 변환 비용 벤치마크
+
+기존 경로(db_model.__dict__ 복사 → entity.dict() → Schema(**dict))와
+매퍼 경로(EntityMapper.to_entity → Schema.from_entity)의 행당 변환 비용을 비교한다.
+
+실행:
+    cd backend
+    python benchmarks/bench_entity_mapping.py --rows 500 --repeat 20
+"""
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# backend/를 sys.path에 추가 (alembic/env.py와 동일한 방식)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app import models  # noqa: F401
+from app.models.deployment import DeploymentModel
+from app.domain.entities.deployment import Deployment
+from app.schemas.deployment import DeploymentResponse
+from app.repositories.implementations.mapper import EntityMapper
+
+
+def legacy_convert(db_model: DeploymentModel) -> DeploymentResponse:
+    """기존 경로: __dict__ 복사 → dataclass → dict() → Schema(**dict)"""
+    state = {k: v for k, v in db_model.__dict__.items() if not k.startswith("_")}
+    entity = Deployment(**state)
+    return DeploymentResponse(**entity.dict())
+
+
+def mapper_convert(mapper: EntityMapper, db_model: DeploymentModel) -> DeploymentResponse:
+    """매퍼 경로 (from_entity): itemgetter 한 번 → slots dataclass → model_validate(from_attributes)"""
+    return DeploymentResponse.from_entity(mapper.to_entity(db_model))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500, help="조회할 행 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    infrastructure_id = uuid.uuid4()
+    session.add_all(
+        DeploymentModel(
+            infrastructure_design_id=infrastructure_id,
+            iac_code_id=uuid.uuid4(),
+            status="success",
+            deployment_log="ok",
+        )
+        for _ in range(args.rows)
+    )
+    session.commit()
+    rows = session.query(DeploymentModel).all()
+
+    mapper = EntityMapper(DeploymentModel, Deployment)
+    cases = {
+        "legacy (__dict__ → dict() → **kwargs)": lambda row: legacy_convert(row),
+        "mapper + from_entity": lambda row: mapper_convert(mapper, row),
+    }
+
+    print(f"rows={args.rows} repeat={args.repeat}")
+    for name, convert in cases.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for row in rows:
+                convert(row)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:<42} {best / args.rows * 1e6:8.2f} µs/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+테스트/로컬 개발용 가짜 Prometheus 서버
+
+Prometheus HTTP API 중 MetricsCollector가 쓰는 부분만 흉내 낸다.
+
+- GET /api/v1/query_range?query=&start=&end=&step=  (resultType: matrix)
+- GET /api/v1/query?query=&time=                    (resultType: vector, 5분 lookback)
+- 셀렉터: name{label="v",...}, {__name__=~"a|b",label="v",...} (=, !=, =~, !~)
+- 값은 add_series로 넣은 점 또는 시드 기반 합성 값
+
+사용:
+    with FakePrometheus() as prom:
+        prom.add_series("cpu_usage", {"deployment_id": "..."}, [(ts, 42.0), ...])
+        client = PrometheusClient(base_url=prom.url)
+
+로컬 실행 (METRICS_SOURCE=prometheus, PROMETHEUS_URL=http://localhost:9090):
+    cd backend
+    python -m tests.fixtures.fake_prometheus --port 9090 --deployment <deployment_id>
+"""
+import argparse
+import json
+import math
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_LOOKBACK_SECONDS = 300
+_MATCHER = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*(=~|!~|!=|=)\s*"((?:[^"\\]|\\.)*)"\s*,?')
+_SELECTOR = re.compile(r"^\s*([a-zA-Z_:][a-zA-Z0-9_:]*)?\s*(?:\{(.*)\})?\s*$")
+
+
+def format_value(value: float) -> str:
+    """Prometheus 샘플 값 문자열 (NaN, +Inf, -Inf 표기 포함)"""
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def parse_selector(query: str) -> List[Tuple[str, str, str]]:
+    """셀렉터 → [(레이블, 연산자, 값)] (메트릭 이름은 __name__ 매처로 변환)"""
+    match = _SELECTOR.match(query)
+    if not match or not (match.group(1) or match.group(2)):
+        raise ValueError(f"unsupported query: {query}")
+    matchers = []
+    if match.group(1):
+        matchers.append(("__name__", "=", match.group(1)))
+    body = match.group(2) or ""
+    position = 0
+    while position < len(body):
+        item = _MATCHER.match(body, position)
+        if not item:
+            raise ValueError(f"unsupported matcher: {body[position:]}")
+        value = item.group(3).replace('\\"', '"').replace("\\\\", "\\")
+        matchers.append((item.group(1), item.group(2), value))
+        position = item.end()
+    return matchers
+
+
+def _matches(labels: Dict[str, str], matchers: List[Tuple[str, str, str]]) -> bool:
+    for label, op, value in matchers:
+        actual = labels.get(label, "")
+        if op == "=" and actual != value:
+            return False
+        if op == "!=" and actual == value:
+            return False
+        if op == "=~" and not re.fullmatch(value, actual):
+            return False
+        if op == "!~" and re.fullmatch(value, actual):
+            return False
+    return True
+
+
+class FakePrometheus:
+    """
+    스레드에서 실행되는 가짜 Prometheus 서버
+
+    Args:
+        port: 0이면 빈 포트 자동 선택
+        latency: 요청마다 추가할 지연 (초, 왕복 횟수 비교용)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.latency = latency
+        self.series: List[Tuple[Dict[str, str], List[Tuple[float, float]]]] = []
+        self.requests: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_series(self, name: str, labels: Dict[str, str], samples: List[Tuple[float, float]]) -> None:
+        """시계열 추가 (samples: [(epoch 초, 값)], 시각 오름차순)"""
+        with self._lock:
+            self.series.append(({"__name__": name, **labels}, sorted(samples)))
+
+    def add_synthetic(
+        self,
+        deployment_id: str,
+        names: Tuple[str, ...] = ("cpu_usage", "memory_usage", "network_in", "network_out"),
+        resources: Tuple[str, ...] = ("web-server-1",),
+        hours: float = 24,
+        interval: float = 15
+    ) -> None:
+        """현재 시각까지 hours 시간 동안 interval 간격 합성 시계열 추가"""
+        now = time.time()
+        start = now - hours * 3600
+        count = int((now - start) // interval) + 1
+        for n, name in enumerate(names):
+            for r, resource in enumerate(resources):
+                samples = [
+                    (start + i * interval, 50.0 + 20.0 * math.sin((i + 37 * n + 11 * r) / 40.0))
+                    for i in range(count)
+                ]
+                self.add_series(name, {"deployment_id": deployment_id, "resource": resource}, samples)
+
+    def _select(self, query: str) -> List[Tuple[Dict[str, str], List[Tuple[float, float]]]]:
+        matchers = parse_selector(query)
+        with self._lock:
+            return [(labels, samples) for labels, samples in self.series if _matches(labels, matchers)]
+
+    def query_range(self, query: str, start: float, end: float, step: float) -> Dict:
+        result = []
+        for labels, samples in self._select(query):
+            values = []
+            t = start
+            index = 0
+            while t <= end + 1e-9:
+                # t 이전 lookback 안의 마지막 점 (Prometheus 범위 조회와 같은 규칙)
+                while index < len(samples) and samples[index][0] <= t:
+                    index += 1
+                if index and t - samples[index - 1][0] <= _LOOKBACK_SECONDS:
+                    values.append([round(t, 3), format_value(samples[index - 1][1])])
+                t += step
+            if values:
+                result.append({"metric": labels, "values": values})
+        return {"resultType": "matrix", "result": result}
+
+    def query(self, query: str, at: float) -> Dict:
+        result = []
+        for labels, samples in self._select(query):
+            previous = [s for s in samples if at - _LOOKBACK_SECONDS <= s[0] <= at]
+            if previous:
+                result.append({"metric": labels, "value": [at, format_value(previous[-1][1])]})
+        return {"resultType": "vector", "result": result}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # noqa: A002 - 기본 접근 로그 끄기
+                pass
+
+            def _reply(self, status: int, body: Dict) -> None:
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                with fake._lock:
+                    fake.requests.append({"path": url.path, **params})
+                if fake.latency:
+                    time.sleep(fake.latency)
+                try:
+                    if url.path == "/api/v1/query_range":
+                        data = fake.query_range(
+                            params["query"], float(params["start"]), float(params["end"]), float(params["step"])
+                        )
+                    elif url.path == "/api/v1/query":
+                        data = fake.query(params["query"], float(params.get("time", time.time())))
+                    else:
+                        self._reply(404, {"status": "error", "errorType": "not_found", "error": url.path})
+                        return
+                except (KeyError, ValueError) as e:
+                    self._reply(400, {"status": "error", "errorType": "bad_data", "error": str(e)})
+                    return
+                self._reply(200, {"status": "success", "data": data})
+
+        return Handler
+
+    def start(self) -> "FakePrometheus":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakePrometheus":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="가짜 Prometheus 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9090)
+    parser.add_argument("--deployment", action="append", default=[], help="합성 메트릭을 만들 배포 ID (여러 번 지정 가능)")
+    parser.add_argument("--hours", type=float, default=24)
+    args = parser.parse_args()
+
+    server = FakePrometheus(args.host, args.port)
+    for deployment_id in args.deployment:
+        server.add_synthetic(deployment_id, hours=args.hours)
+    print(f"가짜 Prometheus 실행: {server.url} (deployments={args.deployment})")
+    server.start()
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
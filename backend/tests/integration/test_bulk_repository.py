@@ -0,0 +1,66 @@
+"""
+BulkRepositoryMixin 동작 확인 (SQLite)
+"""
+import time
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.db.base import Base
+from app.domain.entities.requirement import Requirement
+from app.models.user import UserModel
+from app.repositories.implementations.requirement_repository import RequirementRepository
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_bulk_update_refreshes_updated_at(db):
+    user_id = uuid.uuid4()
+    db.add(UserModel(id=user_id, email=f"{user_id}@example.com"))
+    db.commit()
+    repository = RequirementRepository(db)
+    requirement = repository.create(Requirement(user_id=user_id, input_type="survey"))
+    before = requirement.updated_at
+
+    time.sleep(1.1)  # SQLite CURRENT_TIMESTAMP는 초 단위
+    requirement.status = "completed"
+    assert repository.bulk_update([requirement]) == 1
+
+    db.expire_all()
+    updated = repository.get_by_id(requirement.id)
+    assert updated.status == "completed"
+    assert updated.updated_at > before
+
+
+def test_bulk_update_counts_only_updated_rows(db):
+    user_id = uuid.uuid4()
+    db.add(UserModel(id=user_id, email=f"{user_id}@example.com"))
+    db.commit()
+    repository = RequirementRepository(db)
+    kept, deleted, changed = repository.bulk_create(
+        [Requirement(user_id=user_id, input_type="survey", status="processing") for _ in range(3)]
+    )
+    repository.delete(deleted.id)
+    other = repository.get_by_id(changed.id)
+    other.status = "completed"  # 조회 후 다른 요청이 바꾼 행
+    repository.update(other)
+
+    for requirement in (kept, deleted, changed):
+        requirement.status = "failed"
+    assert repository.bulk_update([kept, deleted, changed], where={"status": "processing"}) == 1
+
+    db.expire_all()
+    assert repository.get_by_id(kept.id).status == "failed"
+    assert repository.get_by_id(changed.id).status == "completed"
+    assert repository.bulk_update([kept, deleted]) == 1
@@ -0,0 +1,115 @@
+"""
+업로드 문서 청크 격리 확인 (로컬 벡터 스토어 + SQLite)
+
+요구사항 A의 업로드 문서를 수집해도 요구사항 B 분석의 참고 문서 검색에 나오지 않아야 한다.
+"""
+import asyncio
+import hashlib
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.core.config import settings
+from app.core.resources import DOCUMENT_STORE_COLLECTION, ResourceRegistry
+from app.db import session as db_session
+from app.db.base import Base
+from app.domain.entities.document_content import DocumentContent
+from app.repositories.implementations.document_content_repository import DocumentContentRepository
+from app.services import llm_service
+from app.services.ingestion_service import index_document_content
+from app.services.llm_service import LLMService
+
+SECRET = "고객A 결제 시스템은 내부망 전용 오라클 클러스터와 쿠버네티스 웹 서비스로 구성한다."
+KNOWLEDGE = "쿠버네티스 웹 서비스는 인그레스와 오토스케일링으로 구성한다."
+
+
+class HashEmbeddings:
+    """텍스트 해시 기반 결정적 임베딩"""
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255.0 + 0.01 for byte in digest[:8]]
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(settings, "VECTOR_STORE_BACKEND", "local")
+    monkeypatch.setattr(settings, "VECTOR_INDEX_DTYPE", "float32")
+    registry = ResourceRegistry()
+    registry._embeddings = HashEmbeddings()
+    monkeypatch.setattr(llm_service, "get_resource_registry", lambda: registry)
+    return registry
+
+
+@pytest.fixture
+def content_hash(tmp_path, monkeypatch):
+    """요구사항 A가 업로드한 문서 내용"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'isolation.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(db_session, "SessionLocal", session_factory)
+
+    digest = hashlib.sha256(SECRET.encode("utf-8")).hexdigest()
+    db = session_factory()
+    DocumentContentRepository(db).create(DocumentContent(
+        content_hash=digest, file_type="pdf", file_size=len(SECRET), file_path="a.pdf",
+        extracted_text=SECRET, parsed_data={"type": "pdf", "text": SECRET},
+    ))
+    db.close()
+    yield digest
+    engine.dispose()
+
+
+def _analyze(service):
+    """요구사항 B 분석 → LLM에 전달된 참고 문서"""
+    captured = []
+
+    async def fake_llm(requirement_text, relevant_docs):
+        captured.extend(relevant_docs)
+        return {}
+
+    requirement = SimpleNamespace(
+        service_type="쿠버네티스 웹 서비스", deployment_type="onprem", scale="small", budget=None,
+        has_ops_team=None, special_requirements="결제 시스템 오라클 클러스터", structured_data=None,
+    )
+    service.requirement_repository = SimpleNamespace(get_by_id=lambda _: requirement)
+    service._analyze_with_llm = fake_llm
+    asyncio.run(service.analyze_requirement(uuid.uuid4()))
+    return captured
+
+
+def test_uploaded_document_is_not_retrieved_for_other_requirement(registry, content_hash):
+    service = LLMService()
+    asyncio.run(service.add_knowledge_document(KNOWLEDGE, {"source": "knowledge"}))
+    result = index_document_content(content_hash)
+
+    assert result is not None and result.added > 0
+    document_store = registry.get_vector_store(DOCUMENT_STORE_COLLECTION)
+    assert document_store.get(where={"content_hash": content_hash}, include=[])["ids"]
+
+    docs = _analyze(service)
+    assert KNOWLEDGE in docs
+    assert not any("고객A" in doc for doc in docs)
+
+
+def test_legacy_chunks_in_knowledge_collection_are_excluded(registry, content_hash):
+    service = LLMService()
+    asyncio.run(service.add_knowledge_document(KNOWLEDGE, {"source": "knowledge"}))
+    # 분리 전 방식으로 지식 컬렉션에 수집된 업로드 문서
+    asyncio.run(service.add_knowledge_document(
+        SECRET, {"source": "requirement_document", "content_hash": content_hash}, source_key=content_hash
+    ))
+
+    docs = _analyze(service)
+    assert KNOWLEDGE in docs
+    assert not any("고객A" in doc for doc in docs)
+
+    assert service.delete_document_chunks([content_hash]) == 1  # 보관 기간 정리 시 함께 삭제
@@ -0,0 +1,122 @@
+"""
+JSON 컬럼 조회 결과 확인 (SQLite)
+
+search_by_structured_data / search_by_architecture / count_component_types가
+실제로 맞는 행과 개수를 돌려주는지 확인한다 (실행 계획은 test_query_plans에서 검사).
+"""
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.db.base import Base
+from app.domain.entities.infrastructure import Infrastructure
+from app.domain.entities.requirement import Requirement
+from app.models.user import UserModel
+from app.repositories.implementations.infrastructure_repository import InfrastructureRepository
+from app.repositories.implementations.requirement_repository import RequirementRepository
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'json.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def requirements(db):
+    user_id = uuid.uuid4()
+    db.add(UserModel(id=user_id, email=f"{user_id}@example.com"))
+    db.commit()
+    repository = RequirementRepository(db)
+    rows = {
+        "onprem_small": ("onprem", "small", ["nginx", "mysql"]),
+        "onprem_large": ("onprem", "large", ["nginx"]),
+        "cloud_small": ("cloud", "small", ["redis"]),
+        "empty": None,
+    }
+    created = {
+        name: repository.create(Requirement(
+            user_id=user_id,
+            input_type="survey",
+            structured_data=dict(zip(("deployment_type", "scale", "technical_stack_suggestions"), data))
+            if data else None,
+        ))
+        for name, data in rows.items()
+    }
+    return repository, {requirement.id: name for name, requirement in created.items()}
+
+
+def _names(results, ids):
+    return sorted(ids[item.id] for item in results)
+
+
+def test_search_by_structured_data(requirements):
+    repository, ids = requirements
+
+    assert _names(repository.search_by_structured_data(deployment_type="onprem"), ids) == [
+        "onprem_large", "onprem_small"
+    ]
+    assert _names(repository.search_by_structured_data(scale="small"), ids) == ["cloud_small", "onprem_small"]
+    assert _names(repository.search_by_structured_data(deployment_type="onprem", scale="small"), ids) == [
+        "onprem_small"
+    ]
+    assert _names(repository.search_by_structured_data(technical_stack="nginx"), ids) == [
+        "onprem_large", "onprem_small"
+    ]
+    assert _names(repository.search_by_structured_data(technical_stack="mysql", scale="small"), ids) == [
+        "onprem_small"
+    ]
+    assert repository.search_by_structured_data(technical_stack="postgres") == []
+    assert len(repository.search_by_structured_data()) == 4
+    assert len(repository.search_by_structured_data(deployment_type="onprem", limit=1)) == 1
+
+
+@pytest.fixture
+def infrastructures(db, requirements):
+    _, ids = requirements
+    requirement_id = next(iter(ids))
+    repository = InfrastructureRepository(db)
+    rows = {
+        "web_db": ("onprem", "onprem", [
+            {"type": "web", "name": "web-1"}, {"type": "web", "name": "web-2"}, {"type": "db", "name": "db-1"}
+        ]),
+        "cache": ("cloud", "aws", [{"type": "cache", "name": "redis-1"}, {"type": "web", "name": "web-1"}]),
+        "empty": ("onprem", "onprem", []),
+        "none": ("onprem", "onprem", None),
+    }
+    created = {
+        name: repository.create(Infrastructure(
+            requirement_id=requirement_id,
+            design_type=design_type,
+            provider=provider,
+            architecture={"components": components} if components is not None else None,
+        ))
+        for name, (design_type, provider, components) in rows.items()
+    }
+    return repository, {infrastructure.id: name for name, infrastructure in created.items()}
+
+
+def test_search_by_architecture(infrastructures):
+    repository, ids = infrastructures
+
+    assert _names(repository.search_by_architecture(component_type="web"), ids) == ["cache", "web_db"]
+    assert _names(repository.search_by_architecture(component_type="db"), ids) == ["web_db"]
+    assert _names(repository.search_by_architecture(component_type="web", provider="aws"), ids) == ["cache"]
+    assert _names(repository.search_by_architecture(component_type="web", design_type="onprem"), ids) == ["web_db"]
+    assert repository.search_by_architecture(component_type="queue") == []
+    assert _names(repository.search_by_architecture(design_type="onprem"), ids) == ["empty", "none", "web_db"]
+
+
+def test_count_component_types(infrastructures):
+    repository, _ = infrastructures
+
+    assert repository.count_component_types() == {"web": 3, "db": 1, "cache": 1}
+    assert repository.count_component_types(design_type="onprem") == {"web": 2, "db": 1}
+    assert repository.count_component_types(design_type="hybrid") == {}
@@ -0,0 +1,128 @@
+"""
+메트릭 push 수집 API (/monitoring/ingest)
+
+- 없는 배포 ID는 버퍼에 넣기 전에 거절하고, 확인된 배포는 캐시해 요청마다 조회하지 않는다
+- 본문 크기는 Content-Length와 실제로 읽은 바이트 양쪽으로 제한한다
+"""
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.api.v1 import monitoring
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.base import Base
+from app.models.deployment import DeploymentModel
+from app.utils.metrics_ingest import MetricsIngestBuffer
+from app.utils.metrics_store import MetricsStore
+
+TS_MS = 1_760_000_000_000
+
+
+@pytest.fixture
+def deployment_id(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(db_session, "SessionLocal", session_factory)
+    db = session_factory()
+    deployment = DeploymentModel(infrastructure_design_id=uuid.uuid4(), iac_code_id=uuid.uuid4(), status="completed")
+    db.add(deployment)
+    db.commit()
+    yield str(deployment.id)
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """배포 존재 확인 DB 조회 기록"""
+    calls = []
+    original = monitoring._unknown_deployments
+
+    def recording(deployment_ids):
+        calls.append(sorted(str(d) for d in deployment_ids))
+        return original(deployment_ids)
+
+    monkeypatch.setattr(monitoring, "_unknown_deployments", recording)
+    monkeypatch.setattr(monitoring, "_known_ingest_deployments", LRUCache(max_size=100, ttl=60))
+    return calls
+
+
+@pytest.fixture
+def buffer(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ALERT_ENABLED", False)
+    buffer = MetricsIngestBuffer(store=MetricsStore(str(tmp_path / "metrics")))
+    monkeypatch.setattr(monitoring, "get_ingest_buffer", lambda: buffer)
+    return buffer
+
+
+@pytest.fixture
+def client(deployment_id, lookups, buffer):
+    app = FastAPI()
+    app.include_router(monitoring.router, prefix="/monitoring")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _payload(*deployment_ids):
+    return {"series": [
+        {"name": "cpu_usage", "unit": "percent", "deployment_id": d, "points": [[TS_MS, 10.0]]}
+        for d in deployment_ids
+    ]}
+
+
+def _line(deployment_id):
+    return f"cpu_usage,deployment_id={deployment_id},unit=percent value=10 {TS_MS}"
+
+
+def test_known_deployment_is_validated_once(client, deployment_id, lookups, buffer):
+    for _ in range(3):
+        response = client.post("/monitoring/ingest?precision=ms", content=_line(deployment_id))
+        assert response.status_code == 202
+    assert lookups == [[deployment_id]]  # 이후 요청은 캐시
+    assert buffer.pending_points == 3
+
+
+def test_unknown_deployment_is_rejected(client, deployment_id, lookups, buffer):
+    unknown = str(uuid.uuid4())
+    response = client.post("/monitoring/ingest", json=_payload(deployment_id, unknown))
+    assert response.status_code == 404
+    assert unknown in response.json()["detail"] and deployment_id not in response.json()["detail"]
+    assert buffer.pending_points == 0  # 요청 단위로 전부 거절
+
+    # 확인된 배포만 캐시되고 없는 배포는 다시 조회한다
+    assert client.post("/monitoring/ingest", json=_payload(unknown)).status_code == 404
+    assert client.post("/monitoring/ingest", json=_payload(deployment_id)).status_code == 202
+    assert lookups == [sorted([deployment_id, unknown]), [unknown]]
+
+
+def test_declared_body_over_limit_is_rejected_before_reading(client, deployment_id, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_INGEST_MAX_BODY_BYTES", 64)
+    response = client.post("/monitoring/ingest", content=b"x" * 100, headers={"Content-Type": "text/plain"})
+    assert response.status_code == 413
+
+
+def test_streamed_body_over_limit_is_rejected(client, deployment_id, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_INGEST_MAX_BODY_BYTES", 64)
+
+    def chunks():
+        for _ in range(10):
+            yield (_line(deployment_id) + "\n").encode()
+
+    response = client.post("/monitoring/ingest?precision=ms", content=chunks())  # chunked, Content-Length 없음
+    assert response.status_code == 413
+
+    small = client.post("/monitoring/ingest?precision=ms", content=_line(deployment_id)[:64])
+    assert small.status_code != 413
+
+
+def test_invalid_content_length(client):
+    response = client.post("/monitoring/ingest", content=b"", headers={"Content-Length": "abc"})
+    assert response.status_code == 400
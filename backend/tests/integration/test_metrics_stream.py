@@ -0,0 +1,138 @@
+"""
+실시간 메트릭 스트림 (허브 + /monitoring/stream, /monitoring/ws)
+
+- 스트림은 임시(mock) 데이터를 만들지 않고 저장소의 실제 점만 보낸다
+- 없는 배포 ID는 구독 전에 거절한다
+- 헬스 상태는 알림 엔진 상태를 우선한다
+"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.api.v1 import monitoring
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.base import Base
+from app.models.deployment import DeploymentModel
+from app.utils import metrics_stream
+from app.utils.alert_engine import AlertEngine, AlertRule
+from app.utils.metrics_collector import MetricsCollector
+from app.utils.metrics_store import MetricsStore, to_millis
+from app.utils.metrics_stream import MetricsStreamHub
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = MetricsStore(str(tmp_path / "metrics"))
+    monkeypatch.setattr(settings, "METRICS_MOCK_FALLBACK", True)
+    monkeypatch.setattr(settings, "METRICS_SOURCE", "store")
+    monkeypatch.setattr(settings, "ALERT_ENABLED", False)
+    monkeypatch.setattr(
+        metrics_stream, "MetricsCollector", lambda deployment_id: MetricsCollector(deployment_id, store=store)
+    )
+    return store
+
+
+@pytest.fixture
+def deployment_id(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stream.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(db_session, "SessionLocal", session_factory)
+    db = session_factory()
+    deployment = DeploymentModel(infrastructure_design_id=uuid.uuid4(), iac_code_id=uuid.uuid4(), status="completed")
+    db.add(deployment)
+    db.commit()
+    yield deployment.id
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(store, deployment_id, monkeypatch):
+    hub = MetricsStreamHub(interval=0.05)
+    monkeypatch.setattr(monitoring, "get_metrics_stream_hub", lambda: hub)
+    app = FastAPI()
+    app.include_router(monitoring.router, prefix="/monitoring")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_stream_sends_no_mock_samples(store):
+    async def scenario():
+        hub = MetricsStreamHub(interval=0.05)
+        empty = str(uuid.uuid4())
+        live = str(uuid.uuid4())
+        store.append(uuid.UUID(live), "cpu_usage", [datetime.utcnow()], [42.0], unit="percent")
+
+        subscription = await hub.subscribe([empty, live])
+        snapshot = await subscription.get(timeout=1)
+        await asyncio.sleep(0.2)  # 폴러 몇 번
+        follow_up = await subscription.get(timeout=0.1)
+        hub.unsubscribe(subscription)
+        return empty, live, snapshot, follow_up
+
+    empty, live, snapshot, follow_up = asyncio.run(scenario())
+    assert [(s["deployment_id"], s["name"], s["value"]) for s in snapshot["samples"]] == [(live, "cpu_usage", 42.0)]
+    assert follow_up is None  # 새 점이 없으면 아무것도 보내지 않음
+
+
+def test_stream_status_comes_from_alert_engine(store, monkeypatch):
+    engine = AlertEngine(
+        [AlertRule(name="silent", type="absent", metric="heartbeat", for_seconds=1.0, severity="critical")]
+    )
+    monkeypatch.setattr(metrics_stream, "get_alert_engine", lambda: engine)
+
+    async def scenario():
+        hub = MetricsStreamHub(interval=0.05)
+        deployment_id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        store.append(uuid.UUID(deployment_id), "cpu_usage", [now], [10.0], unit="percent")
+        engine.observe(deployment_id, "heartbeat", None, None, np.array([to_millis(now)]), np.array([1.0]))
+
+        subscription = await hub.subscribe([deployment_id])
+        snapshot = await subscription.get(timeout=1)
+        engine.tick(now + timedelta(seconds=5))  # percent 값은 정상이지만 absent 알림 firing
+        changed = await subscription.get(timeout=1)
+        hub.unsubscribe(subscription)
+        return deployment_id, snapshot, changed
+
+    deployment_id, snapshot, changed = asyncio.run(scenario())
+    assert snapshot["status"] == {deployment_id: "healthy"}
+    assert changed["status"] == {deployment_id: "critical"}
+
+
+def test_sse_rejects_unknown_deployment(client, deployment_id):
+    unknown = uuid.uuid4()
+    response = client.get("/monitoring/stream", params={"deployment_id": [str(deployment_id), str(unknown)]})
+    assert response.status_code == 404
+    assert str(unknown) in response.json()["detail"]
+    assert str(deployment_id) not in response.json()["detail"]
+
+
+def test_ws_rejects_unknown_deployment_on_connect(client):
+    unknown = uuid.uuid4()
+    with client.websocket_connect(f"/monitoring/ws?deployment_id={unknown}") as websocket:
+        message = websocket.receive_json()
+        assert message["type"] == "error" and str(unknown) in message["detail"]
+        with pytest.raises(Exception):
+            websocket.receive_json()
+
+
+def test_ws_subscribe_command_rejects_unknown_deployment(client, deployment_id):
+    with client.websocket_connect(f"/monitoring/ws?deployment_id={deployment_id}") as websocket:
+        snapshot = websocket.receive_json()
+        assert snapshot["type"] == "update" and snapshot["samples"] == []
+
+        unknown = uuid.uuid4()
+        websocket.send_json({"subscribe": [str(unknown)]})
+        message = websocket.receive_json()
+        assert message == {"type": "error", "detail": f"Deployment not found: {unknown}"}
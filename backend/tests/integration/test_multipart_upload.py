@@ -0,0 +1,161 @@
+"""
+재개 가능한 멀티파트 업로드 확인 (SQLite + 임시 UPLOAD_DIR)
+
+init → part(순서 무관, 재전송) → status → complete / abort,
+파싱 실패 후 파트를 다시 보내지 않고 완료를 재시도할 수 있는지 확인한다.
+"""
+import asyncio
+import hashlib
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.core.config import settings
+from app.db.base import Base
+from app.domain.entities.requirement import Requirement
+from app.models.user import UserModel
+from app.repositories.implementations.document_content_repository import DocumentContentRepository
+from app.repositories.implementations.document_repository import DocumentRepository
+from app.repositories.implementations.requirement_repository import RequirementRepository
+from app.schemas.document import UploadInitRequest
+from app.services.file_service import FileService
+from app.services.requirement_service import RequirementService
+
+PART_SIZE = 16
+DATA = bytes(range(40))  # 파트 3개 (16 + 16 + 8)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(settings, "UPLOAD_MIN_PART_SIZE", 1)
+    engine = create_engine(f"sqlite:///{tmp_path / 'upload.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    """파싱 호출 기록 (fail=True면 실패)"""
+    state = {"calls": 0, "fail": False}
+
+    async def fake_parse(self, stored, filename):
+        state["calls"] += 1
+        if state["fail"]:
+            raise TimeoutError("parse timed out")
+        with open(stored.file_path, "rb") as f:
+            return {"type": "pdf", "text": f.read().hex()}
+
+    monkeypatch.setattr(FileService, "parse_stored_file", fake_parse)
+    return state
+
+
+@pytest.fixture
+def service(db):
+    return RequirementService(RequirementRepository(db), DocumentRepository(db), DocumentContentRepository(db))
+
+
+@pytest.fixture
+def requirement_id(db, service):
+    user_id = uuid.uuid4()
+    db.add(UserModel(id=user_id, email=f"{user_id}@example.com"))
+    db.commit()
+    return service.repository.create(Requirement(user_id=user_id, input_type="document")).id
+
+
+async def _stream(data: bytes):
+    yield data[:5]
+    yield data[5:]
+
+
+def _init(service, requirement_id):
+    return asyncio.run(service.init_upload(UploadInitRequest(
+        requirement_id=requirement_id, file_name="rfp.pdf", file_size=len(DATA), part_size=PART_SIZE
+    )))
+
+
+def _send(service, upload_id, *part_numbers):
+    for n in part_numbers:
+        chunk = DATA[(n - 1) * PART_SIZE:n * PART_SIZE]
+        asyncio.run(service.upload_part(upload_id, n, _stream(chunk)))
+
+
+def test_init_part_status_complete(service, requirement_id, parser):
+    status = _init(service, requirement_id)
+    upload_id = status.upload_id
+    assert (status.total_parts, status.received_parts, status.missing_parts) == (3, [], [1, 2, 3])
+
+    _send(service, upload_id, 3, 1, 1)  # 순서 무관, 같은 파트 재전송
+    status = asyncio.run(service.get_upload_status(upload_id))
+    assert (status.received_parts, status.missing_parts, status.status) == ([1, 3], [2], "uploading")
+
+    with pytest.raises(ValueError, match="Missing parts"):
+        asyncio.run(service.complete_upload(upload_id))
+
+    _send(service, upload_id, 2)
+    result = asyncio.run(service.complete_upload(upload_id))
+    digest = hashlib.sha256(DATA).hexdigest()
+    assert result["status"] == "parsed" and result["content_hash"] == digest
+    assert parser["calls"] == 1
+
+    document = service.document_repository.get_by_id(upload_id)
+    assert document.status == "parsed" and document.content_hash == digest
+    with open(document.file_path, "rb") as f:
+        assert f.read() == DATA
+    assert not os.path.exists(service.file_service.parts_dir(str(upload_id)))
+    assert service.document_content_repository.get_by_hash(digest).extracted_text == DATA.hex()
+    assert asyncio.run(service.get_upload_status(upload_id)).missing_parts == []
+
+    with pytest.raises(ValueError, match="status"):
+        asyncio.run(service.complete_upload(upload_id))  # 중복 완료
+
+
+def test_part_validation(service, requirement_id, parser):
+    upload_id = _init(service, requirement_id).upload_id
+    with pytest.raises(ValueError, match="Part number"):
+        _send(service, upload_id, 4)
+    with pytest.raises(ValueError, match="size"):
+        asyncio.run(service.upload_part(upload_id, 1, _stream(DATA[:10])))
+    assert asyncio.run(service.get_upload_status(upload_id)).received_parts == []
+
+
+def test_complete_retries_after_parse_failure(service, requirement_id, parser):
+    upload_id = _init(service, requirement_id).upload_id
+    _send(service, upload_id, 1, 2, 3)
+
+    parser["fail"] = True
+    with pytest.raises(ValueError, match="parse timed out"):
+        asyncio.run(service.complete_upload(upload_id))
+
+    # 실패해도 저장 객체는 문서에 기록되어 있다 (고아 객체 없음)
+    document = service.document_repository.get_by_id(upload_id)
+    assert document.status == "failed"
+    assert document.content_hash == hashlib.sha256(DATA).hexdigest()
+    assert os.path.isfile(document.file_path)
+    assert asyncio.run(service.get_upload_status(upload_id)).missing_parts == []
+
+    parser["fail"] = False
+    result = asyncio.run(service.complete_upload(upload_id))  # 파트를 다시 보내지 않고 재시도
+    assert result["status"] == "parsed"
+    assert parser["calls"] == 2
+    assert service.repository.get_by_id(requirement_id).status == "completed"
+
+
+def test_abort(service, requirement_id, parser):
+    upload_id = _init(service, requirement_id).upload_id
+    _send(service, upload_id, 1)
+
+    asyncio.run(service.abort_upload(upload_id))
+    assert not os.path.exists(service.file_service.parts_dir(str(upload_id)))
+    assert service.document_repository.get_by_id(upload_id).status == "failed"
+    with pytest.raises(ValueError, match="status"):
+        _send(service, upload_id, 2)
+    with pytest.raises(ValueError, match="Missing parts"):
+        asyncio.run(service.complete_upload(upload_id))
@@ -0,0 +1,99 @@
+"""
+내용 해시 기준 파싱 결과 캐시 확인 (document_contents)
+"""
+import asyncio
+import hashlib
+import io
+import uuid
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.core.config import settings
+from app.db.base import Base
+from app.domain.entities.requirement import Requirement
+from app.models.user import UserModel
+from app.repositories.implementations.document_content_repository import DocumentContentRepository
+from app.repositories.implementations.document_repository import DocumentRepository
+from app.repositories.implementations.requirement_repository import RequirementRepository
+from app.services.file_service import FileService
+from app.services.requirement_service import RequirementService
+
+DATA = b"%PDF-1.4 same requirement document"
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield RequirementService(RequirementRepository(db), DocumentRepository(db), DocumentContentRepository(db))
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+
+    async def fake_parse(self, stored, filename):
+        calls.append(filename)
+        return {"type": "pdf", "text": "parsed text", "pages": 1}
+
+    monkeypatch.setattr(FileService, "parse_stored_file", fake_parse)
+    return calls
+
+
+def _requirement(service):
+    user_id = uuid.uuid4()
+    service.repository.db.add(UserModel(id=user_id, email=f"{user_id}@example.com"))
+    service.repository.db.commit()
+    return service.repository.create(Requirement(user_id=user_id, input_type="document")).id
+
+
+def _upload(service, requirement_id, filename):
+    file = UploadFile(io.BytesIO(DATA), filename=filename)
+    return asyncio.run(service.upload_document(requirement_id, file))
+
+
+def test_identical_upload_skips_parsing(service, parse_calls):
+    first = _upload(service, _requirement(service), "a.pdf")
+    second = _upload(service, _requirement(service), "b.pdf")
+
+    assert parse_calls == ["a.pdf"]
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["parsed_data"] == first["parsed_data"] == {"type": "pdf", "text": "parsed text", "pages": 1}
+
+    digest = hashlib.sha256(DATA).hexdigest()
+    content = service.document_content_repository.get_by_hash(digest)
+    assert content.extracted_text == "parsed text"
+    assert content.parsed_data == first["parsed_data"]
+    assert content.file_size == len(DATA)
+    assert content.last_used_at is not None  # 캐시 적중 시 갱신
+
+    # 문서는 내용 해시만 참조하고 텍스트는 document_contents에만 둔다
+    for result in (first, second):
+        document = service.document_repository.get_by_id(uuid.UUID(result["document_id"]))
+        assert document.content_hash == digest and document.extracted_text is None
+
+
+def test_cache_row_swept_before_touch_is_reparsed(service, parse_calls, monkeypatch):
+    _upload(service, _requirement(service), "a.pdf")
+    contents = service.document_content_repository
+    original = contents.get_by_hash
+
+    def swept_after_lookup(content_hash):
+        hit = original(content_hash)
+        contents.delete_many([content_hash])  # 조회와 touch 사이에 보관 기간 정리가 행을 삭제
+        return hit
+
+    monkeypatch.setattr(contents, "get_by_hash", swept_after_lookup)
+    second = _upload(service, _requirement(service), "b.pdf")
+
+    assert parse_calls == ["a.pdf", "b.pdf"]
+    assert second["cached"] is False
+    assert original(hashlib.sha256(DATA).hexdigest()).extracted_text == "parsed text"
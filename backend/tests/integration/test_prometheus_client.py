@@ -0,0 +1,161 @@
+"""
+PrometheusClient / MetricsCollector ↔ 가짜 Prometheus 서버
+
+- 패널(배포 전체 또는 메트릭 하나)마다 HTTP 요청 한 번
+- 같은 키의 동시 요청은 요청 하나를 공유
+- (쿼리, step, 정렬 범위) 캐시 적중
+- drop_labels / 단위 매핑
+- NaN/±Inf 샘플 제외
+"""
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.utils.metrics_collector import MetricsCollector
+from app.utils.metrics_store import MetricsStore
+from app.utils.prometheus_client import PrometheusClient
+from tests.fixtures.fake_prometheus import FakePrometheus
+
+STEP = 60
+
+
+@pytest.fixture
+def deployment_id():
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def prom(deployment_id):
+    with FakePrometheus() as server:
+        server.add_synthetic(str(deployment_id), resources=("web-1", "web-2"), hours=2)
+        server.add_synthetic(str(uuid.uuid4()), hours=2)  # 다른 배포 (조회되면 안 됨)
+        yield server
+
+
+def _run(coro_factory, base_url):
+    """클라이언트를 만든 루프 안에서 실행하고 커넥션 풀 정리"""
+    async def main():
+        client = PrometheusClient(base_url=base_url, cache_ttl=60)
+        try:
+            return await coro_factory(client), client
+        finally:
+            await client.aclose()
+    return asyncio.run(main())
+
+
+def _window():
+    end = datetime.utcnow()
+    return end - timedelta(hours=1), end
+
+
+def _range_requests(prom):
+    return [request for request in prom.requests if request["path"] == "/api/v1/query_range"]
+
+
+def test_one_request_per_panel(prom, deployment_id, tmp_path):
+    start, end = _window()
+
+    async def panels(client):
+        collector = MetricsCollector(deployment_id, store=MetricsStore(str(tmp_path)), prometheus=client)
+        overview = await collector.collect_series(None, start, end, step=STEP)
+        cpu = await collector.collect_metric_by_name("cpu_usage", start, end, step=STEP)
+        latest = await collector.collect_latest_metrics(start, end)
+        return overview, cpu, latest
+
+    (overview, cpu, latest), client = _run(panels, prom.url)
+
+    # 배포 전체 4개 메트릭 × 리소스 2개 = 8개 시계열을 요청 한 번으로
+    assert len(overview) == 8
+    assert {series.name for series in overview} == {"cpu_usage", "memory_usage", "network_in", "network_out"}
+    assert cpu and {point["name"] for point in cpu} == {"cpu_usage"}
+    assert len(latest) == 8
+    assert client.request_count == 3
+    assert [request["query"] for request in _range_requests(prom)] == [
+        f'{{deployment_id="{deployment_id}"}}',
+        f'cpu_usage{{deployment_id="{deployment_id}"}}',
+    ]
+
+
+def test_concurrent_identical_queries_share_one_request(prom, deployment_id):
+    prom.latency = 0.2
+    start, end = _window()
+    query = f'{{deployment_id="{deployment_id}"}}'
+
+    async def concurrent(client):
+        return await asyncio.gather(*(client.query_range(query, start, end, STEP) for _ in range(5)))
+
+    results, client = _run(concurrent, prom.url)
+    assert client.request_count == 1
+    assert len(_range_requests(prom)) == 1
+    assert all(len(result) == 8 for result in results)
+
+
+def test_aligned_range_cache_hit(prom, deployment_id):
+    query = f'cpu_usage{{deployment_id="{deployment_id}"}}'
+    # step 경계 한가운데에서 시작해, 몇 초 밀린 새로 고침도 같은 정렬 범위가 되도록
+    end = datetime.utcfromtimestamp((int(time.time()) // STEP) * STEP - STEP // 2)
+    start = end - timedelta(hours=1)
+
+    async def refresh(client):
+        first = await client.query_range(query, start, end, STEP)
+        shifted = await client.query_range(query, start + timedelta(seconds=5), end + timedelta(seconds=5), STEP)
+        other_step = await client.query_range(query, start, end, STEP * 2)
+        return first, shifted, other_step
+
+    (first, shifted, other_step), client = _run(refresh, prom.url)
+    assert client.request_count == 2  # 밀린 범위는 캐시, step이 다르면 새 요청
+    assert [s.timestamps.tolist() for s in first] == [s.timestamps.tolist() for s in shifted]
+    assert len(other_step[0]) < len(first[0])
+
+
+def test_drop_labels_and_unit_mapping(prom, deployment_id):
+    start, end = _window()
+    query = f'{{deployment_id="{deployment_id}"}}'
+
+    async def fetch(client):
+        series = await client.query_range(query, start, end, STEP, drop_labels=("deployment_id",))
+        points = await client.query(query, end, drop_labels=("deployment_id",))
+        return series, points
+
+    (series, points), _ = _run(fetch, prom.url)
+    units = {s.name: s.unit for s in series}
+    assert units == {"cpu_usage": "percent", "memory_usage": "percent", "network_in": None, "network_out": None}
+    assert all(set(s.tags) == {"resource"} for s in series)
+    assert all(s.timestamps.dtype.kind == "i" and len(s) > 0 for s in series)
+
+    assert {point["unit"] for point in points if point["name"] == "cpu_usage"} == {"percent"}
+    assert all(point["tags"] == {"resource": point["tags"]["resource"]} for point in points)
+
+
+def test_non_finite_samples_are_dropped(deployment_id, tmp_path):
+    now = time.time()
+    labels = {"deployment_id": str(deployment_id)}
+    with FakePrometheus() as prom:
+        # 0으로 나눈 비율(NaN), 오버플로(+Inf) 샘플이 섞인 시계열과 최신 값이 NaN인 시계열
+        prom.add_series("error_ratio", labels, [
+            (now - 240, 0.5), (now - 180, float("nan")), (now - 120, float("inf")), (now - 60, 0.25),
+        ])
+        prom.add_series("latency_percent", labels, [(now - 60, float("nan"))])
+        start, end = datetime.utcfromtimestamp(now - 300), datetime.utcfromtimestamp(now)
+
+        async def fetch(client):
+            collector = MetricsCollector(deployment_id, store=MetricsStore(str(tmp_path)), prometheus=client)
+            series = await client.query_range(f'error_ratio{{deployment_id="{deployment_id}"}}', start, end, 60)
+            points = await collector.collect_metric_by_name("error_ratio", start, end, step=60)
+            latest = await collector.collect_latest_metrics(start, end, mock_fallback=False)
+            return series, points, latest
+
+        (series, points, latest), _ = _run(fetch, prom.url)
+
+    assert len(series) == 1 and np.isfinite(series[0].values).all()
+    assert set(series[0].values.tolist()) == {0.5, 0.25}
+    assert {point["value"] for point in points} == {0.5, 0.25}
+    assert [(point["name"], point["value"]) for point in latest] == [("error_ratio", 0.25)]
+    # API 응답/SSE 이벤트로 직렬화할 수 있다 (FastAPI JSONResponse는 allow_nan=False)
+    json.dumps(jsonable_encoder({"points": points, "latest": latest}), allow_nan=False)
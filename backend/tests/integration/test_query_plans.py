@@ -0,0 +1,219 @@
+"""
+리포지토리 쿼리 실행 계획 검사
+
+모든 리포지토리 조회를 QueryPlanRecorder로 기록한 뒤 EXPLAIN으로 확인하여
+대용량 테이블을 인덱스 없이 순차 스캔하는 조회가 없는지 검사한다.
+
+- SQLite: 항상 실행 (임시 파일 DB)
+- PostgreSQL: POSTGRES_TEST_URL이 설정된 경우에만 실행 (빈 테스트 DB, 테이블을 만들고 지운다)
+"""
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.db.base import Base
+from app.db.query_plan import QueryPlanRecorder, find_sequential_scans
+from app.domain.entities.alert_event import AlertEvent
+from app.domain.entities.chat_message import ChatMessage
+from app.domain.entities.deployment import Deployment
+from app.domain.entities.document import Document
+from app.domain.entities.document_content import DocumentContent
+from app.domain.entities.iac_code import IaCCode
+from app.domain.entities.infrastructure import Infrastructure
+from app.domain.entities.requirement import Requirement
+from app.models.user import UserModel
+from app.repositories.implementations.alert_repository import AlertRepository
+from app.repositories.implementations.chat_repository import ChatRepository
+from app.repositories.implementations.deployment_repository import DeploymentRepository
+from app.repositories.implementations.document_content_repository import DocumentContentRepository
+from app.repositories.implementations.document_repository import DocumentRepository
+from app.repositories.implementations.iac_repository import IaCRepository
+from app.repositories.implementations.infrastructure_repository import InfrastructureRepository
+from app.repositories.implementations.requirement_repository import RequirementRepository
+
+# 운영에서 행 수가 계속 늘어나는 테이블 (users는 작아서 제외)
+LARGE_TABLES = {
+    "requirements",
+    "infrastructure_designs",
+    "iac_codes",
+    "deployments",
+    "documents",
+    "document_contents",
+    "chat_messages",
+    "alert_events",
+}
+
+_BACKENDS = [
+    pytest.param("sqlite", id="sqlite"),
+    pytest.param(
+        "postgresql",
+        id="postgresql",
+        marks=pytest.mark.skipif(not os.getenv("POSTGRES_TEST_URL"), reason="POSTGRES_TEST_URL not set"),
+    ),
+]
+
+
+@pytest.fixture(scope="module", params=_BACKENDS)
+def engine(request, tmp_path_factory):
+    if request.param == "sqlite":
+        path = tmp_path_factory.mktemp("query_plans") / "plans.db"
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    else:
+        engine = create_engine(os.environ["POSTGRES_TEST_URL"])
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def seeded(engine):
+    """테이블마다 몇 행씩 만들고 (세션, 리포지토리, ID) 반환"""
+    db = sessionmaker(bind=engine)()
+    user_id = uuid.uuid4()
+    db.add(UserModel(id=user_id, email=f"{user_id}@example.com", name="tester"))
+    db.commit()
+
+    repos = {
+        "requirement": RequirementRepository(db),
+        "infrastructure": InfrastructureRepository(db),
+        "iac": IaCRepository(db),
+        "deployment": DeploymentRepository(db),
+        "document": DocumentRepository(db),
+        "document_content": DocumentContentRepository(db),
+        "chat": ChatRepository(db),
+        "alert": AlertRepository(db),
+    }
+
+    requirement = repos["requirement"].create(Requirement(
+        user_id=user_id,
+        input_type="survey",
+        structured_data={"deployment_type": "onprem", "scale": "small", "technical_stack_suggestions": ["nginx"]},
+    ))
+    infrastructure = repos["infrastructure"].create(Infrastructure(
+        requirement_id=requirement.id,
+        design_type="onprem",
+        provider="onprem",
+        architecture={"components": [{"type": "web", "name": "web-1"}]},
+    ))
+    iac_code = repos["iac"].create(IaCCode(
+        infrastructure_design_id=infrastructure.id, iac_tool="terraform", code_content="# main.tf"
+    ))
+    deployment = repos["deployment"].create(Deployment(
+        infrastructure_design_id=infrastructure.id, iac_code_id=iac_code.id, status="deploying"
+    ))
+    content = repos["document_content"].create(DocumentContent(
+        content_hash="a" * 64, file_type="pdf", file_size=1, file_path="/tmp/a.pdf"
+    ))
+    document = repos["document"].create(Document(
+        requirement_id=requirement.id,
+        file_name="a.pdf",
+        file_type="pdf",
+        file_size=1,
+        file_path="/tmp/a.pdf",
+        content_hash=content.content_hash,
+    ))
+    repos["chat"].create(ChatMessage(requirement_id=requirement.id, role="user", message="hello"))
+    repos["alert"].bulk_create([AlertEvent(
+        deployment_id=deployment.id,
+        rule_name="percent_warning",
+        severity="warning",
+        state="firing",
+        metric_name="cpu_usage",
+        series_key="b" * 40,
+        value=90.0,
+        triggered_at=datetime.utcnow(),
+    )])
+
+    ids = {
+        "user": user_id,
+        "requirement": requirement.id,
+        "infrastructure": infrastructure.id,
+        "iac": iac_code.id,
+        "deployment": deployment.id,
+        "document": document.id,
+        "content_hash": content.content_hash,
+    }
+    yield repos, ids
+    db.close()
+
+
+def _now():
+    return datetime.utcnow()
+
+
+# 조회 이름 → (리포지토리, ID) 호출 (필터가 있는 조회는 필터를 주고 호출)
+REPOSITORY_CALLS = {
+    "requirement.get_by_id": lambda r, i: r["requirement"].get_by_id(i["requirement"]),
+    "requirement.get_by_user_id": lambda r, i: r["requirement"].get_by_user_id(i["user"]),
+    "requirement.search_by_structured_data": lambda r, i: r["requirement"].search_by_structured_data(
+        deployment_type="onprem", scale="small", limit=10
+    ),
+    "requirement.update": lambda r, i: r["requirement"].update(r["requirement"].get_by_id(i["requirement"])),
+    "requirement.bulk_get_by_ids": lambda r, i: r["requirement"].bulk_get_by_ids([i["requirement"]]),
+    "infrastructure.get_by_id": lambda r, i: r["infrastructure"].get_by_id(i["infrastructure"]),
+    "infrastructure.get_by_requirement_id": lambda r, i: r["infrastructure"].get_by_requirement_id(
+        i["requirement"]
+    ),
+    "infrastructure.update": lambda r, i: r["infrastructure"].update(
+        r["infrastructure"].get_by_id(i["infrastructure"])
+    ),
+    "infrastructure.bulk_get_by_ids": lambda r, i: r["infrastructure"].bulk_get_by_ids([i["infrastructure"]]),
+    "iac.get_by_id": lambda r, i: r["iac"].get_by_id(i["iac"]),
+    "iac.get_by_infrastructure_id": lambda r, i: r["iac"].get_by_infrastructure_id(i["infrastructure"]),
+    "iac.get_current_version": lambda r, i: r["iac"].get_current_version(i["infrastructure"]),
+    "iac.update": lambda r, i: r["iac"].update(r["iac"].get_by_id(i["iac"])),
+    "deployment.get_by_id": lambda r, i: r["deployment"].get_by_id(i["deployment"]),
+    "deployment.get_by_infrastructure_id": lambda r, i: r["deployment"].get_by_infrastructure_id(
+        i["infrastructure"]
+    ),
+    "deployment.get_list(status)": lambda r, i: r["deployment"].get_list(status="deploying", limit=10),
+    "deployment.get_list(stale)": lambda r, i: r["deployment"].get_list(
+        status="deploying", started_before=_now() - timedelta(hours=1)
+    ),
+    "deployment.update": lambda r, i: r["deployment"].update(r["deployment"].get_by_id(i["deployment"])),
+    "deployment.bulk_update": lambda r, i: r["deployment"].bulk_update([r["deployment"].get_by_id(i["deployment"])]),
+    "document.get_by_id": lambda r, i: r["document"].get_by_id(i["document"]),
+    "document.get_by_requirement_id": lambda r, i: r["document"].get_by_requirement_id(i["requirement"]),
+    "document.get_expired": lambda r, i: r["document"].get_expired(_now() - timedelta(days=7), limit=100),
+    "document.mark_deleted": lambda r, i: r["document"].mark_deleted([uuid.uuid4()], _now()),
+    "document.get_live_content_hashes": lambda r, i: r["document"].get_live_content_hashes([i["content_hash"]]),
+    "document.update": lambda r, i: r["document"].update(r["document"].get_by_id(i["document"])),
+    "document_content.get_by_hash": lambda r, i: r["document_content"].get_by_hash(i["content_hash"]),
+    "document_content.touch": lambda r, i: r["document_content"].touch(i["content_hash"]),
+    "document_content.update": lambda r, i: r["document_content"].update(
+        r["document_content"].get_by_hash(i["content_hash"])
+    ),
+    "document_content.delete_many": lambda r, i: r["document_content"].delete_many(["0" * 64]),
+    "document_content.delete_unreferenced": lambda r, i: r["document_content"].delete_unreferenced(["0" * 64]),
+    "chat.get_by_requirement_id": lambda r, i: r["chat"].get_by_requirement_id(i["requirement"]),
+    "alert.get_by_deployment_id": lambda r, i: r["alert"].get_by_deployment_id(
+        i["deployment"], since=_now() - timedelta(days=1), limit=100
+    ),
+    "alert.get_firing": lambda r, i: r["alert"].get_firing(),
+}
+
+
+@pytest.mark.parametrize("name", list(REPOSITORY_CALLS))
+def test_repository_query_uses_index(engine, seeded, name):
+    repos, ids = seeded
+    with QueryPlanRecorder(engine) as recorder:
+        REPOSITORY_CALLS[name](repos, ids)
+
+    assert recorder.statements, f"{name}: no SQL recorded"
+    assert find_sequential_scans(engine, recorder.statements, tables=LARGE_TABLES) == []
+
+
+def test_detects_sequential_scan(engine, seeded):
+    """검사기 자체 확인: 인덱스 없는 컬럼 필터는 순차 스캔으로 검출된다"""
+    repos, _ = seeded
+    with QueryPlanRecorder(engine) as recorder:
+        repos["chat"].db.query(models.ChatMessageModel).filter(models.ChatMessageModel.role == "user").all()
+
+    scans = find_sequential_scans(engine, recorder.statements, tables=LARGE_TABLES)
+    assert [scan.table for scan in scans] == ["chat_messages"]
@@ -0,0 +1,190 @@
+"""
+문서 보관 기간 정리 확인 (SQLite + 임시 UPLOAD_DIR)
+
+만료 문서 삭제 표시, 고아 내용(파일/파싱 결과 캐시/청크) 삭제, 공유 내용 유지,
+정리 도중 같은 내용을 참조하게 된 업로드와의 경합을 확인한다.
+"""
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import models  # noqa: F401 - Base.metadata에 테이블 등록
+from app.core.config import settings
+from app.db.base import Base
+from app.domain.entities.document import Document
+from app.domain.entities.document_content import DocumentContent
+from app.domain.entities.requirement import Requirement
+from app.models.user import UserModel
+from app.repositories.implementations.document_content_repository import DocumentContentRepository
+from app.repositories.implementations.document_repository import DocumentRepository
+from app.repositories.implementations.requirement_repository import RequirementRepository
+from app.services import retention_service
+from app.services.file_service import content_path
+from app.services.retention_service import RetentionService
+
+EXPIRED = datetime.utcnow() - timedelta(days=30)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    engine = create_engine(f"sqlite:///{tmp_path / 'retention.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def repos(db):
+    return DocumentRepository(db), DocumentContentRepository(db)
+
+
+@pytest.fixture
+def requirement_id(db):
+    user_id = uuid.uuid4()
+    db.add(UserModel(id=user_id, email=f"{user_id}@example.com"))
+    db.commit()
+    return RequirementRepository(db).create(Requirement(user_id=user_id, input_type="document")).id
+
+
+@pytest.fixture
+def chunks():
+    deleted = []
+
+    def delete_chunks(hashes):
+        deleted.extend(hashes)
+        return len(hashes)
+
+    return deleted, delete_chunks
+
+
+def _object(data: bytes) -> str:
+    """내용 주소 경로에 객체 기록, 내용 해시 반환"""
+    digest = hashlib.sha256(data).hexdigest()
+    path = content_path(digest, "pdf")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return digest
+
+
+def _document(repos, requirement_id, digest, created_at=EXPIRED):
+    document_repository, content_repository = repos
+    if content_repository.get_by_hash(digest) is None:
+        content_repository.create(DocumentContent(
+            content_hash=digest, file_type="pdf", file_size=1, file_path=content_path(digest, "pdf"),
+            extracted_text="text", parsed_data={"type": "pdf"},
+        ))
+    return document_repository.create(Document(
+        requirement_id=requirement_id, file_name="rfp.pdf", file_type="pdf", file_size=1,
+        file_path=content_path(digest, "pdf"), content_hash=digest, status="parsed", created_at=created_at,
+    ))
+
+
+def _sweep(repos, delete_chunks):
+    service = RetentionService(*repos, delete_chunks)
+    return asyncio.run(service.sweep(retention_days=7, batch_pause=0))
+
+
+def test_expired_orphan_is_removed(repos, requirement_id, chunks):
+    deleted_chunks, delete_chunks = chunks
+    digest = _object(b"old rfp")
+    document = _document(repos, requirement_id, digest)
+
+    result = _sweep(repos, delete_chunks)
+
+    assert (result.documents, result.files, result.contents, result.chunks) == (1, 1, 1, 1)
+    assert result.bytes_reclaimed == len(b"old rfp")
+    assert repos[0].get_by_id(document.id).deleted_at is not None
+    assert not os.path.exists(content_path(digest, "pdf"))
+    assert repos[1].get_by_hash(digest) is None
+    assert deleted_chunks == [digest]
+    assert os.listdir(os.path.join(settings.UPLOAD_DIR, "tmp")) == []  # 격리 파일도 삭제
+
+
+def test_content_shared_with_live_document_is_kept(repos, requirement_id, chunks):
+    deleted_chunks, delete_chunks = chunks
+    digest = _object(b"shared rfp")
+    _document(repos, requirement_id, digest)
+    _document(repos, requirement_id, digest, created_at=datetime.utcnow())
+
+    result = _sweep(repos, delete_chunks)
+
+    assert (result.documents, result.files, result.contents) == (1, 0, 0)
+    assert os.path.isfile(content_path(digest, "pdf"))
+    assert repos[1].get_by_hash(digest) is not None
+    assert deleted_chunks == []
+
+
+def test_upload_claiming_content_during_sweep_keeps_it(repos, requirement_id, chunks, monkeypatch):
+    """파일 격리 후 참조 재확인 전에 같은 내용의 문서가 생기면 파일과 캐시 행을 되돌린다"""
+    deleted_chunks, delete_chunks = chunks
+    document_repository = repos[0]
+    digest = _object(b"racing rfp")
+    _document(repos, requirement_id, digest)
+
+    original = document_repository.get_live_content_hashes
+    calls = []
+
+    def racing_live_hashes(hashes):
+        calls.append(set(hashes))
+        if len(calls) == 2:  # 두 번째(재확인) 조회 직전에 업로드가 문서 행을 커밋
+            assert not os.path.exists(content_path(digest, "pdf"))  # 이미 격리됨
+            _document(repos, requirement_id, digest, created_at=datetime.utcnow())
+        return original(hashes)
+
+    monkeypatch.setattr(document_repository, "get_live_content_hashes", racing_live_hashes)
+    result = _sweep(repos, delete_chunks)
+
+    assert len(calls) == 2
+    assert (result.documents, result.files, result.contents, result.chunks) == (1, 0, 0, 0)
+    with open(content_path(digest, "pdf"), "rb") as f:
+        assert f.read() == b"racing rfp"
+    assert repos[1].get_by_hash(digest) is not None
+    assert os.listdir(os.path.join(settings.UPLOAD_DIR, "tmp")) == []
+
+
+def test_claim_after_recheck_keeps_content_row(repos, requirement_id, chunks, monkeypatch):
+    """참조 재확인 이후에 생긴 문서는 DELETE의 NOT EXISTS 조건이 캐시 행을 남긴다"""
+    deleted_chunks, delete_chunks = chunks
+    content_repository = repos[1]
+    digest = _object(b"late rfp")
+    _document(repos, requirement_id, digest)
+
+    original = content_repository.delete_unreferenced
+
+    def claim_then_delete(hashes):
+        _document(repos, requirement_id, digest, created_at=datetime.utcnow())
+        return original(hashes)
+
+    monkeypatch.setattr(content_repository, "delete_unreferenced", claim_then_delete)
+    result = _sweep(repos, delete_chunks)
+
+    assert (result.contents, result.chunks) == (0, 0)
+    assert content_repository.get_by_hash(digest) is not None
+    assert deleted_chunks == []
+
+
+def test_stale_tmp_files_are_removed(repos, chunks, monkeypatch):
+    tmp_dir = os.path.join(settings.UPLOAD_DIR, "tmp")
+    os.makedirs(tmp_dir)
+    stale, fresh = os.path.join(tmp_dir, "stale.part"), os.path.join(tmp_dir, "fresh.part")
+    for path in (stale, fresh):
+        with open(path, "wb") as f:
+            f.write(b"partial")
+    old = time.time() - 2 * retention_service._TMP_FILE_MAX_AGE
+    os.utime(stale, (old, old))
+
+    result = _sweep(repos, chunks[1])
+
+    assert result.files == 1
+    assert os.listdir(tmp_dir) == ["fresh.part"]
@@ -0,0 +1,159 @@
+"""
+알림 규칙 엔진 증분 평가 확인 (threshold for_seconds, rate, absent, 복원, 시계열 정리)
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.domain.entities.alert_event import AlertEvent
+from app.utils.alert_engine import AlertEngine, AlertRule, series_key
+from app.utils.metrics_store import to_millis
+
+DEPLOYMENT = str(uuid.uuid4())
+T0 = datetime(2026, 1, 1)
+T0_MS = to_millis(T0)
+
+
+def _observe(engine, seconds, values, metric="cpu_usage", unit="percent"):
+    timestamps = np.array([T0_MS + int(s * 1000) for s in seconds], dtype=np.int64)
+    return engine.observe(DEPLOYMENT, metric, {"host": "web-1"}, unit, timestamps, np.array(values, dtype=np.float64))
+
+
+def _states(events):
+    return [(event.rule_name, event.state) for event in events]
+
+
+def test_threshold_fires_after_for_seconds_and_resolves():
+    engine = AlertEngine([AlertRule(name="hot", unit="percent", op=">", threshold=80.0, for_seconds=30.0)])
+
+    assert _observe(engine, [0, 10, 20], [90, 91, 92]) == []  # 아직 30초 미만
+    events = _observe(engine, [30, 40], [93, 94])
+    assert _states(events) == [("hot", "firing")]
+    assert events[0].triggered_at == T0 + timedelta(seconds=30)
+    assert engine.status(DEPLOYMENT) == "warning"
+
+    assert _states(_observe(engine, [50], [10])) == [("hot", "resolved")]
+    assert engine.status(DEPLOYMENT, T0 + timedelta(seconds=60)) == "healthy"
+
+
+def test_threshold_interrupted_condition_restarts_for_seconds():
+    engine = AlertEngine([AlertRule(name="hot", op=">", threshold=80.0, for_seconds=30.0)])
+
+    assert _observe(engine, [0, 20, 25, 40], [90, 90, 10, 90]) == []
+    assert _states(_observe(engine, [70], [90])) == [("hot", "firing")]  # 40초부터 다시 30초
+
+
+def test_threshold_ignores_late_points():
+    engine = AlertEngine([AlertRule(name="hot", op=">", threshold=80.0)])
+
+    assert _states(_observe(engine, [10], [90])) == [("hot", "firing")]
+    assert _observe(engine, [5], [10]) == []  # 이미 평가한 시각 이전 점
+    assert engine.status(DEPLOYMENT) == "warning"
+
+
+def test_rate_rule():
+    engine = AlertEngine([AlertRule(name="growth", type="rate", op=">", threshold=1.0, window_seconds=60.0)])
+
+    assert _observe(engine, [0, 10], [0, 5]) == []  # 0.5/초
+    events = _observe(engine, [20, 30], [30, 40])  # 20초 구간 30 → 1.5/초
+    assert _states(events) == [("growth", "firing")]
+    assert events[0].value == 1.5
+    assert _states(_observe(engine, [100], [40])) == [("growth", "resolved")]  # 창 안 (30~100초) 0/초
+
+
+def test_absent_fires_on_tick_and_resolves_on_data():
+    engine = AlertEngine([AlertRule(name="silent", type="absent", for_seconds=60.0, severity="critical")])
+
+    assert _observe(engine, [0], [1]) == []
+    assert engine.tick(T0 + timedelta(seconds=59)) == []
+    assert _states(engine.tick(T0 + timedelta(seconds=60))) == [("silent", "firing")]
+    assert engine.tick(T0 + timedelta(seconds=120)) == []  # 이미 firing
+    assert engine.status(DEPLOYMENT) == "critical"
+
+    assert _states(_observe(engine, [130], [1])) == [("silent", "resolved")]
+    assert engine.status(DEPLOYMENT, T0 + timedelta(seconds=130)) == "healthy"
+
+
+def _firing_event(rule_name, severity="warning"):
+    return AlertEvent(
+        deployment_id=uuid.UUID(DEPLOYMENT),
+        rule_name=rule_name,
+        severity=severity,
+        state="firing",
+        metric_name="cpu_usage",
+        series_key=series_key("cpu_usage", {"host": "web-1"}),
+        tags={"host": "web-1"},
+        value=90.0,
+        triggered_at=T0,
+    )
+
+
+def test_restore_resolves_on_next_point():
+    rules = [AlertRule(name="hot", unit="percent", op=">", threshold=80.0)]
+    engine = AlertEngine(rules)
+    engine.restore([_firing_event("hot"), _firing_event("removed_rule")], now=T0)
+
+    assert engine.status(DEPLOYMENT) == "warning"
+    assert [alert["rule_name"] for alert in engine.active_alerts(DEPLOYMENT)] == ["hot"]
+    assert _observe(engine, [10], [85]) == []  # 조건 유지: 중복 firing 없음
+    assert _states(_observe(engine, [20], [10])) == [("hot", "resolved")]
+
+
+def test_restore_rearms_absent_rules():
+    rules = [
+        AlertRule(name="hot", unit="percent", op=">", threshold=80.0),
+        AlertRule(name="silent", type="absent", for_seconds=60.0),
+        AlertRule(name="silent_percent", type="absent", unit="percent", for_seconds=60.0),
+    ]
+    engine = AlertEngine(rules)
+    engine.restore([_firing_event("hot")], now=T0)
+
+    # 복원 후 점이 한 번도 오지 않아도 복원 시각부터 센다 (단위를 모르는 규칙은 붙이지 않음)
+    assert engine.tick(T0 + timedelta(seconds=30)) == []
+    assert _states(engine.tick(T0 + timedelta(seconds=60))) == [("silent", "firing")]
+
+
+def test_tick_prunes_stale_series():
+    engine = AlertEngine(
+        [
+            AlertRule(name="hot", op=">", threshold=80.0),
+            AlertRule(name="silent", type="absent", metric="heartbeat", for_seconds=600.0),
+        ],
+        series_ttl=60.0,
+    )
+    _observe(engine, [0], [10])
+    _observe(engine, [0], [90], metric="memory_usage")  # firing 중인 시계열은 남긴다
+    _observe(engine, [0], [1], metric="heartbeat")  # absent 허용 시간 전에는 남긴다
+
+    engine.tick(T0 + timedelta(seconds=120))
+    assert {info.metric_name for info in engine._series.values()} == {"memory_usage", "heartbeat"}
+    assert len(engine._states) == 3  # memory_usage(hot) + heartbeat(hot, silent)
+
+    assert _states(engine.tick(T0 + timedelta(seconds=600))) == [("silent", "firing")]
+    assert engine.status(DEPLOYMENT) == "warning"
+
+
+def test_tick_forgets_deployment_without_series():
+    engine = AlertEngine([AlertRule(name="hot", op=">", threshold=80.0)], series_ttl=60.0)
+    _observe(engine, [0], [10])
+    assert engine.status(DEPLOYMENT, T0) == "healthy"
+
+    engine.tick(T0 + timedelta(seconds=60))
+    assert engine._series == {} and engine._states == {}
+    assert engine.status(DEPLOYMENT) is None
+
+
+def test_status_is_unknown_when_deployment_goes_silent():
+    engine = AlertEngine([AlertRule(name="hot", op=">", threshold=80.0)], status_stale_seconds=300.0)
+    _observe(engine, [0], [10])
+    _observe(engine, [0], [20], metric="memory_usage")
+
+    assert engine.status(DEPLOYMENT, T0 + timedelta(seconds=300)) == "healthy"
+    assert engine.status(DEPLOYMENT, T0 + timedelta(seconds=301)) == "unknown"  # 시계열 정리(series_ttl) 전에도
+
+    _observe(engine, [400], [10], metric="memory_usage")  # 시계열 하나라도 다시 오면 healthy
+    assert engine.status(DEPLOYMENT, T0 + timedelta(seconds=401)) == "healthy"
+
+    _observe(engine, [500], [90])  # firing 알림은 데이터가 끊겨도 심각도 그대로
+    assert engine.status(DEPLOYMENT, T0 + timedelta(seconds=5000)) == "warning"
@@ -0,0 +1,123 @@
+"""
+백그라운드 연결성 프로버 확인 (jitter/동시 확인 상한, stale, 이력 상한, fresh_result, 대상 설정 검증)
+"""
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.utils import connectivity_prober
+from app.utils.connectivity_prober import ConnectivityProber, ProbeTarget, parse_targets
+from app.utils.vm_connectivity import VMConnectivityChecker
+
+
+@pytest.fixture
+def ports(monkeypatch):
+    """포트 확인 대체: 동시 실행 수 기록, 호출마다 up/down 번갈아 반환"""
+    stats = {"calls": 0, "running": 0, "peak": 0}
+
+    async def fake_check(self, host, port, timeout):
+        stats["calls"] += 1
+        stats["running"] += 1
+        stats["peak"] = max(stats["peak"], stats["running"])
+        await asyncio.sleep(0.02)
+        stats["running"] -= 1
+        return {"available": stats["calls"] % 2 == 1, "host": host, "port": port}
+
+    monkeypatch.setattr(VMConnectivityChecker, "check_ssh_connection", fake_check)
+    return stats
+
+
+def _targets(count):
+    return [ProbeTarget("port", f"10.0.0.{i}:22", host=f"10.0.0.{i}", port=22) for i in range(count)]
+
+
+def test_round_is_bounded_by_semaphore(ports):
+    prober = ConnectivityProber(_targets(10), concurrency=3)
+    asyncio.run(prober.run_round(jitter=False))
+    assert ports["calls"] == 10
+    assert ports["peak"] == 3
+    assert prober.rounds == 1
+    assert all(prober.latest(target.key) is not None for target in prober.targets)
+
+
+def test_jitter_delays_are_bounded_by_interval(ports, monkeypatch):
+    bounds = []
+
+    def fake_uniform(low, high):
+        bounds.append((low, high))
+        return high
+
+    monkeypatch.setattr(connectivity_prober.random, "uniform", fake_uniform)
+    prober = ConnectivityProber(_targets(4), interval=0.1, jitter=0.5, concurrency=2)
+
+    async def scenario():
+        await prober.run_round()
+        await prober.run_round()  # 세마포어는 라운드 간에 재사용
+
+    asyncio.run(scenario())
+    assert bounds == [(0, 0.05)] * 8
+    assert ports["calls"] == 8 and ports["peak"] <= 2
+    assert prober.rounds == 2
+
+
+def test_stale_flag_and_fresh_result(ports):
+    prober = ConnectivityProber(_targets(1), stale_seconds=30)
+    key = prober.targets[0].key
+    assert prober.latest(key) is None and prober.fresh_result(key) is None
+
+    asyncio.run(prober.run_round(jitter=False))
+    latest = prober.latest(key)
+    assert (latest["status"], latest["stale"]) == ("up", False)
+    assert prober.fresh_result(key) == {"available": True, "host": "10.0.0.0", "port": 22}
+
+    prober._history[key][-1]["_checked_monotonic"] -= 31  # 31초 전 결과
+    assert prober.latest(key)["stale"] is True
+    assert prober.fresh_result(key) is None  # 호출자가 직접 확인
+    assert prober.snapshot()["stale_count"] == 1
+
+
+def test_history_is_bounded(ports):
+    prober = ConnectivityProber(_targets(1), history=3)
+    key = prober.targets[0].key
+
+    async def scenario():
+        for _ in range(5):
+            await prober.run_round(jitter=False)
+
+    asyncio.run(scenario())
+    history = prober.history(key)
+    assert [entry["status"] for entry in history] == ["up", "down", "up"]  # 최근 3개 (5번째가 마지막)
+    assert all("result" not in entry for entry in history)
+    assert prober.history("port:unknown:1") is None
+
+
+def test_parse_targets_rejects_invalid_host():
+    targets = parse_targets(vms="vm-a,dev", hosts="192.168.56.10:22,[::1]:8080", default_vm="dev")
+    assert [target.key for target in targets] == ["vm:dev", "virtualbox:vm-a", "port:192.168.56.10:22", "port:::1:8080"]
+    with pytest.raises(ValueError, match="host:port"):
+        parse_targets(vms="", hosts="192.168.56.10", default_vm="dev")
+
+
+def test_invalid_hosts_are_parsed_once(monkeypatch):
+    monkeypatch.setattr(settings, "CONNECTIVITY_PROBE_ENABLED", True)
+    monkeypatch.setattr(settings, "CONNECTIVITY_PROBE_HOSTS", "no-port")
+    monkeypatch.setattr(connectivity_prober, "_prober", None)
+    monkeypatch.setattr(connectivity_prober, "_prober_error", None)
+    calls = []
+    original = connectivity_prober.parse_targets
+    monkeypatch.setattr(connectivity_prober, "parse_targets", lambda: calls.append(1) or original())
+
+    with pytest.raises(ValueError, match="no-port"):
+        connectivity_prober.init_connectivity_prober()  # 시작 시 실패
+    # 요청 경로(배포 전 확인 등)에서는 다시 파싱하거나 예외를 내지 않고 프로버 없이 동작
+    assert connectivity_prober.get_connectivity_prober() is None
+    assert connectivity_prober.get_connectivity_prober() is None
+    assert calls == [1]
+
+
+def test_prober_is_disabled_by_default(monkeypatch):
+    assert type(settings).model_fields["CONNECTIVITY_PROBE_ENABLED"].default is False
+    monkeypatch.setattr(settings, "CONNECTIVITY_PROBE_ENABLED", False)
+    monkeypatch.setattr(connectivity_prober, "_prober", None)
+    assert connectivity_prober.get_connectivity_prober() is None
@@ -0,0 +1,51 @@
+"""
+임베딩 캐시 확인
+"""
+from app.core.cache import LRUCache
+from app.services.embedding_cache import CachedEmbeddings, EmbeddingStore
+
+
+class CountingEmbeddings:
+    model = "fake-embedding"
+
+    def __init__(self):
+        self.documents = 0
+        self.queries = 0
+
+    def embed_documents(self, texts):
+        self.documents += len(texts)
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+    def embed_query(self, text):
+        self.queries += 1
+        return [float(len(text)), 0.0, 1.0]
+
+
+def test_documents_are_persisted(tmp_path):
+    inner = CountingEmbeddings()
+    cached = CachedEmbeddings(inner, EmbeddingStore(str(tmp_path)))
+    cached.embed_documents(["a", "bb", "a"])
+    assert inner.documents == 2
+
+    # 새 프로세스(새 저장소 인스턴스)에서도 디스크에서 읽는다
+    reopened = CachedEmbeddings(inner, EmbeddingStore(str(tmp_path)))
+    assert reopened.embed_documents(["bb", "a"]) == [[2.0, 1.0, 0.0], [1.0, 1.0, 0.0]]
+    assert inner.documents == 2
+
+
+def test_query_embeddings_are_not_persisted(tmp_path):
+    inner = CountingEmbeddings()
+    store = EmbeddingStore(str(tmp_path))
+    cached = CachedEmbeddings(inner, store, query_cache=LRUCache(max_size=2, ttl=60))
+
+    for query in ["q1", "q2", "q1", "q3", "q4"]:
+        cached.embed_query(query)
+    assert inner.queries == 4
+    assert len(store) == 0
+    assert not (tmp_path / "keys.bin").exists()
+    assert len(cached.query_cache) == 2
+
+    # 같은 텍스트의 문서 임베딩이 있으면 재사용
+    cached.embed_documents(["shared"])
+    assert cached.embed_query("shared") == [6.0, 1.0, 0.0]
+    assert inner.queries == 4
@@ -0,0 +1,143 @@
+"""
+엔티티 캐시 확인 (LRU/TTL, read-through, 무효화, Redis 공유 버전)
+"""
+import time
+
+from app.core.cache import EntityCache, LRUCache
+from app.core.config import Settings
+
+
+class FakeRedis:
+    """EntityCache가 쓰는 명령만 구현한 메모리 Redis (여러 프로세스가 공유하는 저장소 역할)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+class Loader:
+    def __init__(self, value="v1"):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_lru_cache_ttl_and_eviction():
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a가 최근 사용
+    cache.set("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1 and cache.get("c") == 3
+
+    cache.set("short", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+
+
+def test_get_or_load_hit_and_miss():
+    cache = EntityCache(max_size=10, ttl=60)
+    loader = Loader({"status": "deploying"})
+
+    first = cache.get_or_load("deployment:1", loader)
+    second = cache.get_or_load("deployment:1", loader)
+    assert first == second == {"status": "deploying"}
+    assert loader.calls == 1
+
+    second["status"] = "changed"  # 반환값은 복사본
+    assert cache.get_or_load("deployment:1", loader) == {"status": "deploying"}
+
+
+def test_none_is_not_cached():
+    cache = EntityCache(max_size=10, ttl=60)
+    loader = Loader(None)
+    assert cache.get_or_load("deployment:missing", loader) is None
+    assert cache.get_or_load("deployment:missing", loader) is None
+    assert loader.calls == 2
+
+
+def test_invalidate_reloads_only_that_key():
+    cache = EntityCache(max_size=10, ttl=60)
+    a, b = Loader("a1"), Loader("b1")
+    cache.get_or_load("a", a)
+    cache.get_or_load("b", b)
+
+    a.value = "a2"
+    cache.invalidate("a")
+    assert cache.get_or_load("a", a) == "a2"
+    assert cache.get_or_load("b", b) == "b1"
+    assert (a.calls, b.calls) == (2, 1)
+
+
+def test_invalidating_many_keys_keeps_other_entries():
+    cache = EntityCache(max_size=10, ttl=60)
+    loader = Loader()
+    cache.get_or_load("hot", loader)
+
+    cache.invalidate(*(f"churn:{i}" for i in range(10000)))
+    assert cache.get_or_load("hot", loader) == "v1"
+    assert loader.calls == 1
+    assert cache._loading == {}
+
+
+def test_entries_evicted_by_size_are_reloaded():
+    cache = EntityCache(max_size=2, ttl=60)
+    loaders = {key: Loader(key) for key in "abc"}
+    for key in "abc":
+        cache.get_or_load(key, loaders[key])
+    assert cache.get_or_load("a", loaders["a"]) == "a"
+    assert loaders["a"].calls == 2 and loaders["c"].calls == 1
+
+
+def test_value_loaded_across_invalidation_is_not_stored():
+    cache = EntityCache(max_size=10, ttl=60)
+
+    def racing_loader():
+        cache.invalidate("deployment:1")  # 조회 중 다른 요청의 쓰기
+        return "stale"
+
+    assert cache.get_or_load("deployment:1", racing_loader) == "stale"
+    assert cache.get_or_load("deployment:1", Loader("fresh")) == "fresh"
+
+
+def test_shared_version_invalidates_other_processes():
+    redis = FakeRedis()
+    worker_a = EntityCache(max_size=10, ttl=60, redis_client=redis)
+    worker_b = EntityCache(max_size=10, ttl=60, redis_client=redis)
+    loader = Loader("v1")
+
+    assert worker_a.get_or_load("deployment:1", loader) == "v1"
+    assert worker_b.get_or_load("deployment:1", loader) == "v1"  # 공유 값 사용
+    assert loader.calls == 1
+
+    loader.value = "v2"
+    worker_a.invalidate("deployment:1")
+    assert worker_b.get_or_load("deployment:1", loader) == "v2"  # b의 로컬 값도 버전이 달라 무효
+    assert worker_a.get_or_load("deployment:1", loader) == "v2"
+    assert loader.calls == 2
+
+
+def test_entity_cache_defaults_to_redis_setting():
+    assert Settings(ENTITY_CACHE_USE_REDIS=False).entity_cache_enabled is False
+    assert Settings(ENTITY_CACHE_USE_REDIS=True).entity_cache_enabled is True
+    assert Settings(ENTITY_CACHE_ENABLED=True).entity_cache_enabled is True
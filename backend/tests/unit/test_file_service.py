@@ -0,0 +1,84 @@
+"""
+업로드 스트리밍 저장 확인 (SHA-256, 내용 주소 경로, 중복 제거, 크기 한도)
+"""
+import asyncio
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.services.file_service import FileService, content_path
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)  # 여러 청크로 나누어 기록
+    return tmp_path / "uploads"
+
+
+def _upload(data: bytes, filename: str) -> UploadFile:
+    return UploadFile(io.BytesIO(data), filename=filename)
+
+
+def _save(data: bytes, filename: str):
+    return asyncio.run(FileService().save_upload(_upload(data, filename)))
+
+
+def _objects(upload_dir):
+    return sorted(
+        os.path.relpath(os.path.join(root, name), upload_dir / "objects")
+        for root, _, files in os.walk(upload_dir / "objects") for name in files
+    )
+
+
+def test_streamed_upload_is_stored_by_content_hash(upload_dir):
+    data = b"%PDF-1.4 requirement document body"
+    stored = _save(data, "rfp.PDF")
+
+    digest = hashlib.sha256(data).hexdigest()
+    assert stored.content_hash == digest
+    assert stored.file_size == len(data)
+    assert stored.file_type == "pdf"
+    assert stored.file_path == content_path(digest, "pdf")
+    assert stored.file_path.endswith(os.path.join("objects", digest[:2], digest[2:4], f"{digest}.pdf"))
+    with open(stored.file_path, "rb") as f:
+        assert f.read() == data
+    assert os.listdir(upload_dir / "tmp") == []  # 임시 파일은 이동/삭제
+
+
+def test_same_content_is_stored_once(upload_dir):
+    first = _save(b"same bytes", "a.pdf")
+    second = _save(b"same bytes", "b.pdf")
+    other = _save(b"other bytes", "a.pdf")
+
+    assert second.file_path == first.file_path
+    assert other.file_path != first.file_path
+    assert len(_objects(upload_dir)) == 2
+    assert os.listdir(upload_dir / "tmp") == []
+
+
+def test_same_content_with_other_extension_reuses_object(upload_dir):
+    first = _save(b"same bytes", "a.pdf")
+    second = _save(b"same bytes", "a.docx")
+
+    assert second.content_hash == first.content_hash
+    assert second.file_path == first.file_path  # 해시 하나에 객체 하나
+    assert second.file_type == "docx"
+    assert _objects(upload_dir) == [os.path.relpath(first.file_path, upload_dir / "objects")]
+
+
+def test_upload_over_size_limit_is_rejected(upload_dir, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 10)
+    with pytest.raises(ValueError, match="exceeds"):
+        _save(b"x" * 11, "big.pdf")
+    assert os.listdir(upload_dir / "tmp") == []
+    assert not (upload_dir / "objects").exists()
+
+
+def test_disallowed_file_type_is_rejected():
+    with pytest.raises(ValueError, match="not allowed"):
+        _save(b"#!/bin/sh", "run.sh")
@@ -0,0 +1,85 @@
+"""
+청킹/수집 파이프라인 확인
+"""
+from typing import Any, Dict, List, Optional
+
+from app.services.ingestion_service import (
+    IngestDocument,
+    IngestionService,
+    _split_long,
+    chunk_text,
+    count_tokens,
+)
+from app.services.vector_store.base import match_where
+
+
+class InMemoryStore:
+    """get/add_texts/delete만 구현한 테스트용 벡터 스토어"""
+
+    def __init__(self):
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.added = 0
+
+    def add_texts(self, texts: List[str], metadatas: List[Dict[str, Any]], ids: List[str]) -> List[str]:
+        for text, metadata, cid in zip(texts, metadatas, ids):
+            self.items[cid] = {"text": text, "metadata": metadata}
+        self.added += len(ids)
+        return ids
+
+    def get(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None, include=None):
+        keys = [cid for cid in (ids or list(self.items)) if cid in self.items]
+        keys = [cid for cid in keys if match_where(self.items[cid]["metadata"], where)]
+        return {"ids": keys, "metadatas": [self.items[cid]["metadata"] for cid in keys]}
+
+    def delete(self, ids: List[str]) -> None:
+        for cid in ids:
+            self.items.pop(cid, None)
+
+
+def test_split_long_cuts_words_on_token_boundaries():
+    url = "https://example.com/" + "/".join(f"segment{i}" for i in range(200))
+    pieces = _split_long(f"참고 링크 {url} 끝", chunk_size=20)
+
+    assert all(count_tokens(piece) <= 20 for piece in pieces)
+    assert pieces[0] == "참고 링크"
+    assert pieces[-1].endswith(" 끝")
+    # 단어 조각을 이어 붙이면 원래 URL이 그대로 복원된다
+    assert "".join(pieces[1:-1]) + pieces[-1][:-len(" 끝")] == url
+
+
+def test_chunk_text_keeps_long_word_intact():
+    url = "https://example.com/" + "x" * 500
+    chunks = chunk_text(url, chunk_size=32, overlap=8)
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 32 for chunk in chunks)
+    assert "".join(chunks) == url
+
+
+def test_reingest_removes_chunks_of_previous_version():
+    store = InMemoryStore()
+    service = IngestionService(store, batch_size=8, chunk_size=16, overlap=0)
+    old = "첫 번째 버전 문장입니다. " * 10
+    new = "두 번째 버전 문장입니다. " * 10
+
+    first = service.ingest_many([IngestDocument(text=old, source_key="hash-1", source_id="kb:a.md")])
+    other = service.ingest_many([IngestDocument(text="다른 문서입니다.", source_key="hash-x", source_id="kb:b.md")])
+    assert first.added > 0 and first.removed == 0 and other.removed == 0
+
+    again = service.ingest_many([IngestDocument(text=old, source_key="hash-1", source_id="kb:a.md")])
+    assert again.added == 0 and again.removed == 0
+
+    second = service.ingest_many([IngestDocument(text=new, source_key="hash-2", source_id="kb:a.md")])
+    assert second.removed == first.chunks
+    remaining = {item["metadata"]["source_key"] for item in store.items.values()}
+    assert remaining == {"hash-2", "hash-x"}
+
+
+def test_documents_without_source_id_are_not_cleaned_up():
+    store = InMemoryStore()
+    service = IngestionService(store, chunk_size=16, overlap=0)
+    service.ingest("첫 번째 버전입니다.", source_key="hash-1")
+    result = service.ingest("두 번째 버전입니다.", source_key="hash-2")
+
+    assert result.removed == 0
+    assert len(store.items) == 2
@@ -0,0 +1,58 @@
+"""
+LocalVectorStore IVF 인덱스 저장 확인
+"""
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.services.vector_store import local_store
+from app.services.vector_store.local_store import LocalVectorStore
+
+
+class RandomEmbeddings:
+    def embed_documents(self, texts):
+        return [np.random.default_rng(int(text[1:])).normal(size=8).tolist() for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalVectorStore(str(tmp_path), RandomEmbeddings(), dtype="float32", index_type="ivf", ivf_min_rows=100)
+    store.add_texts([f"t{i}" for i in range(300)], ids=[str(i) for i in range(300)])
+    return store
+
+
+@pytest.mark.skipif(local_store.fcntl is None, reason="fcntl not available")
+def test_ivf_save_waits_for_exclusive_lock(store):
+    released = threading.Event()
+
+    def hold_lock():
+        with store._file_lock():
+            time.sleep(0.3)
+            released.set()
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    time.sleep(0.05)
+    assert len(store.similarity_search("t1", k=3)) == 3  # 검색 중 IVF 학습 → 저장
+    assert released.is_set()
+    holder.join()
+    assert os.path.exists(store._ivf_path)
+
+
+def test_ivf_not_saved_after_concurrent_compaction(store):
+    with open(store._manifest_path) as f:
+        manifest = json.load(f)
+    manifest["generation"] = store.generation + 1  # 다른 프로세스가 압축한 상태
+    with open(store._manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    store._train_ivf()
+    assert store._centroids is not None
+    assert not os.path.exists(store._ivf_path)
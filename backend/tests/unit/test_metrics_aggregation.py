@@ -0,0 +1,124 @@
+"""
+메트릭 집계 엔진 확인 (세그먼트 리듀스, 빈 시계열, 카운터 리셋, group_by, 임계치 초과)
+"""
+import numpy as np
+import pytest
+
+from app.utils.metrics_aggregation import SeriesBatch, aggregate, aggregate_series, threshold_breaches
+from app.utils.metrics_store import MetricSeries
+
+
+def _series(name, points, tags=None, unit=None):
+    """[(초, 값), ...] → MetricSeries"""
+    timestamps = np.array([int(t * 1000) for t, _ in points], dtype=np.int64)
+    values = np.array([v for _, v in points], dtype=np.float64)
+    return MetricSeries(name=name, timestamps=timestamps, values=values, unit=unit, tags=tags or {})
+
+
+def _values(result):
+    return [None if np.isnan(v) else round(float(v), 6) for v in result]
+
+
+@pytest.fixture
+def batch_with_empty():
+    """빈 시계열이 앞/가운데/끝에 섞인 배치"""
+    return SeriesBatch.from_series([
+        _series("a", []),
+        _series("b", [(0, 1), (1, 5), (2, 3)]),
+        _series("c", []),
+        _series("d", [(0, 7)]),
+        _series("e", []),
+    ])
+
+
+@pytest.mark.parametrize("agg, expected", [
+    ("latest", [None, 3, None, 7, None]),
+    ("mean", [None, 3, None, 7, None]),
+    ("min", [None, 1, None, 7, None]),
+    ("max", [None, 5, None, 7, None]),
+    ("sum", [0, 9, 0, 7, 0]),
+    ("count", [0, 3, 0, 1, 0]),
+    ("p50", [None, 3, None, 7, None]),
+    ("p99", [None, 5, None, 7, None]),
+    ("rate", [None, 3.5, None, None, None]),  # 5 → 3은 리셋 (4 + 3) / 2초, 점이 2개 미만이면 rate 없음
+])
+def test_segment_reducers_with_empty_series(batch_with_empty, agg, expected):
+    assert _values(aggregate_series(batch_with_empty, agg)) == expected
+
+
+def test_all_series_empty():
+    batch = SeriesBatch.from_series([_series("a", []), _series("b", [])])
+    assert _values(aggregate_series(batch, "max")) == [None, None]
+    assert _values(aggregate_series(batch, "rate")) == [None, None]
+    assert _values(aggregate_series(SeriesBatch.from_series([]), "mean")) == []
+
+
+def test_rate_handles_counter_reset():
+    batch = SeriesBatch.from_series([
+        _series("requests", [(0, 100), (10, 150), (20, 20), (30, 70)]),  # 20초에 리셋
+        _series("requests", [(0, 5), (10, 5)], tags={"host": "b"}),
+    ])
+    # 증가량 50 + 20(리셋 후 값) + 50 = 120, 30초
+    assert _values(aggregate_series(batch, "rate")) == [4, 0]
+
+
+def test_rate_does_not_cross_series_boundary():
+    # 앞 시계열의 마지막 값보다 다음 시계열의 첫 값이 작아도 리셋으로 보지 않는다
+    batch = SeriesBatch.from_series([
+        _series("requests", [(0, 1000), (10, 1100)]),
+        _series("requests", [(0, 10), (10, 30)], tags={"host": "b"}),
+    ])
+    assert _values(aggregate_series(batch, "rate")) == [10, 2]
+
+
+def test_group_by_latest_is_mean_and_rate_is_sum():
+    batch = SeriesBatch.from_series([
+        _series("cpu", [(0, 10), (10, 20)], tags={"region": "kr", "host": "a"}, unit="percent"),
+        _series("cpu", [(0, 30), (5, 40)], tags={"region": "kr", "host": "b"}, unit="percent"),
+        _series("cpu", [(0, 90), (10, 95)], tags={"region": "us", "host": "c"}, unit="percent"),
+        _series("requests", [(0, 0), (10, 100)], tags={"region": "kr", "host": "a"}),
+        _series("requests", [(0, 0), (10, 50)], tags={"region": "kr", "host": "b"}),
+        _series("requests", [], tags={"region": "kr", "host": "c"}),
+    ])
+
+    latest = aggregate(batch, "latest", group_by="region")
+    assert latest.keys[:2] == [("cpu", {"region": "kr"}), ("cpu", {"region": "us"})]
+    assert _values(latest.values[:2]) == [30, 95]  # kr: (20 + 40) / 2
+    assert latest.timestamps[:2].tolist() == [10000, 10000]
+    assert latest.units[:2] == ["percent", "percent"]
+
+    rate = aggregate(batch, "rate", group_by="region")
+    assert rate.keys[2] == ("requests", {"region": "kr"})
+    assert _values(rate.values) == [3, 0.5, 15]  # kr cpu: 1 + 2, kr requests: 10 + 5 (빈 시계열 제외)
+
+    mean = aggregate(batch, "mean", group_by="region")  # 점 단위 집계는 그룹의 모든 점
+    assert _values(mean.values) == [25, 92.5, 37.5]
+
+
+def test_group_by_missing_tag_and_without_group():
+    batch = SeriesBatch.from_series([
+        _series("cpu", [(0, 1)], tags={"region": "kr"}),
+        _series("cpu", [(0, 3)]),
+    ])
+    result = aggregate(batch, "max", group_by="region")
+    assert result.keys == [("cpu", {"region": "kr"}), ("cpu", {})]
+
+    per_series = aggregate(batch, "max")
+    assert [tags for _, tags in per_series.keys] == [{"region": "kr"}, {}]
+
+
+def test_unsupported_aggregation():
+    with pytest.raises(ValueError, match="Unsupported"):
+        aggregate(SeriesBatch.from_series([]), "median")
+
+
+def test_threshold_breaches():
+    batch = SeriesBatch.from_series([
+        _series("cpu", [(0, 50), (1, 91), (2, 60), (3, 99)]),
+        _series("cpu", []),
+        _series("cpu", [(0, 10), (1, 20)]),
+        _series("cpu", [(5, 95)]),
+    ])
+    counts, first = threshold_breaches(batch, 90)
+    assert counts.tolist() == [2, 0, 0, 1]
+    assert first.tolist() == [1000, -1, -1, 5000]
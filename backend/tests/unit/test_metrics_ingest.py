@@ -0,0 +1,108 @@
+"""
+메트릭 push 수집 파싱 확인
+"""
+import pytest
+
+from app.core.config import settings
+from app.utils.metrics_ingest import MetricsIngestBuffer, parse_json_batch, parse_line_protocol
+from app.utils.metrics_store import MetricsStore
+
+DEPLOYMENT = "7f3c2d1e-0000-4000-8000-000000000001"
+TS_MS = 1_760_000_000_000
+
+
+def _only_series(batch):
+    assert len(batch.series) == 1
+    (key, (timestamps, values)), = batch.series.items()
+    return key, timestamps, values
+
+
+def test_json_batch():
+    batch = parse_json_batch({"deployment_id": DEPLOYMENT, "series": [
+        {"name": "cpu_usage", "unit": "percent", "tags": {"host": "web-1"}, "points": [[TS_MS, 12.5], [TS_MS + 1000, 13]]},
+    ]})
+    key, timestamps, values = _only_series(batch)
+    assert key == (DEPLOYMENT, "cpu_usage", '{"host": "web-1"}')
+    assert timestamps == [TS_MS, TS_MS + 1000] and values == [12.5, 13.0]
+    assert batch.units[key] == "percent"
+
+
+@pytest.mark.parametrize("points", [
+    [[None, 2]],
+    [[TS_MS, None]],
+    [[float("nan"), 1]],
+    [[TS_MS, float("inf")]],
+    [[TS_MS // 1000, 1]],  # 초 단위를 밀리초로 착각
+    [[TS_MS * 1000, 1]],  # 마이크로초
+    [[-1, 1]],
+])
+def test_json_batch_rejects_bad_points(points):
+    with pytest.raises(ValueError, match=r"series\[0\]"):
+        parse_json_batch({"deployment_id": DEPLOYMENT, "series": [{"name": "cpu_usage", "points": points}]})
+
+
+def test_line_protocol_precision():
+    batch = parse_line_protocol(f"cpu,deployment_id={DEPLOYMENT} value=1 {TS_MS // 1000}", precision="s")
+    _, timestamps, _ = _only_series(batch)
+    assert timestamps == [TS_MS]
+
+
+@pytest.mark.parametrize("line, precision", [
+    (f"cpu value=1 {TS_MS}", "s"),  # 밀리초를 초로 보내면 범위 밖
+    (f"cpu value=1 {TS_MS}", "ns"),
+    ("cpu value=1 -5", "ms"),
+    (f"cpu value=1 {2 ** 70}", "ns"),
+    (f"cpu value=nan {TS_MS}", "ms"),
+    (f"cpu value=inf {TS_MS}", "ms"),
+])
+def test_line_protocol_rejects_bad_points(line, precision):
+    with pytest.raises(ValueError, match="line 1"):
+        parse_line_protocol(line, deployment_id=DEPLOYMENT, precision=precision)
+
+
+def test_line_protocol_string_fields_with_spaces_and_commas():
+    batch = parse_line_protocol(
+        f'app,deployment_id={DEPLOYMENT},host=web\\ 1 msg="hello world, again",value=1,ok=true {TS_MS}',
+        precision="ms",
+    )
+    key, timestamps, values = _only_series(batch)
+    assert key == (DEPLOYMENT, "app", '{"host": "web 1"}')
+    assert timestamps == [TS_MS] and values == [1.0]
+
+
+def test_line_protocol_escaped_quote_in_string_field():
+    batch = parse_line_protocol(f'app msg="say \\"hi there\\"",value=2 {TS_MS}', deployment_id=DEPLOYMENT, precision="ms")
+    _, _, values = _only_series(batch)
+    assert values == [2.0]
+
+
+def test_line_protocol_unterminated_string():
+    with pytest.raises(ValueError, match="line 1: unterminated"):
+        parse_line_protocol('app msg="oops value=1', deployment_id=DEPLOYMENT)
+
+
+def test_line_protocol_unit_tag():
+    batch = parse_line_protocol(f"cpu_usage,deployment_id={DEPLOYMENT},unit=percent,host=a value=91 {TS_MS}", precision="ms")
+    key, _, _ = _only_series(batch)
+    assert key == (DEPLOYMENT, "cpu_usage", '{"host": "a"}')
+    assert batch.units[key] == "percent"
+
+
+def test_recent_timestamps_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ALERT_ENABLED", False)
+    monkeypatch.setattr(settings, "METRICS_INGEST_RECENT_SERIES", 2)
+    buffer = MetricsIngestBuffer(store=MetricsStore(str(tmp_path)))
+
+    for host in ("a", "b", "c"):
+        buffer.offer(parse_json_batch({"deployment_id": DEPLOYMENT, "series": [
+            {"name": "cpu_usage", "tags": {"host": host}, "points": [[TS_MS, 1]]},
+        ]}))
+        buffer.flush()
+    assert len(buffer._recent) == 2  # 가장 오래 쓰이지 않은 시계열(a)부터 버림
+
+    # 기억하는 시계열의 재전송은 중복으로 버린다
+    buffer.offer(parse_json_batch({"deployment_id": DEPLOYMENT, "series": [
+        {"name": "cpu_usage", "tags": {"host": "c"}, "points": [[TS_MS, 1]]},
+    ]}))
+    assert buffer.flush() == 0
+    assert buffer.stats["duplicates"] == 1
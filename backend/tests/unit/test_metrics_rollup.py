@@ -0,0 +1,120 @@
+"""
+메트릭 롤업 / 다운샘플링 확인 (p95 병합, 해상도 선택, 재버킷, LTTB)
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.utils.metrics_rollup import ROLLUP_DTYPE, lttb, rollup_points, rollup_rows, rollup_values
+from app.utils.metrics_store import MetricsStore, to_millis
+
+T0 = datetime(2026, 1, 1)
+MINUTE_MS = 60 * 1000
+
+
+def _rows(*rows):
+    """(ts, count, sum, min, max, p95) 튜플 → 롤업 행"""
+    return np.array(list(rows), dtype=ROLLUP_DTYPE)
+
+
+def test_rollup_points_exact_stats():
+    timestamps = np.arange(100, dtype=np.int64) * 100  # 1분 버킷 하나
+    values = np.random.default_rng(0).permutation(np.arange(1, 101)).astype(np.float64)
+
+    rows = rollup_points(timestamps, values, MINUTE_MS)
+    assert len(rows) == 1
+    assert (rows["count"][0], rows["sum"][0], rows["min"][0], rows["max"][0]) == (100, 5050, 1, 100)
+    assert rows["p95"][0] == 95  # nearest-rank
+    assert rollup_values(rows, "avg").tolist() == [50.5]
+
+
+def test_weighted_p95_merge():
+    # 대부분의 점이 낮은 버킷에 있으면 병합 p95도 낮은 버킷의 p95
+    rows = _rows((0, 99, 99, 1, 10, 10), (MINUTE_MS, 1, 100, 100, 100, 100))
+    merged = rollup_rows(rows, 5 * MINUTE_MS)
+    assert merged["p95"].tolist() == [10]
+    assert (merged["count"][0], merged["sum"][0], merged["min"][0], merged["max"][0]) == (100, 199, 1, 100)
+
+    # 높은 버킷이 상위 5%를 넘으면 높은 버킷의 p95
+    rows = _rows((0, 90, 90, 1, 10, 10), (MINUTE_MS, 10, 1000, 100, 100, 100))
+    assert rollup_rows(rows, 5 * MINUTE_MS)["p95"].tolist() == [100]
+
+
+def test_weighted_p95_merge_is_per_bucket():
+    rows = _rows(
+        (0, 10, 10, 1, 1, 1), (MINUTE_MS, 10, 50, 5, 5, 5),  # 5분 버킷 0
+        (5 * MINUTE_MS, 10, 70, 7, 7, 7), (6 * MINUTE_MS, 10, 30, 3, 3, 3),  # 5분 버킷 1
+    )
+    merged = rollup_rows(rows, 5 * MINUTE_MS)
+    assert merged["ts"].tolist() == [0, 5 * MINUTE_MS]
+    assert merged["p95"].tolist() == [5, 7]
+    assert rollup_values(merged, "avg").tolist() == [3, 5]
+
+
+def test_unsupported_stat():
+    with pytest.raises(ValueError, match="Unsupported"):
+        rollup_values(_rows((0, 1, 1, 1, 1, 1)), "median")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """2시간 동안 1초 간격 점 (값 = 경과 초)"""
+    store = MetricsStore(str(tmp_path / "metrics"), partition_seconds=3600, retention_days=0, rollup_retention_days=0)
+    offsets = np.arange(7200, dtype=np.int64)
+    store.append_arrays("dep-1", "cpu_usage", offsets * 1000 + to_millis(T0), offsets.astype(np.float64))
+    return store
+
+
+def _query(store, **kwargs):
+    return store.query("dep-1", "cpu_usage", T0, T0 + timedelta(seconds=7199), **kwargs)
+
+
+@pytest.mark.parametrize("step, resolution, points", [(60, 60, 120), (300, 300, 24), (3600, 3600, 2), (1, 1, 7200)])
+def test_step_selects_matching_rollup(store, step, resolution, points):
+    series = _query(store, step=step)
+    assert (series.resolution, len(series)) == (resolution, points)
+
+
+def test_step_wider_than_rollup_is_rebucketed(store):
+    series = _query(store, step=120)  # 1분 롤업을 2분 단위로 다시 묶는다
+    assert (series.resolution, len(series)) == (120, 60)
+    assert series.values[:2].tolist() == [59.5, 179.5]  # 버킷 평균은 원본 평균과 같다
+    assert (series.timestamps[1] - series.timestamps[0]) == 120 * 1000
+
+    peaks = _query(store, step=120, stat="max")
+    assert peaks.values[:2].tolist() == [119, 239]
+
+
+def test_max_points_selects_finest_fitting_rollup(store):
+    assert _query(store, max_points=10000).resolution == 0  # 원본이 한도 안
+    assert _query(store, max_points=120).resolution == 60  # 7200초 / 60 = 120
+    series = _query(store, max_points=100)  # 120 > 100 → 5분 롤업 (24점)
+    assert (series.resolution, len(series)) == (300, 24)
+
+
+def test_max_points_downsamples_chosen_resolution(store):
+    series = _query(store, step=1, max_points=50)  # 원본 해상도 고정 → LTTB
+    assert len(series) == 50
+    assert series.timestamps[0] == to_millis(T0)
+    assert series.timestamps[-1] == to_millis(T0) + 7199 * 1000
+
+
+def test_lttb_keeps_endpoints_and_size():
+    timestamps = np.arange(1000, dtype=np.int64)
+    values = np.sin(timestamps / 50.0)
+    values[500] = 10.0  # 급격한 값은 남는다
+
+    ts, vals = lttb(timestamps, values, 100)
+    assert len(ts) == len(vals) == 100
+    assert (ts[0], ts[-1]) == (0, 999)
+    assert np.all(np.diff(ts) > 0)
+    assert 500 in ts.tolist()
+
+
+def test_lttb_passthrough():
+    timestamps = np.arange(10, dtype=np.int64)
+    values = timestamps.astype(np.float64)
+    for max_points in (10, 20, 2):  # 이미 작거나 3 미만이면 그대로
+        ts, vals = lttb(timestamps, values, max_points)
+        assert len(ts) == 10
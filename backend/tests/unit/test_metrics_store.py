@@ -0,0 +1,141 @@
+"""
+메트릭 시계열 저장소 확인 (시간 파티션, 순서 어긋난 점 병합, 보관 기간, 중단된 쓰기)
+"""
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.utils.metrics_collector import MetricsCollector
+from app.utils.metrics_store import MetricsStore, to_millis
+
+T0 = datetime(2026, 1, 1)
+HOUR_MS = 3600 * 1000
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MetricsStore(str(tmp_path / "metrics"), partition_seconds=3600, retention_days=0, rollup_retention_days=0)
+
+
+def _series_dir(store, metric="cpu_usage"):
+    return store._series_dir("dep-1", metric)
+
+
+def _append(store, offsets_ms, values, metric="cpu_usage"):
+    base = to_millis(T0)
+    return store.append_arrays(
+        "dep-1", metric, np.asarray(offsets_ms, dtype=np.int64) + base, np.asarray(values, dtype=np.float64)
+    )
+
+
+def _read(store, start=T0 - timedelta(days=1), end=T0 + timedelta(days=1), metric="cpu_usage"):
+    series = store.read_range("dep-1", metric, start, end)
+    return (series.timestamps - to_millis(T0)).tolist(), series.values.tolist()
+
+
+def test_points_are_split_into_time_partitions(store):
+    offsets = [0, HOUR_MS - 1, HOUR_MS, 2 * HOUR_MS + 5]
+    assert _append(store, offsets, [1, 2, 3, 4]) == 4
+
+    files = sorted(name for name in os.listdir(_series_dir(store)) if name.endswith(".ts"))
+    start = to_millis(T0) // 1000
+    assert files == [f"{start}.ts", f"{start + 3600}.ts", f"{start + 7200}.ts"]
+
+    # 범위 조회는 겹치는 파티션만 읽고 경계를 포함한다
+    assert _read(store) == (offsets, [1, 2, 3, 4])
+    assert _read(store, T0 + timedelta(milliseconds=HOUR_MS - 1), T0 + timedelta(hours=1)) == (
+        [HOUR_MS - 1, HOUR_MS], [2, 3]
+    )
+    assert store.latest("dep-1", "cpu_usage", before=T0 + timedelta(hours=1, minutes=30))["value"] == 3
+
+
+def test_out_of_order_points_are_merged(store):
+    _append(store, [10, 20, 30], [1, 2, 3])
+    _append(store, [25, 15], [2.5, 1.5])  # 파티션 마지막 시각보다 이른 점
+    _append(store, [40], [4])  # 이후에는 다시 이어 쓰기
+
+    assert _read(store) == ([10, 15, 20, 25, 30, 40], [1, 1.5, 2, 2.5, 3, 4])
+    assert not [name for name in os.listdir(_series_dir(store)) if name.endswith(".tmp")]
+
+
+def test_torn_write_is_ignored_and_repaired(store):
+    _append(store, [10, 20, 30], [1, 2, 3])
+    partition = to_millis(T0) // 1000
+    val_path = os.path.join(_series_dir(store), f"{partition}.val")
+    ts_path = os.path.join(_series_dir(store), f"{partition}.ts")
+
+    # 값 열만 기록되고 타임스탬프 열은 일부만 기록된 채 중단된 쓰기
+    with open(val_path, "ab") as f:
+        f.write(np.asarray([9.0], dtype=np.float64).tobytes())
+    with open(ts_path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    reopened = MetricsStore(store.root_dir, partition_seconds=3600, retention_days=0, rollup_retention_days=0)
+    assert _read(reopened) == ([10, 20, 30], [1, 2, 3])
+
+    _append(reopened, [40], [4])  # 다음 쓰기는 완전한 길이까지 잘라내고 이어 쓴다
+    assert _read(reopened) == ([10, 20, 30, 40], [1, 2, 3, 4])
+    assert os.path.getsize(ts_path) == os.path.getsize(val_path) == 4 * 8
+
+
+def test_retention_removes_old_raw_partitions_and_keeps_rollups(tmp_path):
+    store = MetricsStore(str(tmp_path / "metrics"), partition_seconds=3600, retention_days=1, rollup_retention_days=0)
+    old = [0, 60 * 1000]
+    recent = [3 * 24 * HOUR_MS, 3 * 24 * HOUR_MS + 60 * 1000]
+    _append(store, old + recent, [1, 2, 3, 4])
+
+    assert store.enforce_retention(now=T0 + timedelta(days=3, hours=1)) == 1  # 원본 파티션 하나
+    assert _read(store, T0, T0 + timedelta(days=4)) == (recent, [3, 4])
+
+    # 원본이 지워진 구간도 롤업으로는 조회된다
+    rolled = store.query("dep-1", "cpu_usage", T0, T0 + timedelta(minutes=2), step=60)
+    assert rolled.resolution == 60
+    assert rolled.values.tolist() == [1, 2]
+
+
+def test_retention_removes_expired_series_directory(tmp_path):
+    store = MetricsStore(str(tmp_path / "metrics"), partition_seconds=3600, retention_days=1, rollup_retention_days=1)
+    _append(store, [0], [1])
+
+    store.enforce_retention(now=T0 + timedelta(days=5000))
+    assert not os.path.exists(_series_dir(store))
+    assert store.list_series("dep-1") == []
+
+
+def test_collector_reads_do_not_block_event_loop(store):
+    """flush가 저장소 잠금을 잡고 있어도 조회는 스레드에서 기다리고 이벤트 루프는 계속 돈다"""
+    _append(store, [0, 1000], [1, 2])
+    collector = MetricsCollector("dep-1", store=store, prometheus=None)
+    locked, release = threading.Event(), threading.Event()
+
+    def hold_lock():
+        with store._lock:
+            locked.set()
+            release.wait(5)
+
+    async def scenario():
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        locked.wait(5)
+        read = asyncio.ensure_future(
+            collector.collect_series(None, T0, T0 + timedelta(minutes=1), mock_fallback=False)
+        )
+        ticks = 0
+        started = time.monotonic()
+        while time.monotonic() - started < 0.2:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not read.done()
+        release.set()
+        series = await read
+        holder.join()
+        return ticks, series
+
+    ticks, series = asyncio.run(scenario())
+    assert ticks >= 5
+    assert [s.values.tolist() for s in series] == [[1, 2]]
@@ -0,0 +1,134 @@
+"""
+메트릭 스트림 허브 확인 (공유 폴러 fan-out, 구독자별 병합, 느린 구독자 끊기)
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.utils import metrics_stream
+from app.utils.metrics_collector import MetricsCollector
+from app.utils.metrics_store import MetricsStore
+from app.utils.metrics_stream import MetricsStreamHub, Subscription
+
+DEPLOYMENT = str(uuid.UUID(int=1))
+T0 = datetime(2026, 1, 1)
+
+
+def _point(value, seconds=0, name="cpu_usage"):
+    return {"name": name, "value": value, "unit": "percent", "timestamp": T0 + timedelta(seconds=seconds), "tags": None}
+
+
+def _key(name="cpu_usage"):
+    return DEPLOYMENT, name, "{}"
+
+
+def _attach(hub, subscription):
+    """폴러 없이 허브에 구독자 등록"""
+    subscription.deployment_ids.add(DEPLOYMENT)
+    hub._subscribers.setdefault(DEPLOYMENT, set()).add(subscription)
+
+
+def test_shared_poller_reads_once_per_deployment(tmp_path, monkeypatch):
+    store = MetricsStore(str(tmp_path / "metrics"))
+    monkeypatch.setattr(settings, "METRICS_SOURCE", "store")
+    monkeypatch.setattr(settings, "ALERT_ENABLED", False)
+    monkeypatch.setattr(
+        metrics_stream, "MetricsCollector", lambda deployment_id: MetricsCollector(deployment_id, store=store)
+    )
+    interval = 0.1
+
+    async def scenario():
+        hub = MetricsStreamHub(interval=interval)
+        subscriptions = [await hub.subscribe([DEPLOYMENT]) for _ in range(10)]
+        for subscription in subscriptions:
+            await subscription.get(timeout=1)  # 스냅샷
+        started = time.monotonic()
+        await asyncio.sleep(interval * 1.5)
+        store.append(uuid.UUID(DEPLOYMENT), "cpu_usage", [datetime.utcnow()], [42.0], unit="percent")
+        updates = [await subscription.get(timeout=1) for subscription in subscriptions]
+        elapsed = time.monotonic() - started
+        reads = hub.upstream_reads
+        await hub.close()
+        return updates, reads, elapsed
+
+    updates, reads, elapsed = asyncio.run(scenario())
+    assert all([s["value"] for s in update["samples"]] == [42.0] for update in updates)
+    # 구독자 10명이어도 폴링 주기마다 조회는 한 번
+    assert 2 <= reads <= elapsed / interval + 2
+
+
+def test_push_coalesces_pending_series_to_latest_point():
+    async def scenario():
+        subscription = Subscription([DEPLOYMENT], max_pending=10)
+        subscription.push({_key(): [_point(1, 0), _point(2, 1)]}, {DEPLOYMENT: "healthy"})
+        subscription.push(
+            {_key(): [_point(3, 2), _point(4, 3)], _key("memory_usage"): [_point(5, 3, "memory_usage")]},
+            {DEPLOYMENT: "warning"},
+        )
+        first = await subscription.get(timeout=1)
+
+        subscription.push({_key(): [_point(6, 4), _point(7, 5)]}, {})  # 가져간 뒤에는 다시 전부 보낸다
+        second = await subscription.get(timeout=1)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert [(s["name"], s["value"]) for s in first["samples"]] == [("cpu_usage", 4), ("memory_usage", 5)]
+    assert first["status"] == {DEPLOYMENT: "warning"}
+    assert [s["value"] for s in second["samples"]] == [6, 7]
+    assert second["status"] == {}
+
+
+def test_push_reports_max_pending():
+    subscription = Subscription([DEPLOYMENT], max_pending=2)
+    assert subscription.push({_key("a"): [_point(1)], _key("b"): [_point(1)]}, {})
+    assert subscription.push({_key("a"): [_point(2)]}, {})  # 같은 시계열 병합은 늘지 않는다
+    assert not subscription.push({_key("c"): [_point(1)]}, {})
+
+
+def test_publish_drops_slow_consumer():
+    async def scenario():
+        hub = MetricsStreamHub(slow_consumer_seconds=5, max_pending=10)
+        slow, fast = Subscription((), hub.max_pending), Subscription((), hub.max_pending)
+        _attach(hub, slow)
+        _attach(hub, fast)
+        slow.push({_key(): [_point(1)]}, {})
+        slow._pending_since = time.monotonic() - 10  # 10초째 가져가지 않음
+
+        hub._publish(DEPLOYMENT, {_key(): [_point(2, 1)]}, {})
+        return hub, slow, await slow.get(timeout=1), await fast.get(timeout=1)
+
+    hub, slow, dropped, update = asyncio.run(scenario())
+    assert dropped == {"type": "dropped", "reason": "slow consumer"}
+    assert not slow.deployment_ids
+    assert [s["value"] for s in update["samples"]] == [2]
+    assert hub.subscriber_count == 1
+
+
+def test_publish_drops_subscriber_over_max_pending():
+    async def scenario():
+        hub = MetricsStreamHub(max_pending=2)
+        subscription = Subscription((), hub.max_pending)
+        _attach(hub, subscription)
+        hub._publish(DEPLOYMENT, {_key(name): [_point(1, 0, name)] for name in ("a", "b", "c")}, {})
+        return hub, await subscription.get(timeout=1)
+
+    hub, message = asyncio.run(scenario())
+    assert message == {"type": "dropped", "reason": "too many pending series"}
+    assert hub.subscriber_count == 0
+
+
+@pytest.mark.parametrize("pending_age", [0.0, 4.0])
+def test_publish_keeps_consumer_within_limits(pending_age):
+    hub = MetricsStreamHub(slow_consumer_seconds=5, max_pending=10)
+    subscription = Subscription((), hub.max_pending)
+    _attach(hub, subscription)
+    subscription.push({_key(): [_point(1)]}, {})
+    subscription._pending_since = time.monotonic() - pending_age
+
+    hub._publish(DEPLOYMENT, {_key(): [_point(2, 1)]}, {})
+    assert subscription.dropped is None
+    assert hub.subscriber_count == 1
@@ -0,0 +1,161 @@
+"""
+네트워크 대역 포트 스윕 확인 (포트/대역 파싱, 허용 대역, 호스트 예산, 전역 동시 연결 제한, 인벤토리 TTL)
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import monitoring
+from app.utils import network_sweep
+from app.utils.network_sweep import (
+    NetworkSweeper, SweepInventory, SweepLimits, allowed_networks, expand_hosts, get_sweep_limits, parse_ports
+)
+
+
+def test_parse_ports():
+    assert parse_ports("22") == [22]
+    assert parse_ports(" 80, 22,8000-8002,22 ,") == [22, 80, 8000, 8001, 8002]
+
+
+@pytest.mark.parametrize("spec", ["http", "0", "65536", "10-5", "1-2-3"])
+def test_parse_ports_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        parse_ports(spec)
+
+
+def test_expand_hosts():
+    assert expand_hosts(["192.168.56.0/30", "192.168.56.1", "10.0.0.5"]) == [
+        "192.168.56.1", "192.168.56.2", "10.0.0.5"
+    ]
+    assert expand_hosts(["fd00::1"]) == ["fd00::1"]
+
+
+@pytest.mark.parametrize("cidr", [
+    "8.8.8.8", "0.0.0.0/0", "10.0.0.0/7", "2001:db8::1",
+    "127.0.0.1", "169.254.169.254", "fe80::1", "::1",  # 루프백/링크 로컬(메타데이터)도 기본 허용 대역 밖
+])
+def test_expand_hosts_rejects_public_networks(cidr):
+    with pytest.raises(ValueError, match="not allowed"):
+        expand_hosts([cidr])
+
+
+def test_expand_hosts_custom_allowlist():
+    allowed = allowed_networks("203.0.113.0/24")
+    assert expand_hosts(["203.0.113.7"], allowed=allowed) == ["203.0.113.7"]
+    with pytest.raises(ValueError, match="not allowed"):
+        expand_hosts(["192.168.56.1"], allowed=allowed)
+
+
+@pytest.mark.parametrize("cidrs", [["192.168.0.0/16"], ["192.168.56.0/24"] * 2 + ["192.168.57.0/24"], ["nope"]])
+def test_expand_hosts_rejects_invalid_or_too_many(cidrs):
+    with pytest.raises(ValueError):
+        expand_hosts(cidrs, max_hosts=500)
+
+
+def test_sweep_endpoint_rejects_public_network():
+    app = FastAPI()
+    app.include_router(monitoring.router, prefix="/monitoring")
+    with TestClient(app) as client:
+        response = client.post("/monitoring/network/sweep", json={"cidrs": ["8.8.8.0/24"], "ports": "22"})
+    assert response.status_code == 400
+    assert "not allowed" in response.json()["detail"]
+
+
+def test_sweep_skips_ports_after_host_budget(monkeypatch):
+    async def slow_connect(host, port, timeout):
+        await asyncio.sleep(min(0.1, timeout))
+        return ("open", None) if timeout >= 0.1 else ("filtered", None)
+
+    monkeypatch.setattr(network_sweep, "connect", slow_connect)
+    inventory = SweepInventory(ttl=60, max_entries=100)
+    sweeper = NetworkSweeper(timeout=1.0, host_budget=0.15, inventory=inventory, limits=SweepLimits(concurrency=1, rate=0))
+
+    async def run():
+        return [result async for result in sweeper.sweep(["10.0.0.5"], [22, 80, 443, 8080])]
+
+    results = asyncio.run(run())
+    assert [(r["port"], r["status"]) for r in results] == [
+        (22, "open"), (80, "filtered"), (443, "skipped"), (8080, "skipped")
+    ]
+    assert results[2]["latency_ms"] is None and results[2]["error"] == "host time budget exceeded"
+    # 건너뛴 포트는 인벤토리에 남기지 않아 다음 스윕에서 다시 확인한다
+    assert [(r["port"], r["status"]) for r in inventory.query()] == [(22, "open"), (80, "filtered")]
+
+
+def test_sweep_reuses_fresh_inventory(monkeypatch):
+    attempts = []
+
+    async def fake_connect(host, port, timeout):
+        attempts.append((host, port))
+        return "closed", None
+
+    monkeypatch.setattr(network_sweep, "connect", fake_connect)
+    sweeper = NetworkSweeper(inventory=SweepInventory(ttl=60, max_entries=100), limits=SweepLimits(concurrency=4, rate=0))
+
+    async def run(refresh=False):
+        return [result async for result in sweeper.sweep(["10.0.0.5", "10.0.0.6"], [22], refresh=refresh)]
+
+    assert [r["cached"] for r in asyncio.run(run())] == [False, False]
+    assert [r["cached"] for r in asyncio.run(run())] == [True, True]
+    assert len(attempts) == 2
+    assert [r["cached"] for r in asyncio.run(run(refresh=True))] == [False, False]
+    assert len(attempts) == 4
+
+
+def test_concurrent_sweeps_share_connection_limit(monkeypatch):
+    stats = {"running": 0, "peak": 0}
+
+    async def fake_connect(host, port, timeout):
+        stats["running"] += 1
+        stats["peak"] = max(stats["peak"], stats["running"])
+        await asyncio.sleep(0.01)
+        stats["running"] -= 1
+        return "closed", None
+
+    monkeypatch.setattr(network_sweep, "connect", fake_connect)
+    limits = SweepLimits(concurrency=3, rate=0)
+
+    async def run():
+        sweepers = [NetworkSweeper(inventory=SweepInventory(ttl=60, max_entries=100), limits=limits) for _ in range(4)]
+        hosts = [f"10.0.0.{i}" for i in range(1, 6)]
+        return await asyncio.gather(*(_collect(sweeper.sweep(hosts, [22, 80])) for sweeper in sweepers))
+
+    assert [len(results) for results in asyncio.run(run())] == [10] * 4
+    assert stats["peak"] == 3  # 스윕 4개가 동시에 돌아도 전체 동시 연결은 3개
+
+
+def test_sweepers_use_process_wide_limits():
+    assert NetworkSweeper().limits is get_sweep_limits()
+    assert NetworkSweeper().limits is NetworkSweeper().limits
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+def test_inventory_ttl_and_size(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(network_sweep, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    inventory = SweepInventory(ttl=300, max_entries=2)
+
+    def result(host, port, status="open"):
+        return {"host": host, "port": port, "status": status}
+
+    inventory.put(result("10.0.0.5", 22))
+    inventory.put(result("10.0.0.5", 80, status="skipped"))
+    assert inventory.get("10.0.0.5", 22)["status"] == "open"
+    assert inventory.get("10.0.0.5", 80) is None
+
+    clock[0] += 301
+    assert inventory.get("10.0.0.5", 22) is None
+    assert inventory.query() == []
+
+    inventory.put(result("10.0.0.5", 22))
+    inventory.put(result("192.168.56.10", 22, status="closed"))
+    inventory.put(result("192.168.56.11", 22))
+    assert inventory.get("10.0.0.5", 22) is None  # 용량 초과로 가장 오래된 항목 제거
+    assert [r["host"] for r in inventory.query(cidr="192.168.56.0/24")] == ["192.168.56.10", "192.168.56.11"]
+    assert [r["host"] for r in inventory.query(status="open")] == ["192.168.56.11"]
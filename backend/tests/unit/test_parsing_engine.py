@@ -0,0 +1,59 @@
+"""
+ParsingEngine 타임아웃 격리 확인
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.services import parsing_engine
+from app.services.parsing_engine import ParsingEngine
+
+
+def _sleep_then_echo(file_path: str):
+    """file_path = "<초>:<텍스트>" 형식의 가짜 파서"""
+    seconds, _, text = file_path.partition(":")
+    time.sleep(float(seconds))
+    return {"type": "docx", "text": text}
+
+
+def _fail(file_path: str):
+    raise ValueError(f"broken: {file_path}")
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(parsing_engine, "_parse_docx", _sleep_then_echo)
+    monkeypatch.setattr(parsing_engine, "_parse_hwp", _fail)
+    engine = ParsingEngine(max_workers=2, timeout=1.5, memory_limit_mb=0)
+    yield engine
+    engine.shutdown()
+
+
+def test_timeout_kills_only_offending_parse(engine):
+    async def scenario():
+        return await asyncio.gather(
+            engine.parse("30:slow", "docx"),
+            engine.parse("0.5:fast", "docx"),
+            return_exceptions=True,
+        )
+
+    started = time.monotonic()
+    slow, fast = asyncio.run(scenario())
+    assert time.monotonic() - started < 10
+    assert isinstance(slow, ValueError) and "시간 초과" in str(slow)
+    assert fast == {"type": "docx", "text": "fast"}
+    assert engine._jobs == set()
+
+    # 타임아웃 후에도 엔진은 계속 사용 가능
+    assert asyncio.run(engine.parse("0:again", "docx"))["text"] == "again"
+
+
+def test_worker_exception_is_reraised(engine):
+    with pytest.raises(ValueError, match="broken: x.hwp"):
+        asyncio.run(engine.parse("x.hwp", "hwp"))
+
+
+def test_unsupported_type(engine):
+    with pytest.raises(ValueError, match="Unsupported"):
+        asyncio.run(engine.parse("a.txt", "txt"))
@@ -0,0 +1,85 @@
+"""
+하이브리드 검색기 BM25 동기화 확인
+"""
+import hashlib
+
+import pytest
+
+from app.services.retrieval_service import BM25Index, HybridRetriever
+from app.services.vector_store.local_store import LocalVectorStore
+
+
+class HashEmbeddings:
+    """텍스트 해시 기반 결정적 임베딩"""
+
+    def embed_documents(self, texts):
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+    @staticmethod
+    def _vector(text):
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255.0 + 0.01 for byte in digest[:8]]
+
+
+class CountingStore(LocalVectorStore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.document_reads = 0
+
+    def get(self, ids=None, where=None, include=None):
+        result = super().get(ids=ids, where=where, include=include)
+        if include is None or "documents" in include:
+            self.document_reads += len(result["ids"])
+        return result
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CountingStore(str(tmp_path), HashEmbeddings(), dtype="float32")
+
+
+def _bm25_texts(retriever, query):
+    return [retriever._bm25.texts[doc_id] for doc_id, _ in retriever._bm25.search(query, 10)]
+
+
+def test_bm25_tracks_delete_plus_add_with_same_count(store):
+    store.add_texts(["쿠버네티스 클러스터 구성", "테라폼 모듈 작성"], ids=["a", "b"])
+    retriever = HybridRetriever(store, use_mmr=False, cache_ttl=60, sync_interval=3600)
+    assert retriever.search("쿠버네티스", k=1, max_tokens=0)[0].text == "쿠버네티스 클러스터 구성"
+    assert store.document_reads == 2
+
+    # 청크 수는 그대로지만 내용이 바뀜 (count 기반 버전으로는 감지되지 않던 경우)
+    store.delete(["a"])
+    store.add_texts(["앤서블 플레이북 작성"], ids=["c"])
+    assert _bm25_texts(retriever, "쿠버네티스") == ["쿠버네티스 클러스터 구성"]
+
+    results = retriever.search("앤서블", k=2, max_tokens=0)
+    assert results[0].text == "앤서블 플레이북 작성"
+    assert _bm25_texts(retriever, "쿠버네티스") == []
+    # 추가된 청크만 읽는다
+    assert store.document_reads == 3
+
+
+def test_unchanged_store_is_not_rescanned(store):
+    store.add_texts(["쿠버네티스 클러스터 구성"], ids=["a"])
+    retriever = HybridRetriever(store, use_mmr=False, cache_ttl=0, sync_interval=3600)
+    for _ in range(3):
+        retriever.search("클러스터", k=1, max_tokens=0)
+    assert store.document_reads == 1
+
+
+def test_bm25_index_remove_and_rebuild():
+    index = BM25Index()
+    index.add([f"문서 {i} 테라폼" for i in range(3000)], [{}] * 3000, [str(i) for i in range(3000)])
+    index.remove([str(i) for i in range(2500)])
+    assert len(index) == 500
+    assert len(index.texts) == 500  # 삭제가 많아지면 재구성
+    hits = index.search("테라폼", k=5)
+    assert len(hits) == 5 and all(index.texts[d] is not None for d, _ in hits)
+
+    index.add(["교체된 문서"], [{}], ["2999"])
+    assert len(index) == 500
+    assert index.texts[index.search("교체된", k=1)[0][0]] == "교체된 문서"
@@ -0,0 +1,66 @@
+"""
+VM 연결성 확인 캐시 (TTL, 진행 중 확인 공유, 새로 확인, 타임아웃별 키)
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.core.cache import LRUCache
+from app.utils import vm_connectivity
+from app.utils.vm_connectivity import VMConnectivityChecker
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """probe_port 호출 기록 (호출 순서대로 connected/disconnected 번갈아 반환)"""
+    calls = []
+
+    async def fake_probe(host, port, timeout):
+        calls.append((host, port, timeout))
+        await asyncio.sleep(0.05)
+        return ("connected", None) if len(calls) % 2 else ("disconnected", "refused")
+
+    monkeypatch.setattr(vm_connectivity, "probe_port", fake_probe)
+    monkeypatch.setattr(vm_connectivity, "_result_cache", LRUCache(max_size=100, ttl=60))
+    return calls
+
+
+def test_results_are_cached_until_ttl(probes, monkeypatch):
+    checker = VMConnectivityChecker()
+    assert asyncio.run(checker._probe("db", 5432, 1.0)) == ("connected", None)
+    assert asyncio.run(VMConnectivityChecker()._probe("db", 5432, 1.0)) == ("connected", None)  # 인스턴스 간 공유
+    assert len(probes) == 1
+
+    monkeypatch.setattr(vm_connectivity, "_result_cache", LRUCache(max_size=100, ttl=0.05))
+    asyncio.run(checker._probe("db", 5432, 1.0))
+    time.sleep(0.1)
+    assert asyncio.run(checker._probe("db", 5432, 1.0)) == ("connected", None)
+    assert len(probes) == 3  # 만료 후 다시 확인
+
+
+def test_concurrent_checks_share_inflight_probe(probes):
+    async def scenario():
+        checkers = [VMConnectivityChecker(use_cache=False) for _ in range(5)]
+        return await asyncio.gather(*(checker._probe("db", 5432, 1.0) for checker in checkers))
+
+    assert asyncio.run(scenario()) == [("connected", None)] * 5
+    assert len(probes) == 1
+    assert vm_connectivity._inflight == {}
+
+
+def test_refresh_bypasses_cache_and_updates_it(probes):
+    assert asyncio.run(VMConnectivityChecker()._probe("db", 5432, 1.0)) == ("connected", None)
+    assert asyncio.run(VMConnectivityChecker(use_cache=False)._probe("db", 5432, 1.0)) == ("disconnected", "refused")
+    assert len(probes) == 2
+    # 새로 확인한 결과가 캐시에 남는다
+    assert asyncio.run(VMConnectivityChecker()._probe("db", 5432, 1.0)) == ("disconnected", "refused")
+    assert len(probes) == 2
+
+
+def test_timeout_is_part_of_cache_key(probes):
+    checker = VMConnectivityChecker()
+    asyncio.run(checker._probe("db", 5432, 0.1))
+    asyncio.run(checker._probe("db", 5432, 5.0))
+    asyncio.run(checker._probe("db", 5432, 5.0))
+    assert probes == [("db", 5432, 0.1), ("db", 5432, 5.0)]